@@ -14,10 +14,15 @@ from math import comb
 from pathlib import Path
 from typing import Optional, Tuple
 
+import numpy as np
+
 _SRC = Path(__file__).resolve().parent.parent / "src"
 if str(_SRC) not in sys.path:
   sys.path.insert(0, str(_SRC))
 from bch_codec import BCHCodec  # noqa: E402
+from crc_codec import get_engine as get_crc_engine  # noqa: E402
+
+_CRC8 = get_crc_engine(0x07, 0x00)
 
 
 class ECCDatasetGenerator:
@@ -559,20 +564,8 @@ class ECCDatasetGenerator:
 
   @staticmethod
   def calculate_crc_8(data: int, data_width: int) -> int:
-    """Matches crc_ecc.v / crc_ecc_tb.cpp nested shift model."""
-    crc = 0x00
-    mask = (1 << data_width) - 1
-    data &= mask
-    for i in range(data_width):
-      bit = (data >> i) & 1
-      if bit:
-        crc ^= 0x80
-      for _ in range(8):
-        if crc & 0x80:
-          crc = ((crc << 1) ^ 0x07) & 0xFF
-        else:
-          crc = (crc << 1) & 0xFF
-    return crc
+    """Matches crc_ecc.v / crc_ecc_tb.cpp nested shift model (table-driven, see crc_codec)."""
+    return _CRC8.compute(data, data_width)
 
   @staticmethod
   def encode_crc(data: int, data_width: int, crc_width: int = 8) -> int:
@@ -930,7 +923,7 @@ class ECCDatasetGenerator:
 
   def generate_bch(self, width: int, num_tests: int = 10) -> None:
     """Five-case BCH matrix (smoke) for width in {4,8,16,...}."""
-    codec = BCHCodec.for_width(width)
+    codec = BCHCodec.for_width(width).use_decode_table()
     module_name = "bch_ecc"
     data_width = width
     cw_width = codec.n
@@ -989,7 +982,7 @@ class ECCDatasetGenerator:
       num_clean: Optional[int] = None,
   ) -> int:
     """100% exhaustive BCH decode vectors for w4/w8/w16 (errors 1..t)."""
-    codec = BCHCodec.for_width(width)
+    codec = BCHCodec.for_width(width).use_decode_table()
     n = codec.n
     t = codec.t
     module_name = "bch_ecc"
@@ -1040,7 +1033,7 @@ class ECCDatasetGenerator:
       num_clean: int = 50,
   ) -> None:
     """CRV for FSM widths (w32/w64/w128): exhaustive 1/2-error + random 3..t."""
-    codec = BCHCodec.for_width(width)
+    codec = BCHCodec.for_width(width).use_decode_table()
     t = codec.t
     module_name = "bch_ecc"
     data_width = width
@@ -1115,18 +1108,22 @@ class ECCDatasetGenerator:
           f"w{width} [RS Clean] {i}",
       )
 
+    err_cws = []
+    descs = []
     for err_count in (1, 2):
       for positions in combinations(range(n), err_count):
         err_mask = sum(0xFF << (8 * p) for p in positions)
-        err_cw = base_cw ^ err_mask
-        d, det, cor = codec.decode(err_cw)
+        err_cws.append(base_cw ^ err_mask)
         if err_count == 1:
-          desc = f"w{width} [RS Exhaustive 1-Byte] pos {positions[0]}"
+          descs.append(f"w{width} [RS Exhaustive 1-Byte] pos {positions[0]}")
         else:
-          desc = f"w{width} [RS Exhaustive 2-Byte] pos {positions[0]},{positions[1]}"
-        self.add_vector(
-            module_name, data_width, cw_width, base_data, err_cw, d, det, cor, desc,
-        )
+          descs.append(f"w{width} [RS Exhaustive 2-Byte] pos {positions[0]},{positions[1]}")
+    dec, det, cor = codec.decode_batch(np.array(err_cws, dtype=object))
+    for err_cw, desc, d, e_det, e_cor in zip(err_cws, descs, dec, det, cor):
+      self.add_vector(
+          module_name, data_width, cw_width, base_data, err_cw,
+          int(d), int(e_det), int(e_cor), desc,
+      )
 
     total = num_clean + n + comb(n, 2)
     print(f"[RS w{width}] exhaustive: {total} vectors")
@@ -1146,13 +1143,10 @@ class ECCDatasetGenerator:
     data_width = width
     cw_width = 8 * n
     mask = (1 << data_width) - 1
-    count = 0
+    pending = []
 
     def add(data: int, cw: int, desc: str) -> None:
-      nonlocal count
-      d, det, cor = codec.decode(cw)
-      self.add_vector("reed_solomon_ecc", data_width, cw_width, data, cw, d, det, cor, desc)
-      count += 1
+      pending.append((data, cw, desc))
 
     print(f"[RS CRV w{width}] n={n} t={codec.t}...")
     for i in range(num_clean):
@@ -1180,6 +1174,14 @@ class ECCDatasetGenerator:
       mask3 = sum(0xFF << (8 * p) for p in pos3)
       add(data, perfect ^ mask3, f"w{width} [RS Random 3-Byte] test {i}")
 
+    # One batched decode (matrix syndromes + PGZ/Chien/Forney) for the whole sweep
+    dec, det, cor = codec.decode_batch(np.array([cw for _, cw, _ in pending], dtype=object))
+    for (data, cw, desc), d, e_det, e_cor in zip(pending, dec, det, cor):
+      self.add_vector(
+          "reed_solomon_ecc", data_width, cw_width, data, cw, int(d), int(e_det), int(e_cor), desc,
+      )
+    count = len(pending)
+
     print(f"[RS CRV w{width}] total {count} vectors")
 
   def generate_bch_w32_crv(self, num_random_per_tier: int = 1000) -> None:
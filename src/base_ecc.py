@@ -1,4 +1,115 @@
-from typing import Tuple
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+# Integer codes returned by the batch API in place of the error_type strings.
+ERROR_TYPES: Tuple[str, ...] = ('corrected', 'detected', 'undetected')
+ERROR_TYPE_CODES = {name: code for code, name in enumerate(ERROR_TYPES)}
+CORRECTED = ERROR_TYPE_CODES['corrected']
+DETECTED = ERROR_TYPE_CODES['detected']
+UNDETECTED = ERROR_TYPE_CODES['undetected']
+
+_MASK64 = (1 << 64) - 1
+
+
+def word_dtype(bits: int):
+    """Return the NumPy dtype used to hold words of the given bit width."""
+    return np.uint64 if bits <= 64 else object
+
+
+def as_word_array(values: Iterable[int], bits: Optional[int] = None) -> np.ndarray:
+    """
+    Convert integers to a 1-D word array.
+
+    Words that fit in 64 bits are stored as ``uint64``; wider words are kept as
+    Python ints in an ``object`` array.
+
+    Args:
+        values: Integers (or an existing array) to convert.
+        bits: Word width in bits. Inferred from the largest value when omitted.
+
+    Returns:
+        1-D array of words.
+    """
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        if bits is None or bits <= 64:
+            return values.astype(np.uint64, copy=False).ravel()
+        values = values.ravel().tolist()
+    values = [int(v) for v in np.asarray(values, dtype=object).ravel()]
+    if bits is None:
+        bits = max((v.bit_length() for v in values), default=0)
+    if bits <= 64:
+        return np.array(values, dtype=np.uint64)
+    out = np.empty(len(values), dtype=object)
+    out[:] = values
+    return out
+
+
+def unpack_bits(words: np.ndarray, nbits: int) -> np.ndarray:
+    """
+    Expand words into a bit matrix.
+
+    Args:
+        words: 1-D word array (see ``as_word_array``).
+        nbits: Number of low bits to extract from each word.
+
+    Returns:
+        ``uint8`` array of shape (len(words), nbits); column i holds bit i.
+    """
+    words = np.asarray(words)
+    if words.dtype != object:
+        shifts = np.arange(nbits, dtype=np.uint64)
+        return ((words.astype(np.uint64)[:, None] >> shifts) & np.uint64(1)).astype(np.uint8)
+    bits = np.empty((len(words), nbits), dtype=np.uint8)
+    for lo in range(0, nbits, 64):
+        width = min(64, nbits - lo)
+        limb = ((words >> lo) & _MASK64).astype(np.uint64)
+        bits[:, lo:lo + width] = unpack_bits(limb, width)
+    return bits
+
+
+def pack_bits(bits: np.ndarray) -> np.ndarray:
+    """
+    Collapse a bit matrix back into words (inverse of ``unpack_bits``).
+
+    Args:
+        bits: Array of shape (count, nbits) with values 0/1; column i is bit i.
+
+    Returns:
+        1-D word array, ``uint64`` for nbits <= 64 and ``object`` otherwise.
+    """
+    bits = np.asarray(bits)
+    nbits = bits.shape[1]
+    if nbits <= 64:
+        weights = np.uint64(1) << np.arange(nbits, dtype=np.uint64)
+        return np.bitwise_or.reduce(bits.astype(np.uint64) * weights, axis=1)
+    out = np.zeros(len(bits), dtype=object)
+    for lo in range(0, nbits, 64):
+        limb = pack_bits(bits[:, lo:lo + 64]).astype(object)
+        out = out | (limb << lo)
+    return out
+
+
+def word_parity(words: np.ndarray, bits: int) -> np.ndarray:
+    """
+    XOR-fold each word down to its parity bit.
+
+    Args:
+        words: 1-D word array.
+        bits: Number of significant low bits in each word.
+
+    Returns:
+        Array of 0/1 parities with the same dtype as ``words``.
+    """
+    shift = 1
+    while shift < bits:
+        shift <<= 1
+    folded = words
+    while shift > 1:
+        shift >>= 1
+        folded = folded ^ (folded >> shift)
+    return folded & 1
+
 
 class ECCBase:
     """Abstract base class for ECC schemes."""
@@ -17,10 +128,10 @@ class ECCBase:
     def decode(self, codeword: int) -> Tuple[int, str]:
         """
         Decode a codeword and return the original data.
-        
+
         Args:
             codeword: The encoded codeword
-            
+
         Returns:
             Tuple of (decoded_data, error_type) where error_type is one of:
             - 'corrected': Error was detected and corrected
@@ -29,6 +140,49 @@ class ECCBase:
         """
         raise NotImplementedError("Subclasses must implement decode method")
 
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        """
+        Encode an array of data words.
+
+        The base implementation loops over ``encode``; codecs with a vectorized
+        kernel override it.
+
+        Args:
+            data: 1-D array (or iterable) of data words.
+
+        Returns:
+            Array of codewords (``uint64`` or ``object`` for words over 64 bits).
+        """
+        return as_word_array([self.encode(int(d)) for d in np.asarray(data, dtype=object).ravel()])
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Decode an array of codewords.
+
+        The base implementation loops over ``decode``; codecs with a vectorized
+        kernel override it.
+
+        Args:
+            codewords: 1-D array (or iterable) of codewords.
+
+        Returns:
+            Tuple of (decoded_data, error_codes) where error_codes holds
+            CORRECTED, DETECTED or UNDETECTED for each word.
+        """
+        decoded = []
+        codes = []
+        for cw in np.asarray(codewords, dtype=object).ravel():
+            data, error_type = self.decode(int(cw))
+            decoded.append(int(data))
+            codes.append(ERROR_TYPE_CODES.get(error_type, UNDETECTED))
+        return as_word_array(decoded), np.array(codes, dtype=np.uint8)
+
+    def has_batch_path(self) -> bool:
+        """Return True if the codec overrides the scalar batch fallback."""
+        cls = type(self)
+        return (cls.encode_batch is not ECCBase.encode_batch or
+                cls.decode_batch is not ECCBase.decode_batch)
+
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         """
         Flip the bit at bit_idx in the codeword.
@@ -40,4 +194,4 @@ class ECCBase:
         Returns:
             int: The corrupted codeword.
         """
-        return codeword ^ (1 << bit_idx) 
\ No newline at end of file
+        return codeword ^ (1 << bit_idx)
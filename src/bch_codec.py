@@ -7,9 +7,16 @@ Decode: odd syndromes S_1..S_{2t-1}, Berlekamp-Massey, Chien search, bit-flip co
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Dict, List, Tuple
 
+import numpy as np
+
+from gf2m import GF2m, get_field
+
 # width -> (n, k, t, prim_poly)
 BCH_CONFIGS: Dict[int, Tuple[int, int, int, int]] = {
     4: (7, 4, 1, 0b1011),
@@ -21,53 +28,6 @@ BCH_CONFIGS: Dict[int, Tuple[int, int, int, int]] = {
 }
 
 
-class GF2m:
-    def __init__(self, m: int, prim_poly: int) -> None:
-        self.m = m
-        self.prim_poly = prim_poly
-        self.size = 1 << m
-        self.order = self.size - 1
-        self.alpha_to_int = [0] * self.size
-        self.int_to_alpha = [-1] * self.size
-        x = 1
-        for i in range(self.order):
-            self.alpha_to_int[i] = x
-            self.int_to_alpha[x] = i
-            x <<= 1
-            if x & self.size:
-                x ^= self.prim_poly
-
-    def add(self, a: int, b: int) -> int:
-        return a ^ b
-
-    def mul(self, a: int, b: int) -> int:
-        if a == 0 or b == 0:
-            return 0
-        log_res = (self.int_to_alpha[a] + self.int_to_alpha[b]) % self.order
-        return self.alpha_to_int[log_res]
-
-    def div(self, a: int, b: int) -> int:
-        if b == 0:
-            raise ZeroDivisionError
-        if a == 0:
-            return 0
-        log_res = (self.int_to_alpha[a] - self.int_to_alpha[b]) % self.order
-        return self.alpha_to_int[log_res]
-
-    def inv(self, a: int) -> int:
-        return self.power(a, self.order - 1)
-
-    def power(self, a: int, exp: int) -> int:
-        if a == 0:
-            return 0
-        log_a = self.int_to_alpha[a]
-        return self.alpha_to_int[(log_a * exp) % self.order]
-
-    def alpha_pow(self, exp: int) -> int:
-        """Return alpha^exp (alpha = primitive element 2)."""
-        return self.power(2, exp % self.order)
-
-
 def poly_eval(coeffs: List[int], x: int, gf: GF2m) -> int:
     """Evaluate poly at x; coeffs[i] is coeff of x^i."""
     y = 0
@@ -120,14 +80,124 @@ def berlekamp_massey(syndromes: List[int], gf: GF2m, max_degree: int) -> List[in
     return out if out else [1]
 
 
+def berlekamp_massey_batch(syndromes: np.ndarray, gf: GF2m, max_degree: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    berlekamp_massey over many syndrome vectors at once (same update rules).
+
+    Args:
+        syndromes: (N, 2t) array of GF elements, one syndrome vector per row.
+        gf: Field the syndromes live in.
+        max_degree: Same role as in berlekamp_massey (workspace sizing).
+
+    Returns:
+        (sigma, deg): (N, 2t + max_degree + 1) coefficient matrix (low degree
+        first, zero past deg) and the locator degree of each row.
+    """
+    syn = np.asarray(syndromes, dtype=np.int64)
+    count, n_syn = syn.shape
+    size = n_syn + max_degree + 1
+    mul = gf.mul_array
+
+    rows = np.arange(count)
+    c = np.zeros((count, size), dtype=np.int64)
+    b = np.zeros((count, size), dtype=np.int64)
+    c[:, 0] = 1
+    b[:, 0] = 1
+    L = np.zeros(count, dtype=np.int64)
+    m = np.ones(count, dtype=np.int64)
+    b_val = np.ones(count, dtype=np.int64)
+
+    for n in range(n_syn):
+        d = syn[:, n].copy()
+        for i in range(1, n + 1):
+            d ^= np.where(i <= L, mul(c[:, i], syn[:, n - i]), 0)
+
+        nz = d != 0
+        t_poly = c.copy()
+        # coef = d / b_val; b_val is never zero
+        coef = gf.div_array(d, b_val)
+        for j in range(size):
+            src = j - m
+            ok = nz & (src >= 0)
+            c[:, j] ^= np.where(ok, mul(coef, b[rows, np.maximum(src, 0)]), 0)
+
+        grow = nz & (2 * L <= n)
+        L = np.where(grow, n + 1 - L, L)
+        b = np.where(grow[:, None], t_poly, b)
+        b_val = np.where(grow, d, b_val)
+        m = np.where(grow, 1, m + 1)
+
+    c[np.arange(size)[None, :] > L[:, None]] = 0
+    nonzero = c != 0
+    deg = size - 1 - np.argmax(nonzero[:, ::-1], axis=1)
+    return c, deg
+
+
+# (m, prim_poly, n, n_coeffs) -> per-term exponent table
+_CHIEN_TABLES: Dict[Tuple[int, int, int, int], np.ndarray] = {}
+_CHIEN_CHUNK = 128
+# Positions per step of the scalar early-exit scan
+_CHIEN_BLOCK = 64
+
+
+def _chien_steps(gf: GF2m, n: int, n_coeffs: int) -> np.ndarray:
+    key = (gf.m, gf.prim_poly, n, n_coeffs)
+    if key not in _CHIEN_TABLES:
+        # steps[i, pos] = -i*pos mod order, the exponent alpha^-pos contributes to x^i
+        steps = (-np.outer(np.arange(n_coeffs), np.arange(n))) % gf.order
+        _CHIEN_TABLES[key] = steps.astype(np.intp)
+    return _CHIEN_TABLES[key]
+
+
+def chien_search_batch(sigmas: np.ndarray, gf: GF2m, n: int) -> np.ndarray:
+    """
+    Evaluate many locator polynomials at alpha^-pos for every pos in 0..n-1.
+
+    Each term sigma_i * alpha^(-i*pos) is one antilog lookup of
+    log(sigma_i) + steps[i, pos] (doubled table, no modulo), and the terms are
+    XOR-reduced across i for all positions and rows at once.
+
+    Args:
+        sigmas: (N, D) coefficients, low degree first; zero-pad shorter rows.
+        gf: Field of the coefficients.
+        n: Codeword length (number of positions searched).
+
+    Returns:
+        (N, n) bool array, True where pos is a root (an error position).
+    """
+    sigmas = np.atleast_2d(np.asarray(sigmas, dtype=np.intp))
+    exp2, log = gf.exp_np, gf.log_np
+    steps = _chien_steps(gf, n, sigmas.shape[1])
+    roots = np.empty((len(sigmas), n), dtype=bool)
+    for lo in range(0, len(sigmas), _CHIEN_CHUNK):
+        chunk = sigmas[lo:lo + _CHIEN_CHUNK]
+        terms = exp2[log[chunk][:, :, None] + steps[None, :, :]]
+        terms[chunk == 0] = 0
+        roots[lo:lo + _CHIEN_CHUNK] = np.bitwise_xor.reduce(terms, axis=1) == 0
+    return roots
+
+
 def chien_search(sigma: List[int], gf: GF2m, n: int) -> List[int]:
-  """Return error bit positions 0..n-1."""
-  errs: List[int] = []
-  for pos in range(n):
-      x = gf.alpha_pow(-pos)
-      if poly_eval(sigma, x, gf) == 0:
-          errs.append(pos)
-  return errs
+    """
+    Return error bit positions 0..n-1 (roots of sigma at alpha^-pos).
+
+    Positions are evaluated _CHIEN_BLOCK at a time with the chien_search_batch
+    lookups, and the scan stops once deg(sigma) roots are found since a
+    degree-d polynomial has at most d of them.
+    """
+    deg = len(sigma) - 1
+    coeffs = np.asarray(sigma, dtype=np.intp)
+    steps = _chien_steps(gf, n, len(coeffs))
+    logs = gf.log_np[coeffs][:, None]
+    zero = coeffs == 0
+    errs: List[int] = []
+    for lo in range(0, n, _CHIEN_BLOCK):
+        terms = gf.exp_np[logs + steps[:, lo:lo + _CHIEN_BLOCK]]
+        terms[zero] = 0
+        errs.extend((np.flatnonzero(np.bitwise_xor.reduce(terms, axis=0) == 0) + lo).tolist())
+        if len(errs) >= deg:
+            return errs[:deg]
+    return errs
 
 
 @dataclass
@@ -141,13 +211,58 @@ class BCHCodec:
     parity_bits: int  # deg(g), not always n - k from the table
     k_encode: int  # message bits in codeword (n - parity_bits)
     g_poly: List[int]
+    # Precomputed syndrome contributions (see _build_syndrome_tables)
+    bit_syndrome_keys: List[int] = field(init=False, repr=False)
+    byte_syndrome_keys: List[List[int]] = field(init=False, repr=False)
+    byte_syndrome_table: np.ndarray = field(init=False, repr=False)
+    # Optional syndrome ROM consulted before BM/Chien (see use_decode_table)
+    rom: SyndromeMaskTable | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._build_syndrome_tables()
+
+    def _build_syndrome_tables(self) -> None:
+        """
+        Per-bit and per-byte syndrome contributions.
+
+        Bit i of the codeword adds alpha^(j*i) to S_j, so the packed syndrome
+        key (see syndrome_key) of a codeword is the XOR of bit_syndrome_keys
+        over its set bits. byte_syndrome_keys[b][v] pre-XORs the 8 bits of
+        byte lane b, giving ceil(n/8) lookups per codeword;
+        byte_syndrome_table holds the same data as GF elements for the
+        NumPy batch path.
+        """
+        gf = self.gf
+        n_syn = 2 * self.t
+        self.bit_syndrome_keys = []
+        for i in range(self.n):
+            syn = [gf.alpha_to_int[(j * i) % gf.order] for j in range(1, n_syn + 1)]
+            self.bit_syndrome_keys.append(self.syndrome_key(syn))
+
+        n_bytes = (self.n + 7) // 8
+        self.byte_syndrome_keys = []
+        for b in range(n_bytes):
+            lane = [0] * 256
+            for v in range(1, 256):
+                low = v & -v
+                bit = 8 * b + low.bit_length() - 1
+                contrib = self.bit_syndrome_keys[bit] if bit < self.n else 0
+                lane[v] = lane[v ^ low] ^ contrib
+            self.byte_syndrome_keys.append(lane)
+
+        sym_mask = (1 << gf.m) - 1
+        self.byte_syndrome_table = np.array(
+            [[[(key >> (gf.m * j)) & sym_mask for j in range(n_syn)] for key in lane]
+             for lane in self.byte_syndrome_keys],
+            dtype=np.uint16,
+        )
 
     @classmethod
     def for_width(cls, width: int) -> "BCHCodec":
         if width not in BCH_CONFIGS:
             raise ValueError(f"unsupported width {width}")
         n, k, t, pp = BCH_CONFIGS[width]
-        gf = GF2m(n.bit_length(), pp)
+        gf = get_field(n.bit_length(), pp)
         from generate_bch_verilog import get_bch_generator_poly  # noqa: WPS433
 
         g_poly = get_bch_generator_poly(gf.m, n, k, t, pp)
@@ -157,6 +272,18 @@ class BCHCodec:
         k_encode = n - parity_bits
         return cls(width, n, k, t, pp, gf, parity_bits, k_encode, g_poly)
 
+    def use_decode_table(self, max_errors: int | None = None) -> "BCHCodec":
+        """
+        Attach the shared on-disk syndrome ROM so decode() skips BM/Chien for
+        patterns of up to ``max_errors`` flips (default: _TABLE_ERR_LIMIT).
+        Results are unchanged because such patterns decode uniquely.
+        """
+        if max_errors is None:
+            self.rom = _get_decode_table(self.width) or None
+        else:
+            self.rom = load_syndrome_mask_table(self.width, max_errors)
+        return self
+
     def pack_data_k(self, data: int) -> int:
         """Map width-bit user data into low bits of k_encode-bit message."""
         return data & ((1 << self.width) - 1)
@@ -181,17 +308,44 @@ class BCHCodec:
                 parity |= 1 << j
         return (dk << self.parity_bits) | parity
 
+    def syndrome_key_of(self, codeword: int) -> int:
+        """Packed S_1..S_{2t} of a codeword (same layout as syndrome_key)."""
+        cw = codeword & ((1 << self.n) - 1)
+        key = 0
+        for lane in self.byte_syndrome_keys:
+            key ^= lane[cw & 0xFF]
+            cw >>= 8
+        return key
+
     def syndromes_gf(self, codeword: int) -> List[int]:
         """S_1 .. S_{2t} as GF elements (matches generated syndrome wiring)."""
-        cw = codeword & ((1 << self.n) - 1)
-        alpha = 2
-        out: List[int] = []
-        for j in range(1, 2 * self.t + 1):
-            sj = 0
-            for i in range(self.n):
-                if (cw >> i) & 1:
-                    sj = self.gf.add(sj, self.gf.power(alpha, (j * i) % self.gf.order))
-            out.append(sj)
+        key = self.syndrome_key_of(codeword)
+        sym_mask = (1 << self.gf.m) - 1
+        return [(key >> (self.gf.m * j)) & sym_mask for j in range(2 * self.t)]
+
+    def syndromes_batch(self, codewords: np.ndarray) -> np.ndarray:
+        """
+        S_1 .. S_{2t} for a 1-D array of codewords.
+
+        Args:
+            codewords: uint64 array, or object array of Python ints for n > 64.
+
+        Returns:
+            uint16 array of shape (len(codewords), 2t).
+        """
+        codewords = np.asarray(codewords)
+        table = self.byte_syndrome_table
+        out = np.zeros((len(codewords), 2 * self.t), dtype=np.uint16)
+        for lo in range(0, self.n, 64):
+            if codewords.dtype == object:
+                limb = ((codewords >> lo) & ((1 << 64) - 1)).astype(np.uint64)
+            elif lo == 0:
+                limb = codewords.astype(np.uint64)
+            else:
+                break
+            for b in range(lo // 8, min(len(table), lo // 8 + 8)):
+                byte = (limb >> np.uint64(8 * b - lo)) & np.uint64(0xFF)
+                out ^= table[b][byte.astype(np.intp)]
         return out
 
     def syndrome_key(self, syn: List[int]) -> int:
@@ -208,29 +362,196 @@ class BCHCodec:
     def decode(self, codeword: int) -> Tuple[int, int, int]:
         """Decode via Berlekamp-Massey + Chien search (O(t^2 + n*t))."""
         cw = codeword & ((1 << self.n) - 1)
-        syn = self.syndromes_gf(cw)
+        key = self.syndrome_key_of(cw)
         data_mask = (1 << self.width) - 1
         data_out = ((cw >> self.parity_bits) & ((1 << self.k_encode) - 1)) & data_mask
 
-        if all(s == 0 for s in syn):
+        if key == 0:
             return data_out, 0, 0
 
+        if self.rom is not None:
+            mask = self.rom.get(key)
+            if mask:
+                corrected = cw ^ mask
+                data_out = ((corrected >> self.parity_bits) & ((1 << self.k_encode) - 1)) & data_mask
+                return data_out, 1, 1
+
+        mask = self.error_mask(self.syndromes_gf(cw))
+        if mask is None:
+            return data_out, 1, 0
+        corrected = cw ^ mask
+        data_out = ((corrected >> self.parity_bits) & ((1 << self.k_encode) - 1)) & data_mask
+        return data_out, 1, 1
+
+    def error_mask(self, syn: List[int]) -> int | None:
+        """BM + Chien error mask for a nonzero syndrome (None if uncorrectable)."""
         sigma = berlekamp_massey(syn, self.gf, self.t)
         deg = len(sigma) - 1
         if deg <= 0 or deg > self.t:
-            return data_out, 1, 0
-
+            return None
         positions = chien_search(sigma, self.gf, self.n)
         if not positions or len(positions) > self.t:
-            return data_out, 1, 0
+            return None
+        return sum(1 << p for p in positions)
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        decode() over an array of codewords (uint64, or object above 64 bits).
+
+        Syndromes, Berlekamp-Massey and Chien search run vectorized across the
+        batch; only rows with a plausible locator (1 <= deg <= t) are searched.
+
+        Returns:
+            (data_out, error_detected, error_corrected) arrays.
+        """
+        codewords = np.asarray(codewords)
+        syn = self.syndromes_batch(codewords)
+        cws = [int(cw) & ((1 << self.n) - 1) for cw in codewords]
+        det = syn.any(axis=1).astype(np.uint8)
+        cor = np.zeros(len(cws), dtype=np.uint8)
+        masks = [0] * len(cws)
+
+        todo = np.nonzero(det)[0]
+        if len(todo):
+            sigma, deg = berlekamp_massey_batch(syn[todo], self.gf, self.t)
+            plausible = (deg > 0) & (deg <= self.t)
+            todo = todo[plausible]
+            roots = chien_search_batch(sigma[plausible, : self.t + 1], self.gf, self.n)
+            n_roots = roots.sum(axis=1)
+            for row, idx in enumerate(todo):
+                if 0 < n_roots[row] <= self.t:
+                    masks[idx] = sum(1 << int(p) for p in np.flatnonzero(roots[row]))
+                    cor[idx] = 1
 
-        mask = sum(1 << p for p in positions)
-        corrected = cw ^ mask
-        data_out = ((corrected >> self.parity_bits) & ((1 << self.k_encode) - 1)) & data_mask
-        return data_out, 1, 1
+        data_mask = (1 << self.width) - 1
+        k_mask = (1 << self.k_encode) - 1
+        data = [((cw ^ mk) >> self.parity_bits) & k_mask & data_mask for cw, mk in zip(cws, masks)]
+        out = np.array(data, dtype=np.uint64 if self.width <= 64 else object)
+        return out, det, cor
+
+
+# Bump whenever syndrome_key packing, the encoder layout or the table file
+# format changes; stale files are then ignored instead of silently reused.
+DECODE_TABLE_VERSION = 1
+DECODE_TABLE_DIR = Path(
+    os.environ.get("CORE_CC_BCH_TABLE_DIR", Path(__file__).resolve().parent.parent / "results" / "bch_tables")
+)
+
+
+class SyndromeMaskTable:
+    """
+    Read-only syndrome key -> error mask ROM backed by two .npy files.
+
+    Keys and masks are stored as fixed-size big-endian byte strings (NumPy
+    void dtype), keys sorted, so the files can be memory-mapped and shared by
+    every process while lookups are a binary search.
+    """
+
+    def __init__(self, keys: np.ndarray, masks: np.ndarray) -> None:
+        self.keys = keys
+        self.masks = masks
+        self.key_bytes = keys.dtype.itemsize
+        self.mask_bytes = masks.dtype.itemsize
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def from_dict(cls, table: Dict[int, int], key_bits: int, mask_bits: int) -> "SyndromeMaskTable":
+        key_bytes = max(1, (key_bits + 7) // 8)
+        mask_bytes = max(1, (mask_bits + 7) // 8)
+        items = sorted(table.items())
+        keys = np.frombuffer(
+            b"".join(k.to_bytes(key_bytes, "big") for k, _ in items), dtype=f"V{key_bytes}"
+        )
+        masks = np.frombuffer(
+            b"".join(m.to_bytes(mask_bytes, "big") for _, m in items), dtype=f"V{mask_bytes}"
+        )
+        return cls(keys, masks)
+
+    def get(self, key: int, default: int = 0) -> int:
+        """Error mask for a packed syndrome key (``default`` when absent)."""
+        if key >> (8 * self.key_bytes):
+            return default
+        probe = np.frombuffer(key.to_bytes(self.key_bytes, "big"), dtype=self.keys.dtype)
+        idx = int(np.searchsorted(self.keys, probe[0]))
+        if idx < len(self.keys) and self.keys[idx] == probe[0]:
+            return int.from_bytes(self.masks[idx].tobytes(), "big")
+        return default
+
+    def to_dict(self) -> Dict[int, int]:
+        return {
+            int.from_bytes(k.tobytes(), "big"): int.from_bytes(m.tobytes(), "big")
+            for k, m in zip(self.keys, self.masks)
+        }
+
+    def save(self, stem: Path) -> None:
+        """Write ``<stem>.keys.npy`` / ``<stem>.masks.npy`` atomically."""
+        stem.parent.mkdir(parents=True, exist_ok=True)
+        for suffix, arr in ((".masks.npy", self.masks), (".keys.npy", self.keys)):
+            final = stem.with_name(stem.name + suffix)
+            fd, tmp = tempfile.mkstemp(dir=stem.parent, prefix=final.name, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    np.save(fh, arr)
+                os.chmod(tmp, 0o644)
+                os.replace(tmp, final)
+            except BaseException:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+                raise
+
+    @classmethod
+    def load(cls, stem: Path) -> "SyndromeMaskTable":
+        keys = np.load(stem.with_name(stem.name + ".keys.npy"), mmap_mode="r")
+        masks = np.load(stem.with_name(stem.name + ".masks.npy"), mmap_mode="r")
+        if keys.shape != masks.shape:
+            raise ValueError(f"corrupt syndrome table {stem}")
+        return cls(keys, masks)
+
+
+def decode_table_path(width: int, max_errors: int, cache_dir: Path | None = None) -> Path:
+    """File stem for a ROM table keyed by (width, prim_poly, max_errors, version)."""
+    _, _, _, prim_poly = BCH_CONFIGS[width]
+    base = Path(cache_dir) if cache_dir is not None else DECODE_TABLE_DIR
+    return base / f"bch_w{width}_p{prim_poly:#x}_e{max_errors}_v{DECODE_TABLE_VERSION}"
+
+
+def load_syndrome_mask_table(
+    width: int, max_errors: int | None = None, cache_dir: Path | None = None
+) -> SyndromeMaskTable:
+    """
+    Memory-map the ROM table for ``width``, building and saving it on a miss.
+
+    Args:
+        width: Data width (key of BCH_CONFIGS).
+        max_errors: Largest error weight enumerated (defaults to and is capped at t).
+        cache_dir: Directory holding the table files (defaults to DECODE_TABLE_DIR).
+
+    Returns:
+        SyndromeMaskTable whose arrays are read-only memory maps.
+    """
+    if width not in BCH_CONFIGS:
+        raise ValueError(f"unsupported width {width}")
+    n, _, t, _ = BCH_CONFIGS[width]
+    limit = t if max_errors is None else min(max_errors, t)
+    stem = decode_table_path(width, limit, cache_dir)
+    try:
+        return SyndromeMaskTable.load(stem)
+    except (OSError, ValueError):
+        pass
+    codec = BCHCodec.for_width(width)
+    table = SyndromeMaskTable.from_dict(
+        build_syndrome_mask_table(width, max_errors=limit), 2 * t * codec.gf.m, n
+    )
+    try:
+        table.save(stem)
+    except OSError:
+        return table  # read-only checkout: keep the in-memory copy
+    return SyndromeMaskTable.load(stem)
 
 
-_DECODE_TABLES: Dict[int, Dict[int, int]] = {}
+_DECODE_TABLES: Dict[int, SyndromeMaskTable] = {}
 # Pre-build ROM tables where enumeration is feasible.
 _TABLE_ERR_LIMIT: Dict[int, int] = {
     4: 1,
@@ -242,45 +563,26 @@ _TABLE_ERR_LIMIT: Dict[int, int] = {
 }
 
 
-def _get_decode_table(width: int) -> Dict[int, int]:
+def _get_decode_table(width: int) -> SyndromeMaskTable | Dict[int, int]:
     if width not in _DECODE_TABLES:
         if width in _TABLE_ERR_LIMIT:
-            _DECODE_TABLES[width] = build_syndrome_mask_table(
+            _DECODE_TABLES[width] = load_syndrome_mask_table(
                 width, max_errors=_TABLE_ERR_LIMIT[width]
             )
         else:
-            _DECODE_TABLES[width] = {}
+            return {}
     return _DECODE_TABLES[width]
 
 
 def _find_mask_for_syndrome(codec: "BCHCodec", syn: List[int]) -> int:
-    """Locate error mask: fast paths, then bounded enumeration with caching."""
-    from itertools import combinations
-
-    gf = codec.gf
-    target = codec.syndrome_key(syn)
-
-    # --- 1-bit: S_j = S_1^j ---
-    s1 = syn[0]
-    if s1 != 0:
-        ok = True
-        for j in range(2, 2 * codec.t + 1):
-            if syn[j - 1] != gf.power(s1, j):
-                ok = False
-                break
-        if ok:
-            e = gf.int_to_alpha[s1]
-            return 1 << e
-
-    # --- bounded search (w32+ skips 4..t bit patterns for speed) ---
-    search_t = codec.t if codec.n <= 31 else min(codec.t, 3)
-    base = codec.encode(0)
-    for err_count in range(1, search_t + 1):
-        for positions in combinations(range(codec.n), err_count):
-            mask = sum(1 << p for p in positions)
-            if codec.syndrome_key(codec.syndromes_gf(base ^ mask)) == target:
-                return mask
-    return 0
+    """Locate error mask for any width: ROM hit, else exact BM + Chien (0 if uncorrectable)."""
+    key = codec.syndrome_key(syn)
+    if key == 0:
+        return 0
+    mask = _get_decode_table(codec.width).get(key, 0)
+    if mask:
+        return mask
+    return codec.error_mask(syn) or 0
 
 
 def build_syndrome_mask_table(width: int, max_errors: int | None = None) -> Dict[int, int]:
@@ -293,14 +595,25 @@ def build_syndrome_mask_table(width: int, max_errors: int | None = None) -> Dict
     table: Dict[int, int] = {}
     base = codec.encode(0)
 
+    bit_keys = codec.bit_syndrome_keys
+    base_key = codec.syndrome_key_of(base)
+
     for err_count in range(1, limit + 1):
         for positions in combinations(range(codec.n), err_count):
-            mask = sum(1 << p for p in positions)
-            syn = codec.syndromes_gf(base ^ mask)
-            if all(s == 0 for s in syn):
+            key = base_key
+            for p in positions:
+                key ^= bit_keys[p]
+            if key == 0:
                 continue
-            key = codec.syndrome_key(syn)
+            mask = sum(1 << p for p in positions)
             if key in table and table[key] != mask:
                 raise RuntimeError(f"syndrome collision w{width} key={key:#x}")
             table[key] = mask
     return table
+
+
+if __name__ == "__main__":
+    # Pre-build the shared ROM tables so benchmark / dataset workers only map them.
+    for _width, _limit in _TABLE_ERR_LIMIT.items():
+        _table = load_syndrome_mask_table(_width, _limit)
+        print(f"w{_width}: {len(_table)} syndromes -> {decode_table_path(_width, _limit)}")
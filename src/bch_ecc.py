@@ -169,15 +169,13 @@ class BCHECC(ECCBase):
                 # If codeword is smaller (leading zeros), we need to pad correctly.
                 codeword_bytes = codeword.to_bytes(total_len, 'big')
                 
-                decoded_bytes_full = self.rs.decode(codeword_bytes)
+                decoded_msg = self.rs.decode(codeword_bytes)[0]
                 
-                decoded_data = int.from_bytes(decoded_bytes_full[0], 'big')
+                decoded_data = int.from_bytes(decoded_msg, 'big')
                 
-                # Determine if anything was corrected by re-encoding
-                if self.rs.encode(decoded_bytes_full[0]) != codeword_bytes:
-                    return decoded_data, 'corrected'
-                else:
-                    return decoded_data, 'corrected' # Treat clean as clean (success)
+                # Clean and repaired words are both a successful decode, so the
+                # result does not depend on whether anything was corrected
+                return decoded_data, 'corrected'
                     
             except Exception:
                 # Detection failed or uncorrectable
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Zero-copy plumbing for codecs built from inner codecs over packed sub-words.
+
+A FieldLayout fixes where each sub-word lives inside an outer word (bit
+offset and width, at most 64 bits each). It precomputes, per field, the
+64-bit limb it starts in, the shift within that limb and whether it spills
+into the next limb. Splitting a batch of outer words is then one limb
+conversion plus a gather and a shift over an (N, fields) uint64 matrix;
+joining is the reverse scatter. Words over 64 bits are converted to limbs
+once per batch, not once per field.
+
+batch_encode / batch_decode run an inner codec's batch kernels on every
+field of every word as one flat array, so an outer code over F sub-words
+costs a few vector passes instead of N * F scalar calls. Scalar split/join
+use the same tables for the one-word path.
+"""
+
+from __future__ import annotations
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from base_ecc import as_word_array
+
+_MASK64 = (1 << 64) - 1
+
+
+def to_limbs(words: np.ndarray, nbits: int) -> np.ndarray:
+    """(N,) words -> (N, ceil(nbits / 64)) uint64 limbs, least significant first."""
+    words = np.asarray(words)
+    nlimbs = max((nbits + 63) // 64, 1)
+    if words.dtype != object:
+        return words.astype(np.uint64).reshape(-1, 1)
+    limbs = np.empty((len(words), nlimbs), dtype=np.uint64)
+    for j in range(nlimbs):
+        limbs[:, j] = ((words >> (64 * j)) & _MASK64).astype(np.uint64)
+    return limbs
+
+
+def from_limbs(limbs: np.ndarray, nbits: int) -> np.ndarray:
+    """Inverse of to_limbs: uint64 words for nbits <= 64, object otherwise."""
+    if nbits <= 64:
+        return limbs[:, 0].copy()
+    out = limbs[:, 0].astype(object)
+    for j in range(1, limbs.shape[1]):
+        out = out | (limbs[:, j].astype(object) << (64 * j))
+    return out
+
+
+class FieldLayout:
+    """Fixed (offset, width) fields inside an outer word, with gather/scatter tables."""
+
+    def __init__(self, widths: Sequence[int], offsets: Sequence[int] = None) -> None:
+        self.widths = [int(w) for w in widths]
+        if any(not 1 <= w <= 64 for w in self.widths):
+            raise ValueError("field widths must be between 1 and 64 bits")
+        if offsets is None:
+            offsets = np.concatenate([[0], np.cumsum(self.widths)[:-1]]).astype(int).tolist()
+        self.offsets = [int(o) for o in offsets]
+        self.count = len(self.widths)
+        self.nbits = max((o + w for o, w in zip(self.offsets, self.widths)), default=0)
+        self.nlimbs = max((self.nbits + 63) // 64, 1)
+
+        self._masks_int = [(1 << w) - 1 for w in self.widths]
+        offsets_np = np.array(self.offsets, dtype=np.int64)
+        widths_np = np.array(self.widths, dtype=np.int64)
+        self._limb = offsets_np // 64
+        shift = offsets_np % 64
+        self._spill = shift + widths_np > 64
+        self._shift = shift.astype(np.uint64)
+        # Shift that brings the spilled high part down (unused where nothing spills)
+        self._spill_shift = np.where(self._spill, 64 - shift, 0).astype(np.uint64)
+        self._mask = np.array(self._masks_int, dtype=np.uint64)
+        # Fields whose low / spilled high part lands in each limb
+        self._low_fields = [np.flatnonzero(self._limb == j) for j in range(self.nlimbs)]
+        self._high_fields = [np.flatnonzero(self._spill & (self._limb + 1 == j)) for j in range(self.nlimbs)]
+
+    # --- scalar -------------------------------------------------------------
+
+    def split_int(self, word: int) -> List[int]:
+        return [(word >> o) & m for o, m in zip(self.offsets, self._masks_int)]
+
+    def join_int(self, fields: Sequence[int]) -> int:
+        word = 0
+        for value, o, m in zip(fields, self.offsets, self._masks_int):
+            word |= (value & m) << o
+        return word
+
+    # --- batch --------------------------------------------------------------
+
+    def split(self, words: np.ndarray) -> np.ndarray:
+        """(N,) outer words of any width -> (N, count) uint64 fields."""
+        limbs = to_limbs(as_word_array(words), self.nbits)
+        if limbs.shape[1] < self.nlimbs + 1:
+            limbs = np.hstack([limbs, np.zeros((len(limbs), self.nlimbs + 1 - limbs.shape[1]), dtype=np.uint64)])
+        fields = limbs[:, self._limb] >> self._shift
+        if self._spill.any():
+            high = limbs[:, self._limb + 1] << self._spill_shift
+            fields |= np.where(self._spill, high, np.uint64(0))
+        return fields & self._mask
+
+    def join(self, fields: np.ndarray) -> np.ndarray:
+        """(N, count) fields -> (N,) outer words (extra high bits of each field are dropped)."""
+        fields = np.asarray(fields, dtype=np.uint64) & self._mask
+        low = fields << self._shift
+        high = np.where(self._spill, fields >> self._spill_shift, np.uint64(0))
+        limbs = np.zeros((len(fields), self.nlimbs), dtype=np.uint64)
+        for j in range(self.nlimbs):
+            if len(self._low_fields[j]):
+                limbs[:, j] |= np.bitwise_or.reduce(low[:, self._low_fields[j]], axis=1)
+            if len(self._high_fields[j]):
+                limbs[:, j] |= np.bitwise_or.reduce(high[:, self._high_fields[j]], axis=1)
+        return from_limbs(limbs, self.nbits)
+
+
+def uniform_layout(width: int, count: int, start: int = 0) -> FieldLayout:
+    """``count`` back-to-back fields of ``width`` bits starting at bit ``start``."""
+    return FieldLayout([width] * count, [start + i * width for i in range(count)])
+
+
+def batch_encode(ecc, fields: np.ndarray) -> np.ndarray:
+    """Run ``ecc.encode_batch`` over every entry of an (N, F) field matrix."""
+    shape = fields.shape
+    out = ecc.encode_batch(np.ascontiguousarray(fields).reshape(-1))
+    return np.asarray(out).astype(np.uint64).reshape(shape)
+
+
+def batch_decode(ecc, fields: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Run ``ecc.decode_batch`` over every entry of an (N, F) field matrix."""
+    shape = fields.shape
+    data, codes = ecc.decode_batch(np.ascontiguousarray(fields).reshape(-1))
+    return np.asarray(data).astype(np.uint64).reshape(shape), np.asarray(codes).reshape(shape)
+
+
+def word_bit_length(words: np.ndarray) -> np.ndarray:
+    """int.bit_length of every word, as int64."""
+    words = np.asarray(words)
+    if words.dtype == object:
+        return np.array([int(w).bit_length() for w in words], dtype=np.int64)
+    x = words.astype(np.uint64)
+    length = np.zeros(len(x), dtype=np.int64)
+    for step in (32, 16, 8, 4, 2, 1):
+        high = x >> np.uint64(step)
+        move = high != 0
+        length += np.where(move, step, 0)
+        x = np.where(move, high, x)
+    return length + (x != 0)
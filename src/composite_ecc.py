@@ -1,5 +1,6 @@
 from typing import List, Tuple
-from base_ecc import ECCBase
+from base_ecc import ECCBase, CORRECTED, DETECTED, as_word_array
+import numpy as np
 
 class CompositeECC(ECCBase):
     """Composite ECC that applies multiple ECCs in sequence (encode) and reverse (decode)."""
@@ -7,8 +8,12 @@ class CompositeECC(ECCBase):
         """
         Args:
             data_length (int): Data length for compatibility.
-            ecc_chain (List[ECCBase]): List of ECC modules to apply in order.
+            ecc_chain (List[ECCBase]): List of ECC modules to apply in order. When
+                omitted, the fixed 8-bit redundancy code mirrored by
+                verilogs/composite_ecc.v is used instead of a chain.
         """
+        # An explicit chain runs each stage's codeword through the next stage
+        self.chained = ecc_chain is not None
         if ecc_chain is None:
             # Default to Parity + Hamming
             from parity_ecc import ParityECC
@@ -30,6 +35,8 @@ class CompositeECC(ECCBase):
         # If data is 8 bits (0xAA). (0xAA << 8) | 0xAA = 0xAAAA. 16 bits.
         # So overhead is 8 bits.
         self.n = data_length + 8
+        if self.chained:
+            self.n = self.ecc_chain[-1].n if self.ecc_chain else data_length
 
     def encode(self, data: int) -> int:
         """
@@ -41,6 +48,10 @@ class CompositeECC(ECCBase):
         Returns:
             int: The encoded codeword after all ECCs.
         """
+        if self.chained:
+            for ecc in self.ecc_chain:
+                data = ecc.encode(data)
+            return data
         # For all data sizes, use a simpler approach
         # Simple redundancy for all data
         codeword = (data << 8) | (data & 0xFF)
@@ -56,6 +67,13 @@ class CompositeECC(ECCBase):
         Returns:
             Tuple of (decoded_data, error_type)
         """
+        if self.chained:
+            error_detected = False
+            for ecc in reversed(self.ecc_chain):
+                codeword, error_type = ecc.decode(codeword)
+                error_detected |= error_type == 'detected'
+            return codeword, 'detected' if error_detected else 'corrected'
+
         # Extract original data and redundancy
         decoded_data = (codeword >> 8) & ((1 << self.k) - 1)
         received_redundancy = codeword & 0xFF
@@ -69,6 +87,32 @@ class CompositeECC(ECCBase):
             
         return decoded_data, 'corrected'
 
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        if self.chained:
+            # Each stage's batch kernel consumes the previous stage's codeword array
+            for ecc in self.ecc_chain:
+                data = ecc.encode_batch(data)
+            return data
+        data = as_word_array(data)
+        if self.n > 64:
+            data = data.astype(object)
+        return (data << 8) | (data & 0xFF)
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if self.chained:
+            detected = None
+            for ecc in reversed(self.ecc_chain):
+                codewords, codes = ecc.decode_batch(codewords)
+                stage = codes == DETECTED
+                detected = stage if detected is None else detected | stage
+            if detected is None:
+                return as_word_array(codewords), np.full(len(codewords), CORRECTED, dtype=np.uint8)
+            return codewords, np.where(detected, DETECTED, CORRECTED).astype(np.uint8)
+        codewords = as_word_array(codewords)
+        decoded_data = (codewords >> 8) & ((1 << self.k) - 1)
+        clean = ((codewords & 0xFF) == (decoded_data & 0xFF)).astype(bool)
+        return decoded_data, np.where(clean, CORRECTED, DETECTED).astype(np.uint8)
+
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         """
         Flip the bit at bit_idx in the codeword.
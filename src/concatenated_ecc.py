@@ -2,7 +2,9 @@ from typing import Tuple, List
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.base_ecc import ECCBase
+from src.base_ecc import ECCBase, CORRECTED, DETECTED, as_word_array
+from src.composite_codec import batch_decode, batch_encode, uniform_layout
+import numpy as np
 
 class ConcatenatedECC(ECCBase):
     """Concatenated ECC that chains multiple ECCs in sequence."""
@@ -44,26 +46,20 @@ class ConcatenatedECC(ECCBase):
         # 2. Each chunk -> inner_ecc -> outer_ecc
         # 3. N = num_chunks * outer_ecc.n
         num_chunks = (self.word_length + self.inner_word_length - 1) // self.inner_word_length
-        outer_n = self.outer_ecc.n if hasattr(self.outer_ecc, 'n') else 13 # Default Hamming(5) -> 9? No, Parity(4)->5. Hamming(5)->9.
-        self.n = num_chunks * outer_n
+        self.n = num_chunks * self.outer_ecc.n
+
+        # Sub-word and outer-codeword positions, fixed per instance
+        self.num_sub_words = num_chunks
+        self._data_layout = uniform_layout(self.inner_word_length, num_chunks)
+        self._outer_layout = uniform_layout(self.outer_ecc.n, num_chunks)
 
     def _pack_data(self, data: int) -> List[int]:
         """Pack data into sub-words for concatenated encoding."""
-        sub_words = []
-        mask = (1 << self.inner_word_length) - 1
-        
-        for i in range(0, self.word_length, self.inner_word_length):
-            sub_word = (data >> i) & mask
-            sub_words.append(sub_word)
-        
-        return sub_words
+        return self._data_layout.split_int(data)
 
     def _unpack_data(self, sub_words: List[int]) -> int:
         """Unpack sub-words back to original data."""
-        data = 0
-        for i, sub_word in enumerate(sub_words):
-            data |= (sub_word << (i * self.inner_word_length))
-        return data
+        return self._data_layout.join_int(sub_words)
 
     def encode(self, data: int) -> int:
         """
@@ -79,35 +75,10 @@ class ConcatenatedECC(ECCBase):
         if data >= (1 << self.word_length):
             data = data & ((1 << self.word_length) - 1)
         
-        # Pack data into sub-words that fit the inner ECC capacity
-        # For 8-bit data with 4-bit inner ECC, we need 2 sub-words
-        sub_words = []
-        for i in range(0, self.word_length, self.inner_word_length):
-            sub_word = (data >> i) & ((1 << self.inner_word_length) - 1)
-            sub_words.append(sub_word)
-        
-        # Encode each sub-word with inner ECC first
-        inner_encoded_words = []
-        for sub_word in sub_words:
-            inner_encoded = self.inner_ecc.encode(sub_word)
-            inner_encoded_words.append(inner_encoded)
-        
-        # Encode each inner codeword with outer ECC
-        outer_encoded_words = []
-        for inner_encoded in inner_encoded_words:
-            outer_encoded = self.outer_ecc.encode(inner_encoded)
-            outer_encoded_words.append(outer_encoded)
-        
-        # Pack encoded words into a single codeword
-        codeword = 0
-        bit_pos = 0
-        
-        for word in outer_encoded_words:
-            word_bits = self.outer_ecc.n if hasattr(self.outer_ecc, 'n') else 13
-            codeword |= (word << bit_pos)
-            bit_pos += word_bits
-        
-        return codeword
+        # Each sub-word goes through the inner ECC, then the outer ECC
+        outer_encoded_words = [self.outer_ecc.encode(self.inner_ecc.encode(sub_word))
+                               for sub_word in self._pack_data(data)]
+        return self._outer_layout.join_int(outer_encoded_words)
 
     def decode(self, codeword: int) -> Tuple[int, str]:
         """
@@ -119,49 +90,35 @@ class ConcatenatedECC(ECCBase):
         Returns:
             Tuple of (decoded_data, error_type)
         """
-        # Calculate how many sub-words we have
-        num_sub_words = (self.word_length + self.inner_word_length - 1) // self.inner_word_length
-        
-        # Extract outer encoded words
-        outer_encoded_words = []
-        bit_pos = 0
-        
-        for i in range(num_sub_words):
-            word_bits = self.outer_ecc.n if hasattr(self.outer_ecc, 'n') else 13
-            word = (codeword >> bit_pos) & ((1 << word_bits) - 1)
-            outer_encoded_words.append(word)
-            bit_pos += word_bits
-        
-        # Decode each sub-word
         decoded_sub_words = []
         error_detected = False
-        
-        for outer_encoded in outer_encoded_words:
-            # Decode outer ECC first
+        for outer_encoded in self._outer_layout.split_int(codeword):
+            # Decode outer ECC first, then inner ECC
             inner_encoded, outer_error = self.outer_ecc.decode(outer_encoded)
-            
-            # Decode inner ECC
             decoded_sub_word, inner_error = self.inner_ecc.decode(inner_encoded)
-            
             decoded_sub_words.append(decoded_sub_word)
-            
-            # Track errors
             if outer_error == 'detected' or inner_error == 'detected':
                 error_detected = True
         
-        # Unpack decoded sub-words back to original data
-        decoded_data = 0
-        for i, sub_word in enumerate(decoded_sub_words):
-            # Ensure sub_word fits within inner_word_length bits
-            sub_word = sub_word & ((1 << self.inner_word_length) - 1)
-            decoded_data |= (sub_word << (i * self.inner_word_length))
-        
-        # Determine error type
+        # Sub-words are masked to inner_word_length bits on the way back
+        decoded_data = self._unpack_data(decoded_sub_words)
         if error_detected:
             return decoded_data, 'detected'
         else:
             return decoded_data, 'corrected'
 
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        data = as_word_array(data) & ((1 << self.word_length) - 1)
+        inner = batch_encode(self.inner_ecc, self._data_layout.split(data))
+        return self._outer_layout.join(batch_encode(self.outer_ecc, inner))
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        inner, outer_codes = batch_decode(self.outer_ecc, self._outer_layout.split(codewords))
+        sub_words, inner_codes = batch_decode(self.inner_ecc, inner)
+        detected = ((outer_codes == DETECTED) | (inner_codes == DETECTED)).any(axis=1)
+        data = self._data_layout.join(sub_words)
+        return data, np.where(detected, DETECTED, CORRECTED).astype(np.uint8)
+
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         """
         Flip the bit at bit_idx in the codeword.
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Table-driven trellis and Viterbi decoder for rate-1/R feed-forward convolutional codes.
+
+State convention follows ConvolutionalCode: the register holds the last K
+input bits, next = ((state << 1) | bit) & (2^K - 1), and output j of a step is
+parity(next & g_j). Symbol bit j of a step is output j, and step t occupies
+codeword bits R*t .. R*t + R - 1.
+
+Each next state has exactly two predecessors, (next >> 1) and
+(next >> 1) | 2^(K-1), both driven by input bit next & 1. Add-compare-select
+therefore reduces to one gather, add and argmin per step, across states (and
+across frames in batch mode). Ties go to the smaller predecessor, and the
+final state to the smallest index, matching the original nested loops.
+Survivor decisions are packed one bit per state into a single integer per
+step (a uint64 column per frame in batch mode), and traceback reads the
+decoded bit as the LSB of each surviving state.
+
+viterbi_stream is the sliding-window form for unbounded streams, laid out
+the way a pipelined hardware decoder is: one ACS per received symbol, metrics
+renormalized against the best state every step, and a register-exchange
+survivor memory of traceback_depth bits per state. Each symbol after the
+first traceback_depth - 1 releases the bit decided traceback_depth steps
+earlier along the current best path (a fixed decision latency); memory stays
+O(states * traceback_depth) regardless of stream length. With a depth at
+least the stream length it reproduces viterbi() exactly.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Larger than any reachable path metric; unreachable states start here
+_UNREACHED = 1 << 40
+
+# Default traceback depth in multiples of the constraint length
+TRACEBACK_FACTOR = 5
+
+
+class Trellis:
+    """Next-state, output and predecessor tables for one (generators, K) code."""
+
+    def __init__(self, generators: Sequence[int], K: int) -> None:
+        self.generators = tuple(generators)
+        self.K = K
+        self.R = len(self.generators)
+        self.num_states = 1 << K
+        if self.num_states > 64:
+            raise ValueError("packed survivor memory holds at most 64 states")
+        mask = self.num_states - 1
+        S = self.num_states
+
+        # next_state[s][b], output[s][b] (R-bit symbol)
+        self.next_state = [[((s << 1) | b) & mask for b in (0, 1)] for s in range(S)]
+        self.output = [[self._symbol(self.next_state[s][b]) for b in (0, 1)] for s in range(S)]
+        # Predecessors of each next state in ascending order, and their branch symbols
+        self.prev = [((ns >> 1), (ns >> 1) | (1 << (K - 1))) for ns in range(S)]
+        self.prev_symbol = [tuple(self.output[p][ns & 1] for p in self.prev[ns]) for ns in range(S)]
+
+        num_symbols = 1 << self.R
+        # Hamming distance between a received symbol and every branch symbol
+        self.distance = [[bin(r ^ c).count('1') for c in range(num_symbols)] for r in range(num_symbols)]
+
+        self._prev_np = np.array(self.prev, dtype=np.intp)                    # (S, 2)
+        self._prev_symbol_np = np.array(self.prev_symbol, dtype=np.intp)      # (S, 2)
+        self._distance_np = np.array(self.distance, dtype=np.int64)           # (2^R, 2^R)
+        self._next_np = np.array(self.next_state, dtype=np.intp)              # (S, 2)
+        self._output_np = np.array(self.output, dtype=np.int64)               # (S, 2)
+        self._state_bits = np.uint64(1) << np.arange(S, dtype=np.uint64)
+
+    def _symbol(self, state: int) -> int:
+        sym = 0
+        for j, g in enumerate(self.generators):
+            sym |= (bin(state & g).count('1') & 1) << j
+        return sym
+
+    # --- encode -------------------------------------------------------------
+
+    def encode_symbols(self, bits: Sequence[int]) -> List[int]:
+        state = 0
+        out = []
+        for b in bits:
+            out.append(self.output[state][b])
+            state = self.next_state[state][b]
+        return out
+
+    def encode_symbols_batch(self, bits: np.ndarray) -> np.ndarray:
+        """(B, T) input bits -> (B, T) output symbols."""
+        bits = np.asarray(bits, dtype=np.intp)
+        state = np.zeros(bits.shape[0], dtype=np.intp)
+        out = np.empty(bits.shape, dtype=np.int64)
+        for t in range(bits.shape[1]):
+            out[:, t] = self._output_np[state, bits[:, t]]
+            state = self._next_np[state, bits[:, t]]
+        return out
+
+    # --- decode -------------------------------------------------------------
+
+    def viterbi(self, symbols: Sequence[int]) -> List[int]:
+        """Hard-decision Viterbi over received symbols (one per step); returns the input bits."""
+        S = self.num_states
+        prev, prev_symbol, distance = self.prev, self.prev_symbol, self.distance
+        metric = [0] + [_UNREACHED] * (S - 1)
+        survivors = []
+        for r in symbols:
+            dist = distance[r]
+            new = [0] * S
+            decisions = 0
+            for ns in range(S):
+                p0, p1 = prev[ns]
+                c0, c1 = prev_symbol[ns]
+                m0 = metric[p0] + dist[c0]
+                m1 = metric[p1] + dist[c1]
+                if m1 < m0:
+                    new[ns] = m1
+                    decisions |= 1 << ns
+                else:
+                    new[ns] = m0
+            metric = new
+            survivors.append(decisions)
+
+        state = metric.index(min(metric))
+        bits = [0] * len(survivors)
+        for t in range(len(survivors) - 1, -1, -1):
+            bits[t] = state & 1
+            state = prev[state][(survivors[t] >> state) & 1]
+        return bits
+
+    def viterbi_stream(self, symbols: Iterable[int],
+                       traceback_depth: Optional[int] = None) -> Iterator[int]:
+        """
+        Sliding-window Viterbi over an unbounded symbol stream.
+
+        Args:
+            symbols: Received symbols, one per step (consumed lazily).
+            traceback_depth: Decision delay D in steps; defaults to
+                TRACEBACK_FACTOR * K.
+
+        Yields:
+            Decoded input bits in order: one per symbol once D symbols have
+            been seen, then the last min(steps, D - 1) bits when the stream ends.
+        """
+        depth = traceback_depth if traceback_depth is not None else TRACEBACK_FACTOR * self.K
+        if depth < 1:
+            raise ValueError("traceback_depth must be at least 1")
+        S = self.num_states
+        prev, prev_symbol, distance = self.prev, self.prev_symbol, self.distance
+        window = (1 << depth) - 1
+        oldest = depth - 1
+        metric = [0] + [_UNREACHED] * (S - 1)
+        paths = [0] * S
+        steps = 0
+        for r in symbols:
+            dist = distance[r]
+            new_metric = [0] * S
+            new_paths = [0] * S
+            for ns in range(S):
+                p0, p1 = prev[ns]
+                c0, c1 = prev_symbol[ns]
+                m0 = metric[p0] + dist[c0]
+                m1 = metric[p1] + dist[c1]
+                if m1 < m0:
+                    new_metric[ns] = m1
+                    new_paths[ns] = ((paths[p1] << 1) | (ns & 1)) & window
+                else:
+                    new_metric[ns] = m0
+                    new_paths[ns] = ((paths[p0] << 1) | (ns & 1)) & window
+            best = min(new_metric)
+            metric = [m - best for m in new_metric]
+            paths = new_paths
+            steps += 1
+            if steps >= depth:
+                yield (paths[metric.index(0)] >> oldest) & 1
+
+        survivor = paths[metric.index(0)]
+        for i in range(min(steps, depth - 1) - 1, -1, -1):
+            yield (survivor >> i) & 1
+
+    def viterbi_batch(self, symbols: np.ndarray) -> np.ndarray:
+        """
+        Viterbi decode of many frames in lock step.
+
+        Args:
+            symbols: (B, T) received symbols.
+
+        Returns:
+            (B, T) uint8 decoded input bits.
+        """
+        symbols = np.asarray(symbols, dtype=np.intp)
+        count, steps = symbols.shape
+        S = self.num_states
+        metric = np.full((count, S), _UNREACHED, dtype=np.int64)
+        metric[:, 0] = 0
+        survivors = np.empty((steps, count), dtype=np.uint64)
+        for t in range(steps):
+            # (B, S, 2): metric of each predecessor plus its branch distance
+            cand = metric[:, self._prev_np] + self._distance_np[symbols[:, t]][:, self._prev_symbol_np]
+            take1 = cand[..., 1] < cand[..., 0]
+            metric = np.where(take1, cand[..., 1], cand[..., 0])
+            survivors[t] = (take1.astype(np.uint64) * self._state_bits).sum(axis=1, dtype=np.uint64)
+
+        state = metric.argmin(axis=1)
+        bits = np.empty((count, steps), dtype=np.uint8)
+        for t in range(steps - 1, -1, -1):
+            bits[:, t] = state & 1
+            choice = ((survivors[t] >> state.astype(np.uint64)) & np.uint64(1)).astype(np.intp)
+            state = self._prev_np[state, choice]
+        return bits
+
+
+_TRELLISES: Dict[Tuple[Tuple[int, ...], int], Trellis] = {}
+
+
+def get_trellis(generators: Sequence[int], K: int) -> Trellis:
+    """Shared trellis tables per (generators, K)."""
+    key = (tuple(generators), K)
+    if key not in _TRELLISES:
+        _TRELLISES[key] = Trellis(*key)
+    return _TRELLISES[key]
@@ -1,5 +1,7 @@
-from typing import List, Tuple
-from base_ecc import ECCBase
+from typing import Iterable, Iterator, List, Optional, Tuple
+from base_ecc import ECCBase, CORRECTED, pack_bits, unpack_bits
+from convolutional_codec import get_trellis
+import numpy as np
 
 class ConvolutionalCode:
     """Simple (2,1,2) Convolutional Code ECC implementation.
@@ -10,6 +12,7 @@ class ConvolutionalCode:
         self.g1 = 0b11  # Generator 1: 3 (octal)
         self.g2 = 0b10  # Generator 2: 2 (octal)
         self.K = 2      # Constraint length
+        self.trellis = get_trellis((self.g1, self.g2), self.K)
 
     def encode(self, bits: List[int]) -> List[int]:
         """Encodes a list of bits using the convolutional code.
@@ -19,13 +22,9 @@ class ConvolutionalCode:
         Returns:
             Encoded list of bits (rate 1/2).
         """
-        state = 0
         out = []
-        for bit in bits:
-            state = ((state << 1) | bit) & ((1 << self.K) - 1)
-            o1 = self._parity(state & self.g1)
-            o2 = self._parity(state & self.g2)
-            out.extend([o1, o2])
+        for sym in self.trellis.encode_symbols(bits):
+            out.extend([sym & 1, sym >> 1])
         return out
 
     def _parity(self, x: int) -> int:
@@ -34,6 +33,8 @@ class ConvolutionalCode:
     def viterbi_decode(self, codeword: List[int]) -> List[int]:
         """Decodes a codeword using Viterbi algorithm.
 
+        Runs on the shared table-driven trellis (see convolutional_codec).
+
         Args:
             codeword: Encoded list of bits (length must be even).
         Returns:
@@ -41,60 +42,23 @@ class ConvolutionalCode:
         """
         if len(codeword) % 2 != 0:
             raise ValueError("Codeword length must be even.")
-        n = len(codeword) // 2
-        
-        # Viterbi algorithm implementation
-        num_states = 1 << self.K
-        trellis = [[float('inf')] * num_states for _ in range(n + 1)]
-        backpointer = [[0] * num_states for _ in range(n + 1)]
-        
-        # Initialize start state
-        trellis[0][0] = 0
-        
-        # Forward pass
-        for t in range(n):
-            for state in range(num_states):
-                if trellis[t][state] == float('inf'):
-                    continue
-                
-                # Try both possible input bits
-                for input_bit in [0, 1]:
-                    # Calculate next state
-                    next_state = ((state << 1) | input_bit) & ((1 << self.K) - 1)
-                    
-                    # Calculate expected output
-                    o1 = self._parity(next_state & self.g1)
-                    o2 = self._parity(next_state & self.g2)
-                    expected_output = [o1, o2]
-                    
-                    # Calculate received output
-                    received_output = codeword[2*t:2*t+2]
-                    
-                    # Calculate branch metric (Hamming distance)
-                    branch_metric = sum(1 for a, b in zip(expected_output, received_output) if a != b)
-                    
-                    # Update trellis
-                    new_cost = trellis[t][state] + branch_metric
-                    if new_cost < trellis[t + 1][next_state]:
-                        trellis[t + 1][next_state] = new_cost
-                        backpointer[t + 1][next_state] = state
-        
-        # Backward pass to find best path
-        # Prefer state 0 if costs are equal, or just pick min
-        best_state = min(range(num_states), key=lambda s: trellis[n][s])
-        decoded_bits = []
-        
-        for t in range(n, 0, -1):
-            prev_state = backpointer[t][best_state]
-            # Extract input bit from state transition
-            # State is ((prev_state << 1) | input_bit) & mask
-            # So input_bit is the LSB of best_state
-            input_bit = best_state & 1
-            decoded_bits.append(input_bit)
-            best_state = prev_state
-        
-        # Reverse to get correct order
-        return decoded_bits[::-1]
+        symbols = [codeword[2 * t] | (codeword[2 * t + 1] << 1) for t in range(len(codeword) // 2)]
+        return self.trellis.viterbi(symbols)
+
+    def viterbi_stream(self, bits: Iterable[int], traceback_depth: Optional[int] = None) -> Iterator[int]:
+        """Decodes an unbounded bit stream with a sliding-window Viterbi.
+
+        Args:
+            bits: Received bits (o1, o2 per step), consumed lazily; a trailing
+                unpaired bit is ignored.
+            traceback_depth: Decision delay in steps (default 5 * K). Memory is
+                bounded by num_states * traceback_depth bits.
+        Yields:
+            Decoded bits, traceback_depth steps behind the input.
+        """
+        it = iter(bits)
+        symbols = (o1 | (o2 << 1) for o1, o2 in zip(it, it))
+        return self.trellis.viterbi_stream(symbols, traceback_depth)
 
 class ConvolutionalECC(ECCBase):
     """Convolutional ECC implementation."""
@@ -177,4 +141,19 @@ class ConvolutionalECC(ECCBase):
             
         except Exception:
             # If decoding fails, error detected
-            return codeword, 'detected' 
\ No newline at end of file
+            return codeword, 'detected'
+
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        bits = unpack_bits(data, self.data_length)
+        # Tail bits flush the encoder to state 0
+        bits = np.hstack([bits, np.zeros((len(bits), 2), dtype=np.uint8)])
+        symbols = self.conv.trellis.encode_symbols_batch(bits)
+        codeword_bits = np.stack([symbols & 1, symbols >> 1], axis=2).reshape(len(bits), self.n)
+        return pack_bits(codeword_bits)
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Viterbi-decode all codewords in lock step; every frame decodes as 'corrected'."""
+        bits = unpack_bits(codewords, self.n).astype(np.intp).reshape(len(codewords), -1, 2)
+        symbols = bits[:, :, 0] | (bits[:, :, 1] << 1)
+        decoded = self.conv.trellis.viterbi_batch(symbols)[:, :self.data_length]
+        return pack_bits(decoded), np.full(len(decoded), CORRECTED, dtype=np.uint8)
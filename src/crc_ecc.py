@@ -1,5 +1,10 @@
 from typing import List, Tuple
-from base_ecc import ECCBase
+import numpy as np
+from base_ecc import ECCBase, CORRECTED, DETECTED, as_word_array, word_dtype
+from crc_codec import get_engine
+
+# Bit-reversal of a CRC byte: CRCECC stores the CRC MSB-first above the data bits
+_REVERSE8 = np.array([int(f"{x:08b}"[::-1], 2) for x in range(256)], dtype=np.uint8)
 
 class CRC8:
     """CRC-8 ECC implementation (polynomial x^8 + x^2 + x + 1, 0x07).
@@ -15,6 +20,7 @@ class CRC8:
         """
         self.poly = poly
         self.init = init
+        self.engine = get_engine(poly, init)
 
     def compute(self, data: List[int]) -> int:
         """Computes the CRC-8 value for the given data bits.
@@ -24,15 +30,7 @@ class CRC8:
         Returns:
             CRC-8 value as integer (8 bits).
         """
-        crc = self.init
-        for bit in data:
-            crc ^= (bit << 7)
-            for _ in range(8):
-                if crc & 0x80:
-                    crc = ((crc << 1) ^ self.poly) & 0xFF
-                else:
-                    crc = (crc << 1) & 0xFF
-        return crc
+        return self.engine.compute_bits(data)
 
     def encode(self, data: List[int]) -> List[int]:
         """Appends CRC-8 to the data bits.
@@ -92,18 +90,9 @@ class CRCECC(ECCBase):
         Returns:
             Encoded codeword as integer
         """
-        # Convert data to bit list with proper length
-        data_bits = [(data >> i) & 1 for i in range(self.data_length)]
-        
-        # Encode with CRC
-        codeword_bits = self.crc.encode(data_bits)
-        
-        # Convert back to integer
-        codeword = 0
-        for i, bit in enumerate(codeword_bits):
-            codeword |= (bit << i)
-            
-        return codeword
+        data &= (1 << self.data_length) - 1
+        crc = self.crc.engine.compute(data, self.data_length)
+        return data | (int(_REVERSE8[crc]) << self.data_length)
     
     def _calculate_crc(self, data: int) -> int:
         """
@@ -115,11 +104,7 @@ class CRCECC(ECCBase):
         Returns:
             CRC value
         """
-        # Convert data to bit list
-        data_bits = [(data >> i) & 1 for i in range(data.bit_length() or 1)]
-        
-        # Calculate CRC
-        return self.crc.compute(data_bits)
+        return self.crc.engine.compute(data, data.bit_length() or 1)
     
     def decode(self, codeword: int) -> Tuple[int, str]:
         """
@@ -131,28 +116,44 @@ class CRCECC(ECCBase):
         Returns:
             Tuple of (decoded_data, error_type)
         """
-        try:
-            # Calculate expected codeword length: data_length + CRC_bits
-            expected_codeword_length = self.data_length + 8  # Assuming 8-bit CRC
-            
-            # Convert to bit list with proper length
-            codeword_bits = [(codeword >> i) & 1 for i in range(expected_codeword_length)]
+        data = codeword & ((1 << self.data_length) - 1)
+        received = (codeword >> self.data_length) & 0xFF
+        if int(_REVERSE8[self.crc.engine.compute(data, self.data_length)]) == received:
+            return data, 'corrected'
+        # CRC check failed - error detected
+        return codeword, 'detected'
+
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        """
+        Encode an array of data words using CRC.
+        
+        Args:
+            data: 1-D array of data words
             
-            # Check CRC validity
-            if self.crc.check(codeword_bits):
-                # Extract data bits (all except last 8 CRC bits)
-                data_bits = codeword_bits[:-8]
-                
-                # Convert back to integer
-                decoded_data = 0
-                for i, bit in enumerate(data_bits):
-                    decoded_data |= (bit << i)
-                    
-                return decoded_data, 'corrected'
-            else:
-                # CRC check failed - error detected
-                return codeword, 'detected'
+        Returns:
+            Array of codewords
+        """
+        data = as_word_array(as_word_array(data) & ((1 << self.data_length) - 1), self.data_length)
+        crc = _REVERSE8[self.crc.engine.compute_batch(data, self.data_length)]
+        dtype = word_dtype(self.n)
+        return data.astype(dtype) | (crc.astype(np.uint64).astype(dtype) << self.data_length)
+
+    def decode_batch(self, codewords: np.ndarray):
+        """
+        Decode an array of CRC codewords.
+        
+        Args:
+            codewords: 1-D array of codewords
             
-        except Exception:
-            # If decoding fails, error detected
-            return codeword, 'detected' 
\ No newline at end of file
+        Returns:
+            Tuple of (decoded_data, error_codes)
+        """
+        codewords = as_word_array(codewords)
+        data = as_word_array(codewords & ((1 << self.data_length) - 1), self.data_length)
+        received = ((codewords >> self.data_length) & 0xFF).astype(np.uint8)
+        ok = _REVERSE8[self.crc.engine.compute_batch(data, self.data_length)] == received
+        if codewords.dtype == object:
+            data = data.astype(object)
+        decoded = np.where(ok, data, codewords)
+        codes = np.where(ok, CORRECTED, DETECTED).astype(np.uint8)
+        return decoded, codes
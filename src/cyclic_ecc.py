@@ -1,22 +1,61 @@
-from typing import Tuple, List, Optional
-from base_ecc import ECCBase
+import warnings
+from typing import Dict, Tuple, List, Optional
+from base_ecc import ECCBase, CORRECTED, DETECTED
+from gf2x import get_poly_mod
 import numpy as np
 
+# Largest parity degree used by default; wider n - k requests are shortened
+# to this degree, as the RTL does for DATA_WIDTH >= 32
+CYCLIC_MAX_PARITY = 32
+
+# Default generator per parity degree (Hamming, CRC-4, CRC-8/ATM, CCITT, CRC-32)
+_STANDARD_GENERATORS = {3: 0b1011, 4: 0b10011, 5: 0b100101, 8: 0x107, 16: 0x11021, 32: 0x104C11DB7}
+
+
+def _separates_single_errors(poly: int, n: int) -> bool:
+    """True if x^0 .. x^(n-1) have distinct remainders mod poly (x^j != 1 for 0 < j < n)."""
+    if not poly & 1:
+        return False
+    degree = poly.bit_length() - 1
+    state = 1
+    for _ in range(1, n):
+        state <<= 1
+        if state >> degree:
+            state ^= poly
+        if state == 1:
+            return False
+    return True
+
+
+def default_generator(n: int, degree: int) -> int:
+    """Standard generator of the given degree, else the smallest one whose period covers n."""
+    standard = _STANDARD_GENERATORS.get(degree)
+    if standard is not None and _separates_single_errors(standard, n):
+        return standard
+    for low in range(1, 1 << degree, 2):
+        poly = (1 << degree) | low
+        if _separates_single_errors(poly, n):
+            return poly
+    raise ValueError(f"no degree-{degree} generator separates single errors over n={n}")
+
+
 class CyclicECC(ECCBase):
     """
     General Cyclic Code ECC implementation.
     Supports different generator polynomials and field sizes.
     """
     
-    def __init__(self, n: int = 15, k: int = 7, generator_poly: int = None, 
+    def __init__(self, n: Optional[int] = None, k: int = 7, generator_poly: int = None, 
                  field_size: int = 2, data_length: int = None):
         """
         Initialize Cyclic ECC.
         
         Args:
-            n: Codeword length
+            n: Codeword length (default 15, or 2 * k when k >= 15)
             k: Data length
-            generator_poly: Generator polynomial (if None, uses default)
+            generator_poly: Generator polynomial (if None, one of degree n - k whose
+                period covers n; n is shortened to k + CYCLIC_MAX_PARITY if wider,
+                with a warning when n was given explicitly)
             field_size: Field size (2 for binary, 4 for GF(4), etc.)
             data_length: Data length for compatibility
         """
@@ -25,119 +64,66 @@ class CyclicECC(ECCBase):
         else:
             self.k = k
             
-        self.n = n
+        self.n = n if n is not None else (15 if self.k < 15 else 2 * self.k)
         self.field_size = field_size
         
         # Ensure n >= k and adjust if necessary
         if self.n < self.k:
             self.n = self.k * 2
+        # Codeword length before any shortening, reported by get_cyclic_info()
+        self.requested_n = self.n
         
         # Set generator polynomial
         if generator_poly is None:
-            # Default generator polynomials for common cyclic codes
-            if self.n == 7 and self.k == 4:
-                self.generator_poly = 0b1011  # x^3 + x + 1 (Hamming)
-            elif self.n == 15 and self.k == 7:
-                self.generator_poly = 0b10011  # x^4 + x + 1 (BCH)
-            elif self.n == 31 and self.k == 16:
-                self.generator_poly = 0b100101  # x^5 + x^2 + 1
-            else:
-                # Default to a simple polynomial
-                self.generator_poly = 0b1011
+            # Degree n - k, so every codeword bit has its own single-error syndrome
+            if self.n == self.k:
+                raise ValueError("a cyclic code needs n > k")
+            if self.n > self.k + CYCLIC_MAX_PARITY:
+                self.n = self.k + CYCLIC_MAX_PARITY
+                if n is not None:
+                    warnings.warn(f"CyclicECC: n={self.requested_n} needs a degree-{self.requested_n - self.k} "
+                                  f"generator; shortened to n={self.n}")
+            self.generator_poly = default_generator(self.n, self.n - self.k)
         else:
             self.generator_poly = generator_poly
         
-        # Calculate parity check polynomial
-        self.parity_check_poly = self._calculate_parity_check_poly()
-        
-        # Generate encoding and decoding matrices
+        # Table-driven remainder mod g(x); syndrome of a word is word mod g(x)
+        self.poly_mod = get_poly_mod(self.generator_poly)
+        # Syndrome -> single-bit error position, only for syndromes owned by
+        # exactly one position (shared ones are detect only)
+        owners: Dict[int, List[int]] = {}
+        for i in range(self.n):
+            owners.setdefault(self.poly_mod.x_pow_mod(i), []).append(i)
+        self._single_error = {syndrome: positions[0] for syndrome, positions in owners.items()
+                              if len(positions) == 1 and syndrome != 0}
+        # Sorted copy for batch lookups
+        self._error_syndromes = np.array(sorted(self._single_error), dtype=np.uint64)
+        self._error_positions = np.array([self._single_error[sy] for sy in sorted(self._single_error)],
+                                         dtype=np.int64)
+
+        # Encoding and parity check matrices derived from g(x)
         self.G = self._generate_generator_matrix()
         self.H = self._generate_parity_check_matrix()
     
-    def _calculate_parity_check_poly(self) -> int:
-        """Calculate parity check polynomial h(x) where g(x) * h(x) = x^n - 1."""
-        # For simplicity, use a basic approach
-        # In practice, this would involve polynomial division
-        return 0b111  # Default parity check polynomial
-    
     def _generate_generator_matrix(self) -> np.ndarray:
-        """Generate systematic generator matrix."""
+        """Systematic generator matrix: row i is the codeword of data bit i (column j = bit j)."""
         G = np.zeros((self.k, self.n), dtype=int)
-        
-        # Systematic form: identity matrix for data part
-        for i in range(self.k):
-            G[i, i] = 1
-        
-        # Calculate parity part using polynomial division
         for i in range(self.k):
-            for j in range(self.k, self.n):
-                # Simple parity pattern based on generator polynomial
-                if (i + j - self.k) % 2 == 0:
-                    G[i, j] = 1
-        
+            codeword = self.encode(1 << i)
+            for j in range(self.n):
+                G[i, j] = (codeword >> j) & 1
         return G
     
     def _generate_parity_check_matrix(self) -> np.ndarray:
-        """Generate parity check matrix."""
+        """Parity check matrix: column j holds x^j mod g(x), so H @ c is the syndrome of c."""
         m = self.n - self.k
         H = np.zeros((m, self.n), dtype=int)
-        
-        # Create parity check matrix that satisfies G * H^T = 0
-        for i in range(m):
-            for j in range(self.n):
-                if j >= self.k:  # Parity bits
-                    if i == (j - self.k):
-                        H[i, j] = 1
-                else:  # Data bits
-                    if (i + j) % 2 == 0:
-                        H[i, j] = 1
-        
+        for j in range(self.n):
+            syndrome = self.poly_mod.x_pow_mod(j)
+            for i in range(m):
+                H[i, j] = (syndrome >> i) & 1
         return H
     
-    def _polynomial_division(self, dividend: int, divisor: int) -> Tuple[int, int]:
-        """
-        Perform polynomial division.
-        
-        Args:
-            dividend: Dividend polynomial
-            divisor: Divisor polynomial
-            
-        Returns:
-            Tuple of (quotient, remainder)
-        """
-        if divisor == 0:
-            return 0, dividend
-        
-        # Add timeout protection
-        max_iterations = 100
-        iterations = 0
-        
-        # Convert to binary representation
-        dividend_bits = bin(dividend)[2:]
-        divisor_bits = bin(divisor)[2:]
-        
-        # Perform polynomial division
-        quotient = 0
-        remainder = dividend
-        
-        while remainder >= divisor and iterations < max_iterations:
-            iterations += 1
-            
-            # Find the highest power
-            remainder_bits = bin(remainder)[2:]
-            divisor_bits = bin(divisor)[2:]
-            
-            # Shift divisor to align with remainder
-            shift = len(remainder_bits) - len(divisor_bits)
-            if shift < 0:
-                break
-            
-            shifted_divisor = divisor << shift
-            remainder ^= shifted_divisor
-            quotient |= (1 << shift)
-        
-        return quotient, remainder
-    
     def encode(self, data: int) -> int:
         """
         Encode data using cyclic code.
@@ -148,27 +134,13 @@ class CyclicECC(ECCBase):
         Returns:
             Encoded codeword
         """
-        try:
-            # Ensure data fits within k bits
-            if data >= (1 << self.k):
-                data = data & ((1 << self.k) - 1)
-            
-            # Convert data to polynomial
-            data_poly = data << (self.n - self.k)  # Shift left by (n-k) positions
-            
-            # Perform polynomial division to get remainder
-            _, remainder = self._polynomial_division(data_poly, self.generator_poly)
-            
-            # Systematic codeword: data followed by remainder
-            codeword = data_poly | remainder
-            
-            return codeword
-            
-        except Exception as e:
-            # Fallback: simple encoding without polynomial division
-            if data >= (1 << self.k):
-                data = data & ((1 << self.k) - 1)
-            return data << (self.n - self.k)
+        # Ensure data fits within k bits
+        if data >= (1 << self.k):
+            data = data & ((1 << self.k) - 1)
+        
+        # Systematic codeword: data shifted left by (n-k) positions, then remainder mod g(x)
+        data_poly = data << (self.n - self.k)
+        return data_poly | self.poly_mod.mod(data_poly, self.n)
     
     def decode(self, codeword: int) -> Tuple[int, str]:
         """
@@ -180,51 +152,18 @@ class CyclicECC(ECCBase):
         Returns:
             Tuple of (decoded_data, error_type)
         """
-        try:
-            # Simple fallback: just extract data bits
-            if self.n <= 0 or self.k <= 0:
-                return codeword, 'detected'
-            
-            # Extract data bits (first k bits from the right)
-            # The data is in the most significant k bits
-            decoded_data = (codeword >> (self.n - self.k)) & ((1 << self.k) - 1)
-            
-            # For the simplified fallback, just return the data
-            # This matches the encoding process where data is shifted left
-            return decoded_data, 'corrected'
-                    
-        except Exception as e:
-            # If any error occurs, try simple data extraction
-            try:
-                decoded_data = (codeword >> (self.n - self.k)) & ((1 << self.k) - 1)
-                return decoded_data, 'detected'
-            except:
-                return codeword, 'detected'
+        if self.n <= 0 or self.k <= 0:
+            return codeword, 'detected'
+
+        corrected, success = self._correct_errors(codeword, self._calculate_syndrome(codeword))
+        
+        # The data is in the most significant k bits
+        decoded_data = (corrected >> (self.n - self.k)) & ((1 << self.k) - 1)
+        return decoded_data, 'corrected' if success else 'detected'
     
     def _calculate_syndrome(self, codeword: int) -> int:
-        """Calculate syndrome for error detection."""
-        # Use parity check matrix
-        syndrome = 0
-        m = self.n - self.k
-        
-        # Ensure matrix dimensions are correct
-        if self.H.shape != (m, self.n):
-            # Fallback to simple parity check
-            return codeword & ((1 << m) - 1)
-        
-        # Add bounds checking
-        try:
-            for i in range(m):
-                parity = 0
-                for j in range(self.n):
-                    if ((codeword >> j) & 1) and self.H[i, j]:
-                        parity ^= 1
-                syndrome |= (parity << i)
-        except IndexError as e:
-            # If matrix indexing fails, use fallback
-            return codeword & ((1 << m) - 1)
-        
-        return syndrome
+        """Calculate syndrome (codeword mod g(x)) for error detection."""
+        return self.poly_mod.mod(codeword, self.n)
     
     def _correct_errors(self, codeword: int, syndrome: int) -> Tuple[int, bool]:
         """
@@ -237,19 +176,64 @@ class CyclicECC(ECCBase):
         Returns:
             Tuple of (corrected_codeword, success)
         """
-        # Simple error correction for single-bit errors
         if syndrome == 0:
             return codeword, True
         
-        # Try to find error position
-        for i in range(self.n):
-            test_codeword = codeword ^ (1 << i)
-            test_syndrome = self._calculate_syndrome(test_codeword)
-            if test_syndrome == 0:
-                return test_codeword, True
+        # Single-bit error with an unambiguous syndrome
+        position = self._single_error.get(syndrome, -1)
+        if position >= 0:
+            return codeword ^ (1 << position), True
         
         # Could not correct
         return codeword, False
+
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        """
+        Encode a batch of data words.
+        
+        Args:
+            data: Array of input data words (uint64, or object for n > 64)
+            
+        Returns:
+            Array of codewords, same layout as encode()
+        """
+        data = np.asarray(data)
+        shift = self.n - self.k
+        if self.n <= 64:
+            data_poly = (data.astype(np.uint64) & np.uint64((1 << self.k) - 1)) << np.uint64(shift)
+        else:
+            data_poly = (data.astype(object) & ((1 << self.k) - 1)) << shift
+        remainder = self.poly_mod.mod_batch(data_poly, self.n)
+        return data_poly | (remainder if self.n <= 64 else remainder.astype(object))
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Decode a batch of codewords.
+        
+        Args:
+            codewords: Array of received codewords
+            
+        Returns:
+            Tuple of (decoded_data, codes) with CORRECTED / DETECTED per word
+        """
+        codewords = np.asarray(codewords)
+        syndrome = self.poly_mod.mod_batch(codewords, self.n).astype(np.uint64)
+        slot = np.searchsorted(self._error_syndromes, syndrome).clip(0, max(len(self._error_syndromes) - 1, 0))
+        if len(self._error_syndromes):
+            fixable = self._error_syndromes[slot] == syndrome
+            position = np.where(fixable, self._error_positions[slot], -1)
+        else:
+            fixable = np.zeros(len(syndrome), dtype=bool)
+            position = np.full(len(syndrome), -1, dtype=np.int64)
+        codes = np.where((syndrome == 0) | fixable, CORRECTED, DETECTED).astype(np.uint8)
+        if self.n <= 64:
+            words = codewords.astype(np.uint64)
+            flips = np.where(fixable, np.uint64(1) << position.clip(0).astype(np.uint64), np.uint64(0))
+            data = ((words ^ flips) >> np.uint64(self.n - self.k)) & np.uint64((1 << self.k) - 1)
+        else:
+            flips = np.array([1 << int(p) if p >= 0 else 0 for p in position], dtype=object)
+            data = ((codewords.astype(object) ^ flips) >> (self.n - self.k)) & ((1 << self.k) - 1)
+        return data, codes
     
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         """
@@ -269,6 +253,7 @@ class CyclicECC(ECCBase):
         return {
             'n': self.n,
             'k': self.k,
+            'shortened_from': self.requested_n if self.requested_n != self.n else None,
             'generator_polynomial': bin(self.generator_poly),
             'field_size': self.field_size,
             'code_rate': self.k / self.n,
@@ -1,19 +1,61 @@
-from typing import Tuple, List
+from math import gcd
+from typing import Dict, List, Tuple
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.base_ecc import ECCBase
+from src.base_ecc import ECCBase, CORRECTED, DETECTED
+from src.gf2x import get_poly_mod
+import numpy as np
+
+# (generator_poly, burst_length, k) -> syndrome-indexed data correction masks
+_BURST_TABLES: Dict[Tuple[int, int, int], List[int]] = {}
+
+
+def _period(poly: int) -> int:
+    """Smallest e > 0 with x^e = 1 mod poly (poly with a non-zero constant term)."""
+    degree = poly.bit_length() - 1
+    state = 1
+    for e in range(1, 1 << degree):
+        state <<= 1
+        if state >> degree:
+            state ^= poly
+        if state == 1:
+            return e
+    return 0
+
+
+def fire_generator(burst_length: int, data_bits: int) -> int:
+    """
+    Fire code generator g(x) = (x^(2b-1) + 1) p(x) correcting bursts of b bits.
+
+    p(x) is the first primitive polynomial of degree >= b whose period e does not
+    divide 2b - 1 and with lcm(2b - 1, e), the code's maximum length, covering
+    data_bits plus the parity.
+    """
+    c = 2 * burst_length - 1
+    degree = burst_length
+    while True:
+        for low in range(1, 1 << degree, 2):
+            poly = (1 << degree) | low
+            e = _period(poly)
+            if e == (1 << degree) - 1 and e % c and c * e // gcd(c, e) >= data_bits + c + degree:
+                # Carry-less (x^c + 1) * p(x)
+                return (poly << c) ^ poly
+        degree += 1
 
 class FireCodeECC(ECCBase):
     """Fire Code ECC implementation for burst error correction."""
     
-    def __init__(self, burst_length: int = 3, data_length: int = None):
+    def __init__(self, burst_length: int = 3, data_length: int = None,
+                 rtl_compatible: bool = False):
         """
         Initialize Fire Code ECC.
         
         Args:
             burst_length: Maximum burst length to correct (default: 3)
             data_length: Data length for compatibility
+            rtl_compatible: Use the x^(2b) + 1 interleaved parity that
+                verilogs/fire_code_ecc.v implements instead of a true Fire code
         """
         self.burst_length = burst_length
         
@@ -30,9 +72,26 @@ class FireCodeECC(ECCBase):
         
         # Calculate code parameters
         self.data_length = data_length or 8
-        self.parity_length = 2 * self.burst_length
-        self.n = self.data_length + self.parity_length
         self.k = self.data_length
+        if rtl_compatible:
+            # Parity bit j is the XOR of data bits i with i % P == j, i.e. the parity
+            # is data(x) mod (x^P + 1). Every burst aliases with its shift by P, so
+            # this variant mostly detects.
+            self.parity_length = 2 * self.burst_length
+            self.generator_poly = (1 << self.parity_length) | 1
+        else:
+            self.generator_poly = fire_generator(self.burst_length, self.k)
+            self.parity_length = self.generator_poly.bit_length() - 1
+        self.n = self.data_length + self.parity_length
+
+        # Systematic parity is (data(x) * x^P) mod g(x); a codeword's syndrome is codeword(x) mod g(x)
+        self.poly_mod = get_poly_mod(self.generator_poly)
+        key = (self.generator_poly, self.burst_length, self.k)
+        if key not in _BURST_TABLES:
+            _BURST_TABLES[key] = self._build_burst_table()
+        # Syndrome -> data correction mask, or -1 when no burst pattern matches
+        self.burst_table = _BURST_TABLES[key]
+        self._burst_table_np = np.array(self.burst_table, dtype=object if self.k >= 63 else np.int64)
 
     def encode(self, data: int) -> int:
         """
@@ -48,22 +107,9 @@ class FireCodeECC(ECCBase):
         if data >= (1 << self.k):
             data = data & ((1 << self.k) - 1)
         
-        # Create a simple systematic code
-        # Data bits followed by parity bits
-        codeword = data << self.parity_length
-        
-        # Calculate parity bits using a simple polynomial
-        # This is a simplified version - real Fire codes use specific polynomials
-        parity = 0
-        for i in range(self.k):
-            if (data >> i) & 1:
-                # Add contribution to parity
-                parity ^= (1 << (i % self.parity_length))
-        
-        # Add parity bits
-        codeword |= parity
-        
-        return codeword
+        # Systematic code: data bits followed by parity bits
+        data_poly = data << self.parity_length
+        return data_poly | self.poly_mod.mod(data_poly, self.n)
 
     def decode(self, codeword: int) -> Tuple[int, str]:
         """
@@ -75,57 +121,79 @@ class FireCodeECC(ECCBase):
         Returns:
             Tuple of (decoded_data, error_type)
         """
-        # Extract data and parity
+        # Extract data; syndrome = received parity ^ parity of received data
         data = (codeword >> self.parity_length) & ((1 << self.k) - 1)
-        received_parity = codeword & ((1 << self.parity_length) - 1)
-        
-        # Calculate expected parity
-        expected_parity = 0
-        for i in range(self.k):
-            if (data >> i) & 1:
-                expected_parity ^= (1 << (i % self.parity_length))
-        
-        # Check for errors
-        syndrome = received_parity ^ expected_parity
+        syndrome = self.poly_mod.mod(codeword, self.n)
         
         if syndrome == 0:
             # No errors
             return data, 'corrected'
-        else:
-            # Try to correct burst errors
-            corrected_data, correction_success = self._correct_burst_errors(data, syndrome)
-            
-            if correction_success:
-                return corrected_data, 'corrected'
-            else:
-                return data, 'detected'
+
+        # Burst correction is one table lookup
+        correction = self.burst_table[syndrome]
+        if correction >= 0:
+            return data ^ correction, 'corrected'
+        return data, 'detected'
 
     def _correct_burst_errors(self, data: int, syndrome: int) -> Tuple[int, bool]:
         """Attempt to correct burst errors using syndrome."""
-        # This is a simplified burst error correction
-        # Real Fire codes use more sophisticated algorithms
-        
-        # Try different burst positions
-        for start_pos in range(self.n):
-            # Try to correct a burst starting at start_pos
-            error_pattern = 0
-            for i in range(self.burst_length):
-                if start_pos + i < self.parity_length:
-                    error_pattern |= (1 << (start_pos + i))
-            
-            # Check if this error pattern matches the syndrome
-            if (error_pattern & ((1 << self.parity_length) - 1)) == syndrome:
-                # Found matching error pattern
-                corrected_data = data
-                for i in range(self.burst_length):
-                    if start_pos + i >= self.parity_length:
-                        bit_pos = start_pos + i - self.parity_length
-                        if bit_pos < self.k:
-                            corrected_data ^= (1 << bit_pos)
-                return corrected_data, True
-        
+        correction = self.burst_table[syndrome]
+        if correction >= 0:
+            return data ^ correction, True
         return data, False
 
+    def _build_burst_table(self) -> List[int]:
+        """
+        Syndrome -> data correction mask for every syndrome.
+
+        Enumerates every burst of up to burst_length bits (first and last bit set)
+        at every codeword position, keyed by its real syndrome. A syndrome reached
+        by bursts needing different data corrections is ambiguous and left at -1
+        (detect only), as is any syndrome no burst produces.
+        """
+        data_mask = (1 << self.k) - 1
+        word_mask = (1 << self.n) - 1
+        corrections: Dict[int, set] = {}
+        for length in range(1, self.burst_length + 1):
+            if length == 1:
+                patterns = [1]
+            else:
+                inner = length - 2
+                patterns = [1 | (middle << 1) | (1 << (length - 1)) for middle in range(1 << inner)]
+            for start_pos in range(self.n):
+                for pattern in patterns:
+                    # Bits past the top of the codeword fall off
+                    error = (pattern << start_pos) & word_mask
+                    syndrome = self.poly_mod.mod(error, self.n)
+                    corrections.setdefault(syndrome, set()).add((error >> self.parity_length) & data_mask)
+        table = [-1] * (1 << self.parity_length)
+        for syndrome, masks in corrections.items():
+            if len(masks) == 1:
+                table[syndrome] = next(iter(masks))
+        table[0] = 0
+        return table
+
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        data = np.asarray(data)
+        if self.n <= 64:
+            data_poly = (data.astype(np.uint64) & np.uint64((1 << self.k) - 1)) << np.uint64(self.parity_length)
+            return data_poly | self.poly_mod.mod_batch(data_poly, self.n)
+        data_poly = (data.astype(object) & ((1 << self.k) - 1)) << self.parity_length
+        return data_poly | self.poly_mod.mod_batch(data_poly, self.n).astype(object)
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        codewords = np.asarray(codewords)
+        syndrome = self.poly_mod.mod_batch(codewords, self.n).astype(np.intp)
+        correction = self._burst_table_np[syndrome]
+        fixable = (correction >= 0).astype(bool)
+        codes = np.where(fixable, CORRECTED, DETECTED).astype(np.uint8)
+        correction = np.where(fixable, correction, 0)
+        if self.n <= 64:
+            data = (codewords.astype(np.uint64) >> np.uint64(self.parity_length)) & np.uint64((1 << self.k) - 1)
+            return data ^ correction.astype(np.uint64), codes
+        data = (codewords.astype(object) >> self.parity_length) & ((1 << self.k) - 1)
+        return data ^ correction.astype(object), codes
+
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         """
         Flip the bit at bit_idx in the codeword.
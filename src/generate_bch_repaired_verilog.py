@@ -3,7 +3,7 @@
 Emit repaired BCH decoders for CORE-CC.
 
 - w4, w8: syndrome -> err_mask case tables (t=1)
-- w16: full ROM from bch_codec.build_syndrome_mask_table (t=3, BCH(31,16))
+- w16: full ROM from bch_codec.load_syndrome_mask_table (t=3, BCH(31,16))
 - w32: use src/generate_bch_decoder_fsm.py (BM+Chien FSM, k_encode=36, parity=27)
 """
 
@@ -14,7 +14,7 @@ import re
 import sys
 
 sys.path.insert(0, os.path.dirname(__file__))
-from bch_codec import BCHCodec, build_syndrome_mask_table, BCH_CONFIGS  # noqa: E402
+from bch_codec import BCHCodec, load_syndrome_mask_table, BCH_CONFIGS  # noqa: E402
 
 
 def read_raw_module(width: int) -> str:
@@ -78,7 +78,7 @@ def generate_repaired(width: int, out_dir: str) -> None:
     raw = read_raw_module(width)
     codec = BCHCodec.for_width(width)
     n, k, t = codec.n, codec.k, codec.t
-    table = build_syndrome_mask_table(width)
+    table = load_syndrome_mask_table(width).to_dict()
 
     enc = extract_encoder_block(raw)
     synd = extract_syndrome_wires(raw)
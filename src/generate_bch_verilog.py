@@ -2,42 +2,12 @@
 import os
 import sys
 
-# Minimal GF(2^m) and Polynomial Arithmetic for BCH Generator Polynomial Calculation
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from gf2m import GF2m as SharedGF2m  # noqa: E402
 
-class GF2m:
-    def __init__(self, m, prim_poly):
-        self.m = m
-        self.prim_poly = prim_poly
-        self.size = 1 << m
-        self.alpha_to_int = [0] * self.size
-        self.int_to_alpha = [0] * self.size
-        
-        # Initialize field (generate alpha^i tables)
-        x = 1
-        for i in range(self.size - 1):
-            self.alpha_to_int[i] = x
-            self.int_to_alpha[x] = i
-            
-            x <<= 1
-            if x & self.size:
-                x ^= self.prim_poly
-                
-        # Zero is distinct
-        self.int_to_alpha[0] = -1 # Special marker
+# GF(2^m) (shared gf2m tables) and Polynomial Arithmetic for BCH Generator Polynomial Calculation
 
-    def mul(self, a, b):
-        if a == 0 or b == 0: return 0
-        log_a = self.int_to_alpha[a]
-        log_b = self.int_to_alpha[b]
-        log_res = (log_a + log_b) % (self.size - 1)
-        return self.alpha_to_int[log_res]
-
-    def power(self, a, n):
-        if a == 0: return 0
-        log_a = self.int_to_alpha[a]
-        log_res = (log_a * n) % (self.size - 1)
-        return self.alpha_to_int[log_res]
-        
+class GF2m(SharedGF2m):
     def inverse(self, a):
         return self.power(a, self.size - 2)
 
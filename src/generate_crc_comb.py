@@ -12,6 +12,9 @@ import random
 import sys
 from typing import Dict, List
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from crc_codec import get_engine  # noqa: E402
+
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 OUT_DIR = os.path.join(ROOT, "verilogs", "repaired_golden", "generated")
 
@@ -147,6 +150,13 @@ def self_test(data_width: int, deps: Dict[int, List[int]], trials: int = 512) ->
         data = 1 << bit
         if parallel_crc_from_deps(data, deps) != serial_crc_8(data, data_width):
             raise RuntimeError(f"CRC comb one-hot mismatch w={data_width} bit={bit}")
+    # Table-driven engine shared with CRCECC and dataset/generate_vectors.py
+    engine = get_engine(CRC_POLY, CRC_INIT)
+    engine.self_check(widths=(data_width,), trials=trials)
+    for _ in range(trials):
+        data = random.randint(0, mask)
+        if engine.compute(data, data_width) != serial_crc_8(data, data_width):
+            raise RuntimeError(f"CRC table engine mismatch at DATA_WIDTH={data_width}, data=0x{data:x}")
 
 
 def generate_one(data_width: int) -> str:
@@ -6,12 +6,18 @@ import numpy as np
 # Add src to path to import ldpc_ecc
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from ldpc_ecc import LDPCECC
+from ldpc_codec import BF_MAX_ITER, LDPC_SEED
 
-def generate_verilog_for_width(k, output_dir):
+def generate_verilog_for_width(k, output_dir, seed=LDPC_SEED):
     """
     Generates a fixed-width LDPC Verilog module.
     k: Data width (4, 8, 16, 32, 64, 128)
     n will be 2*k (Rate 1/2)
+    seed: LDPC construction seed; matches LDPCECC(k, seed=seed) (same cached H/G)
+
+    Syndrome and bit flipping use the sparse H that LDPCEngine decodes on, with
+    its rule: flip the lowest-index variable with the most unsatisfied checks,
+    at most BF_MAX_ITER times, and return the received data bits on failure.
     """
     n = k * 2
     module_name = f"ldpc_ecc_w{k}"
@@ -20,18 +26,23 @@ def generate_verilog_for_width(k, output_dir):
     print(f"Generating {module_name} (n={n}, k={k})...")
     
     # 1. Instantiate Model to get Matrices
-    ecc = LDPCECC(k=k, data_length=k) 
+    ecc = LDPCECC(k=k, data_length=k, seed=seed)
     
     # G = [I | P.T]. We only need P.T for encoding parity.
     assert np.array_equal(ecc.G[:, :k], np.eye(k, dtype=int)), "G must be systematic [I | P.T]"
     P_T = ecc.G[:, k:] # (k x m)
     
-    # H Matrix for decoding
-    H = ecc.H # (m x n)
+    # Sparse H the Python bit-flipping decoder runs on (same code as the systematic H)
+    H = ecc.engine.H_sparse # (m x n)
     m = n - k
+    # Vote (unsatisfied-check count) and variable index widths
+    vote_width = max(1, int(H.sum(axis=0).max()).bit_length())
+    idx_width = max(1, (n - 1).bit_length())
+    iter_width = max(1, BF_MAX_ITER.bit_length())
     
     verilog = []
     verilog.append(f"// Generated {module_name} - Do not edit manually")
+    verilog.append(f"// LDPC matrices: n={n}, k={k}, seed={seed}")
     verilog.append(f"module {module_name} (")
     verilog.append(f"    input  wire clk,")
     verilog.append(f"    input  wire rst_n,")
@@ -51,10 +62,11 @@ def generate_verilog_for_width(k, output_dir):
     # ---------------------------------------------------------
     verilog.append(f"    reg [3:0] state;")
     verilog.append(f"    localparam IDLE = 0, CALC_SYNDROME = 1, FLIP_BITS = 2, CHECK_DONE = 3, FINISH = 4;")
-    verilog.append(f"    reg [4:0] iter_count;")
-    verilog.append(f"    localparam MAX_ITER = 10;")
+    verilog.append(f"    reg [{iter_width-1}:0] iter_count;")
+    verilog.append(f"    localparam MAX_ITER = {BF_MAX_ITER};")
     verilog.append(f"    ")
     verilog.append(f"    reg [{n-1}:0] current_cw;")
+    verilog.append(f"    reg [{k-1}:0] received_data;")
     verilog.append(f"    wire [{m-1}:0] syndrome;")
     verilog.append(f"    wire has_error;")
 
@@ -86,32 +98,36 @@ def generate_verilog_for_width(k, output_dir):
     # ---------------------------------------------------------
     # BIT FLIPPING VOTING LOGIC (Combinational)
     # ---------------------------------------------------------
-    vn_connections = {}
-    for j in range(n):
-        vn_connections[j] = np.where(H[:, j] == 1)[0]
-
+    # sum_j = number of unsatisfied checks on variable j
     for j in range(n):
-        checks = vn_connections[j]
+        checks = np.where(H[:, j] == 1)[0]
         if len(checks) == 0:
-             verilog.append(f"    wire flip_{j} = 1'b0;")
+            verilog.append(f"    wire [{vote_width-1}:0] sum_{j} = {vote_width}'d0;")
         else:
-             terms = [f"syndrome[{c}]" for c in checks]
-             
-             # Dynamic width calculation
-             max_val = len(checks)
-             width = max_val.bit_length()
-             if width == 0: width = 1
-             
-             pad = width - 1
-             if pad > 0:
-                extended_terms = [f"{{ {pad}'d0, {t} }}" for t in terms]
-             else:
-                extended_terms = terms
+            pad = vote_width - 1
+            if pad > 0:
+                terms = [f"{{ {pad}'d0, syndrome[{c}] }}" for c in checks]
+            else:
+                terms = [f"syndrome[{c}]" for c in checks]
+            verilog.append(f"    wire [{vote_width-1}:0] sum_{j} = {' + '.join(terms)};")
 
-             sum_expr = " + ".join(extended_terms)
-             verilog.append(f"    wire [{width-1}:0] sum_{j} = {sum_expr};")
-             threshold = int(len(checks)/2 + 0.5)
-             verilog.append(f"    wire flip_{j} = (sum_{j} >= {width}'d{threshold});")
+    # Argmax tree; ties keep the left (lower-index) operand
+    nodes = [(f"sum_{j}", f"{idx_width}'d{j}") for j in range(n)]
+    level = 0
+    while len(nodes) > 1:
+        merged = []
+        for i in range(0, len(nodes) - 1, 2):
+            (lv, li), (rv, ri) = nodes[i], nodes[i + 1]
+            name = f"{level}_{i // 2}"
+            verilog.append(f"    wire [{vote_width-1}:0] best_votes_{name} = ({lv} >= {rv}) ? {lv} : {rv};")
+            verilog.append(f"    wire [{idx_width-1}:0] best_idx_{name} = ({lv} >= {rv}) ? {li} : {ri};")
+            merged.append((f"best_votes_{name}", f"best_idx_{name}"))
+        if len(nodes) % 2:
+            merged.append(nodes[-1])
+        nodes = merged
+        level += 1
+    verilog.append(f"    wire [{vote_width-1}:0] best_votes = {nodes[0][0]};")
+    verilog.append(f"    wire [{idx_width-1}:0] best_idx = {nodes[0][1]};")
 
     # ---------------------------------------------------------
     # MAIN CONTROL BLOCK (Single Always Block)
@@ -120,6 +136,7 @@ def generate_verilog_for_width(k, output_dir):
     verilog.append(f"        if (!rst_n) begin")
     verilog.append(f"            state <= IDLE;")
     verilog.append(f"            current_cw <= 0;")
+    verilog.append(f"            received_data <= 0;")
     verilog.append(f"            iter_count <= 0;")
     verilog.append(f"            codeword_out <= 0;")
     verilog.append(f"            data_out <= 0;")
@@ -138,6 +155,7 @@ def generate_verilog_for_width(k, output_dir):
     verilog.append(f"            else if (decode_en && state == IDLE) begin")
     verilog.append(f"                state <= CALC_SYNDROME;")
     verilog.append(f"                current_cw <= codeword_in;")
+    verilog.append(f"                received_data <= codeword_in[{k-1}:0];")
     verilog.append(f"                iter_count <= 0;")
     verilog.append(f"            end")
     verilog.append(f"            ")
@@ -146,23 +164,23 @@ def generate_verilog_for_width(k, output_dir):
     verilog.append(f"                    CALC_SYNDROME: begin")
     verilog.append(f"                        if (!has_error) begin")
     verilog.append(f"                             state <= FINISH;")
-    verilog.append(f"                        end else if (iter_count == MAX_ITER) begin")
+    verilog.append(f"                        end else if (iter_count == MAX_ITER || best_votes == 0) begin")
     verilog.append(f"                             state <= FINISH;")
     verilog.append(f"                        end else begin")
     verilog.append(f"                             state <= FLIP_BITS;")
     verilog.append(f"                        end")
     verilog.append(f"                    end")
     verilog.append(f"                    FLIP_BITS: begin")
-    verilog.append(f"                        // Apply flips")
-    for j in range(n):
-        verilog.append(f"                        current_cw[{j}] <= current_cw[{j}] ^ flip_{j};")
+    verilog.append(f"                        // Flip the lowest-index variable with the most unsatisfied checks")
+    verilog.append(f"                        current_cw[best_idx] <= ~current_cw[best_idx];")
     verilog.append(f"                        iter_count <= iter_count + 1;")
     verilog.append(f"                        state <= CALC_SYNDROME;")
     verilog.append(f"                    end")
     verilog.append(f"                    FINISH: begin")
-    verilog.append(f"                        data_out <= current_cw[{k-1}:0];")
+    verilog.append(f"                        // On failure return the received data bits, as LDPCEngine does")
+    verilog.append(f"                        data_out <= has_error ? received_data : current_cw[{k-1}:0];")
     verilog.append(f"                        error_detected <= has_error;")
-    verilog.append(f"                        error_corrected <= (has_error == 0); // Approx")
+    verilog.append(f"                        error_corrected <= (has_error == 0);")
     verilog.append(f"                        valid_out <= 1'b1;")
     verilog.append(f"                        state <= IDLE;")
     verilog.append(f"                    end")
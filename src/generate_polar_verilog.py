@@ -3,17 +3,18 @@ import os
 import sys
 import math
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from polar_codec import polar_info_indices
+
 class PolarCodeGenerator:
-    def __init__(self, N, K):
+    def __init__(self, N, K, construction="popcount"):
         self.N = N
         self.K = K
         self.n = int(math.log2(N))
         
-        indices = list(range(N))
-        self.channel_reliability = sorted([(i, bin(i).count('1'), i) for i in indices], key=lambda x: (x[1], x[2]))
-        
-        self.info_indices = set([x[0] for x in self.channel_reliability[-K:]])
-        self.frozen_indices = set([x[0] for x in self.channel_reliability[:-K]])
+        # Same frozen set as PolarECC(construction=...); "popcount" is the default
+        self.info_indices = set(polar_info_indices(N, K, construction))
+        self.frozen_indices = set(range(N)) - self.info_indices
 
     def generate_verilog(self, module_name):
         self.lines = []
@@ -2,43 +2,19 @@
 import os
 import sys
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from gf2m import GF2m  # noqa: E402
+
 # Reed-Solomon Verilog Generator
 # Implements:
 # 1. GF(2^8) Arithmetic (Primitive Poly 0x11D, FCR=0)
 # 2. Parallel LFSR Encoder (Systematic)
 # 3. Syndrome Generator (Loopback verification)
 
-class GF256:
+class GF256(GF2m):
     def __init__(self, prim=0x11d):
+        super().__init__(8, prim)
         self.prim = prim
-        self.exp = [0] * 512
-        self.log = [0] * 256
-        
-        x = 1
-        for i in range(255):
-            self.exp[i] = x
-            self.log[x] = i
-            x <<= 1
-            if x & 0x100:
-                x ^= self.prim
-        
-        # Double the exp table for easy lookups
-        for i in range(255, 512):
-            self.exp[i] = self.exp[i-255]
-            
-    def mul(self, a, b):
-        if a == 0 or b == 0:
-            return 0
-        return self.exp[self.log[a] + self.log[b]]
-        
-    def add(self, a, b):
-        return a ^ b
-        
-    def pow(self, a, b):
-        if a == 0: return 0
-        if b == 0: return 1
-        log_a = self.log[a]
-        return self.exp[(log_a * b) % 255]
 
     def poly_mul(self, p1, p2):
         # Multiply two polynomials
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Shared GF(2^m) arithmetic for the BCH/RS codecs and RTL generators.
+
+Elements are ints 0..2^m-1 in polynomial basis (bit i = coeff of alpha^i).
+Antilog tables are doubled so a product is exp[log a + log b] with no modulo,
+and every table also exists as a NumPy array for the element-wise *_array
+operations and GF(2^m) matrix-vector products. Tables are built once per
+(m, prim_poly) and shared by every GF2m instance for that field.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+# (m, prim_poly) -> (exp, log, exp_np, log_np)
+_TABLES: Dict[Tuple[int, int], Tuple[List[int], List[int], np.ndarray, np.ndarray]] = {}
+_FIELDS: Dict[Tuple[int, int], "GF2m"] = {}
+
+
+def _build_tables(m: int, prim_poly: int) -> Tuple[List[int], List[int], np.ndarray, np.ndarray]:
+    key = (m, prim_poly)
+    if key not in _TABLES:
+        size = 1 << m
+        order = size - 1
+        exp = [0] * (2 * size)
+        log = [-1] * size
+        x = 1
+        for i in range(order):
+            exp[i] = x
+            log[x] = i
+            x <<= 1
+            if x & size:
+                x ^= prim_poly
+        for i in range(order, 2 * size):
+            exp[i] = exp[i - order]
+        exp_np = np.array(exp, dtype=np.int64)
+        # log(0) is undefined; 0 here, callers mask zero operands
+        log_np = np.array([max(v, 0) for v in log], dtype=np.int64)
+        exp_np.setflags(write=False)
+        log_np.setflags(write=False)
+        _TABLES[key] = (exp, log, exp_np, log_np)
+    return _TABLES[key]
+
+
+class GF2m:
+    """GF(2^m) defined by a primitive polynomial (bit m set, e.g. 0x11D for GF(256))."""
+
+    def __init__(self, m: int, prim_poly: int) -> None:
+        self.m = m
+        self.prim_poly = prim_poly
+        self.size = 1 << m
+        self.order = self.size - 1
+        self.exp, self.log, self.exp_np, self.log_np = _build_tables(m, prim_poly)
+        # Historical names used by the BCH code (alpha^i <-> int)
+        self.alpha_to_int = self.exp
+        self.int_to_alpha = self.log
+
+    # --- scalar ---------------------------------------------------------
+
+    def add(self, a: int, b: int) -> int:
+        return a ^ b
+
+    def mul(self, a: int, b: int) -> int:
+        if a == 0 or b == 0:
+            return 0
+        return self.exp[self.log[a] + self.log[b]]
+
+    def div(self, a: int, b: int) -> int:
+        if b == 0:
+            raise ZeroDivisionError
+        if a == 0:
+            return 0
+        return self.exp[self.log[a] - self.log[b] + self.order]
+
+    def inv(self, a: int) -> int:
+        if a == 0:
+            raise ZeroDivisionError
+        return self.exp[self.order - self.log[a]]
+
+    def sqr(self, a: int) -> int:
+        return self.mul(a, a)
+
+    def power(self, a: int, exp: int) -> int:
+        if a == 0:
+            return 0
+        return self.exp[(self.log[a] * exp) % self.order]
+
+    pow = power
+
+    def alpha_pow(self, exp: int) -> int:
+        """Return alpha^exp (alpha = primitive element 2); exp may be negative."""
+        return self.exp[exp % self.order]
+
+    # --- arrays -----------------------------------------------------------
+
+    def mul_array(self, a, b) -> np.ndarray:
+        """Element-wise product of broadcastable integer arrays."""
+        a = np.asarray(a, dtype=np.int64)
+        b = np.asarray(b, dtype=np.int64)
+        out = self.exp_np[self.log_np[a] + self.log_np[b]]
+        return np.where((a != 0) & (b != 0), out, 0)
+
+    def div_array(self, a, b) -> np.ndarray:
+        """Element-wise a / b; raises ZeroDivisionError if any divisor is 0."""
+        a = np.asarray(a, dtype=np.int64)
+        b = np.asarray(b, dtype=np.int64)
+        if np.any(b == 0):
+            raise ZeroDivisionError
+        out = self.exp_np[self.log_np[a] - self.log_np[b] + self.order]
+        return np.where(a != 0, out, 0)
+
+    def pow_array(self, a, exp) -> np.ndarray:
+        """Element-wise a^exp (exp may be an array; 0^e = 0 as in power)."""
+        a = np.asarray(a, dtype=np.int64)
+        e = np.asarray(exp, dtype=np.int64)
+        out = self.exp_np[(self.log_np[a] * e) % self.order]
+        return np.where(a != 0, out, 0)
+
+    def inv_array(self, a) -> np.ndarray:
+        return self.div_array(1, a)
+
+    def alpha_pow_array(self, exp) -> np.ndarray:
+        return self.exp_np[np.asarray(exp, dtype=np.int64) % self.order]
+
+    def matvec(self, matrix, vec) -> np.ndarray:
+        """
+        GF(2^m) matrix-vector product(s).
+
+        Args:
+            matrix: (R, C) array of field elements.
+            vec: (C,) vector or (N, C) batch of vectors.
+
+        Returns:
+            (R,) or (N, R) array: XOR over c of matrix[r, c] * vec[c].
+        """
+        matrix = np.asarray(matrix, dtype=np.int64)
+        vec = np.asarray(vec, dtype=np.int64)
+        prods = self.mul_array(matrix, vec[..., None, :])
+        return np.bitwise_xor.reduce(prods, axis=-1)
+
+    def poly_eval_array(self, coeffs: Sequence[int], x) -> np.ndarray:
+        """Evaluate a polynomial (coeffs[i] is coeff of x^i) at every element of x."""
+        x = np.asarray(x, dtype=np.int64)
+        y = np.zeros_like(x)
+        for c in reversed(list(coeffs)):
+            y = self.mul_array(y, x) ^ c
+        return y
+
+
+def get_field(m: int, prim_poly: int) -> GF2m:
+    """Shared GF2m instance per (m, prim_poly)."""
+    key = (m, prim_poly)
+    if key not in _FIELDS:
+        _FIELDS[key] = GF2m(m, prim_poly)
+    return _FIELDS[key]
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Shared GF(2)[x] remainder engine for the cyclic-family codes.
+
+Polynomials are ints (bit i = coeff of x^i). Reduction mod g(x) is linear,
+so v mod g is the XOR over bytes j of v of table_j[byte_j], where
+table_j[b] = (b * x^(8j)) mod g. Table j + 1 is table j stepped eight times
+through the LFSR (multiplied by x^8), so tables are grown on demand and a
+remainder costs one lookup per byte with no carried state. The same tables
+drive a NumPy batch mode over arrays of words. Engines are shared per g.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+import numpy as np
+
+_MASK64 = (1 << 64) - 1
+
+
+class PolyMod:
+    """Remainder (and syndrome) arithmetic modulo a fixed g(x) of degree <= 64."""
+
+    def __init__(self, poly: int) -> None:
+        if poly <= 0:
+            raise ValueError("generator polynomial must be non-zero")
+        self.poly = poly
+        self.degree = poly.bit_length() - 1
+        if self.degree > 64:
+            raise ValueError("generator polynomial degree must be <= 64")
+        self._mask = (1 << self.degree) - 1
+        self.byte_tables: List[List[int]] = []
+        self._np_tables = np.zeros((0, 256), dtype=np.uint64)
+        self._extend(1)
+
+    def _mulx8(self, r: int) -> int:
+        """r * x^8 mod g for r of degree < deg g."""
+        for _ in range(8):
+            r <<= 1
+            if (r >> self.degree) & 1:
+                r ^= self.poly
+        return r
+
+    def _extend(self, count: int) -> None:
+        """Make sure tables exist for the first ``count`` byte positions."""
+        if count <= len(self.byte_tables):
+            return
+        if not self.byte_tables:
+            first = []
+            for b in range(256):
+                r = b
+                for i in range(7, -1, -1):
+                    if self.degree <= i and (r >> i) & 1:
+                        r ^= self.poly << (i - self.degree)
+                first.append(r)
+            self.byte_tables.append(first)
+        while len(self.byte_tables) < count:
+            self.byte_tables.append([self._mulx8(r) for r in self.byte_tables[-1]])
+        self._np_tables = np.array(self.byte_tables, dtype=np.uint64)
+
+    def mod(self, value: int, nbits: int = None) -> int:
+        """value mod g(x), using the low ``nbits`` bits of value (default: all of them)."""
+        if nbits is None:
+            nbits = value.bit_length()
+        else:
+            value &= (1 << nbits) - 1
+        nbytes = (nbits + 7) // 8
+        self._extend(nbytes)
+        tables = self.byte_tables
+        r = 0
+        j = 0
+        while value:
+            r ^= tables[j][value & 0xFF]
+            value >>= 8
+            j += 1
+        return r
+
+    def x_pow_mod(self, exponent: int) -> int:
+        """x^exponent mod g(x)."""
+        return self.mod(1 << exponent)
+
+    def mod_batch(self, words: np.ndarray, nbits: int) -> np.ndarray:
+        """
+        Remainders of every word in a 1-D array (uint64, or object for words over 64 bits).
+
+        Returns:
+            uint64 array of remainders.
+        """
+        words = np.asarray(words)
+        nbytes = (nbits + 7) // 8
+        self._extend(nbytes)
+        if words.dtype == object:
+            words = words & ((1 << nbits) - 1)
+            limbs = [((words >> lo) & _MASK64).astype(np.uint64) for lo in range(0, nbits, 64)]
+        else:
+            words = words.astype(np.uint64)
+            if nbits < 64:
+                words = words & np.uint64((1 << nbits) - 1)
+            limbs = [words]
+
+        r = np.zeros(len(words), dtype=np.uint64)
+        for j in range(nbytes):
+            byte = (limbs[j // 8] >> np.uint64(8 * (j % 8))) & np.uint64(0xFF)
+            r ^= self._np_tables[j][byte.astype(np.intp)]
+        return r
+
+
+_ENGINES: Dict[int, PolyMod] = {}
+
+
+def get_poly_mod(poly: int) -> PolyMod:
+    """Shared PolyMod per generator polynomial."""
+    if poly not in _ENGINES:
+        _ENGINES[poly] = PolyMod(poly)
+    return _ENGINES[poly]
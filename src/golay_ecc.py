@@ -1,5 +1,66 @@
+from itertools import combinations
 from typing import List, Tuple
-from base_ecc import ECCBase
+from base_ecc import ECCBase, CORRECTED, pack_bits, unpack_bits
+import numpy as np
+
+GOLAY_N = 23
+GOLAY_K = 12
+# g(x) = x^11 + x^10 + x^6 + x^5 + x^4 + x^2 + 1
+GOLAY_POLY = 0xC75
+
+# Built once per process by golay_tables():
+# (byte syndrome rows as lists, same as (3, 256) array, 2048-entry error table as list, same as array)
+_TABLES = None
+
+
+def _remainder(vec_int: int) -> int:
+    """Bitwise long division by g(x); only used to seed the byte tables."""
+    out = vec_int
+    for i in range(GOLAY_N - 1, GOLAY_N - GOLAY_K - 1, -1):
+        if (out >> i) & 1:
+            out ^= GOLAY_POLY << (i - (GOLAY_N - GOLAY_K))
+    return out & 0x7FF
+
+
+def golay_tables():
+    """
+    Shared Golay lookup tables.
+
+    The syndrome is linear, so byte j of a 23-bit word contributes
+    byte_syndromes[j][byte] independently and three lookups give the
+    remainder. The error table maps each of the 2048 syndromes to its coset
+    leader, filled in order of weight 0..3 (lowest weight, then lowest
+    combination, wins), which for this perfect code covers every syndrome.
+    """
+    global _TABLES
+    if _TABLES is None:
+        byte_syndromes = [[_remainder(v << (8 * j)) for v in range(256)] for j in range(3)]
+        byte_syndromes_np = np.array(byte_syndromes, dtype=np.uint32)
+
+        patterns = [0]
+        for weight in (1, 2, 3):
+            patterns.extend(sum(1 << i for i in combo) for combo in combinations(range(GOLAY_N), weight))
+        patterns = np.array(patterns, dtype=np.uint32)
+        syndromes = syndrome_array(patterns, byte_syndromes_np)
+        unique_syndromes, first = np.unique(syndromes, return_index=True)
+        error_table_np = np.zeros(1 << (GOLAY_N - GOLAY_K), dtype=np.uint32)
+        error_table_np[unique_syndromes] = patterns[first]
+
+        byte_syndromes_np.setflags(write=False)
+        error_table_np.setflags(write=False)
+        _TABLES = (byte_syndromes, byte_syndromes_np, error_table_np.tolist(), error_table_np)
+    return _TABLES
+
+
+def syndrome_array(words: np.ndarray, byte_syndromes: np.ndarray = None) -> np.ndarray:
+    """Syndromes of an array of 23-bit words (bits above 22 are ignored)."""
+    if byte_syndromes is None:
+        byte_syndromes = golay_tables()[1]
+    words = np.asarray(words, dtype=np.uint32)
+    return (byte_syndromes[0][words & 0xFF]
+            ^ byte_syndromes[1][(words >> 8) & 0xFF]
+            ^ byte_syndromes[2][(words >> 16) & 0x7F])
+
 
 class GolayCode:
     """
@@ -7,79 +68,17 @@ class GolayCode:
     Uses Systematic Cyclic Encoding and Syndrome Table Decoding.
     """
     def __init__(self) -> None:
-        self.n = 23
-        self.k = 12
-        # Generator polynomial for Golay (23,12): g(x) = x^11 + x^10 + x^6 + x^5 + x^4 + x^2 + 1 ?
-        # Standard: g(x) = x^11 + x^9 + x^7 + x^6 + x^5 + x + 1 (0xAE3? No. 101011100011 -> AE3? No)
-        # 1 0 1 0 1 1 1 0 0 0 1 1
-        # Coefficients: 1, 0, 1, 0, 1, 1, 1, 0, 0, 0, 1, 1 (Wait, highest power first?)
-        # Let's use the one from the dummy file which claimed to be correct: 0b1000000001011 ??
-        # The dummy file said: 0b1000000001011 = x^11 + ...
-        # Let's use a standard well-known polynomial: 0xC75 (Octal 6165)
-        # g(x) = x^11 + x^10 + x^6 + x^5 + x^4 + x^2 + 1
-        # Bin: 1 1 0 0 0 1 1 1 0 1 0 1 => 0xC75.
-        self.poly = 0xC75
-        
-        # Precompute Syndrome Table for correction of up to 3 errors
-        # (Syndrome -> Error Pattern)
-        # This takes some time to init, but only done once.
-        self.syndrome_table = {}
-        self._build_syndrome_table()
-
-    def _build_syndrome_table(self):
-        """Builds mapping from Syndrome (11 bits) to Error Pattern (23 bits)."""
-        # 0 errors
-        self.syndrome_table[0] = 0
+        self.n = GOLAY_N
+        self.k = GOLAY_K
+        self.poly = GOLAY_POLY
         
-        # 1 error
-        for i in range(23):
-            err = 1 << i
-            syn = self._calculate_syndrome(err)
-            self.syndrome_table[syn] = err
-            
-        # 2 errors
-        for i in range(23):
-            for j in range(i+1, 23):
-                err = (1 << i) | (1 << j)
-                syn = self._calculate_syndrome(err)
-                if syn not in self.syndrome_table: # Prefer lower weight
-                    self.syndrome_table[syn] = err
-                    
-        # 3 errors
-        # Note: 3 errors takes combinatorial search. 23C3 = 1771 combos.
-        # Total entries in table <= 2048. 1+23+253+1771 = 2048. Perfect.
-        # (23,12,7) code is perfect 3-error correcting code.
-        for i in range(23):
-            for j in range(i+1, 23):
-                for k in range(j+1, 23):
-                    err = (1 << i) | (1 << j) | (1 << k)
-                    syn = self._calculate_syndrome(err)
-                    if syn not in self.syndrome_table:
-                        self.syndrome_table[syn] = err
+        # Syndrome -> error pattern (correction of up to 3 errors), shared by all instances
+        self._byte_syndromes, self._byte_syndromes_np, self.syndrome_table, self._syndrome_table_np = golay_tables()
 
     def _calculate_syndrome(self, vec_int: int) -> int:
         """Calculates syndrome of 23-bit vector (remainder of division by g(x))."""
-        # Systematic encoding usually implies: C(x) = D(x)*x^(N-K) + (D(x)*x^(N-K) mod g(x))
-        # Wait, if we receive R(x), Syndrome S(x) = R(x) mod g(x).
-        
-        # Polynomial division over GF(2)
-        d = vec_int
-        # Evaluate degree? No, just shift register simulation
-        # Using simple bitwise long division
-        
-        # High bit of 23-bit codeword is coefficient of x^22.
-        # Generator is degree 11 (highest bit is x^11).
-        # We process from high bit down.
-        
-        out = d
-        # Loop from degree 22 down to 11
-        for i in range(22, 10, -1):
-            if (out >> i) & 1:
-                # Subtract (XOR) generator shifted
-                out ^= (self.poly << (i - 11))
-                
-        # Remainder is lower 11 bits
-        return out & 0x7FF
+        s0, s1, s2 = self._byte_syndromes
+        return s0[vec_int & 0xFF] ^ s1[(vec_int >> 8) & 0xFF] ^ s2[(vec_int >> 16) & 0x7F]
 
     def encode(self, data: int) -> int:
         """Encodes 12-bit data into 23-bit codeword."""
@@ -94,18 +93,22 @@ class GolayCode:
 
     def decode(self, codeword: int) -> int:
         """Decodes 23-bit codeword using Syndrome Table."""
-        syn = self._calculate_syndrome(codeword)
-        
-        if syn == 0:
-            err_pattern = 0
-        else:
-            err_pattern = self.syndrome_table.get(syn, 0) # Should always be found if <=3 errors
-            
-        corrected = codeword ^ err_pattern
+        corrected = codeword ^ self.syndrome_table[self._calculate_syndrome(codeword)]
         
         # Return data part (top 12 bits)
         return (corrected >> 11) & 0xFFF
 
+    def encode_array(self, data: np.ndarray) -> np.ndarray:
+        """Encodes an array of 12-bit data values into 23-bit codewords."""
+        shifted = np.asarray(data, dtype=np.uint32) << 11
+        return shifted | syndrome_array(shifted, self._byte_syndromes_np)
+
+    def decode_array(self, codewords: np.ndarray) -> np.ndarray:
+        """Decodes an array of 23-bit codewords to their 12-bit data values."""
+        codewords = np.asarray(codewords, dtype=np.uint32) & 0x7FFFFF
+        corrected = codewords ^ self._syndrome_table_np[syndrome_array(codewords, self._byte_syndromes_np)]
+        return (corrected >> 11) & 0xFFF
+
 class GolayECC(ECCBase):
     """Golay ECC wrapper for benchmark."""
     
@@ -152,5 +155,29 @@ class GolayECC(ECCBase):
             
         return data, 'corrected'
 
+    def _blocks(self, words: np.ndarray, block_bits: int) -> np.ndarray:
+        """(B,) words -> (B, num_blocks) block values of block_bits bits each."""
+        bits = unpack_bits(words, block_bits * self.num_blocks)
+        weights = np.uint32(1) << np.arange(block_bits, dtype=np.uint32)
+        return (bits.reshape(len(bits), self.num_blocks, block_bits).astype(np.uint32) * weights).sum(
+            axis=2, dtype=np.uint32)
+
+    @staticmethod
+    def _join(blocks: np.ndarray, block_bits: int) -> np.ndarray:
+        """(B, num_blocks) block values -> packed words, block i at bit i * block_bits."""
+        shifts = np.arange(block_bits, dtype=np.uint32)
+        bits = ((blocks[:, :, None] >> shifts) & 1).astype(np.uint8)
+        return pack_bits(bits.reshape(len(blocks), -1))
+
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        data = np.asarray(data)
+        chunks = self._blocks(data, 8)
+        return self._join(self.golay.encode_array(chunks), 23)
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        codewords = np.asarray(codewords)
+        data = self.golay.decode_array(self._blocks(codewords, 23)) & 0xFF
+        return self._join(data, 8), np.full(len(codewords), CORRECTED, dtype=np.uint8)
+
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         return codeword ^ (1 << bit_idx)
\ No newline at end of file
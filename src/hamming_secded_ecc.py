@@ -1,8 +1,126 @@
-from typing import Tuple
+from typing import Dict, List, Tuple
 import sys
 import os
+import numpy as np
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.base_ecc import ECCBase
+from src.base_ecc import ECCBase, CORRECTED, DETECTED, as_word_array, word_parity
+
+_MASK64 = (1 << 64) - 1
+# syndrome_to_position sentinels (entries >= 0 are the bit to flip)
+_NO_ERROR = -1
+_DOUBLE_ERROR = -2
+
+
+def _to_lanes(words: np.ndarray, lanes: int) -> np.ndarray:
+    """Split a word array into an (N, lanes) uint64 array, lane 0 = bits 0..63."""
+    if words.dtype != object:
+        out = np.zeros((len(words), lanes), dtype=np.uint64)
+        out[:, 0] = words
+        return out
+    out = np.empty((len(words), lanes), dtype=np.uint64)
+    for lane in range(lanes):
+        out[:, lane] = ((words >> (64 * lane)) & _MASK64).astype(np.uint64)
+    return out
+
+
+def _from_lanes(lanes: np.ndarray, bits: int) -> np.ndarray:
+    """Inverse of _to_lanes; returns uint64 words when bits <= 64, else object."""
+    if bits <= 64:
+        return lanes[:, 0].copy()
+    words = lanes[:, 0].astype(object)
+    for lane in range(1, lanes.shape[1]):
+        words = words | (lanes[:, lane].astype(object) << (64 * lane))
+    return words
+
+
+class HammingBitMatrix:
+    """
+    Precomputed parity-check representation of a Hamming(n, k) code.
+
+    Codewords are handled as packed uint64 lanes (two lanes for the 71-bit
+    code, three for the 136-bit code). Data bits occupy contiguous runs
+    between the parity positions, so insert/extract are a few shift-and-mask
+    operations, syndromes are XOR-popcount reductions against the check
+    masks, and a 2^m table maps each syndrome to the bit to flip.
+    """
+
+    def __init__(self, n: int, k: int) -> None:
+        self.n = n
+        self.k = k
+        self.m = n - k
+        self.lanes = (n + 63) // 64
+        self.k_lanes = (k + 63) // 64
+        self.last_lane_mask = np.uint64((1 << (n - 64 * (self.lanes - 1))) - 1)
+        parity_positions = [(1 << i) - 1 for i in range(self.m)]
+
+        # (data_lo, length, codeword_pos) for each contiguous run of data bits
+        self.runs: List[Tuple[int, int, int]] = []
+        data_lo = 0
+        for i, pos in enumerate(parity_positions):
+            end = parity_positions[i + 1] if i + 1 < self.m else n
+            if end > pos + 1:
+                self.runs.append((data_lo, end - pos - 1, pos + 1))
+                data_lo += end - pos - 1
+
+        # Check i covers every position j with bit i set in (j + 1)
+        self.check_masks: List[int] = [
+            sum(1 << j for j in range(n) if (j + 1) & (1 << i)) for i in range(self.m)
+        ]
+        self.check_lanes = np.array(
+            [[(mask >> (64 * lane)) & _MASK64 for lane in range(self.lanes)] for mask in self.check_masks],
+            dtype=np.uint64,
+        )
+
+        table = np.full(1 << self.m, _DOUBLE_ERROR, dtype=np.int16)
+        table[0] = _NO_ERROR
+        table[1:n + 1] = np.arange(n)
+        self.syndrome_to_position = table
+
+    def syndromes(self, lanes: np.ndarray) -> np.ndarray:
+        """Return the syndrome of each (N, lanes) codeword row as an int array."""
+        masked = np.bitwise_xor.reduce(lanes[:, None, :] & self.check_lanes[None, :, :], axis=2)
+        bits = word_parity(masked, 64).astype(np.int64)
+        return (bits << np.arange(self.m, dtype=np.int64)).sum(axis=1)
+
+    def insert(self, data_lanes: np.ndarray) -> np.ndarray:
+        """Scatter (N, k_lanes) data rows into (N, lanes) codeword rows."""
+        out = np.zeros((len(data_lanes), self.lanes), dtype=np.uint64)
+        for data_lo, length, pos in self.runs:
+            _put_field(out, _get_field(data_lanes, data_lo, length), pos, length)
+        return out
+
+    def extract(self, lanes: np.ndarray) -> np.ndarray:
+        """Gather the data runs of (N, lanes) codeword rows into (N, k_lanes) rows."""
+        out = np.zeros((len(lanes), self.k_lanes), dtype=np.uint64)
+        for data_lo, length, pos in self.runs:
+            _put_field(out, _get_field(lanes, pos, length), data_lo, length)
+        return out
+
+
+def _get_field(lanes: np.ndarray, lo: int, length: int) -> np.ndarray:
+    """Read a <= 64-bit field starting at bit lo of each lane row."""
+    q, r = divmod(lo, 64)
+    value = lanes[:, q] >> np.uint64(r)
+    if r and r + length > 64:
+        value = value | (lanes[:, q + 1] << np.uint64(64 - r))
+    return value & np.uint64(_MASK64 >> (64 - length))
+
+
+def _put_field(lanes: np.ndarray, value: np.ndarray, lo: int, length: int) -> None:
+    """OR a <= 64-bit field into each lane row starting at bit lo."""
+    q, r = divmod(lo, 64)
+    lanes[:, q] |= value << np.uint64(r)
+    if r and r + length > 64:
+        lanes[:, q + 1] |= value >> np.uint64(64 - r)
+
+
+_ENGINES: Dict[Tuple[int, int], HammingBitMatrix] = {}
+
+
+def _get_engine(n: int, k: int) -> HammingBitMatrix:
+    if (n, k) not in _ENGINES:
+        _ENGINES[(n, k)] = HammingBitMatrix(n, k)
+    return _ENGINES[(n, k)]
 
 class HammingSECDEDECC(ECCBase):
     """Hamming SECDED (Single Error Correction, Double Error Detection) ECC implementation."""
@@ -80,6 +198,8 @@ class HammingSECDEDECC(ECCBase):
                     self.data_positions.append(i)
         else:
             raise ValueError(f"Word length {self.word_length} not supported")
+        
+        self._engine = _get_engine(self.n, self.k)
     
     def _extract_data(self, codeword: int) -> int:
         """
@@ -92,9 +212,8 @@ class HammingSECDEDECC(ECCBase):
             The data bits
         """
         data = 0
-        for i, pos in enumerate(self.data_positions):
-            bit = (codeword >> pos) & 1
-            data |= (bit << i)
+        for data_lo, length, pos in self._engine.runs:
+            data |= ((codeword >> pos) & ((1 << length) - 1)) << data_lo
         return data
 
     def _insert_data(self, data: int) -> int:
@@ -108,11 +227,25 @@ class HammingSECDEDECC(ECCBase):
             Codeword with data bits in position
         """
         codeword = 0
-        for i, pos in enumerate(self.data_positions):
-            bit = (data >> i) & 1
-            codeword |= (bit << pos)
+        for data_lo, length, pos in self._engine.runs:
+            codeword |= ((data >> data_lo) & ((1 << length) - 1)) << pos
         return codeword
 
+    def _syndrome(self, codeword: int) -> int:
+        """
+        Calculate the Hamming syndrome of a codeword.
+        
+        Args:
+            codeword: The codeword
+            
+        Returns:
+            Syndrome (1-based error position, 0 if all checks pass)
+        """
+        syndrome = 0
+        for i, mask in enumerate(self._engine.check_masks):
+            syndrome |= (bin(codeword & mask).count('1') & 1) << i
+        return syndrome
+
     def _calculate_parity(self, codeword: int) -> int:
         """
         Calculate parity bits for the codeword.
@@ -124,15 +257,9 @@ class HammingSECDEDECC(ECCBase):
             Parity bits
         """
         parity = 0
+        syndrome = self._syndrome(codeword)
         for i, pos in enumerate(self.parity_positions):
-            # Calculate parity for this parity bit
-            p = 0
-            for j in range(self.n):
-                if j != pos and ((codeword >> j) & 1):
-                    # Check if this bit position is covered by this parity bit
-                    if (j + 1) & (1 << i):
-                        p ^= 1
-            parity |= (p << pos)
+            parity |= ((syndrome >> i) & 1) << pos
         return parity
 
     def encode(self, data: int) -> int:
@@ -168,34 +295,59 @@ class HammingSECDEDECC(ECCBase):
         Returns:
             Tuple of (decoded_data, error_type)
         """
-        # Calculate syndrome
-        syndrome = 0
-        for i, pos in enumerate(self.parity_positions):
-            # Calculate expected parity
-            expected_parity = 0
-            for j in range(self.n):
-                if j != pos and ((codeword >> j) & 1):
-                    # Check if this bit position is covered by this parity bit
-                    if (j + 1) & (1 << i):
-                        expected_parity ^= 1
-            
-            # Compare with actual parity
-            actual_parity = (codeword >> pos) & 1
-            if expected_parity != actual_parity:
-                syndrome |= (1 << i)
+        syndrome = self._syndrome(codeword)
+        error_bit = self._engine.syndrome_to_position[syndrome]
         
-        if syndrome == 0:
+        if error_bit == _NO_ERROR:
             # No error detected
             return self._extract_data(codeword), 'corrected'
-        elif syndrome <= self.n:
+        elif error_bit >= 0:
             # Single bit error detected and corrected
-            error_bit = syndrome - 1
-            corrected_codeword = codeword ^ (1 << error_bit)
+            corrected_codeword = codeword ^ (1 << int(error_bit))
             return self._extract_data(corrected_codeword), 'corrected'
         else:
             # Double bit error detected but not corrected
             return self._extract_data(codeword), 'detected'
 
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        """
+        Encode an array of data words.
+
+        Args:
+            data: 1-D array of data words.
+
+        Returns:
+            Array of codewords.
+        """
+        data = as_word_array(as_word_array(data) & ((1 << self.word_length) - 1), self.word_length)
+        lanes = self._engine.insert(_to_lanes(data, self._engine.k_lanes))
+        syndrome = self._engine.syndromes(lanes)
+        for i, pos in enumerate(self.parity_positions):
+            lanes[:, pos // 64] |= ((syndrome >> i) & 1).astype(np.uint64) << np.uint64(pos % 64)
+        return _from_lanes(lanes, self.n)
+
+    def decode_batch(self, codewords: np.ndarray):
+        """
+        Decode an array of codewords.
+
+        Args:
+            codewords: 1-D array of codewords.
+
+        Returns:
+            Tuple of (decoded_data, error_codes).
+        """
+        engine = self._engine
+        lanes = _to_lanes(as_word_array(codewords), engine.lanes)
+        lanes[:, -1] &= engine.last_lane_mask
+        error_bit = engine.syndrome_to_position[engine.syndromes(lanes)]
+        
+        rows = np.nonzero(error_bit >= 0)[0]
+        flip = error_bit[rows].astype(np.uint64)
+        lanes[rows, (flip // np.uint64(64)).astype(np.intp)] ^= np.uint64(1) << (flip % np.uint64(64))
+        
+        codes = np.where(error_bit == _DOUBLE_ERROR, DETECTED, CORRECTED).astype(np.uint8)
+        return _from_lanes(engine.extract(lanes), self.k), codes
+
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         """
         Flip the bit at bit_idx in the codeword.
@@ -0,0 +1,544 @@
+#!/usr/bin/env python3
+"""
+Sparse/packed LDPC engine shared by the LDPC ECC classes.
+
+The encoder uses the systematic G. Syndromes and hard-decision bit flipping
+run on the sparse pre-reduction H, which defines the same code. That H is
+held as CSR adjacency (check -> variables and variable -> checks) and as
+packed rows (Python ints for scalar words, uint64 limbs for NumPy batches).
+A syndrome bit is the parity of popcount(row & word). Each iteration, the
+bit-flipping decoder flips the lowest-index variable with the most
+unsatisfied checks. The syndrome and the per-variable unsatisfied-check
+counts are kept up to date incrementally: flipping v toggles only the
+checks of v, so only the counts of those checks' variables change, by +-1.
+The batch decoder does this in lock step from padded copies of the same
+neighbour lists.
+
+Matrices come from a seeded dual-diagonal construction reduced to systematic
+form by a row-vectorized GF(2) elimination; the (H, G) pair is cached on disk
+keyed by (n, k, seed) so every process and the RTL generator share one code.
+The generated RTL checks and flips on the same sparse H with the same rule
+(lowest-index variable with the most unsatisfied checks, BF_MAX_ITER flips).
+Soft-decision decoding (MinSumDecoder) runs layered normalized min-sum on the
+sparse pre-reduction H, which defines the same code with far fewer edges.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from base_ecc import CORRECTED, DETECTED, pack_bits, unpack_bits, word_parity
+
+BF_MAX_ITER = 20
+# Layered normalized min-sum defaults (decode_llr)
+LLR_MAX_ITER = 20
+LLR_ALPHA = 0.75
+
+# Column weight of the random data part H_d
+LDPC_DV = 3
+LDPC_SEED = 0
+
+# Bump whenever the construction below changes; stale files are then ignored.
+LDPC_MATRIX_VERSION = 1
+LDPC_MATRIX_DIR = Path(
+    os.environ.get("CORE_CC_LDPC_MATRIX_DIR", Path(__file__).resolve().parent.parent / "results" / "ldpc_matrices")
+)
+
+_MASK64 = (1 << 64) - 1
+
+
+def gf2_systematic(H: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Row-reduce H (m x n) over GF(2) so its last m columns become the identity.
+
+    Pivots are taken in column order from the first row at or below the
+    current pivot row, and each elimination step XORs the pivot row into every
+    other row holding a 1 in one vectorized operation.
+
+    Returns:
+        The reduced matrix [P | I] (a new array), or None if the right block is singular.
+    """
+    H = np.array(H, dtype=np.uint8)
+    m, n = H.shape
+    for pivot, j in enumerate(range(n - m, n)):
+        below = np.flatnonzero(H[pivot:, j])
+        if below.size == 0:
+            return None
+        target = pivot + int(below[0])
+        if target != pivot:
+            H[[pivot, target]] = H[[target, pivot]]
+        rows = H[:, j].astype(bool)
+        rows[pivot] = False
+        H[rows] ^= H[pivot]
+    return H
+
+
+def dual_diagonal_matrix(n: int, k: int, seed: int = LDPC_SEED) -> np.ndarray:
+    """
+    Seeded sparse H = [H_d | H_p] before systematic reduction.
+
+    Column j of H_d gets LDPC_DV ones at rows drawn with
+    ``RandomState(seed).choice`` in column order; H_p has ones on the main and
+    sub-diagonal, so its reduction always succeeds.
+    """
+    m = n - k
+    rng = np.random.RandomState(seed)
+    H = np.zeros((m, n), dtype=np.uint8)
+    for j in range(k):
+        H[rng.choice(m, min(LDPC_DV, m), replace=False), j] = 1
+    parity = np.arange(m)
+    H[parity, k + parity] = 1
+    H[parity[1:], k + parity[:-1]] = 1
+    return H
+
+
+def build_ldpc_matrices(n: int, k: int, seed: int = LDPC_SEED) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Seeded dual-diagonal construction (see dual_diagonal_matrix) reduced to systematic form.
+
+    Returns:
+        (H_syst, G) with H_syst = [P | I] and G = [I | P.T], both uint8.
+    """
+    H_syst = gf2_systematic(dual_diagonal_matrix(n, k, seed))
+    if H_syst is None:
+        raise ValueError(f"LDPC parity block is singular for n={n}, k={k}")
+    G = np.hstack((np.eye(k, dtype=np.uint8), H_syst[:, :k].T))
+    return H_syst, G
+
+
+def ldpc_matrix_path(n: int, k: int, seed: int, cache_dir: Path | None = None) -> Path:
+    """Cache file keyed by (n, k, seed, version)."""
+    base = Path(cache_dir) if cache_dir is not None else LDPC_MATRIX_DIR
+    return base / f"ldpc_n{n}_k{k}_s{seed}_v{LDPC_MATRIX_VERSION}.npz"
+
+
+def _save_matrices(path: Path, H: np.ndarray, G: np.ndarray) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            np.savez(fh, H=H, G=G)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+_MATRICES: Dict[Tuple[int, int, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+
+def load_ldpc_matrices(
+    n: int, k: int, seed: int = LDPC_SEED, cache_dir: Path | None = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (H, G) for (n, k, seed): process cache, then disk cache, then build and save.
+
+    Every process (benchmark workers, RTL generators) therefore sees the same
+    matrices for the same key. The returned arrays are read-only uint8.
+    """
+    key = (n, k, seed)
+    if cache_dir is None and key in _MATRICES:
+        return _MATRICES[key]
+    path = ldpc_matrix_path(n, k, seed, cache_dir)
+    try:
+        with np.load(path) as f:
+            H, G = f["H"], f["G"]
+        if H.shape != (n - k, n) or G.shape != (k, n):
+            raise ValueError(f"corrupt LDPC matrix file {path}")
+    except (OSError, ValueError, KeyError):
+        H, G = build_ldpc_matrices(n, k, seed)
+        try:
+            _save_matrices(path, H, G)
+        except OSError:
+            pass  # read-only checkout: keep the in-memory copy
+    H.setflags(write=False)
+    G.setflags(write=False)
+    if cache_dir is None:
+        _MATRICES[key] = (H, G)
+    return H, G
+
+
+def word_limbs(words: np.ndarray, nbits: int) -> np.ndarray:
+    """Split a 1-D word array (uint64 or object) into (N, ceil(nbits/64)) uint64 limbs, low limb first."""
+    words = np.asarray(words)
+    nlimbs = max(1, (nbits + 63) // 64)
+    if words.dtype != object:
+        limbs = words.astype(np.uint64).reshape(-1, 1)
+        if nlimbs > 1:
+            limbs = np.hstack([limbs, np.zeros((len(words), nlimbs - 1), dtype=np.uint64)])
+        return limbs
+    return np.stack([((words >> (64 * i)) & _MASK64).astype(np.uint64) for i in range(nlimbs)], axis=1)
+
+
+def _mask_limbs(mask: int, nlimbs: int) -> List[int]:
+    return [(mask >> (64 * i)) & _MASK64 for i in range(nlimbs)]
+
+
+def masked_parity_batch(limbs: np.ndarray, masks: np.ndarray) -> np.ndarray:
+    """
+    Parity of (word & mask) for every word/mask pair.
+
+    Args:
+        limbs: (N, L) uint64 word limbs (see ``word_limbs``).
+        masks: (R, L) uint64 packed masks.
+
+    Returns:
+        (N, R) uint8 array of parities.
+    """
+    acc = limbs[:, None, 0] & masks[None, :, 0]
+    for i in range(1, limbs.shape[1]):
+        acc ^= limbs[:, None, i] & masks[None, :, i]
+    return word_parity(acc, 64).astype(np.uint8)
+
+
+class LDPCEngine:
+    """Packed encoder and bit-flipping decoder for one (H, G) pair; see module docstring."""
+
+    def __init__(self, H: np.ndarray, G: np.ndarray, H_sparse: np.ndarray = None,
+                 max_iter: int = BF_MAX_ITER) -> None:
+        """
+        Args:
+            H: Systematic parity-check matrix [P | I] matching G.
+            G: Systematic generator matrix [I | P.T].
+            H_sparse: Sparse parity-check matrix of the same code used for
+                decoding (default: H).
+            max_iter: Bit-flipping iteration cap.
+        """
+        self.H = np.asarray(H, dtype=np.uint8)
+        self.G = np.asarray(G, dtype=np.uint8)
+        self.H_sparse = self.H if H_sparse is None else np.asarray(H_sparse, dtype=np.uint8)
+        self.m, self.n = self.H_sparse.shape
+        self.k = self.G.shape[0]
+        self.max_iter = max_iter
+        self._data_mask = (1 << self.k) - 1
+
+        # CSR adjacency of the decoding H in both directions
+        rows, cols = np.nonzero(self.H_sparse)
+        self.check_ptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=self.m))))
+        self.check_vars = cols
+        order = np.argsort(cols, kind="stable")
+        self.var_ptr = np.concatenate(([0], np.cumsum(np.bincount(cols, minlength=self.n))))
+        self.var_checks = rows[order]
+
+        # Padded per-variable lists for the batch decoder: the checks of v
+        # (dummy check m) and every (check slot, variable) edge of those
+        # checks (dummy variable n), so one flip is one gather and scatter
+        checks = [self.var_checks[self.var_ptr[v]:self.var_ptr[v + 1]] for v in range(self.n)]
+        degree = max(1, max(len(c) for c in checks))
+        self._checks_pad = np.full((self.n, degree), self.m, dtype=np.intp)
+        edges = [[(slot, var) for slot, c in enumerate(cs)
+                  for var in self.check_vars[self.check_ptr[c]:self.check_ptr[c + 1]]] for cs in checks]
+        width = max(1, max(len(e) for e in edges))
+        self._edge_slots = np.zeros((self.n, width), dtype=np.intp)
+        self._edge_vars = np.full((self.n, width), self.n, dtype=np.intp)
+        for v in range(self.n):
+            self._checks_pad[v, :len(checks[v])] = checks[v]
+            if edges[v]:
+                self._edge_slots[v, :len(edges[v])], self._edge_vars[v, :len(edges[v])] = zip(*edges[v])
+
+        # Packed rows / columns of the decoding H (syndrome) and parity columns of G (encoder)
+        self.row_masks = [self._pack(self.H_sparse[c]) for c in range(self.m)]
+        self.col_masks = [self._pack(self.H_sparse[:, v]) for v in range(self.n)]
+        self.parity_masks = [self._pack(self.G[:, j]) for j in range(self.k, self.n)]
+        word_len = max(1, (self.n + 63) // 64)
+        data_len = max(1, (self.k + 63) // 64)
+        self._row_limbs = np.array([_mask_limbs(r, word_len) for r in self.row_masks],
+                                   dtype=np.uint64).reshape(self.m, word_len)
+        self._parity_limbs = np.array([_mask_limbs(p, data_len) for p in self.parity_masks],
+                                      dtype=np.uint64).reshape(self.n - self.k, data_len)
+
+    @staticmethod
+    def _pack(bits: np.ndarray) -> int:
+        mask = 0
+        for i in np.flatnonzero(bits):
+            mask |= 1 << int(i)
+        return mask
+
+    # --- encode -------------------------------------------------------------
+
+    def encode(self, data: int) -> int:
+        data &= self._data_mask
+        codeword = data
+        for j, mask in enumerate(self.parity_masks):
+            codeword |= (bin(data & mask).count('1') & 1) << (self.k + j)
+        return codeword
+
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        data_bits = unpack_bits(data, self.k)
+        limbs = word_limbs(pack_bits(data_bits), self.k)
+        parity = masked_parity_batch(limbs, self._parity_limbs)
+        return pack_bits(np.hstack([data_bits, parity]))
+
+    # --- syndrome -----------------------------------------------------------
+
+    def syndrome(self, codeword: int) -> int:
+        """Packed syndrome (bit c = check c unsatisfied)."""
+        s = 0
+        for c, row in enumerate(self.row_masks):
+            s |= (bin(codeword & row).count('1') & 1) << c
+        return s
+
+    def syndrome_batch(self, codewords: np.ndarray) -> np.ndarray:
+        """(N, m) uint8 syndrome bits of a word array."""
+        return masked_parity_batch(word_limbs(codewords, self.n), self._row_limbs)
+
+    def _votes(self, unsat: np.ndarray) -> np.ndarray:
+        """Unsatisfied-check count per variable from (N, m + 1) syndrome bits (dummy check last)."""
+        return unsat[:, self._checks_pad].sum(axis=2, dtype=np.int32)
+
+    # --- bit flipping -------------------------------------------------------
+
+    def decode(self, codeword: int, trace: Optional[List[int]] = None) -> Tuple[int, bool]:
+        """
+        Bit-flipping decode of one word.
+
+        Args:
+            codeword: Received word.
+            trace: If given, each flipped variable is appended to it in order.
+
+        Returns:
+            (data, converged): the systematic bits of the decoded word if the
+            syndrome reached zero within max_iter flips, otherwise those of
+            the received word.
+        """
+        codeword &= (1 << self.n) - 1
+        s = self.syndrome(codeword)
+        if s == 0:
+            return codeword & self._data_mask, True
+
+        unsat = np.array([(s >> c) & 1 for c in range(self.m)] + [0], dtype=np.uint8)
+        votes = self._votes(unsat[None, :])[0]
+        x = codeword
+        for _ in range(self.max_iter):
+            if s == 0:
+                return x & self._data_mask, True
+            v = int(np.argmax(votes))
+            if votes[v] == 0:
+                break
+            x ^= 1 << v
+            if trace is not None:
+                trace.append(v)
+            s ^= self.col_masks[v]
+            for c in self.var_checks[self.var_ptr[v]:self.var_ptr[v + 1]]:
+                votes[self.check_vars[self.check_ptr[c]:self.check_ptr[c + 1]]] += -1 if unsat[c] else 1
+                unsat[c] ^= 1
+        if s == 0:
+            return x & self._data_mask, True
+        return codeword & self._data_mask, False
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Bit-flipping decode of a word array, all words in lock step.
+
+        Returns:
+            (data, codes) with CORRECTED for converged words and DETECTED otherwise.
+        """
+        received = unpack_bits(codewords, self.n)
+        count = len(received)
+        x = received.copy()
+        unsat = np.zeros((count, self.m + 1), dtype=np.uint8)
+        unsat[:, :self.m] = self.syndrome_batch(codewords)
+        # Column n collects the padding edges and never wins the argmax
+        votes = np.zeros((count, self.n + 1), dtype=np.int32)
+        votes[:, :self.n] = self._votes(unsat)
+        converged = np.zeros(count, dtype=bool)
+        live = np.ones(count, dtype=bool)
+
+        for _ in range(self.max_iter):
+            idx = np.flatnonzero(live)
+            if idx.size == 0:
+                break
+            done = ~unsat[idx, :self.m].any(axis=1)
+            converged[idx[done]] = True
+            live[idx[done]] = False
+            idx = idx[~done]
+            if idx.size == 0:
+                break
+            row_votes = votes[idx, :self.n]
+            v = np.argmax(row_votes, axis=1)
+            stuck = row_votes[np.arange(idx.size), v] == 0
+            live[idx[stuck]] = False
+            idx, v = idx[~stuck], v[~stuck]
+            x[idx, v] ^= 1
+            checks = self._checks_pad[v]
+            signs = 1 - 2 * unsat[idx[:, None], checks].astype(np.int32)
+            unsat[idx[:, None], checks] ^= 1
+            delta = np.take_along_axis(signs, self._edge_slots[v], axis=1)
+            np.add.at(votes, (np.broadcast_to(idx[:, None], delta.shape), self._edge_vars[v]), delta)
+        # Words whose last allowed flip cleared the syndrome
+        idx = np.flatnonzero(live)
+        converged[idx[~unsat[idx, :self.m].any(axis=1)]] = True
+
+        data_bits = np.where(converged[:, None], x[:, :self.k], received[:, :self.k])
+        codes = np.where(converged, CORRECTED, DETECTED).astype(np.uint8)
+        return pack_bits(data_bits), codes
+
+
+class MinSumDecoder:
+    """
+    Layered normalized min-sum decoder over one parity-check matrix.
+
+    Check rows are greedily grouped into layers whose rows share no variable,
+    so one layer is a single vectorized update across every row in it and
+    every frame in the batch. Rows are padded to the layer's widest row with a
+    dummy variable pinned at a huge positive LLR, which never wins a minimum
+    and never flips a sign. LLRs are log(P(bit=0) / P(bit=1)).
+    """
+
+    _PAD_LLR = np.float32(1e9)
+
+    def __init__(self, H: np.ndarray) -> None:
+        self.H = np.asarray(H, dtype=np.uint8)
+        self.m, self.n = self.H.shape
+
+        layer_rows: List[List[int]] = []
+        layer_used: List[int] = []
+        row_vars = [np.flatnonzero(self.H[c]) for c in range(self.m)]
+        row_masks = [LDPCEngine._pack(self.H[c]) for c in range(self.m)]
+        for c in range(self.m):
+            for i, used in enumerate(layer_used):
+                if not used & row_masks[c]:
+                    layer_rows[i].append(c)
+                    layer_used[i] |= row_masks[c]
+                    break
+            else:
+                layer_rows.append([c])
+                layer_used.append(row_masks[c])
+        # CSR rows of H for the syndrome check (empty rows are always satisfied)
+        rows, self._check_vars = np.nonzero(self.H)
+        self._check_starts = np.flatnonzero(np.diff(rows, prepend=-1))
+
+        # Per layer: (R, w) variable indices padded with n, and the padding mask
+        self.layers: List[Tuple[np.ndarray, np.ndarray]] = []
+        for rows in layer_rows:
+            width = max(1, max(len(row_vars[c]) for c in rows))
+            idx = np.full((len(rows), width), self.n, dtype=np.intp)
+            for r, c in enumerate(rows):
+                idx[r, :len(row_vars[c])] = row_vars[c]
+            self.layers.append((idx, idx == self.n))
+
+    def syndrome_ok(self, bits: np.ndarray) -> np.ndarray:
+        """
+        True for each row of a (N, n) 0/1 matrix that satisfies every check.
+
+        Bit-sliced: each variable's bits are packed across frames into uint64
+        lanes (64 frames per word), a check is the XOR of its variables' lanes
+        over the CSR rows of H, and a frame fails if any check lane has its bit set.
+        """
+        count = bits.shape[0]
+        if self._check_vars.size == 0:
+            return np.ones(count, dtype=bool)
+        nwords = max(1, (count + 63) // 64)
+        lanes = np.zeros((self.n, 8 * nwords), dtype=np.uint8)
+        lanes[:, :(count + 7) // 8] = np.packbits(bits.T, axis=1, bitorder="little")
+        lanes = lanes.view(np.uint64)
+        checks = np.bitwise_xor.reduceat(lanes[self._check_vars], self._check_starts, axis=0)
+        failed = np.bitwise_or.reduce(checks, axis=0)
+        return np.unpackbits(failed.view(np.uint8), bitorder="little")[:count] == 0
+
+    def decode(self, llr: np.ndarray, max_iter: int = LLR_MAX_ITER, alpha: float = LLR_ALPHA,
+               early_stop: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Decode a batch of frames.
+
+        Args:
+            llr: (N, n) or (n,) channel LLRs; column i is codeword bit i.
+            max_iter: Maximum number of full sweeps over all layers.
+            alpha: Normalization factor applied to every check-to-variable message.
+            early_stop: Retire each frame as soon as its hard decision satisfies H.
+
+        Returns:
+            (bits, converged, iterations): (N, n) uint8 hard decisions, whether
+            each frame ended on a codeword, and the sweeps spent on it.
+        """
+        llr = np.atleast_2d(np.asarray(llr, dtype=np.float32))
+        count = llr.shape[0]
+        bits = (llr < 0).astype(np.uint8)
+        converged = self.syndrome_ok(bits) if early_stop else np.zeros(count, dtype=bool)
+        iterations = np.zeros(count, dtype=np.int32)
+        live = np.flatnonzero(~converged)
+        if live.size == 0 or max_iter <= 0:
+            return bits, self.syndrome_ok(bits), iterations
+
+        post = np.empty((live.size, self.n + 1), dtype=np.float32)
+        post[:, :self.n] = llr[live]
+        post[:, self.n] = self._PAD_LLR
+        msgs = [np.zeros((live.size,) + idx.shape, dtype=np.float32) for idx, _ in self.layers]
+        alpha = np.float32(alpha)
+
+        for it in range(1, max_iter + 1):
+            for (idx, pad), r_old in zip(self.layers, msgs):
+                q = post[:, idx] - r_old
+                mag = np.abs(q)
+                neg = q < 0
+                first = mag.argmin(axis=2)[..., None]
+                min1 = np.take_along_axis(mag, first, axis=2)
+                np.put_along_axis(mag, first, np.inf, axis=2)
+                min2 = mag.min(axis=2, keepdims=True)
+                is_first = np.arange(idx.shape[1]) == first
+                r_new = alpha * np.where(is_first, min2, min1)
+                flip = neg ^ np.logical_xor.reduce(neg, axis=2, keepdims=True)
+                r_new = np.where(flip, -r_new, r_new)
+                r_new[:, pad] = 0.0
+                post[:, idx] = q + r_new
+                r_old[...] = r_new
+
+            hard = (post[:, :self.n] < 0).astype(np.uint8)
+            iterations[live] = it
+            if not early_stop and it < max_iter:
+                continue
+            ok = self.syndrome_ok(hard)
+            bits[live] = hard
+            converged[live] = ok
+            if not early_stop or ok.all():
+                break
+            keep = ~ok
+            live = live[keep]
+            post = post[keep]
+            msgs = [r[keep] for r in msgs]
+
+        return bits, converged, iterations
+
+    def decode_data(self, llr: np.ndarray, data_bits: int, max_iter: int = LLR_MAX_ITER,
+                    alpha: float = LLR_ALPHA, early_stop: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """``decode`` reduced to the decode_batch convention for a systematic code:
+        (low ``data_bits`` of each hard decision as words, CORRECTED/DETECTED codes)."""
+        bits, converged, _ = self.decode(llr, max_iter, alpha, early_stop)
+        return pack_bits(bits[:, :data_bits]), np.where(converged, CORRECTED, DETECTED).astype(np.uint8)
+
+
+_ENGINES: Dict[Tuple[int, int, int], LDPCEngine] = {}
+
+
+def get_engine(n: int, k: int, seed: int = LDPC_SEED) -> LDPCEngine:
+    """Shared engine per (n, k, seed): cached systematic (H, G), bit flipping on the sparse H."""
+    key = (n, k, seed)
+    if key not in _ENGINES:
+        H, G = load_ldpc_matrices(n, k, seed)
+        _ENGINES[key] = LDPCEngine(H, G, dual_diagonal_matrix(n, k, seed))
+    return _ENGINES[key]
+
+
+_MIN_SUM: Dict[Tuple[int, int, int], MinSumDecoder] = {}
+
+
+def get_min_sum_decoder(n: int, k: int, seed: int = LDPC_SEED) -> MinSumDecoder:
+    """Shared min-sum decoder per (n, k, seed), run on the sparse dual-diagonal H."""
+    key = (n, k, seed)
+    if key not in _MIN_SUM:
+        _MIN_SUM[key] = MinSumDecoder(dual_diagonal_matrix(n, k, seed))
+    return _MIN_SUM[key]
+
+
+if __name__ == "__main__":
+    for width in (4, 8, 16, 32, 64, 128):
+        path = ldpc_matrix_path(2 * width, width, LDPC_SEED)
+        load_ldpc_matrices(2 * width, width)
+        print(f"n={2 * width} k={width}: {path}")
@@ -3,6 +3,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.base_ecc import ECCBase
+from src.ldpc_codec import LLR_ALPHA, LLR_MAX_ITER, MinSumDecoder
 import numpy as np
 
 class NonBinaryLDPCECC(ECCBase):
@@ -45,6 +46,21 @@ class NonBinaryLDPCECC(ECCBase):
         self.data_positions = list(range(self.k))
         self.parity_positions = list(range(self.k, self.n))
 
+        # Parity-check matrix of the rule in _calculate_parity: check i covers
+        # parity bit k+i and every data bit j with (j + k + i) % 3 == 0
+        self.H = self._generate_parity_check_matrix()
+        self._llr_decoder = None  # MinSumDecoder, built on first decode_llr
+
+    def _generate_parity_check_matrix(self) -> np.ndarray:
+        """Build H = [P^T | I] matching _calculate_parity."""
+        m = self.n - self.k
+        checks = np.arange(m)[:, None]
+        data = np.arange(self.k)[None, :]
+        H = np.zeros((m, self.n), dtype=int)
+        H[:, :self.k] = (data + self.k + checks) % 3 == 0
+        H[np.arange(m), self.k + np.arange(m)] = 1
+        return H
+
     def _extract_data(self, codeword: int) -> int:
         """Extract data bits from codeword."""
         data = 0
@@ -178,6 +194,24 @@ class NonBinaryLDPCECC(ECCBase):
             # Error detected but not corrected
             return self._extract_data(codeword), 'detected'
 
+    def decode_llr(self, llr: np.ndarray, max_iter: int = LLR_MAX_ITER, alpha: float = LLR_ALPHA,
+                   early_stop: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Soft-decision decode with layered normalized min-sum over H.
+
+        Args:
+            llr: (N, n) or (n,) channel LLRs, log(P(0)/P(1)) per codeword bit.
+            max_iter: Maximum number of decoding iterations.
+            alpha: Min-sum normalization factor.
+            early_stop: Stop each frame once its hard decision satisfies H.
+
+        Returns:
+            Tuple of (decoded_data, error_codes) as in decode_batch.
+        """
+        if self._llr_decoder is None:
+            self._llr_decoder = MinSumDecoder(self.H)
+        return self._llr_decoder.decode_data(llr, self.k, max_iter, alpha, early_stop)
+
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         """
         Flip the bit at bit_idx in the codeword.
@@ -1,8 +1,9 @@
 from typing import Tuple
+import numpy as np
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.base_ecc import ECCBase
+from src.base_ecc import ECCBase, CORRECTED, DETECTED, as_word_array, word_dtype, word_parity
 
 class ParityECC(ECCBase):
     """Parity bit ECC implementation."""
@@ -65,6 +66,38 @@ class ParityECC(ECCBase):
         else:
             return data_bits, 'detected'   # Error detected
 
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        """
+        Encode an array of data words with even parity.
+
+        Args:
+            data: 1-D array of data words.
+
+        Returns:
+            Array of codewords (data shifted left, parity bit as LSB).
+        """
+        data = as_word_array(data, self.word_length)
+        if self.word_length < 64 and np.any(data >> self.word_length):
+            raise ValueError(f"Data exceeds word length {self.word_length} bits")
+        data = data.astype(word_dtype(self.n))
+        return (data << 1) | word_parity(data, self.word_length)
+
+    def decode_batch(self, codewords: np.ndarray):
+        """
+        Decode an array of parity codewords.
+
+        Args:
+            codewords: 1-D array of codewords.
+
+        Returns:
+            Tuple of (decoded_data, error_codes).
+        """
+        codewords = as_word_array(codewords, self.n)
+        data_bits = codewords >> 1
+        expected = word_parity(data_bits & ((1 << self.word_length) - 1), self.word_length)
+        codes = np.where((codewords & 1) == expected, CORRECTED, DETECTED).astype(np.uint8)
+        return data_bits, codes
+
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         """
         Flip the bit at bit_idx in the codeword.
@@ -9,8 +9,12 @@ from typing import List, Tuple
 import os
 import sys
 
+import numpy as np
+
 sys.path.insert(0, os.path.dirname(__file__))
-from bch_codec import BCHCodec, GF2m, berlekamp_massey, chien_search, poly_eval  # noqa: E402
+from bch_codec import (  # noqa: E402
+    BCHCodec, GF2m, berlekamp_massey, chien_search, chien_search_batch, poly_eval,
+)
 
 
 def gf_det3(
@@ -131,29 +135,37 @@ def validate() -> None:
     codec = BCHCodec.for_width(16)
     gf = codec.gf
     n = codec.n
-    fails = 0
-    tests = 0
     data = 0x1234
     cw = codec.encode(data)
+    syns: List[List[int]] = []
+    masks: List[int] = []
     for errs in range(4):
         if errs == 0:
-            masks = [0]
+            masks.append(0)
         else:
-            masks = [sum(1 << p for p in c) for c in combinations(range(n), errs)]
-        for mask in masks:
-            cw_e = cw ^ mask
-            syn = codec.syndromes_gf(cw_e)
-            lam_bm = berlekamp_massey(syn, gf, 3)
-            lam_pgz = pgz_locator_v2(syn, gf)
-            roots_bm = chien_search(lam_bm, gf, n)
-            roots_pgz = chien_search(lam_pgz, gf, n)
-            tests += 1
-            if roots_bm != roots_pgz:
-                fails += 1
-                if fails <= 5:
-                    print("FAIL", errs, hex(mask), "syn", syn)
-                    print("  bm", lam_bm, roots_bm)
-                    print("  pgz", lam_pgz, roots_pgz)
+            masks.extend(sum(1 << p for p in c) for c in combinations(range(n), errs))
+    lams_bm = []
+    lams_pgz = []
+    for mask in masks:
+        syn = codec.syndromes_gf(cw ^ mask)
+        syns.append(syn)
+        lams_bm.append(berlekamp_massey(syn, gf, 3))
+        lams_pgz.append(pgz_locator_v2(syn, gf))
+
+    # One Chien pass over every locator (rows zero-padded to degree 3)
+    def _pad(lams: List[List[int]]) -> np.ndarray:
+        return np.array([lam + [0] * (4 - len(lam)) for lam in lams])
+
+    roots_bm = chien_search_batch(_pad(lams_bm), gf, n)
+    roots_pgz = chien_search_batch(_pad(lams_pgz), gf, n)
+    tests = len(masks)
+    bad = np.flatnonzero((roots_bm != roots_pgz).any(axis=1))
+    fails = len(bad)
+    for row in bad[:5]:
+        errs = bin(masks[row]).count("1")
+        print("FAIL", errs, hex(masks[row]), "syn", syns[row])
+        print("  bm", lams_bm[row], np.flatnonzero(roots_bm[row]).tolist())
+        print("  pgz", lams_pgz[row], np.flatnonzero(roots_pgz[row]).tolist())
     print(f"tests={tests} fails={fails}")
 
 
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Array-based polar transform and successive-cancellation decoder.
+
+Bit order follows PolarCodeRecursive: the transform of u = [u_top | u_bot] is
+[x_top ^ x_bot | x_bot], so the in-place butterfly XORs the upper half of
+every block of size 2h into its lower half, for h = 1, 2, ..., N/2.
+
+The SC decoder walks the same tree iteratively. Level s holds the LLRs of the
+current node of size 2^s (level n is the channel) and, once a left child of
+size 2^s is finished, its re-encoded bits (the partial sums used by g). Leaf
+i only recomputes from level ctz(i) downwards, and after each decision the
+partial sums are folded upwards while the finished node is a right child.
+Every array carries a leading frame axis, so one walk decodes a whole batch.
+
+Two further decoders share the construction: PolarFastSSC prunes the tree at
+Rate-0, Rate-1, repetition and single-parity-check nodes and decodes them in
+one step each, and PolarSCL keeps L paths per frame (optionally picking the
+survivor by CRC). Frozen sets come from polar_info_indices, which ranks bit
+channels by population count (the RTL heuristic), Bhattacharyya parameters or
+the Gaussian approximation, cached per (N, K, construction, design SNR).
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+CONSTRUCTIONS = ("popcount", "bhattacharyya", "ga")
+# Design Es/N0 (dB) for the Bhattacharyya and GA constructions
+DESIGN_SNR_DB = 0.0
+
+
+def _ga_phi(x: np.ndarray) -> np.ndarray:
+    """Chung's approximation of phi(x) = 1 - E[tanh(u/2)], u ~ N(x, 2x)."""
+    x = np.maximum(np.asarray(x, dtype=np.float64), 1e-12)
+    small = np.exp(-0.4527 * x ** 0.86 + 0.0218)
+    large = np.sqrt(np.pi / x) * np.exp(-x / 4.0) * (1.0 - 10.0 / (7.0 * x))
+    return np.where(x < 10.0, small, large)
+
+
+def _ga_phi_inv(y: np.ndarray) -> np.ndarray:
+    """Inverse of _ga_phi by bisection (phi is decreasing)."""
+    y = np.asarray(y, dtype=np.float64)
+    lo = np.zeros_like(y)
+    hi = np.full_like(y, 1e4)
+    for _ in range(100):
+        mid = 0.5 * (lo + hi)
+        above = _ga_phi(mid) > y
+        lo = np.where(above, mid, lo)
+        hi = np.where(above, hi, mid)
+    return 0.5 * (lo + hi)
+
+
+def channel_reliability(N: int, construction: str = "popcount",
+                        design_snr_db: float = DESIGN_SNR_DB) -> np.ndarray:
+    """
+    Reliability score of every bit channel u_0..u_{N-1} (higher is better).
+
+    The root split of the SC tree (the MSB of i) is the first polarization
+    step applied to the channel and the LSB the last, so each step maps a
+    score s_j to the pair (worse(s_j), better(s_j)) at indices (2j, 2j + 1).
+    """
+    n = int(math.log2(N))
+    if construction == "popcount":
+        return np.array([bin(i).count('1') for i in range(N)], dtype=np.float64)
+    snr = 10.0 ** (design_snr_db / 10.0)
+    if construction == "bhattacharyya":
+        # log Z: worse 2Z - Z^2, better Z^2
+        log_z = np.array([-snr])
+        for _ in range(n):
+            worse = log_z + np.log(2.0 - np.exp(log_z))
+            log_z = np.stack((worse, 2.0 * log_z), axis=1).reshape(-1)
+        return -log_z
+    if construction == "ga":
+        # Mean LLR: worse phi^-1(1 - (1 - phi(m))^2), better 2m
+        mean = np.array([4.0 * snr])
+        for _ in range(n):
+            worse = _ga_phi_inv(1.0 - (1.0 - _ga_phi(mean)) ** 2)
+            mean = np.stack((worse, 2.0 * mean), axis=1).reshape(-1)
+        return mean
+    raise ValueError(f"unknown polar construction {construction!r}")
+
+
+_CONSTRUCTION_CACHE: Dict[Tuple[int, int, str, float], Tuple[int, ...]] = {}
+
+
+def polar_info_indices(N: int, K: int, construction: str = "popcount",
+                       design_snr_db: float = DESIGN_SNR_DB) -> Tuple[int, ...]:
+    """
+    The K most reliable bit channels, ascending; ties go to the higher index.
+
+    "popcount" reproduces the original PolarCodeRecursive / RTL heuristic.
+    """
+    key = (N, K, construction, design_snr_db if construction != "popcount" else 0.0)
+    if key not in _CONSTRUCTION_CACHE:
+        if not 0 <= K <= N:
+            raise ValueError(f"K={K} out of range for N={N}")
+        score = channel_reliability(N, construction, design_snr_db)
+        order = np.lexsort((np.arange(N), score))
+        _CONSTRUCTION_CACHE[key] = tuple(sorted(int(i) for i in order[N - K:]))
+    return _CONSTRUCTION_CACHE[key]
+
+
+def polar_transform(u: np.ndarray) -> np.ndarray:
+    """
+    In-place polar transform x = u G_N over the last axis.
+
+    Args:
+        u: (..., N) array of 0/1 values, N a power of two; overwritten with x.
+
+    Returns:
+        ``u`` itself.
+    """
+    N = u.shape[-1]
+    h = 1
+    while h < N:
+        blocks = u.reshape(u.shape[:-1] + (N // (2 * h), 2, h))
+        blocks[..., 0, :] ^= blocks[..., 1, :]
+        h *= 2
+    return u
+
+
+class PolarSC:
+    """SC decoder state for one (N, info set); see module docstring."""
+
+    def __init__(self, N: int, info_indices: Iterable[int]) -> None:
+        self.N = N
+        self.n = int(math.log2(N))
+        self.info_mask = np.zeros(N, dtype=bool)
+        self.info_mask[sorted(info_indices)] = True
+        self.info_positions = np.flatnonzero(self.info_mask)
+        self.K = len(self.info_positions)
+        # Level at which leaf i resumes: ctz(i) (n for leaf 0, which starts at the channel)
+        self._resume = [self.n] + [(i & -i).bit_length() - 1 for i in range(1, N)]
+        self._frozen = [not f for f in self.info_mask.tolist()]
+
+    # --- encode -------------------------------------------------------------
+
+    def encode_bits(self, data_bits: np.ndarray) -> np.ndarray:
+        """(B, K) data bits -> (B, N) codeword bits; data bit j goes to the j-th info index."""
+        data_bits = np.asarray(data_bits, dtype=np.uint8)
+        u = np.zeros((data_bits.shape[0], self.N), dtype=np.uint8)
+        u[:, self.info_positions] = data_bits
+        return polar_transform(u)
+
+    # --- SC decode ----------------------------------------------------------
+
+    def decode_llr(self, llr: np.ndarray) -> np.ndarray:
+        """
+        Min-sum SC decode of a batch of channel LLRs.
+
+        Args:
+            llr: (B, N) LLRs, positive favouring 0 (column i is codeword bit i).
+
+        Returns:
+            (B, N) uint8 decisions u (frozen positions are 0).
+        """
+        llr = np.asarray(llr, dtype=np.float32)
+        count = llr.shape[0]
+        n = self.n
+        L: List[np.ndarray] = [np.empty((count, 1 << s), dtype=np.float32) for s in range(n)] + [llr]
+        left: List[np.ndarray] = [np.empty((count, 1 << s), dtype=np.uint8) for s in range(n)]
+        u = np.zeros((count, self.N), dtype=np.uint8)
+
+        for i in range(self.N):
+            s = self._resume[i]
+            if s < n:
+                # g at the parent of the right child starting at leaf i
+                parent = L[s + 1]
+                h = 1 << s
+                a, b = parent[:, :h], parent[:, h:]
+                L[s][...] = np.where(left[s] != 0, b - a, b + a)
+            # f down to the leaf
+            while s > 0:
+                s -= 1
+                parent = L[s + 1]
+                h = 1 << s
+                a, b = parent[:, :h], parent[:, h:]
+                mag = np.minimum(np.abs(a), np.abs(b))
+                L[s][...] = np.where((a < 0) ^ (b < 0), -mag, mag)
+
+            if self._frozen[i]:
+                x = np.zeros((count, 1), dtype=np.uint8)
+            else:
+                x = (L[0] < 0).astype(np.uint8)
+                u[:, i] = x[:, 0]
+
+            # Fold partial sums upwards while the finished node is a right child
+            s, j = 0, i
+            while j & 1:
+                x = np.concatenate((left[s] ^ x, x), axis=1)
+                s += 1
+                j >>= 1
+            if s < n:
+                left[s][...] = x
+        return u
+
+    def decode_llr_scalar(self, llr: List[float]) -> List[int]:
+        """Same walk as decode_llr for one frame, on preallocated Python lists."""
+        n = self.n
+        L = [[0.0] * (1 << s) for s in range(n)] + [list(llr)]
+        left = [[0] * (1 << s) for s in range(n)]
+        u = [0] * self.N
+        frozen = self._frozen
+
+        for i in range(self.N):
+            s = self._resume[i]
+            if s < n:
+                parent, out, part = L[s + 1], L[s], left[s]
+                h = 1 << s
+                for j in range(h):
+                    out[j] = parent[j + h] - parent[j] if part[j] else parent[j + h] + parent[j]
+            while s > 0:
+                s -= 1
+                parent, out = L[s + 1], L[s]
+                h = 1 << s
+                for j in range(h):
+                    a = parent[j]
+                    b = parent[j + h]
+                    mag = min(abs(a), abs(b))
+                    out[j] = -mag if (a < 0) ^ (b < 0) else mag
+
+            bit = 0 if frozen[i] or L[0][0] >= 0 else 1
+            u[i] = bit
+            x = [bit]
+            s, j = 0, i
+            while j & 1:
+                part = left[s]
+                x = [p ^ v for p, v in zip(part, x)] + x
+                s += 1
+                j >>= 1
+            if s < n:
+                left[s] = x
+        return u
+
+    def decode_hard(self, code_bits: np.ndarray, magnitude: float = 4.0) -> np.ndarray:
+        """SC decode of hard (B, N) 0/1 codeword bits mapped to +-magnitude LLRs."""
+        llr = np.where(np.asarray(code_bits) != 0, -magnitude, magnitude).astype(np.float32)
+        return self.decode_llr(llr)
+
+    def data_bits(self, u: np.ndarray) -> np.ndarray:
+        """(B, N) decisions -> (B, K) data bits."""
+        return u[:, self.info_positions]
+
+
+def _f_minsum(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    mag = np.minimum(np.abs(a), np.abs(b))
+    return np.where((a < 0) ^ (b < 0), -mag, mag)
+
+
+# Fast-SSC node kinds
+_RATE0, _RATE1, _REP, _SPC, _SPLIT = range(5)
+
+
+class PolarFastSSC:
+    """
+    Fast-SSC decoder: SC with Rate-0/Rate-1/REP/SPC subtrees decoded in one step.
+
+    Nodes return their re-encoded bits x; u is recovered at the root with a
+    second transform (G_N is its own inverse).
+    """
+
+    def __init__(self, N: int, info_indices: Iterable[int]) -> None:
+        self.N = N
+        self.info_mask = np.zeros(N, dtype=bool)
+        self.info_mask[sorted(info_indices)] = True
+        self.info_positions = np.flatnonzero(self.info_mask)
+        self.K = len(self.info_positions)
+        self.tree = self._plan(0, N)
+
+    def _plan(self, base: int, size: int):
+        info = self.info_mask[base:base + size]
+        count = int(info.sum())
+        if count == 0:
+            return (_RATE0, size)
+        if count == size:
+            return (_RATE1, size)
+        if count == 1 and info[-1]:
+            return (_REP, size)
+        if count == size - 1 and not info[0]:
+            return (_SPC, size)
+        half = size // 2
+        return (_SPLIT, size, self._plan(base, half), self._plan(base + half, half))
+
+    def _node(self, node, llr: np.ndarray) -> np.ndarray:
+        kind = node[0]
+        if kind == _RATE0:
+            return np.zeros(llr.shape, dtype=np.uint8)
+        if kind == _RATE1:
+            return (llr < 0).astype(np.uint8)
+        if kind == _REP:
+            bit = (llr.sum(axis=1, keepdims=True) < 0).astype(np.uint8)
+            return np.repeat(bit, llr.shape[1], axis=1)
+        if kind == _SPC:
+            x = (llr < 0).astype(np.uint8)
+            odd = np.bitwise_xor.reduce(x, axis=1).astype(bool)
+            weakest = np.abs(llr).argmin(axis=1)
+            rows = np.flatnonzero(odd)
+            x[rows, weakest[rows]] ^= 1
+            return x
+        _, size, left_node, right_node = node
+        h = size // 2
+        a, b = llr[:, :h], llr[:, h:]
+        x_left = self._node(left_node, _f_minsum(a, b))
+        x_right = self._node(right_node, np.where(x_left != 0, b - a, b + a))
+        return np.concatenate((x_left ^ x_right, x_right), axis=1)
+
+    def decode_llr(self, llr: np.ndarray) -> np.ndarray:
+        """(B, N) channel LLRs -> (B, N) uint8 decisions u."""
+        llr = np.asarray(llr, dtype=np.float32)
+        return polar_transform(self._node(self.tree, llr))
+
+    def data_bits(self, u: np.ndarray) -> np.ndarray:
+        return u[:, self.info_positions]
+
+
+class PolarSCL:
+    """
+    Successive-cancellation list decoder (min-sum path metrics), batched over frames.
+
+    Each frame keeps ``list_size`` paths; the per-level LLR and partial-sum
+    arrays of PolarSC gain a path axis and are re-gathered after every info
+    bit. ``crc_check`` (optional) maps (M, K) info bits to an (M,) pass mask;
+    the survivor is then the best-metric path that passes, if any.
+    """
+
+    def __init__(self, N: int, info_indices: Iterable[int], list_size: int = 4) -> None:
+        self.N = N
+        self.n = int(math.log2(N))
+        self.L = list_size
+        self.info_mask = np.zeros(N, dtype=bool)
+        self.info_mask[sorted(info_indices)] = True
+        self.info_positions = np.flatnonzero(self.info_mask)
+        self.K = len(self.info_positions)
+        self._resume = [self.n] + [(i & -i).bit_length() - 1 for i in range(1, N)]
+        self._frozen = [not f for f in self.info_mask.tolist()]
+
+    def decode_llr(self, llr: np.ndarray,
+                   crc_check: Optional[Callable[[np.ndarray], np.ndarray]] = None
+                   ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Args:
+            llr: (B, N) channel LLRs.
+            crc_check: Optional validity test on info bits (see class docstring).
+
+        Returns:
+            (u, ok): (B, N) uint8 decisions of the chosen path and, per frame,
+            whether it passed ``crc_check`` (all True without one).
+        """
+        llr = np.asarray(llr, dtype=np.float32)
+        count = llr.shape[0]
+        n, P = self.n, self.L
+        frames = np.arange(count)[:, None]
+        L = [np.empty((count, P, 1 << s), dtype=np.float32) for s in range(n)]
+        L.append(np.repeat(llr[:, None, :], P, axis=1))
+        left = [np.zeros((count, P, 1 << s), dtype=np.uint8) for s in range(n)]
+        u = np.zeros((count, P, self.N), dtype=np.uint8)
+        metric = np.full((count, P), np.inf, dtype=np.float32)
+        metric[:, 0] = 0.0
+
+        for i in range(self.N):
+            s = self._resume[i]
+            if s < n:
+                parent = L[s + 1]
+                h = 1 << s
+                a, b = parent[..., :h], parent[..., h:]
+                L[s][...] = np.where(left[s] != 0, b - a, b + a)
+            while s > 0:
+                s -= 1
+                parent = L[s + 1]
+                h = 1 << s
+                L[s][...] = _f_minsum(parent[..., :h], parent[..., h:])
+
+            leaf = L[0][..., 0]
+            if self._frozen[i]:
+                metric += np.where(leaf < 0, np.abs(leaf), 0.0)
+                x = np.zeros((count, P, 1), dtype=np.uint8)
+            else:
+                # Candidates: every path extended with 0 (first P) and 1 (last P)
+                penalty0 = np.where(leaf < 0, np.abs(leaf), 0.0)
+                penalty1 = np.where(leaf < 0, 0.0, np.abs(leaf))
+                cand = np.concatenate((metric + penalty0, metric + penalty1), axis=1)
+                keep = np.argsort(cand, axis=1, kind="stable")[:, :P]
+                src = keep % P
+                bit = (keep // P).astype(np.uint8)
+                metric = np.take_along_axis(cand, keep, axis=1)
+                for s2 in range(n):
+                    L[s2] = L[s2][frames, src]
+                    left[s2] = left[s2][frames, src]
+                u = u[frames, src]
+                u[:, :, i] = bit
+                x = bit[..., None]
+
+            s, j = 0, i
+            while j & 1:
+                x = np.concatenate((left[s] ^ x, x), axis=2)
+                s += 1
+                j >>= 1
+            if s < n:
+                left[s][...] = x
+
+        order = np.argsort(metric, axis=1, kind="stable")
+        u = u[frames, order]
+        ok = np.isfinite(np.take_along_axis(metric, order, axis=1))
+        if crc_check is not None:
+            info = u[:, :, self.info_positions].reshape(count * P, self.K)
+            ok &= crc_check(info).reshape(count, P)
+        best = np.where(ok.any(axis=1), ok.argmax(axis=1), 0)
+        return u[np.arange(count), best], ok.any(axis=1)
+
+    def data_bits(self, u: np.ndarray) -> np.ndarray:
+        return u[:, self.info_positions]
@@ -1,176 +1,168 @@
 
-from typing import List, Tuple
-from base_ecc import ECCBase
+from typing import Tuple
+from base_ecc import ECCBase, CORRECTED, DETECTED, ERROR_TYPES, pack_bits, unpack_bits
+from crc_codec import CRC_WIDTH, get_engine as get_crc_engine
+from polar_codec import (DESIGN_SNR_DB, PolarFastSSC, PolarSC, PolarSCL,
+                         channel_reliability, polar_info_indices)
 import math
+import numpy as np
+
+DECODER_MODES = ("sc", "fast_ssc", "scl")
+
 
 class PolarCodeRecursive:
     """
-    Polar Code with Recursive Encoding and SC Decoding.
+    Polar Code with Butterfly Encoding and SC / Fast-SSC / SCL Decoding.
+
+    The decoders are the batched array implementations in polar_codec.py.
+    With crc_bits=8 the last 8 of the K info bits carry the CRC-8 of the data
+    (crc_codec); SCL then keeps the best path that passes it (CA-SCL), and
+    every mode reports 'detected' when the decoded CRC does not match.
     """
-    def __init__(self, N: int, K: int):
+    def __init__(self, N: int, K: int, construction: str = "popcount",
+                 design_snr_db: float = DESIGN_SNR_DB, mode: str = "sc",
+                 list_size: int = 4, crc_bits: int = 0):
         self.N = N
         self.K = K
         self.n = int(math.log2(N))
-        
+        if mode not in DECODER_MODES:
+            raise ValueError(f"unknown polar decoder mode {mode!r}")
+        if crc_bits not in (0, CRC_WIDTH):
+            raise ValueError(f"crc_bits must be 0 or {CRC_WIDTH}")
+        self.mode = mode
+        self.list_size = list_size
+        self.crc_bits = crc_bits
+        self.data_bits = K - crc_bits
+        self.construction = construction
+
         # Frozen Bit Construction based on reliability
-        # Simple heuristic: bit-reversed indices have higher reliability in SC decoding order?
-        # Actually, standard Bhattacharyya bounds or Gaussian Approximation is better.
-        # For simplicity and hardware alignment, let's use a fixed reliability sequence 
-        # based on 5G or similar standard sequences if possible, or population count.
-        
-        indices = list(range(N))
-        # Sort by population count (Hamming weight) as a simple reliability proxy
-        self.channel_reliability = sorted([(i, bin(i).count('1'), i) for i in indices], key=lambda x: (x[1], x[2]))
-        
-        # Info indices (Best K)
-        self.info_indices = set([x[0] for x in self.channel_reliability[-K:]])
-        self.frozen_indices = set([x[0] for x in self.channel_reliability[:-K]])
+        # "popcount" (population count of the index, as in the RTL generator)
+        # or a Bhattacharyya / Gaussian-approximation construction at
+        # design_snr_db, precomputed once per (N, K) in polar_codec.
+        self.channel_reliability = channel_reliability(N, construction, design_snr_db)
+        info = polar_info_indices(N, K, construction, design_snr_db)
+        self.info_indices = set(info)
+        self.frozen_indices = set(range(N)) - self.info_indices
+
+        # Array form of the info/frozen sets and the decoders
+        self.sc = PolarSC(N, info)
+        self.fast_ssc = PolarFastSSC(N, info) if mode == "fast_ssc" else None
+        self.scl = PolarSCL(N, info, list_size) if mode == "scl" else None
+        self.info_positions = self.sc.info_positions.tolist()
+        self._crc = get_crc_engine() if crc_bits else None
+        # Butterfly masks: bits in the upper (low-index) half of each 2h block
+        self._butterfly_masks = []
+        h = 1
+        while h < N:
+            block = (1 << h) - 1
+            mask = 0
+            for base in range(0, N, 2 * h):
+                mask |= block << base
+            self._butterfly_masks.append((h, mask))
+            h *= 2
 
     def encode(self, u_data: int) -> int:
         """
-        Encode K-bit integer into N-bit codeword.
+        Encode K-bit integer (K - crc_bits with a CRC) into N-bit codeword.
         """
-        # 1. Map Data to U vector
-        u_vec = [0] * self.N
-        info_count = 0
-        for i in range(self.N):
-            if i in self.info_indices:
-                bit = (u_data >> info_count) & 1
-                u_vec[i] = bit
-                info_count += 1
-            else:
-                u_vec[i] = 0
-                
-        # 2. Polar Transform: x = u * G_N
-        # Recursive implementation
-        x = self._polar_transform_recursive(u_vec)
-        
-        # Convert to int
-        codeword = 0
-        for i, val in enumerate(x):
-            if val: codeword |= (1 << i)
-        return codeword
-
-    def _polar_transform_recursive(self, u: List[int]) -> List[int]:
-        n = len(u)
-        if n == 1:
-            return u
-        
-        half = n // 2
-        u_top = u[:half]
-        u_bot = u[half:]
-        
-        # Recursive calls
-        x_top = self._polar_transform_recursive(u_top)
-        x_bot = self._polar_transform_recursive(u_bot)
-        
-        # Combine
-        x = [0] * n
-        for i in range(half):
-            x[i] = (x_top[i] + x_bot[i]) % 2
-            x[i + half] = x_bot[i]
-            
-        return x
+        if self._crc is not None:
+            u_data &= (1 << self.data_bits) - 1
+            u_data |= self._crc.compute(u_data, self.data_bits) << self.data_bits
+
+        # 1. Map Data to U vector (data bit j -> j-th info index)
+        u = 0
+        for j, pos in enumerate(self.info_positions):
+            if (u_data >> j) & 1:
+                u |= 1 << pos
+
+        # 2. Polar Transform: x = u * G_N, as an in-place butterfly on the packed word
+        for h, mask in self._butterfly_masks:
+            u ^= (u >> h) & mask
+        return u
 
     def decode(self, codeword: int) -> Tuple[int, str]:
         """
-        SC Decode.
+        SC Decode (or the configured mode).
         """
+        if self.mode != "sc":
+            data, codes = self.decode_batch(np.array([codeword], dtype=object))
+            return int(data[0]), ERROR_TYPES[codes[0]]
+
         # Initialize LLRs
         # 0 -> +4.0 (strong 0), 1 -> -4.0 (strong 1)
-        llrs = [0.0] * self.N
-        for i in range(self.N):
-            bit = (codeword >> i) & 1
-            if bit == 0: llrs[i] = 4.0
-            else: llrs[i] = -4.0
-            
-        # Recursive SC Decoding
-        decoded_u = self._sc_decode_recursive(llrs)
-        
+        llrs = [-4.0 if (codeword >> i) & 1 else 4.0 for i in range(self.N)]
+        decoded_u = self.sc.decode_llr_scalar(llrs)
+
         # Extract data
         data = 0
-        info_count = 0
-        for i in range(self.N):
-            if i in self.info_indices:
-                if decoded_u[i]: data |= (1 << info_count)
-                info_count += 1
-                
+        for j, pos in enumerate(self.info_positions):
+            if decoded_u[pos]:
+                data |= 1 << j
+        if self._crc is not None:
+            crc = data >> self.data_bits
+            data &= (1 << self.data_bits) - 1
+            if self._crc.compute(data, self.data_bits) != crc:
+                return data, "detected"
         return data, "corrected"
 
-    def _sc_decode_recursive(self, llrs: List[float]) -> List[int]:
-        n = len(llrs)
-        if n == 1:
-            # Leaf node: This logic only happens if N=1, which is base case.
-            # But SC decoding visits bits one by one.
-            # We need to know if this bit is frozen or information.
-            # This simple recursive structure doesn't track global index easily without passing it.
-            # Let's switch to an implementation that tracks global indices.
-            raise NotImplementedError("Use _sc_decode_recursive_indexed instead")
-
-        return self._sc_decode_recursive_indexed(llrs, 0)
-
-    def _sc_decode_recursive_indexed(self, llrs: List[float], base_idx: int) -> List[int]:
-        n = len(llrs)
-        if n == 1:
-            # Decision
-            if base_idx in self.frozen_indices:
-                return [0]
-            else:
-                if llrs[0] >= 0: return [0]
-                else: return [1]
-        
-        half = n // 2
-        
-        # 1. Compute Left (Top) LLRs: f(LLR_top, LLR_bot)
-        # f(a, b) = sign(a)*sign(b)*min(|a|, |b|)
-        llrs_top = []
-        for i in range(half):
-            a = llrs[i]
-            b = llrs[i + half]
-            # Min-sum approximation
-            val = (1 if a < 0 else 0) ^ (1 if b < 0 else 0)
-            mag = min(abs(a), abs(b))
-            llrs_top.append(-mag if val else mag)
-            
-        # 2. Decode Left half
-        u_top = self._sc_decode_recursive_indexed(llrs_top, base_idx)
-        
-        # Re-encode u_top to get partial sums (x_top) for cancellation
-        # The g function requires the encoded bits, not the raw info bits
-        x_top = self._polar_transform_recursive(u_top)
-        
-        # 3. Compute Right (Bot) LLRs: g(LLR_top, LLR_bot, x_top)
-        # g(a, b, u) = b + (1-2u)a = b + a if u=0 else b - a
-        llrs_bot = []
-        for i in range(half):
-            a = llrs[i]
-            b = llrs[i + half]
-            u = x_top[i]
-            if u == 0:
-                llrs_bot.append(b + a)
-            else:
-                llrs_bot.append(b - a)
-                
-        # 4. Decode Right half
-        u_bot = self._sc_decode_recursive_indexed(llrs_bot, base_idx + half)
-        
-        # 5. Combine u (partial sums)
-        # u_final = [u_top + u_bot, u_bot] ? No.
-        # u vector is just concatenation of decisions ? Yes, u_top and u_bot are the decisions u_0..u_N-1.
-        # But wait, the standard Polar transform combines them: x = [u_top+u_bot, u_bot].
-        # The decoder returns u itself (the decisions).
-        # Yes, we just concatenate.
-        
-        return u_top + u_bot
+    def _crc_ok(self, info_bits: np.ndarray) -> np.ndarray:
+        """(M, K) info bits -> (M,) True where the trailing CRC matches the data."""
+        data = pack_bits(info_bits[:, :self.data_bits])
+        crc = pack_bits(info_bits[:, self.data_bits:]).astype(np.uint8)
+        return self._crc.compute_batch(data, self.data_bits) == crc
+
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        info = unpack_bits(data, self.data_bits)
+        if self._crc is not None:
+            crc = self._crc.compute_batch(pack_bits(info), self.data_bits)
+            info = np.hstack([info, unpack_bits(crc.astype(np.uint64), self.crc_bits)])
+        return pack_bits(self.sc.encode_bits(info))
+
+    def decode_llr_batch(self, llr: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Decode (B, N) channel LLRs with the configured mode.
+
+        Returns:
+            Tuple of ((B, K - crc_bits) data bits, error codes).
+        """
+        llr = np.atleast_2d(np.asarray(llr, dtype=np.float32))
+        if self.mode == "scl":
+            u, _ = self.scl.decode_llr(llr, self._crc_ok if self._crc is not None else None)
+        elif self.mode == "fast_ssc":
+            u = self.fast_ssc.decode_llr(llr)
+        else:
+            u = self.sc.decode_llr(llr)
+        info = u[:, self.sc.info_positions]
+        codes = np.full(len(info), CORRECTED, dtype=np.uint8)
+        if self._crc is not None:
+            codes[~self._crc_ok(info)] = DETECTED
+        return info[:, :self.data_bits], codes
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        llr = np.where(unpack_bits(codewords, self.N) != 0, -4.0, 4.0)
+        data_bits, codes = self.decode_llr_batch(llr)
+        return pack_bits(data_bits), codes
+
 
 class PolarECC(ECCBase):
-    def __init__(self, n: int = None, k: int = None, data_length: int = None):
+    def __init__(self, n: int = None, k: int = None, data_length: int = None,
+                 mode: str = "sc", list_size: int = 4, crc_bits: int = 0,
+                 construction: str = "popcount", design_snr_db: float = DESIGN_SNR_DB):
+        """
+        Args:
+            mode: Decoder, one of DECODER_MODES ("sc", "fast_ssc", "scl").
+            list_size: SCL list size L.
+            crc_bits: 0, or 8 to append a CRC-8 to the data (CA-SCL with mode="scl").
+            construction: Frozen-set construction ("popcount", "bhattacharyya", "ga").
+            design_snr_db: Design Es/N0 for the Bhattacharyya/GA constructions.
+        """
         if data_length is not None:
             self.k_width = data_length
         else:
             self.k_width = k if k else 8
             
-        self.N_width = 2 * self.k_width # Rate 1/2 (Simplification)
+        # Rate 1/2 over data plus CRC, so the CRC never eats the frozen bits
+        self.N_width = 2 * (self.k_width + crc_bits)
         
         # Ensure N is power of 2
         p = 1
@@ -178,7 +170,8 @@ class PolarECC(ECCBase):
             p *= 2
         self.N_width = p
         
-        self.polar = PolarCodeRecursive(self.N_width, self.k_width)
+        self.polar = PolarCodeRecursive(self.N_width, self.k_width + crc_bits, construction,
+                                        design_snr_db, mode, list_size, crc_bits)
         
         # Expose standard params
         self.n = self.N_width
@@ -189,6 +182,17 @@ class PolarECC(ECCBase):
     
     def decode(self, codeword: int) -> Tuple[int, str]:
         return self.polar.decode(codeword)
+
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        return self.polar.encode_batch(data)
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return self.polar.decode_batch(codewords)
+
+    def decode_llr(self, llr: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Decode (N,) or (B, N) channel LLRs; returns (decoded_data, error_codes)."""
+        data_bits, codes = self.polar.decode_llr_batch(llr)
+        return pack_bits(data_bits), codes
         
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         return codeword ^ (1 << bit_idx)
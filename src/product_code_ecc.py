@@ -1,19 +1,36 @@
-from typing import Tuple, List
+from typing import Dict, Tuple, List
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.base_ecc import ECCBase
+from src.base_ecc import ECCBase, CORRECTED, DETECTED, as_word_array
+from src.composite_codec import FieldLayout, batch_decode, batch_encode, uniform_layout
+from src.product_codec import PRODUCT_MAX_ITER, IterativeProductDecoder
+import numpy as np
 
 class ProductCodeECC(ECCBase):
-    """Product Code ECC that combines two ECCs in a 2D product structure."""
+    """
+    Product Code ECC that combines two ECCs in a 2D product structure.
+
+    The default layout (row codewords followed by per-sub-word column parity)
+    matches verilogs/product_code_ecc.v and is decoded in a single pass.
+    With ``iterative=True`` the codeword is a true product matrix instead:
+    each sub-word is one row, rows are Hamming SECDED codewords and every
+    column is a column-code codeword. Decoding then alternates vectorized
+    row and column passes (see product_codec) for up to ``max_iter``
+    iterations; frames that do not converge are reported as detected.
+    """
     
-    def __init__(self, word_length: int = 8, data_length: int = None):
+    def __init__(self, word_length: int = 8, data_length: int = None, iterative: bool = False,
+                 max_iter: int = PRODUCT_MAX_ITER, column_code: str = 'parity'):
         """
         Initialize Product Code ECC.
         
         Args:
             word_length: Length of data word in bits (default: 8)
             data_length: Alternative parameter name for word_length (for compatibility)
+            iterative: Use the product-matrix layout with iterative decoding
+            max_iter: Default iteration cap of the iterative decoder
+            column_code: Column code of the iterative layout, 'parity' or 'hamming'
         """
         if data_length is not None:
             self.word_length = data_length
@@ -34,8 +51,26 @@ class ProductCodeECC(ECCBase):
         from src.hamming_secded_ecc import HammingSECDEDECC
         from src.parity_ecc import ParityECC
         
-        self.row_ecc = HammingSECDEDECC(data_length=self.sub_word_length)
-        self.col_ecc = ParityECC(data_length=self.sub_word_length)
+        self.iterative = iterative
+        self.num_sub_words = len(range(0, self.word_length, self.sub_word_length))
+        if iterative:
+            if column_code not in ('parity', 'hamming'):
+                raise ValueError(f"unknown column code: {column_code}")
+            # Component encoders must rebuild the corrected codeword from the
+            # decoded data, so the Hamming codes are sized to their own k
+            self.row_ecc = HammingSECDEDECC(data_length=HammingSECDEDECC(data_length=self.sub_word_length).k)
+            if column_code == 'parity':
+                self.col_ecc = ParityECC(data_length=self.num_sub_words)
+            else:
+                self.col_ecc = HammingSECDEDECC(data_length=HammingSECDEDECC(data_length=self.num_sub_words).k)
+            self.decoder = IterativeProductDecoder(self.row_ecc, self.col_ecc, self.col_ecc.k,
+                                                   single_parity_columns=column_code == 'parity',
+                                                   max_iter=max_iter)
+            self._matrix_layout = uniform_layout(self.row_ecc.n, self.col_ecc.n)
+            self.last_decode_stats: Dict[str, List[int]] = {}
+        else:
+            self.row_ecc = HammingSECDEDECC(data_length=self.sub_word_length)
+            self.col_ecc = ParityECC(data_length=self.sub_word_length)
         
         # Product code: n = n_row * n_col, k = k_row * k_col
         # row_ecc is Hamming: n_row = k_row + parity + 1
@@ -43,23 +78,23 @@ class ProductCodeECC(ECCBase):
         self.k = self.row_ecc.k * self.col_ecc.k
         self.n = self.row_ecc.n * self.col_ecc.n
 
+        # Sub-word, row-codeword and column-codeword positions, fixed per instance
+        self._data_layout = uniform_layout(self.sub_word_length, self.num_sub_words)
+        self._row_layout = uniform_layout(self.row_ecc.n, self.num_sub_words)
+        self._col_layout = uniform_layout(self.col_ecc.n, self.num_sub_words,
+                                          start=self.num_sub_words * self.row_ecc.n)
+        # Decoded rows carry row_ecc.k bits and are OR-ed back at the sub-word
+        # offsets (they overlap when the row code rounds k up)
+        self._decoded_layout = FieldLayout([self.row_ecc.k] * self.num_sub_words,
+                                           self._data_layout.offsets)
+
     def _pack_data(self, data: int) -> List[int]:
         """Pack data into sub-words for product code encoding."""
-        sub_words = []
-        mask = (1 << self.sub_word_length) - 1
-        
-        for i in range(0, self.word_length, self.sub_word_length):
-            sub_word = (data >> i) & mask
-            sub_words.append(sub_word)
-        
-        return sub_words
+        return self._data_layout.split_int(data)
 
     def _unpack_data(self, sub_words: List[int]) -> int:
         """Unpack sub-words back to original data."""
-        data = 0
-        for i, sub_word in enumerate(sub_words):
-            data |= (sub_word << (i * self.sub_word_length))
-        return data
+        return self._decoded_layout.join_int(sub_words)
 
     def encode(self, data: int) -> int:
         """
@@ -71,43 +106,17 @@ class ProductCodeECC(ECCBase):
         Returns:
             int: The encoded product codeword.
         """
+        if self.iterative:
+            return int(self.encode_batch(np.array([data], dtype=object))[0])
+
         # Ensure data fits within word length
         if data >= (1 << self.word_length):
             data = data & ((1 << self.word_length) - 1)
         
-        # Pack data into sub-words
         sub_words = self._pack_data(data)
-        
-        # Encode each sub-word with row ECC
-        row_encoded_words = []
-        for sub_word in sub_words:
-            row_encoded = self.row_ecc.encode(sub_word)
-            row_encoded_words.append(row_encoded)
-        
-        # Encode each sub-word with column ECC
-        col_encoded_words = []
-        for sub_word in sub_words:
-            col_encoded = self.col_ecc.encode(sub_word)
-            col_encoded_words.append(col_encoded)
-        
-        # Pack encoded words into a single codeword
-        # Use a simple concatenation approach
-        codeword = 0
-        bit_pos = 0
-        
-        # Pack row encoded words
-        for word in row_encoded_words:
-            word_bits = self.row_ecc.n if hasattr(self.row_ecc, 'n') else 12
-            codeword |= (word << bit_pos)
-            bit_pos += word_bits
-        
-        # Pack column encoded words
-        for word in col_encoded_words:
-            word_bits = self.col_ecc.n if hasattr(self.col_ecc, 'n') else 9
-            codeword |= (word << bit_pos)
-            bit_pos += word_bits
-        
-        return codeword
+        row_encoded_words = [self.row_ecc.encode(sub_word) for sub_word in sub_words]
+        col_encoded_words = [self.col_ecc.encode(sub_word) for sub_word in sub_words]
+        return self._row_layout.join_int(row_encoded_words) | self._col_layout.join_int(col_encoded_words)
 
     def decode(self, codeword: int) -> Tuple[int, str]:
         """
@@ -119,53 +128,74 @@ class ProductCodeECC(ECCBase):
         Returns:
             Tuple of (decoded_data, error_type)
         """
-        # Extract row and column encoded words
-        row_encoded_words = []
-        col_encoded_words = []
-        
-        bit_pos = 0
-        
-        # Extract row encoded words
-        for i in range(len(self._pack_data(0))):  # Use dummy data to get count
-            word_bits = self.row_ecc.n if hasattr(self.row_ecc, 'n') else 12
-            word = (codeword >> bit_pos) & ((1 << word_bits) - 1)
-            row_encoded_words.append(word)
-            bit_pos += word_bits
-        
-        # Extract column encoded words
-        for i in range(len(self._pack_data(0))):  # Use dummy data to get count
-            word_bits = self.col_ecc.n if hasattr(self.col_ecc, 'n') else 9
-            word = (codeword >> bit_pos) & ((1 << word_bits) - 1)
-            col_encoded_words.append(word)
-            bit_pos += word_bits
-        
-        # Decode each sub-word
+        if self.iterative:
+            data, codes = self.decode_batch(np.array([codeword], dtype=object))
+            return int(data[0]), 'detected' if codes[0] == DETECTED else 'corrected'
+
         decoded_sub_words = []
         error_detected = False
-        
-        for i in range(len(row_encoded_words)):
-            # Decode row
-            row_decoded, row_error = self.row_ecc.decode(row_encoded_words[i])
-            
-            # Decode column
-            col_decoded, col_error = self.col_ecc.decode(col_encoded_words[i])
-            
+        for row_word, col_word in zip(self._row_layout.split_int(codeword),
+                                      self._col_layout.split_int(codeword)):
             # Use row result as primary (both should decode to same data)
+            row_decoded, row_error = self.row_ecc.decode(row_word)
+            col_decoded, col_error = self.col_ecc.decode(col_word)
             decoded_sub_words.append(row_decoded)
-            
-            # Track errors
             if row_error == 'detected' or col_error == 'detected':
                 error_detected = True
         
-        # Unpack decoded sub-words
         decoded_data = self._unpack_data(decoded_sub_words)
-        
-        # Determine error type
         if error_detected:
             return decoded_data, 'detected'
         else:
             return decoded_data, 'corrected'
 
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        data = as_word_array(data) & ((1 << self.word_length) - 1)
+        sub_words = self._data_layout.split(data)
+        if self.iterative:
+            # Data rows beyond the sub-words (column code k rounded up) stay zero
+            rows = np.zeros((len(data), self.decoder.data_rows), dtype=np.uint64)
+            rows[:, :self.num_sub_words] = sub_words
+            return self._matrix_layout.join(self.decoder.encode_matrix(rows))
+        rows = self._row_layout.join(batch_encode(self.row_ecc, sub_words))
+        cols = self._col_layout.join(batch_encode(self.col_ecc, sub_words))
+        if rows.dtype == object or cols.dtype == object:
+            return rows.astype(object) | cols.astype(object)
+        return rows | cols
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if self.iterative:
+            data, codes, self.last_decode_stats = self.decode_iterative(codewords)
+            return data, codes
+        codewords = as_word_array(codewords)
+        row_data, row_codes = batch_decode(self.row_ecc, self._row_layout.split(codewords))
+        _, col_codes = batch_decode(self.col_ecc, self._col_layout.split(codewords))
+        detected = ((row_codes == DETECTED) | (col_codes == DETECTED)).any(axis=1)
+        data = self._decoded_layout.join(row_data)
+        return data, np.where(detected, DETECTED, CORRECTED).astype(np.uint8)
+
+    def decode_iterative(self, codewords: np.ndarray, max_iter: int = None
+                         ) -> Tuple[np.ndarray, np.ndarray, Dict[str, List[int]]]:
+        """
+        Iteratively decode a batch of product-matrix codewords.
+
+        Args:
+            codewords: Codewords produced by an iterative-mode encoder
+            max_iter: Iteration cap (default: the constructor's max_iter)
+
+        Returns:
+            Tuple of (decoded data, error codes, per-iteration counters); see
+            IterativeProductDecoder.decode_matrix for the counter names
+        """
+        if not self.iterative:
+            raise ValueError("decode_iterative needs a ProductCodeECC built with iterative=True")
+        matrix = self._matrix_layout.split(codewords)
+        matrix, converged, _, counters = self.decoder.decode_matrix(matrix, max_iter)
+        rows = self.decoder.extract_data(matrix)
+        data = self._data_layout.join(rows[:, :self.num_sub_words])
+        codes = np.where(converged, CORRECTED, DETECTED).astype(np.uint8)
+        return data, codes, counters
+
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         """
         Flip the bit at bit_idx in the codeword.
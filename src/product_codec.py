@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Iterative row/column hard-decision decoding of two-dimensional product codes.
+
+A frame is a matrix of col_ecc.n rows by row_ecc.n columns. Each row is a
+row_ecc codeword packed into one uint64 word. Each column, read with matrix
+row i as bit i, is a col_ecc codeword. Encoding row-encodes the data rows,
+then column-encodes every column. A transpose between the two layouts is
+one unpack / swap-axes / pack over the whole batch.
+
+Decoding alternates passes over all active frames at once:
+
+* Row pass: every row goes through row_ecc.decode_batch, and corrected rows
+  are re-encoded. Rows the component decoder can only detect are flagged.
+* Column pass: the same over the transposed matrix. A single-parity-check
+  column code cannot correct on its own, so in that mode the column
+  syndrome (the XOR of all rows) is used as an erasure pattern instead: it
+  is XOR-ed into the flagged row when exactly one row is flagged.
+
+After the column pass the frame is checked as a whole: it has converged
+when every row and every column of the resulting matrix is a codeword, so
+a repair finished by the last allowed column pass still counts. Converged
+frames are retired from later passes. A frame whose iteration changed no
+bit has stalled: every later pass would repeat it exactly, so it is
+retired too, unconverged. Bit flips, flags and convergence are counted per
+iteration, so latency can be traded against correction strength.
+
+Data is read straight from the systematic positions of the final matrix,
+without another decode, so the iteration cap alone sets how many errors
+are corrected.
+
+Component codecs must be linear and systematic, and encode_batch applied to the output of
+decode_batch must rebuild the corrected codeword (for HammingSECDEDECC,
+build it with data_length equal to its k).
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from base_ecc import CORRECTED, DETECTED, pack_bits, unpack_bits
+
+PRODUCT_MAX_ITER = 4
+
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """Set bits per uint64 word (SWAR)."""
+    x = words.astype(np.uint64)
+    x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return ((x * np.uint64(0x0101010101010101)) >> np.uint64(56)).astype(np.int64)
+
+
+def transpose(words: np.ndarray, nbits: int) -> np.ndarray:
+    """(B, R) uint64 words of ``nbits`` bits -> (B, nbits) uint64 words of R bits."""
+    count, rows = words.shape
+    bits = unpack_bits(words.reshape(-1), nbits).reshape(count, rows, nbits)
+    return pack_bits(bits.transpose(0, 2, 1).reshape(count * nbits, rows)).reshape(count, nbits)
+
+
+def systematic_positions(ecc) -> List[int]:
+    """Codeword bit carrying each data bit of a linear systematic codec."""
+    units = np.asarray(ecc.encode_batch(np.uint64(1) << np.arange(ecc.k, dtype=np.uint64)))
+    masks = [int(word) for word in units]
+    positions = []
+    for i, mask in enumerate(masks):
+        others = 0
+        for j, other in enumerate(masks):
+            if j != i:
+                others |= other
+        own = mask & ~others
+        if not own:
+            raise ValueError(f"{type(ecc).__name__} has no systematic position for data bit {i}")
+        positions.append((own & -own).bit_length() - 1)
+    return positions
+
+
+class IterativeProductDecoder:
+    """Encoder and iterative decoder for the product of two packed-word codecs."""
+
+    def __init__(self, row_ecc, col_ecc, data_rows: int, single_parity_columns: bool = False,
+                 max_iter: int = PRODUCT_MAX_ITER) -> None:
+        if row_ecc.n > 64 or col_ecc.n > 64:
+            raise ValueError("product rows and columns must fit in 64-bit words")
+        self.row_ecc = row_ecc
+        self.col_ecc = col_ecc
+        self.data_rows = data_rows
+        self.single_parity_columns = single_parity_columns
+        self.max_iter = max_iter
+        self.rows = col_ecc.n
+        self.cols = row_ecc.n
+        # Matrix rows holding the data rows, and the data bits within a row
+        self._data_row_index = np.array(systematic_positions(col_ecc)[:data_rows], dtype=np.int64)
+        self._data_bit_shift = np.array(systematic_positions(row_ecc), dtype=np.uint64)
+
+    def encode_matrix(self, data_rows: np.ndarray) -> np.ndarray:
+        """(B, data_rows) row data words -> (B, rows) packed row words of the product codeword."""
+        count = len(data_rows)
+        row_words = np.asarray(self.row_ecc.encode_batch(data_rows.reshape(-1))).astype(np.uint64)
+        columns = transpose(row_words.reshape(count, self.data_rows), self.cols)
+        col_words = np.asarray(self.col_ecc.encode_batch(columns.reshape(-1))).astype(np.uint64)
+        return transpose(col_words.reshape(count, self.cols), self.rows)
+
+    def extract_data(self, matrix: np.ndarray) -> np.ndarray:
+        """(B, rows) matrix -> (B, data_rows) row data read from the systematic positions."""
+        rows = matrix[:, self._data_row_index]
+        data = np.zeros(rows.shape, dtype=np.uint64)
+        for j, shift in enumerate(self._data_bit_shift):
+            data |= ((rows >> shift) & np.uint64(1)) << np.uint64(j)
+        return data
+
+    @staticmethod
+    def _line_pass(ecc, lines: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Correct every line of a (B, L) word matrix; returns (new lines, flagged)."""
+        shape = lines.shape
+        data, codes = ecc.decode_batch(lines.reshape(-1))
+        codes = np.asarray(codes).reshape(shape)
+        fixed = np.asarray(ecc.encode_batch(data)).astype(np.uint64).reshape(shape)
+        return np.where(codes == CORRECTED, fixed, lines), codes == DETECTED
+
+    @staticmethod
+    def _codewords(ecc, lines: np.ndarray) -> np.ndarray:
+        """Which entries of a (B, L) word matrix are already codewords of ``ecc``."""
+        shape = lines.shape
+        data, codes = ecc.decode_batch(lines.reshape(-1))
+        rebuilt = np.asarray(ecc.encode_batch(data)).astype(np.uint64).reshape(shape)
+        return (np.asarray(codes).reshape(shape) == CORRECTED) & (rebuilt == lines)
+
+    def decode_matrix(self, matrix: np.ndarray, max_iter: int = None
+                      ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, List[int]]]:
+        """
+        Iteratively decode (B, rows) packed row words.
+
+        Returns:
+            Tuple of (corrected (B, rows) matrix, (B,) converged flags,
+            (B,) iterations used, per-iteration counters). Counter lists hold one
+            entry per iteration run: active_frames, row_bit_flips,
+            column_bit_flips, flagged_rows, flagged_columns, converged_frames,
+            stalled_frames.
+        """
+        max_iter = self.max_iter if max_iter is None else max_iter
+        matrix = np.array(matrix, dtype=np.uint64)
+        count = len(matrix)
+        converged = np.zeros(count, dtype=bool)
+        iterations = np.zeros(count, dtype=np.int64)
+        counters: Dict[str, List[int]] = {name: [] for name in (
+            "active_frames", "row_bit_flips", "column_bit_flips",
+            "flagged_rows", "flagged_columns", "converged_frames", "stalled_frames")}
+        active = np.arange(count)
+        for _ in range(max_iter):
+            if not len(active):
+                break
+            m = matrix[active]
+            rows, row_flags = self._line_pass(self.row_ecc, m)
+            row_flips = _popcount(rows ^ m).sum(axis=1)
+
+            if self.single_parity_columns:
+                syndrome = np.bitwise_xor.reduce(rows, axis=1)
+                single = row_flags.sum(axis=1) == 1
+                erase = single & (syndrome != 0)
+                new = rows.copy()
+                which = row_flags.argmax(axis=1)
+                idx = np.flatnonzero(erase)
+                new[idx, which[idx]] ^= syndrome[idx]
+                col_flips = np.where(erase, _popcount(syndrome), 0)
+                col_flagged = np.where(erase, 0, _popcount(syndrome))
+                columns_clean = np.bitwise_xor.reduce(new, axis=1) == 0
+            else:
+                columns = transpose(rows, self.cols)
+                fixed, col_flags = self._line_pass(self.col_ecc, columns)
+                col_flips = _popcount(fixed ^ columns).sum(axis=1)
+                new = transpose(fixed, self.rows)
+                col_flagged = col_flags.sum(axis=1)
+                columns_clean = ~col_flags.any(axis=1)
+
+            # Re-encoded and untouched unflagged rows are codewords; only rows
+            # of frames the column pass changed need their syndromes checked
+            rows_clean = ~row_flags.any(axis=1)
+            changed = np.flatnonzero(col_flips > 0)
+            if len(changed):
+                rows_clean[changed] = self._codewords(self.row_ecc, new[changed]).all(axis=1)
+            done = rows_clean & columns_clean
+            stalled = ~done & (row_flips == 0) & (col_flips == 0)
+            matrix[active] = new
+            iterations[active] += 1
+            converged[active] = done
+
+            counters["active_frames"].append(int(len(active)))
+            counters["row_bit_flips"].append(int(row_flips.sum()))
+            counters["column_bit_flips"].append(int(col_flips.sum()))
+            counters["flagged_rows"].append(int(row_flags.sum()))
+            counters["flagged_columns"].append(int(col_flagged.sum()))
+            counters["converged_frames"].append(int(done.sum()))
+            counters["stalled_frames"].append(int(stalled.sum()))
+            active = active[~(done | stalled)]
+        return matrix, converged, iterations, counters
+
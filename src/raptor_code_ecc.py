@@ -1,12 +1,17 @@
-from typing import Tuple, List, Optional
+from typing import Tuple
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.base_ecc import ECCBase
+from src.base_ecc import ECCBase, CORRECTED, DETECTED, as_word_array, word_parity
 import numpy as np
 
 class RaptorCodeECC(ECCBase):
-    """Simplified Raptor Code ECC implementation for fountain coding applications."""
+    """
+    Simplified Raptor Code ECC implementation for fountain coding applications.
+
+    This is the fixed-length word code mirrored by verilogs/raptor_code_ecc.v;
+    block erasure coding with a real fountain code lives in raptor_codec.
+    """
     
     def __init__(self, word_length: int = 8, data_length: int = None):
         """
@@ -38,6 +43,16 @@ class RaptorCodeECC(ECCBase):
         # Generate deterministic encoding matrix
         self.G = self._generate_encoding_matrix()
 
+        # Parity row i covers the data bits j with (i + j) even, so every even
+        # row is the parity of the even data bits and every odd row of the odd
+        # ones; keep both as packed masks plus the rows they fill
+        self._data_mask = (1 << self.k) - 1
+        self._code_mask = (1 << self.n) - 1
+        self._even_bits = sum(1 << j for j in range(0, self.k, 2))
+        self._odd_bits = self._data_mask ^ self._even_bits
+        self._even_rows = sum(1 << i for i in range(self.k, self.n) if i % 2 == 0)
+        self._odd_rows = sum(1 << i for i in range(self.k, self.n) if i % 2 == 1)
+
     def _generate_encoding_matrix(self) -> np.ndarray:
         """Generate systematic encoding matrix for Raptor codes."""
         # Create a systematic encoding matrix
@@ -66,26 +81,17 @@ class RaptorCodeECC(ECCBase):
         Returns:
             int: The encoded codeword.
         """
-        # Ensure data fits within k bits
-        if data >= (1 << self.k):
-            data = data & ((1 << self.k) - 1)
-        
-        # Convert data to bits
-        data_bits = [(data >> i) & 1 for i in range(self.k)]
-        
-        # Encode using encoding matrix
-        encoded_bits = np.dot(self.G, data_bits) % 2
-        
-        # Convert to integer
-        codeword = 0
-        for i, bit in enumerate(encoded_bits):
-            codeword |= (int(bit) << i)
-        
+        data &= self._data_mask
+        codeword = data
+        if bin(data & self._even_bits).count('1') & 1:
+            codeword |= self._even_rows
+        if bin(data & self._odd_bits).count('1') & 1:
+            codeword |= self._odd_rows
         return codeword
 
     def decode(self, codeword: int) -> Tuple[int, str]:
         """
-        Decode a Raptor code codeword using simple matrix operations.
+        Decode a Raptor code codeword by re-encoding its systematic part.
         
         Args:
             codeword: The codeword to decode
@@ -93,32 +99,23 @@ class RaptorCodeECC(ECCBase):
         Returns:
             Tuple of (decoded_data, error_type)
         """
-        # Convert codeword to bits
-        received_bits = [(codeword >> i) & 1 for i in range(self.n)]
-        
-        # Use simple matrix decoding
-        decoded_bits, error_type = self._matrix_decode(received_bits)
-        
-        # Convert back to integer
-        decoded_data = 0
-        for i, bit in enumerate(decoded_bits[:self.k]):
-            decoded_data |= (bit << i)
-        
-        return decoded_data, error_type
+        codeword &= self._code_mask
+        data = codeword & self._data_mask
+        if self.encode(data) != codeword:
+            return data, 'detected'
+        return data, 'corrected'
 
-    def _matrix_decode(self, received_bits: List[int]) -> Tuple[List[int], str]:
-        """Simple matrix-based decoding with error detection."""
-        # Extract the systematic part
-        data_bits = received_bits[:self.k]
-        
-        # Re-encode to check for errors
-        expected_bits = np.dot(self.G, data_bits) % 2
-        
-        # Compare with received bits
-        if not np.array_equal(expected_bits, received_bits):
-            return data_bits, 'detected'
-            
-        return data_bits, 'corrected'
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        data = as_word_array(data, self.n) & self._data_mask
+        even = word_parity(data & self._even_bits, self.k)
+        odd = word_parity(data & self._odd_bits, self.k)
+        return data | (even * self._even_rows) | (odd * self._odd_rows)
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        codewords = as_word_array(codewords, self.n) & self._code_mask
+        data = codewords & self._data_mask
+        clean = (self.encode_batch(data) == codewords).astype(bool)
+        return data, np.where(clean, CORRECTED, DETECTED).astype(np.uint8)
 
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         """
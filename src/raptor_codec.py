@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Raptor fountain code over packed symbols: precode, LT encoder and
+inactivation decoder.
+
+A source block is K symbols, each a packed bit row held as a Python int (so a
+symbol XOR is one big-int XOR whatever the symbol size). The precode follows
+the RFC 5053 layout: K leading intermediate symbols, S LDPC symbols (each
+leading symbol feeding three of them) and H HDPC symbols over the first K + S
+by the Gray-code rule, L = K + S + H intermediate symbols in all.
+
+Every encoding symbol is an LT combination of intermediate symbols: a
+robust-soliton number of neighbours spread over all L by stepping
+b + a*j modulo the smallest prime >= L, plus PI_DEGREE precode symbols (the
+"permanently inactivated" part that RaptorQ uses to keep the overhead at a
+couple of symbols). Both come from a splitmix64 hash of (salt, ESI), so any
+ESI can be generated on its own and repair symbols stream without end. As in
+RFC 5053, the code is systematic: the encoder solves for the intermediate
+symbols whose ESIs 0..K-1 reproduce the source, and the per-K salt is the
+first one for which that system is invertible.
+
+The decoder treats the precode constraints plus every received symbol as
+GF(2) equations in the L unknowns (the encoder runs the same solver).
+Peeling solves degree-one equations. When none is left, the decoder
+inactivates the most connected column of a minimum-degree row. The
+equations that then involve only inactive columns are solved by Gaussian
+elimination on int bit-masks and back-substituted. Precode structure, degree
+table, salt and source rows are cached per (K, seed).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from math import ceil, comb, log, sqrt
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+RAPTOR_SEED = 0
+# Robust soliton parameters
+SOLITON_C = 0.1
+SOLITON_DELTA = 0.5
+# Precode symbols added to every repair symbol on top of its LT neighbours
+PI_DEGREE = 3
+# Salts tried when searching for an invertible systematic layout
+SYSTEMATIC_TRIES = 256
+
+_MASK64 = (1 << 64) - 1
+_CDF_SCALE = 1 << 32
+
+
+def _splitmix64(x: int) -> int:
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def _is_prime(n: int) -> bool:
+    if n < 2:
+        return False
+    i = 2
+    while i * i <= n:
+        if n % i == 0:
+            return False
+        i += 1
+    return True
+
+
+def _next_prime(n: int) -> int:
+    while not _is_prime(n):
+        n += 1
+    return n
+
+
+def robust_soliton_cdf(L: int, c: float = SOLITON_C, delta: float = SOLITON_DELTA) -> List[int]:
+    """Cumulative robust-soliton distribution over degrees 1..L, scaled to 2^32."""
+    R = max(c * log(L / delta) * sqrt(L), 1.0)
+    spike = min(max(int(round(L / R)), 1), L)
+    weights = [0.0] * (L + 1)
+    weights[1] = 1.0 / L
+    for d in range(2, L + 1):
+        weights[d] = 1.0 / (d * (d - 1))
+    for d in range(1, spike):
+        weights[d] += R / (d * L)
+    weights[spike] += R * log(R / delta) / L if R > delta else 0.0
+    total = sum(weights)
+    cdf = []
+    acc = 0.0
+    for d in range(1, L + 1):
+        acc += weights[d]
+        cdf.append(min(int(acc / total * _CDF_SCALE), _CDF_SCALE))
+    cdf[-1] = _CDF_SCALE
+    return cdf
+
+
+class RaptorCode:
+    """Precode layout and LT neighbour generation for one (K, seed)."""
+
+    def __init__(self, K: int, seed: int = RAPTOR_SEED) -> None:
+        if K < 1:
+            raise ValueError("K must be at least 1")
+        self.K = K
+        self.seed = seed
+
+        # RFC 5053 section 5.4.2.3 parameter derivation
+        X = 1
+        while X * (X - 1) < 2 * K:
+            X += 1
+        self.S = _next_prime(max(ceil(0.01 * K) + X, 2))
+        H = 1
+        while comb(H, ceil(H / 2)) < K + self.S:
+            H += 1
+        self.H = H
+        self.L = K + self.S + H
+        self.L_prime = _next_prime(self.L)
+        self.P_prime = _next_prime(self.S + H)
+
+        # LDPC: intermediate symbol i < K feeds LDPC symbols b, b + a, b + 2a (mod S)
+        self.ldpc_rows: List[List[int]] = [[] for _ in range(self.S)]
+        for i in range(K):
+            a = 1 + (i // self.S) % (self.S - 1) if self.S > 1 else 0
+            b = i % self.S
+            for _ in range(3):
+                if i not in self.ldpc_rows[b]:
+                    self.ldpc_rows[b].append(i)
+                b = (b + a) % self.S
+
+        # HDPC: symbol j < K + S feeds HDPC symbol h if bit h of the j-th Gray
+        # code word of weight ceil(H / 2) is set
+        weight = ceil(H / 2)
+        self.hdpc_rows: List[List[int]] = [[] for _ in range(H)]
+        j = 0
+        i = 0
+        while j < K + self.S:
+            gray = i ^ (i >> 1)
+            i += 1
+            if bin(gray).count('1') != weight:
+                continue
+            for h in range(H):
+                if (gray >> h) & 1:
+                    self.hdpc_rows[h].append(j)
+            j += 1
+
+        self.degree_cdf = robust_soliton_cdf(self.L)
+
+        # Like the RFC's systematic index: the first salt for which the source
+        # ESIs together with the precode determine every intermediate symbol
+        for trial in range(SYSTEMATIC_TRIES):
+            self.salt = ((seed << 8) | trial) << 32
+            rows = self.constraint_rows() + [self.neighbours(esi) for esi in range(K)]
+            if _solve(self.L, rows, [0] * len(rows)) is not None:
+                break
+        else:
+            raise ValueError(f"no systematic Raptor layout found for K={K}")
+        self._source_rows = rows
+
+    # --- symbol structure ---------------------------------------------------
+
+    def neighbours(self, esi: int) -> List[int]:
+        """Intermediate symbols combined into encoding symbol ``esi``."""
+        h = _splitmix64(self.salt ^ esi)
+        degree = min(bisect_right(self.degree_cdf, h & 0xFFFFFFFF) + 1, self.L)
+        h = _splitmix64(h)
+        a = 1 + (h & 0xFFFFFFFF) % (self.L_prime - 1)
+        b = (h >> 32) % self.L_prime
+        out = []
+        for _ in range(degree):
+            while b >= self.L:
+                b = (b + a) % self.L_prime
+            out.append(b)
+            b = (b + a) % self.L_prime
+        # Permanently-inactivated part: PI_DEGREE distinct precode symbols
+        h = _splitmix64(h)
+        P = self.L - self.K
+        a = 1 + (h & 0xFFFFFFFF) % (self.P_prime - 1)
+        b = (h >> 32) % self.P_prime
+        lt = set(out)
+        for _ in range(min(PI_DEGREE, P)):
+            while b >= P:
+                b = (b + a) % self.P_prime
+            col = self.K + b
+            if col in lt:
+                out.remove(col)
+            else:
+                out.append(col)
+            b = (b + a) % self.P_prime
+        return out
+
+    def constraint_rows(self) -> List[List[int]]:
+        """Precode equations (XOR over the listed intermediate symbols is zero)."""
+        rows = [row + [self.K + s] for s, row in enumerate(self.ldpc_rows)]
+        rows += [row + [self.K + self.S + h] for h, row in enumerate(self.hdpc_rows)]
+        return rows
+
+    def source_rows(self) -> List[List[int]]:
+        """Precode equations followed by the LT rows of ESIs 0..K-1 (shared, do not modify)."""
+        return self._source_rows
+
+    def intermediate(self, source: Sequence[int]) -> List[int]:
+        """The L intermediate symbols whose ESIs 0..K-1 reproduce ``source``."""
+        if len(source) != self.K:
+            raise ValueError(f"expected {self.K} source symbols, got {len(source)}")
+        values = [0] * (self.S + self.H) + list(source)
+        return _solve(self.L, self.source_rows(), values)
+
+
+_CODES: Dict[Tuple[int, int], RaptorCode] = {}
+
+
+def get_code(K: int, seed: int = RAPTOR_SEED) -> RaptorCode:
+    """Shared RaptorCode per (K, seed)."""
+    key = (K, seed)
+    if key not in _CODES:
+        _CODES[key] = RaptorCode(K, seed)
+    return _CODES[key]
+
+
+class RaptorEncoder:
+    """Encodes one source block; symbols are streamed by ESI."""
+
+    def __init__(self, source: Sequence[int], seed: int = RAPTOR_SEED) -> None:
+        self.code = get_code(len(source), seed)
+        self.source = list(source)
+        self.intermediate = self.code.intermediate(self.source)
+
+    def symbol(self, esi: int) -> int:
+        if esi < self.code.K:
+            return self.source[esi]
+        v = 0
+        inter = self.intermediate
+        for i in self.code.neighbours(esi):
+            v ^= inter[i]
+        return v
+
+    def symbols(self, start: int = 0) -> Iterator[Tuple[int, int]]:
+        """Endless stream of (esi, symbol), source symbols first when start = 0."""
+        esi = start
+        while True:
+            yield esi, self.symbol(esi)
+            esi += 1
+
+    def repair_symbols(self) -> Iterator[Tuple[int, int]]:
+        return self.symbols(self.code.K)
+
+
+def _solve(L: int, rows: List[List[int]], values: List[int]) -> Optional[List[int]]:
+    """
+    Solve XOR equations (rows[r] over the L unknowns sums to values[r]).
+
+    Peeling with degree buckets, inactivation when it stalls, then Gaussian
+    elimination over the inactive columns held as int bit-masks. ``values``
+    is consumed.
+
+    Returns:
+        All L unknowns, or None if the equations do not determine them.
+    """
+    active = [set(r) for r in rows]
+    inact = [0] * len(rows)
+    col_rows: List[set] = [set() for _ in range(L)]
+    for r, cols in enumerate(active):
+        for c in cols:
+            col_rows[c].add(r)
+    max_degree = max((len(a) for a in active), default=0)
+    buckets: List[set] = [set() for _ in range(max_degree + 1)]
+    for r, cols in enumerate(active):
+        if cols:
+            buckets[len(cols)].add(r)
+
+    solved_mask = [0] * L
+    solved_value = [0] * L
+    unresolved = set(range(L))
+    inactive_rows: List[int] = []
+    num_inactive = 0
+
+    def eliminate(c: int, mask: int, value: int) -> None:
+        for r2 in col_rows[c]:
+            cols = active[r2]
+            buckets[len(cols)].discard(r2)
+            cols.discard(c)
+            inact[r2] ^= mask
+            values[r2] ^= value
+            if cols:
+                buckets[len(cols)].add(r2)
+            else:
+                inactive_rows.append(r2)
+        col_rows[c].clear()
+        unresolved.discard(c)
+
+    while unresolved:
+        if buckets[1]:
+            r = buckets[1].pop()
+            (c,) = active[r]
+            active[r].clear()
+            col_rows[c].discard(r)
+            solved_mask[c] = inact[r]
+            solved_value[c] = values[r]
+            eliminate(c, inact[r], values[r])
+            continue
+        # Inactivate the most connected column of a minimum-degree row
+        row = next((next(iter(b)) for b in buckets[2:] if b), None)
+        if row is None:
+            c = next(iter(unresolved))
+        else:
+            c = max(active[row], key=lambda col: len(col_rows[col]))
+        bit = 1 << num_inactive
+        num_inactive += 1
+        solved_mask[c] = bit
+        eliminate(c, bit, 0)
+
+    pivots: Dict[int, Tuple[int, int]] = {}
+    for r in inactive_rows:
+        mask, value = inact[r], values[r]
+        while mask:
+            top = mask.bit_length() - 1
+            if top not in pivots:
+                pivots[top] = (mask, value)
+                break
+            pm, pv = pivots[top]
+            mask ^= pm
+            value ^= pv
+    if len(pivots) < num_inactive:
+        return None
+    inactive_values = [0] * num_inactive
+    for top in range(num_inactive):
+        mask, value = pivots[top]
+        mask ^= 1 << top
+        while mask:
+            low = mask & -mask
+            value ^= inactive_values[low.bit_length() - 1]
+            mask ^= low
+        inactive_values[top] = value
+
+    out = []
+    for c in range(L):
+        mask, value = solved_mask[c], solved_value[c]
+        while mask:
+            low = mask & -mask
+            value ^= inactive_values[low.bit_length() - 1]
+            mask ^= low
+        out.append(value)
+    return out
+
+
+def raptor_decode(K: int, received: Iterable[Tuple[int, int]],
+                  seed: int = RAPTOR_SEED) -> Optional[List[int]]:
+    """
+    Recover the K source symbols from received (esi, symbol) pairs.
+
+    Returns:
+        The source symbols, or None if the received set does not determine
+        them yet (more symbols are needed).
+    """
+    code = get_code(K, seed)
+    rows = code.constraint_rows()
+    values = [0] * len(rows)
+    source: List[Optional[int]] = [None] * K
+    cached = code.source_rows()
+    first = len(rows)
+    for esi, value in received:
+        rows.append(cached[first + esi] if esi < K else code.neighbours(esi))
+        values.append(value)
+        if esi < K:
+            source[esi] = value
+    if None not in source:
+        return source
+    intermediate = _solve(code.L, rows, values)
+    if intermediate is None:
+        return None
+    for esi in range(K):
+        if source[esi] is None:
+            v = 0
+            for i in cached[first + esi]:
+                v ^= intermediate[i]
+            source[esi] = v
+    return source
+
+
+def split_block(data: bytes, symbol_size: int) -> List[int]:
+    """Cut a byte block into symbols of ``symbol_size`` bytes (zero-padded) as packed ints."""
+    count = max(ceil(len(data) / symbol_size), 1)
+    data = data.ljust(count * symbol_size, b"\0")
+    return [int.from_bytes(data[i * symbol_size:(i + 1) * symbol_size], "little") for i in range(count)]
+
+
+def join_block(symbols: Sequence[int], symbol_size: int, length: int) -> bytes:
+    """Inverse of split_block."""
+    return b"".join(s.to_bytes(symbol_size, "little") for s in symbols)[:length]
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Binary Reed-Muller RM(r, m) codes with batched hard-decision decoding.
+
+Codeword bit x (0 <= x < 2^m) is the evaluation at the point whose i-th
+coordinate is bit i of x of the polynomial sum_S c_S * prod_{i in S} x_i over
+monomials S of degree <= r. Message bits are the coefficients c_S, ordered by
+degree, then lexicographically (1, x_0, ..., x_{m-1}, x_0 x_1, ...), so
+k = sum_{i<=r} C(m, i), n = 2^m, d = 2^(m-r) and t = 2^(m-r-1) - 1.
+
+First-order codes are decoded by maximum likelihood with a fast Walsh-Hadamard
+transform: the transform of (-1)^y peaks at the linear part and its sign
+gives the constant term. Higher orders use Reed's majority logic, degree by
+degree from r down to 0: the 2^(m-|S|) check sums of c_S are the XORs of y
+over the subcubes spanned by S, which is a sum over |S| axes of y viewed as a
+(frames, 2, ..., 2) array. A tied vote (or a tied Hadamard peak) leaves the
+decision ambiguous and marks the frame as detected.
+"""
+
+from __future__ import annotations
+
+from itertools import combinations
+from math import comb
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# Largest supported m (codeword length 2^RM_MAX_M)
+RM_MAX_M = 12
+
+
+def rm_dimension(r: int, m: int) -> int:
+    """Number of message bits of RM(r, m)."""
+    return sum(comb(m, i) for i in range(r + 1))
+
+
+def fwht(x: np.ndarray) -> np.ndarray:
+    """Walsh-Hadamard transform over the last axis (length 2^m), natural order."""
+    x = np.array(x, dtype=np.int64)
+    lead = x.shape[:-1]
+    n = x.shape[-1]
+    h = 1
+    while h < n:
+        view = x.reshape(lead + (n // (2 * h), 2, h))
+        a = view[..., 0, :].copy()
+        view[..., 0, :] += view[..., 1, :]
+        view[..., 1, :] = a - view[..., 1, :]
+        h *= 2
+    return x
+
+
+class ReedMullerCode:
+    """RM(r, m): generator rows, encoder and FWHT / majority-logic decoder."""
+
+    def __init__(self, r: int, m: int) -> None:
+        if not 0 <= r <= m:
+            raise ValueError(f"RM(r, m) requires 0 <= r <= m, got r={r}, m={m}")
+        if m > RM_MAX_M:
+            raise ValueError(f"RM(r, m) supports m <= {RM_MAX_M}, got m={m}")
+        self.r = r
+        self.m = m
+        self.n = 1 << m
+        self.monomials: List[Tuple[int, ...]] = [
+            S for degree in range(r + 1) for S in combinations(range(m), degree)]
+        self.k = len(self.monomials)
+        self.d = 1 << (m - r)
+        self.t = max(self.d // 2 - 1, 0)
+
+        points = np.arange(self.n)
+        rows = []
+        for S in self.monomials:
+            mask = sum(1 << i for i in S)
+            rows.append(((points & mask) == mask).astype(np.uint8))
+        self.G = np.array(rows, dtype=np.uint8)                              # (k, n)
+        self.G.setflags(write=False)
+        # Message-bit ranges per degree, and the summed axes of each monomial in
+        # the (frames, 2, ..., 2) view of y (axis m - i holds coordinate x_i)
+        self._degree_slices = []
+        start = 0
+        for degree in range(r + 1):
+            count = comb(m, degree)
+            self._degree_slices.append(slice(start, start + count))
+            start += count
+        self._axes = [tuple(m - i for i in S) for S in self.monomials]
+
+    def encode_bits(self, msg: np.ndarray) -> np.ndarray:
+        """(B, k) message bits -> (B, n) codeword bits."""
+        msg = np.asarray(msg, dtype=np.uint8)
+        return ((msg.astype(np.int64) @ self.G) & 1).astype(np.uint8)
+
+    def decode_bits(self, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Decode (B, n) hard-decision bits.
+
+        Returns:
+            Tuple of ((B, k) uint8 message bits, (B,) bool "unambiguous" flags).
+        """
+        y = np.atleast_2d(np.asarray(y, dtype=np.uint8))
+        if self.r == 1:
+            return self._decode_first_order(y)
+        return self._decode_majority(y)
+
+    def _decode_first_order(self, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        spectrum = fwht(1 - 2 * y.astype(np.int64))
+        magnitude = np.abs(spectrum)
+        peak = magnitude.argmax(axis=1)
+        rows = np.arange(len(y))
+        peak_value = magnitude[rows, peak]
+        unique = (magnitude == peak_value[:, None]).sum(axis=1) == 1
+
+        msg = np.empty((len(y), self.k), dtype=np.uint8)
+        msg[:, 0] = spectrum[rows, peak] < 0
+        msg[:, 1:] = (peak[:, None] >> np.arange(self.m)) & 1
+        return msg, unique
+
+    def _decode_majority(self, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        count = len(y)
+        residual = y.copy()
+        msg = np.zeros((count, self.k), dtype=np.uint8)
+        unique = np.ones(count, dtype=bool)
+        cube = (count,) + (2,) * self.m
+        for degree in range(self.r, -1, -1):
+            block = self._degree_slices[degree]
+            votes_total = 1 << (self.m - degree)
+            view = residual.reshape(cube)
+            for j in range(block.start, block.stop):
+                axes = self._axes[j]
+                checks = (view.sum(axis=axes, dtype=np.int64) & 1) if axes else view
+                ones = checks.reshape(count, -1).sum(axis=1)
+                msg[:, j] = 2 * ones > votes_total
+                unique &= 2 * ones != votes_total
+            if degree:
+                coeffs = msg[:, block].astype(np.int64)
+                residual ^= ((coeffs @ self.G[block]) & 1).astype(np.uint8)
+        return msg, unique
+
+
+_CODES: Dict[Tuple[int, int], ReedMullerCode] = {}
+
+
+def get_code(r: int, m: int) -> ReedMullerCode:
+    """Shared RM(r, m) instance."""
+    key = (r, m)
+    if key not in _CODES:
+        _CODES[key] = ReedMullerCode(r, m)
+    return _CODES[key]
+
+
+def smallest_m(r: int, data_bits: int) -> int:
+    """Smallest m >= r with rm_dimension(r, m) >= data_bits."""
+    m = max(r, 1)
+    while rm_dimension(r, m) < data_bits:
+        m += 1
+        if m > RM_MAX_M:
+            raise ValueError(f"RM({r}, m) needs m > {RM_MAX_M} for {data_bits} data bits")
+    return m
+
+
+def default_code(data_bits: int, m: int = None) -> Tuple[int, int]:
+    """
+    Shortest RM(r, m) carrying data_bits that still corrects an error.
+
+    Among codes with t >= 1 (r <= m - 2) the smallest m wins, and for that m
+    the lowest order, which has the largest distance.
+    """
+    lengths = [m] if m is not None else range(2, RM_MAX_M + 1)
+    for length in lengths:
+        for r in range(length - 1):
+            if rm_dimension(r, length) >= data_bits:
+                return r, length
+    raise ValueError(f"no RM(r, m) with m <= {RM_MAX_M} and t >= 1 carries {data_bits} data bits")
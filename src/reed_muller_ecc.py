@@ -1,25 +1,51 @@
-from typing import Tuple, List
+from typing import Dict, List, Optional, Tuple
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.base_ecc import ECCBase
+from src.base_ecc import ECCBase, CORRECTED, DETECTED, pack_bits, unpack_bits
+from src.reed_muller_codec import default_code, get_code, smallest_m
 import numpy as np
 
 class ReedMullerECC(ECCBase):
-    """Reed-Muller ECC implementation for high-reliability applications."""
+    """Reed-Muller ECC implementation for high-reliability applications.
+
+    By default this is a true RM(r, m) code (see reed_muller_codec): the
+    shortest one that carries the data word and corrects at least one error.
+    ``order`` fixes r, with m the smallest value that carries the data word.
+    ``rtl_compatible=True`` selects the project's rate-1/2 variant (N = 2K)
+    that verilogs/reed_muller_ecc.v implements instead.
+    """
     
-    def __init__(self, word_length: int = 8, data_length: int = None):
+    def __init__(self, word_length: int = 8, data_length: int = None,
+                 order: Optional[int] = None, m: Optional[int] = None,
+                 rtl_compatible: bool = False):
         """
         Initialize Reed-Muller ECC.
         
         Args:
             word_length: Length of data word in bits (default: 8)
             data_length: Alternative parameter name for word_length (for compatibility)
+            order: RM order r (default: chosen with m from the data length)
+            m: RM(r, m) length parameter (default: smallest m that fits the data)
+            rtl_compatible: Use the N = 2K variant mirrored by the RTL
         """
         if data_length is not None:
             self.word_length = data_length
         else:
             self.word_length = word_length
+
+        self.rm = None
+        if not rtl_compatible:
+            if order is None:
+                order, m = default_code(self.word_length, m)
+            self.rm = get_code(order, m if m is not None else smallest_m(order, self.word_length))
+            if self.rm.k < self.word_length:
+                raise ValueError(f"RM({order}, {self.rm.m}) carries only {self.rm.k} data bits")
+            self.order = order
+            self.k = self.word_length
+            self.n = self.rm.n
+            return
+        self.order = None
         
         # Configure Reed-Muller parameters based on word length
         # For this project's "Reed-Muller" variant, we use a Rate 1/2 linear block code
@@ -31,6 +57,19 @@ class ReedMullerECC(ECCBase):
         self.data_positions = list(range(self.k))
         self.parity_positions = list(range(self.k, self.n))
 
+        # Parity bit p covers the data bits j with (j + p) even, so every parity
+        # bit repeats one of two data parities (even j / odd j)
+        self._data_mask = (1 << self.k) - 1
+        self._even_data_mask = sum(1 << j for j in self.data_positions if j % 2 == 0)
+        self._odd_data_mask = self._data_mask ^ self._even_data_mask
+        self._even_parity_mask = sum(1 << p for p in self.parity_positions if p % 2 == 0)
+        self._odd_parity_mask = sum(1 << p for p in self.parity_positions if p % 2 == 1)
+        # Precomputed syndrome signature of each data bit -> data positions sharing it
+        self._signatures: Dict[int, List[int]] = {}
+        for j in self.data_positions:
+            signature = sum(1 << i for i, pos in enumerate(self.parity_positions) if (j + pos) % 2 == 0)
+            self._signatures.setdefault(signature, []).append(j)
+
     def _extract_data(self, codeword: int) -> int:
         """Extract data bits from codeword."""
         data = 0
@@ -50,15 +89,10 @@ class ReedMullerECC(ECCBase):
     def _calculate_parity(self, codeword: int) -> int:
         """Calculate parity bits for the codeword."""
         parity = 0
-        for i, pos in enumerate(self.parity_positions):
-            # Calculate parity for this parity bit based on data bits only
-            p = 0
-            for j in self.data_positions:
-                if ((codeword >> j) & 1):
-                    # Simple parity calculation
-                    if (j + pos) % 2 == 0:
-                        p ^= 1
-            parity |= (p << pos)
+        if bin(codeword & self._even_data_mask).count('1') & 1:
+            parity |= self._even_parity_mask
+        if bin(codeword & self._odd_data_mask).count('1') & 1:
+            parity |= self._odd_parity_mask
         return parity
 
     def encode(self, data: int) -> int:
@@ -74,15 +108,12 @@ class ReedMullerECC(ECCBase):
         # Ensure data fits within word_length bits
         if data >= (1 << self.word_length):
             data = data & ((1 << self.word_length) - 1)
+
+        if self.rm is not None:
+            return int(self.encode_batch(np.array([data], dtype=object))[0])
         
-        # Insert data bits into codeword
-        codeword = self._insert_data(data)
-        
-        # Calculate and insert parity bits
-        parity = self._calculate_parity(codeword)
-        codeword |= parity
-        
-        return codeword
+        # Data occupies the low K bits, parity the high K bits
+        return data | self._calculate_parity(data)
 
     def decode(self, codeword: int) -> Tuple[int, str]:
         """
@@ -94,57 +125,65 @@ class ReedMullerECC(ECCBase):
         Returns:
             Tuple of (decoded_data, error_type)
         """
-        # Calculate syndrome
-        syndrome = 0
-        for i, pos in enumerate(self.parity_positions):
-            # Calculate expected parity based on data bits only
-            expected_parity = 0
-            for j in self.data_positions:
-                if ((codeword >> j) & 1):
-                    # Simple parity calculation
-                    if (j + pos) % 2 == 0:
-                        expected_parity ^= 1
-            
-            # Compare with actual parity
-            actual_parity = (codeword >> pos) & 1
-            if expected_parity != actual_parity:
-                syndrome |= (1 << i)
+        if self.rm is not None:
+            data, codes = self.decode_batch(np.array([codeword], dtype=object))
+            return int(data[0]), 'corrected' if codes[0] == CORRECTED else 'detected'
+
+        data = codeword & self._data_mask
+        syndrome = ((codeword ^ self._calculate_parity(data)) >> self.k) & self._data_mask
         
         if syndrome == 0:
             # No error detected
-            return self._extract_data(codeword), 'corrected'
-        else:
-            # Error detected. Use efficient syndrome matching to find single bit error.
-            # Complexity: O(N * M) instead of O(N * M * K)
-            
-            # Check if error is in a parity bit
-            # A parity bit 'p' at parity_positions[i] only affects syndrome bit i
-            for i, pos in enumerate(self.parity_positions):
-                if syndrome == (1 << i):
-                    # Error is in parity bit 'pos'
-                    return self._extract_data(codeword ^ (1 << pos)), 'corrected'
-            
-            # Check if error is in a data bit
-            matches = []
-            for j in self.data_positions:
-                # Calculate syndrome signature for this data bit
-                # This bit affects parity 'pos' if (j + pos) % 2 == 0
-                bit_syndrome = 0
-                for i, pos in enumerate(self.parity_positions):
-                    if (j + pos) % 2 == 0:
-                        bit_syndrome |= (1 << i)
-                
-                if bit_syndrome == syndrome:
-                    matches.append(j)
-                    
-            if len(matches) == 1:
-                j = matches[0]
-                return self._extract_data(codeword ^ (1 << j)), 'corrected'
-            elif len(matches) > 1:
-                return self._extract_data(codeword), 'detected'
-                    
-            # Error detected but not corrected (e.g. double bit error)
-            return self._extract_data(codeword), 'detected'
+            return data, 'corrected'
+
+        # A single syndrome bit is an error in that parity bit
+        if syndrome & (syndrome - 1) == 0:
+            return data, 'corrected'
+
+        # Data bit errors are correctable only when their signature is unique
+        matches = self._signatures.get(syndrome, [])
+        if len(matches) == 1:
+            return data ^ (1 << matches[0]), 'corrected'
+
+        # Error detected but not corrected (e.g. double bit error)
+        return data, 'detected'
+
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        bits = unpack_bits(data, self.word_length)
+        if self.rm is not None:
+            msg = np.zeros((len(bits), self.rm.k), dtype=np.uint8)
+            msg[:, :self.word_length] = bits
+            return pack_bits(self.rm.encode_bits(msg))
+        even = bits[:, 0::2].sum(axis=1) & 1
+        odd = bits[:, 1::2].sum(axis=1) & 1
+        parity_even = (np.arange(self.k, self.n) % 2 == 0)
+        parity = np.where(parity_even, even[:, None], odd[:, None]).astype(np.uint8)
+        return pack_bits(np.hstack([bits, parity]))
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        bits = unpack_bits(codewords, self.n)
+        if self.rm is not None:
+            msg, unique = self.rm.decode_bits(bits)
+            # Unused message bits are encoded as 0; anything else is a detected failure
+            clean = unique & ~msg[:, self.word_length:].any(axis=1)
+            codes = np.where(clean, CORRECTED, DETECTED).astype(np.uint8)
+            return pack_bits(msg[:, :self.word_length]), codes
+
+        data = bits[:, :self.k].copy()
+        even = data[:, 0::2].sum(axis=1) & 1
+        odd = data[:, 1::2].sum(axis=1) & 1
+        parity_even = (np.arange(self.k, self.n) % 2 == 0)
+        syndrome = bits[:, self.k:] ^ np.where(parity_even, even[:, None], odd[:, None]).astype(np.uint8)
+        weight = syndrome.sum(axis=1)
+        codes = np.where(weight <= 1, CORRECTED, DETECTED).astype(np.uint8)
+        for signature, positions in self._signatures.items():
+            if len(positions) != 1 or signature & (signature - 1) == 0:
+                continue
+            pattern = (signature >> np.arange(self.k)) & 1
+            hit = (weight > 1) & (syndrome == pattern).all(axis=1)
+            data[hit, positions[0]] ^= 1
+            codes[hit] = CORRECTED
+        return pack_bits(data), codes
 
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         """
@@ -1,6 +1,10 @@
 from typing import Tuple
 from dataclasses import dataclass
-from base_ecc import ECCBase
+
+import numpy as np
+
+from base_ecc import ECCBase, CORRECTED, DETECTED, UNDETECTED, as_word_array
+from rs_codec import NSYM, RSCodec
 
 @dataclass
 class RSConfig:
@@ -8,7 +12,14 @@ class RSConfig:
     k: int  # Data length
 
 class ReedSolomonECC(ECCBase):
-    """Configurable Reed-Solomon ECC implementation (Python wrapper, uses reedsolo if available)."""
+    """
+    Configurable Reed-Solomon ECC implementation.
+
+    Codes with n - k = 4 (t = 2, the data_length default) run on the native
+    GF(256) engine in rs_codec; other (n, k) use reedsolo if available. Both
+    produce the same codewords: data bytes big-endian first, then parity, with
+    codeword byte i stored at bits 8i..8i+7.
+    """
     def __init__(self, n: int = None, k: int = None, config: RSConfig = None, data_length: int = None) -> None:
         """
         Initialize Reed-Solomon ECC with either individual parameters or a config object.
@@ -66,12 +77,18 @@ class ReedSolomonECC(ECCBase):
         self.n = self.config.n
         self.k = self.config.k
         
-        try:
-            import reedsolo
-            self.rs = reedsolo.RSCodec(self.config.n - self.config.k)
-        except ImportError:
-            # Fallback implementation without reedsolo
-            self.rs = None
+        # Native engine (same generator/FCR as reedsolo) when the code is t=2
+        self.engine = None
+        self.rs = None
+        if self.config.n - self.config.k == NSYM and self.config.k <= 251:
+            self.engine = RSCodec.for_width(8 * self.config.k)
+        else:
+            try:
+                import reedsolo
+                self.rs = reedsolo.RSCodec(self.config.n - self.config.k)
+            except ImportError:
+                # Fallback implementation without reedsolo
+                self.rs = None
         
         # Store data length for compatibility
         self.data_length = data_length
@@ -86,6 +103,9 @@ class ReedSolomonECC(ECCBase):
         Returns:
             Encoded codeword as integer.
         """
+        if self.engine is not None:
+            return self.engine.encode(self._to_engine_data(data))
+
         if self.rs is None:
             # Fallback: simple repetition code
             return data
@@ -127,6 +147,14 @@ class ReedSolomonECC(ECCBase):
             - 'detected': Error was detected but not corrected  
             - 'undetected': Error was not detected
         """
+        if self.engine is not None:
+            data, detected, corrected = self.engine.decode(codeword)
+            if corrected:
+                return self._from_engine_data(data), 'corrected'
+            if detected:
+                return codeword, 'detected'
+            return self._from_engine_data(data), 'undetected'
+
         if self.rs is None:
             # Fallback: simple repetition code
             return codeword, 'corrected'
@@ -165,6 +193,68 @@ class ReedSolomonECC(ECCBase):
             # If decoding fails, error was detected but not corrected
             return codeword, 'detected'
 
+    def _to_engine_data(self, data: int) -> int:
+        """Big-endian k-byte message (leading bytes kept, as in the reedsolo path) as rs_codec data."""
+        extra = (data.bit_length() + 7) // 8 - self.config.k
+        if extra > 0:
+            data >>= 8 * extra
+        return int.from_bytes(data.to_bytes(self.config.k, 'big'), 'little')
+
+    def _from_engine_data(self, data: int) -> int:
+        return int.from_bytes(data.to_bytes(self.config.k, 'little'), 'big')
+
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        """
+        Encode an array of data words on the native engine's byte matrices.
+
+        Args:
+            data: 1-D array (or iterable) of data words.
+
+        Returns:
+            Array of codewords.
+        """
+        if self.engine is None:
+            return super().encode_batch(data)
+        words = as_word_array(data)
+        msg_bits = 8 * self.config.k
+        if words.dtype == object:
+            oversized = bool(np.any(words >> msg_bits))
+        else:
+            oversized = msg_bits < 64 and bool(np.any(words >> np.uint64(msg_bits)))
+        if oversized:
+            # Wider-than-k data keeps its leading bytes; let encode() handle it
+            return super().encode_batch(data)
+        # Message byte 0 is the most significant data byte
+        msg = self.engine.to_byte_matrix(words, self.config.k)[:, ::-1]
+        return self.engine.from_byte_matrix(self.engine.encode_bytes(msg))
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Decode an array of codewords on the native engine's byte matrices.
+
+        Args:
+            codewords: 1-D array (or iterable) of codewords.
+
+        Returns:
+            Tuple of (decoded_data, error_codes); like decode, rows that are
+            detected but not corrected return the received codeword.
+        """
+        if self.engine is None:
+            return super().decode_batch(codewords)
+        words = as_word_array(codewords)
+        out, detected, corrected = self.engine.decode_bytes(self.engine.to_byte_matrix(words, self.config.n))
+        decoded = self.engine.from_byte_matrix(out[:, self.config.k - 1::-1])
+        codes = np.full(len(words), UNDETECTED, dtype=np.uint8)
+        codes[detected.astype(bool)] = DETECTED
+        codes[corrected.astype(bool)] = CORRECTED
+        failed = codes == DETECTED
+        if failed.any():
+            if decoded.dtype != words.dtype:
+                decoded = decoded.astype(object)
+                words = words.astype(object)
+            decoded = as_word_array(np.where(failed, words, decoded))
+        return decoded, codes
+
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         """
         Flip the bit at bit_idx in the codeword.
@@ -1,5 +1,6 @@
 from typing import List, Tuple
-from base_ecc import ECCBase
+import numpy as np
+from base_ecc import ECCBase, CORRECTED, as_word_array, pack_bits, unpack_bits
 
 class RepetitionCode:
     """Repetition Code ECC implementation.
@@ -114,4 +115,32 @@ class RepetitionECC(ECCBase):
             
         except Exception:
             # If decoding fails, error detected
-            return codeword, 'detected' 
\ No newline at end of file
+            return codeword, 'detected'
+
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        """
+        Encode an array of data words using repetition code.
+
+        Args:
+            data: 1-D array of data words
+
+        Returns:
+            Array of codewords
+        """
+        bits = unpack_bits(as_word_array(data, self.data_length), self.data_length)
+        return pack_bits(np.repeat(bits, self.repetition_factor, axis=1))
+
+    def decode_batch(self, codewords: np.ndarray):
+        """
+        Decode an array of repetition codewords by majority vote.
+
+        Args:
+            codewords: 1-D array of codewords
+
+        Returns:
+            Tuple of (decoded_data, error_codes)
+        """
+        bits = unpack_bits(as_word_array(codewords, self.n), self.n)
+        votes = bits.reshape(len(bits), self.data_length, self.repetition_factor).sum(axis=2)
+        decoded = pack_bits((votes > self.repetition_factor // 2).astype(np.uint8))
+        return decoded, np.full(len(decoded), CORRECTED, dtype=np.uint8)
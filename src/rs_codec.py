@@ -8,55 +8,23 @@ Decode: PGZ closed-form sigma + Chien(X^{-1}) + Forney (FCR=0 simplified).
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
+import numpy as np
+
+from gf2m import GF2m
+
 PRIM_POLY = 0x11D
 T = 2
 NSYM = 2 * T
 
 
-class GF256:
-    def __init__(self, prim: int = PRIM_POLY) -> None:
-        self.exp = [0] * 512
-        self.log = [0] * 256
-        x = 1
-        for i in range(255):
-            self.exp[i] = x
-            self.log[x] = i
-            x <<= 1
-            if x & 0x100:
-                x ^= prim
-        for i in range(255, 512):
-            self.exp[i] = self.exp[i - 255]
-
-    def add(self, a: int, b: int) -> int:
-        return a ^ b
-
-    def mul(self, a: int, b: int) -> int:
-        if a == 0 or b == 0:
-            return 0
-        return self.exp[self.log[a] + self.log[b]]
-
-    def div(self, a: int, b: int) -> int:
-        if b == 0:
-            raise ZeroDivisionError
-        if a == 0:
-            return 0
-        return self.exp[(self.log[a] - self.log[b]) % 255]
-
-    def inv(self, a: int) -> int:
-        return self.div(1, a)
-
-    def sqr(self, a: int) -> int:
-        return self.mul(a, a)
+class GF256(GF2m):
+    """GF(2^8) view of the shared gf2m tables (exp doubled, log[0] = -1)."""
 
-    def pow(self, a: int, e: int) -> int:
-        if a == 0:
-            return 0
-        if e == 0:
-            return 1
-        return self.exp[(self.log[a] * e) % 255]
+    def __init__(self, prim: int = PRIM_POLY) -> None:
+        super().__init__(8, prim)
 
 
 def poly_eval(coeffs_lo_to_hi: List[int], x: int, gf: GF256) -> int:
@@ -76,26 +44,105 @@ class RSCodec:
     n: int
     t: int
     gf: GF256
+    # Per-width tables (see _build_tables)
+    g_poly: List[int] = field(init=False, repr=False)
+    parity_table: List[List[int]] = field(init=False, repr=False)
+    syndrome_table: List[List[int]] = field(init=False, repr=False)
+    syndrome_matrix: np.ndarray = field(init=False, repr=False)
+    locators: np.ndarray = field(init=False, repr=False)  # X_pos = alpha^(n-1-pos)
+    chien_points: np.ndarray = field(init=False, repr=False)  # X_pos^-1
+
+    def __post_init__(self) -> None:
+        self._build_tables()
 
     @classmethod
     def for_width(cls, width: int) -> "RSCodec":
         k = min((width + 7) // 8, 251)
         return cls(width=width, k=k, n=k + NSYM, t=T, gf=GF256())
 
+    def _build_tables(self) -> None:
+        """
+        Linear-map tables for encode and syndromes.
+
+        The LFSR parity and the Horner syndromes are both GF(256)-linear in the
+        message/codeword bytes, so each is an XOR of per-(byte position, value)
+        contributions: parity_table[step][v] is the packed parity word
+        produced by message byte v at LFSR step ``step`` (all other bytes
+        zero), and syndrome_table[j][v] packs S0..S3 (S_i in bits 8i..8i+7) for
+        byte v at codeword position j. syndrome_matrix is the same map as an
+        (NSYM, n) GF(256) matrix, H[i, j] = alpha^(i*(n-1-j)), for batches.
+        """
+        gf = self.gf
+        self.g_poly = self.generator_poly()
+        g = self.g_poly
+        vals = np.arange(256)
+
+        # LFSR state for every byte value at once; fed at the last step first,
+        # then clocked with zero input to move one step earlier.
+        state = [gf.mul_array(g[NSYM], vals)] + [gf.mul_array(g[NSYM - i], vals) for i in range(1, NSYM)]
+        per_step = [None] * self.k
+        for step in range(self.k - 1, -1, -1):
+            word = np.zeros(256, dtype=np.int64)
+            for i in range(NSYM):
+                word |= state[NSYM - 1 - i] << (8 * i)
+            per_step[step] = word.tolist()
+            fb = state[NSYM - 1]
+            state = [gf.mul_array(g[NSYM], fb)] + [
+                state[i - 1] ^ gf.mul_array(g[NSYM - i], fb) for i in range(1, NSYM)
+            ]
+        self.parity_table = per_step
+
+        self.syndrome_matrix = np.array(
+            [[gf.power(2, i * (self.n - 1 - j)) for j in range(self.n)] for i in range(NSYM)],
+            dtype=np.int64,
+        )
+        self.syndrome_table = []
+        for j in range(self.n):
+            word = np.zeros(256, dtype=np.int64)
+            for i in range(NSYM):
+                word |= gf.mul_array(self.syndrome_matrix[i, j], vals) << (8 * i)
+            self.syndrome_table.append(word.tolist())
+
+        self.locators = np.array([self.locator_x(pos) for pos in range(self.n)], dtype=np.int64)
+        self.chien_points = gf.inv_array(self.locators)
+        self._locator_list = self.locators.tolist()
+        self._chien_list = self.chien_points.tolist()
+
     def pack_bytes(self, codeword: int) -> List[int]:
         return [(codeword >> (8 * j)) & 0xFF for j in range(self.n)]
 
     def syndromes(self, codeword: int) -> List[int]:
-        """S0..S3 (FCR=0): Horner at alpha^i."""
-        bytes_ = self.pack_bytes(codeword)
-        syn = []
-        for i in range(NSYM):
-            root = self.gf.exp[i]
-            val = 0
-            for b in bytes_:
-                val = self.gf.add(self.gf.mul(val, root), b)
-            syn.append(val)
-        return syn
+        """S0..S3 (FCR=0): Horner at alpha^i, via the per-byte syndrome_table."""
+        packed = 0
+        for j, row in enumerate(self.syndrome_table):
+            packed ^= row[(codeword >> (8 * j)) & 0xFF]
+        return [(packed >> (8 * i)) & 0xFF for i in range(NSYM)]
+
+    def to_byte_matrix(self, words: np.ndarray, nbytes: int) -> np.ndarray:
+        """(N, nbytes) uint8 matrix of little-endian bytes of each word."""
+        words = np.asarray(words)
+        if words.dtype != object and nbytes <= 8:
+            raw = words.astype("<u8").reshape(-1, 1).view(np.uint8)
+            return raw[:, :nbytes]
+        buf = b"".join((int(w) & ((1 << (8 * nbytes)) - 1)).to_bytes(nbytes, "little") for w in words.ravel())
+        return np.frombuffer(buf, dtype=np.uint8).reshape(-1, nbytes)
+
+    @staticmethod
+    def from_byte_matrix(byte_rows: np.ndarray) -> np.ndarray:
+        """Inverse of to_byte_matrix (uint64 up to 8 bytes, object above)."""
+        byte_rows = np.ascontiguousarray(byte_rows, dtype=np.uint8)
+        count, nbytes = byte_rows.shape
+        if nbytes <= 8:
+            padded = np.zeros((count, 8), dtype=np.uint8)
+            padded[:, :nbytes] = byte_rows
+            return padded.view("<u8").ravel().astype(np.uint64)
+        out = np.empty(count, dtype=object)
+        out[:] = [int.from_bytes(row.tobytes(), "little") for row in byte_rows]
+        return out
+
+    def syndromes_batch(self, codewords: np.ndarray) -> np.ndarray:
+        """(N, NSYM) syndromes: syndrome_matrix times each codeword's byte vector."""
+        return self.gf.matvec(self.syndrome_matrix, self.to_byte_matrix(codewords, self.n))
 
     def generator_poly(self) -> List[int]:
         g = [1]
@@ -111,24 +158,25 @@ class RSCodec:
         return res
 
     def encode(self, data: int) -> int:
-        g = self.generator_poly()
-        msg = [(data >> (8 * i)) & 0xFF for i in range(self.k)]
-        state = [0] * NSYM
+        msg_bits = 8 * self.k
+        data &= (1 << msg_bits) - 1
+        parity = 0
+        for step, row in enumerate(self.parity_table):
+            parity ^= row[(data >> (8 * step)) & 0xFF]
+        return data | (parity << msg_bits)
+
+    def encode_bytes(self, msg: np.ndarray) -> np.ndarray:
+        """(N, k) message bytes -> (N, n) codeword bytes (message, then parity)."""
+        msg = np.asarray(msg, dtype=np.uint8)
+        table = np.array(self.parity_table, dtype=np.uint32)
+        parity = np.zeros(len(msg), dtype=np.uint32)
         for step in range(self.k):
-            fb = self.gf.add(state[NSYM - 1], msg[step])
-            new = [0] * NSYM
-            for i in range(NSYM):
-                if i == 0:
-                    new[0] = self.gf.mul(g[NSYM], fb)
-                else:
-                    new[i] = self.gf.add(state[i - 1], self.gf.mul(g[NSYM - i], fb))
-            state = new
-        out = 0
-        for i, b in enumerate(msg):
-            out |= b << (8 * i)
-        for i in range(NSYM):
-            out |= state[NSYM - 1 - i] << (8 * (self.k + i))
-        return out
+            parity ^= table[step][msg[:, step]]
+        return np.concatenate([msg, parity.astype("<u4").reshape(-1, 1).view(np.uint8)], axis=1)
+
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        """encode() over an array of data words."""
+        return self.from_byte_matrix(self.encode_bytes(self.to_byte_matrix(data, self.k)))
 
     def locator_x(self, pos: int) -> int:
         """X_k = alpha^{n-1-pos} (byte error locator)."""
@@ -163,16 +211,14 @@ class RSCodec:
             return 0
         omega0 = s0
         omega1 = gf.add(s1, gf.mul(s0, sigma1))
-        x_inv = self.chien_x(pos)
-        x_loc = self.locator_x(pos)
+        x_inv = self._chien_list[pos]
+        x_loc = self._locator_list[pos]
         num = gf.add(omega0, gf.mul(omega1, x_inv))
         return gf.mul(gf.div(num, sigma1), x_loc)
 
     def chien_positions(self, sigma: List[int]) -> List[int]:
-        return [
-            j for j in range(self.n)
-            if poly_eval(sigma, self.chien_x(j), self.gf) == 0
-        ]
+        points = self._chien_list
+        return [j for j in range(self.n) if poly_eval(sigma, points[j], self.gf) == 0]
 
     def decode(self, codeword: int) -> Tuple[int, int, int]:
         cw = codeword & ((1 << (8 * self.n)) - 1)
@@ -204,6 +250,72 @@ class RSCodec:
         data_out = (out_cw & ((1 << (8 * self.k)) - 1)) & mask
         return data_out, 1, 1
 
+    def decode_bytes(self, rx: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Decode (N, n) codeword bytes: matrix syndromes, closed-form PGZ, Chien
+        over all positions and Forney magnitudes, all vectorized.
+
+        Returns:
+            (bytes, error_detected, error_corrected): corrected codeword bytes
+            where error_corrected is set, the received bytes otherwise.
+        """
+        gf = self.gf
+        rx = np.asarray(rx, dtype=np.uint8)
+        syn = gf.matvec(self.syndrome_matrix, rx)
+        s0, s1, s2, s3 = syn.T
+
+        det = syn.any(axis=1)
+        delta = gf.mul_array(s0, s2) ^ gf.mul_array(s1, s1)
+        one_err = det & (delta == 0) & (s0 != 0)
+        two_err = det & (delta != 0)
+        safe_delta = np.where(two_err, delta, 1)
+        safe_s0 = np.where(one_err, s0, 1)
+        sigma1 = np.where(
+            two_err,
+            gf.div_array(gf.mul_array(s0, s3) ^ gf.mul_array(s1, s2), safe_delta),
+            np.where(one_err, gf.div_array(s1, safe_s0), 0),
+        )
+        sigma2 = np.where(
+            two_err, gf.div_array(gf.mul_array(s1, s3) ^ gf.mul_array(s2, s2), safe_delta), 0
+        )
+        n_err = np.where(two_err, 2, np.where(one_err, 1, 0))
+
+        # Chien: sigma(X^-1) for every position and row
+        x_inv = self.chien_points[None, :]
+        val = 1 ^ gf.mul_array(sigma1[:, None], x_inv) ^ gf.mul_array(sigma2[:, None], gf.mul_array(x_inv, x_inv))
+        roots = (val == 0) & (n_err[:, None] > 0)
+        located = (n_err > 0) & (roots.sum(axis=1) == n_err)
+
+        # Forney: e = (S0 + (S1 + S0*sigma1) * X^-1) / sigma1 * X
+        omega1 = s1 ^ gf.mul_array(s0, sigma1)
+        num = s0[:, None] ^ gf.mul_array(omega1[:, None], x_inv)
+        safe_sigma1 = np.where(sigma1 != 0, sigma1, 1)[:, None]
+        mag = gf.mul_array(gf.div_array(num, safe_sigma1), self.locators[None, :])
+        mag = np.where(roots & located[:, None] & (sigma1 != 0)[:, None], mag, 0)
+        corrected = rx ^ mag.astype(np.uint8)
+
+        recheck = gf.matvec(self.syndrome_matrix, corrected[located]).any(axis=1)
+        cor = located.copy()
+        cor[np.flatnonzero(located)[recheck]] = False
+
+        out = np.where(cor[:, None], corrected, rx)
+        return out, det.astype(np.uint8), cor.astype(np.uint8)
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        decode() over an array of codewords (see decode_bytes).
+
+        Returns:
+            (data_out, error_detected, error_corrected) arrays.
+        """
+        out, det, cor = self.decode_bytes(self.to_byte_matrix(codewords, self.n))
+        data = self.from_byte_matrix(out[:, : self.k])
+        if self.width < 8 * self.k:
+            mask = (1 << self.width) - 1
+            data = data & (np.uint64(mask) if data.dtype != object else mask)
+        if self.width <= 64:
+            data = data.astype(np.uint64)
+        return data, det, cor
 
 if __name__ == "__main__":
     from itertools import combinations
@@ -3,6 +3,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.base_ecc import ECCBase
+from src.ldpc_codec import LLR_ALPHA, LLR_MAX_ITER, MinSumDecoder
 import numpy as np
 
 class SpatiallyCoupledLDPCECC(ECCBase):
@@ -44,6 +45,7 @@ class SpatiallyCoupledLDPCECC(ECCBase):
         # Generate deterministic matrices
         self.G = self._generate_generator_matrix()
         self.H = self._generate_parity_check_matrix()
+        self._llr_decoder = None  # MinSumDecoder, built on first decode_llr
 
     def _generate_generator_matrix(self) -> np.ndarray:
         """Generate deterministic generator matrix."""
@@ -162,6 +164,24 @@ class SpatiallyCoupledLDPCECC(ECCBase):
         
         return 0, False
 
+    def decode_llr(self, llr: np.ndarray, max_iter: int = LLR_MAX_ITER, alpha: float = LLR_ALPHA,
+                   early_stop: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Soft-decision decode with layered normalized min-sum over H.
+
+        Args:
+            llr: (N, n) or (n,) channel LLRs, log(P(0)/P(1)) per codeword bit.
+            max_iter: Maximum number of decoding iterations.
+            alpha: Min-sum normalization factor.
+            early_stop: Stop each frame once its hard decision satisfies H.
+
+        Returns:
+            Tuple of (decoded_data, error_codes) as in decode_batch.
+        """
+        if self._llr_decoder is None:
+            self._llr_decoder = MinSumDecoder(self.H)
+        return self._llr_decoder.decode_data(llr, self.word_length, max_iter, alpha, early_stop)
+
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         """
         Flip the bit at bit_idx in the codeword.
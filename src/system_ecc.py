@@ -1,5 +1,7 @@
 from typing import Tuple
-from base_ecc import ECCBase
+from base_ecc import ECCBase, DETECTED, as_word_array, word_dtype, word_parity
+from composite_codec import word_bit_length
+import numpy as np
 
 class SystemECC(ECCBase):
     """System-level Hamming SECDED ECC implementation for 8-bit data (example system ECC)."""
@@ -74,6 +76,33 @@ class SystemECC(ECCBase):
             # If decoding fails, error detected
             return codeword, 'detected'
 
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        code = as_word_array(self.hamming.encode_batch(data), self.n)
+        parity = word_parity(code, self.hamming.n)
+        # The system parity sits just above the highest set bit, as in encode()
+        shift = word_bit_length(code)
+        if code.dtype == object:
+            return code | (parity << shift)
+        return code | (parity << shift.astype(np.uint64))
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        codewords = as_word_array(codewords, self.n)
+        length = word_bit_length(codewords)
+        empty = length == 0
+        top_shift = np.maximum(length - 1, 0)
+        if codewords.dtype == object:
+            top = np.where(empty, 0, np.ones(len(codewords), dtype=object) << top_shift)
+        else:
+            top = np.where(empty, np.uint64(0), np.uint64(1) << top_shift.astype(np.uint64))
+        # The MSB is read as the system parity, so it is 1 for every non-zero word
+        base = codewords ^ top
+        mismatch = (word_parity(base, self.n) != 1).astype(bool) | empty
+
+        data, codes = self.hamming.decode_batch(base)
+        data = np.where(mismatch, base, as_word_array(data, self.n)).astype(word_dtype(self.n))
+        codes = np.where(mismatch, DETECTED, codes).astype(np.uint8)
+        return data, codes
+
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         """
         Flip the bit at bit_idx in the codeword.
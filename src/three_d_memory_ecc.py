@@ -1,234 +1,246 @@
 from typing import Tuple, List, Dict
-from base_ecc import ECCBase
+from base_ecc import ECCBase, CORRECTED, DETECTED, as_word_array, word_dtype, word_parity
 import numpy as np
 
 class ThreeDMemoryECC(ECCBase):
     """
     3D Memory ECC implementation for stacked memory architectures.
     Handles errors across multiple memory layers and dimensions.
+
+    Data is laid out die-major, then layer-major: bit ``b`` of layer ``l`` on
+    die ``d`` is data bit ``(d * layers + l) * bits_per_layer + b``. Each die
+    is one packed word per layer and carries its own parity group of
+    ``layers`` layer parities (popcount parity of each layer word),
+    ``bits_per_layer`` column parities (XOR fold of the layer words) and an
+    overall parity. The parity groups follow the data bits in die order.
+    A single-bit error on a die flips exactly one layer parity and one
+    column parity, so the two syndromes are one-hot and their product is the
+    correction mask.
     """
-    
-    def __init__(self, data_length: int = 8, layers: int = 4, bits_per_layer: int = 2):
+
+    def __init__(self, data_length: int = 8, layers: int = None, bits_per_layer: int = None,
+                 dies: int = 1):
         """
         Initialize 3D Memory ECC.
-        
+
         Args:
             data_length: Length of data word in bits
-            layers: Number of memory layers (default: 4)
-            bits_per_layer: Bits per memory layer (default: 2)
+            layers: Number of memory layers per die (default: chosen from data_length)
+            bits_per_layer: Bits per memory layer (default: chosen from data_length)
+            dies: Number of stacked dies, each with its own parity group (default: 1)
         """
+        if dies < 1:
+            raise ValueError("dies must be at least 1")
         self.data_length = data_length
-        
-        # Adjust layers and bits_per_layer based on data_length
-        if data_length <= 8:
-            self.layers = 4
-            self.bits_per_layer = 2
-        elif data_length <= 16:
-            self.layers = 4
-            self.bits_per_layer = 4
-        elif data_length <= 32:
-            self.layers = 8
-            self.bits_per_layer = 4
+        self.dies = dies
+        per_die = -(-data_length // dies)
+
+        if layers is None and bits_per_layer is None:
+            # Adjust layers and bits_per_layer based on data_length
+            if per_die <= 8:
+                self.layers = 4
+                self.bits_per_layer = 2
+            elif per_die <= 16:
+                self.layers = 4
+                self.bits_per_layer = 4
+            elif per_die <= 32:
+                self.layers = 8
+                self.bits_per_layer = 4
+            else:
+                # Scale for larger widths, keeping LAYERS=4 to match hardware implementation
+                self.layers = 4
+                self.bits_per_layer = per_die // 4
         else:
-            # Scale for larger widths, keeping LAYERS=4 to match hardware implementation
-            self.layers = 4
-            self.bits_per_layer = self.data_length // 4
-        
+            self.layers = layers if layers is not None else -(-per_die // bits_per_layer)
+            self.bits_per_layer = bits_per_layer if bits_per_layer is not None else -(-per_die // layers)
+            if self.layers * self.bits_per_layer * dies < data_length:
+                raise ValueError(f"{dies} x {self.layers} x {self.bits_per_layer} geometry "
+                                 f"cannot hold {data_length} data bits")
+        if not 1 <= self.layers <= 64 or self.bits_per_layer < 1:
+            raise ValueError("3D memory geometry needs 1..64 layers and at least one bit per layer")
+
         # Calculate 3D memory parameters
         self.total_bits = self.layers * self.bits_per_layer
         self.parity_bits = self.layers + self.bits_per_layer + 1  # Layer parity + bit parity + overall parity
-        self.n = self.total_bits + self.parity_bits
-        
-        # Import base ECC for layer-level protection
-        from hamming_secded_ecc import HammingSECDEDECC
-        self.layer_ecc = HammingSECDEDECC(data_length=bits_per_layer)
-    
-    def _distribute_data_3d(self, data: int) -> List[List[int]]:
-        """
-        Distribute data across 3D memory layers.
-        
-        Args:
-            data: Input data
-            
-        Returns:
-            3D array of bits [layer][bit_position]
-        """
-        # Create 3D memory structure
-        memory_3d = [[0 for _ in range(self.bits_per_layer)] for _ in range(self.layers)]
-        
-        # Distribute data bits across layers
-        bit_pos = 0
-        for layer in range(self.layers):
-            for bit in range(self.bits_per_layer):
-                if bit_pos < self.data_length:
-                    memory_3d[layer][bit] = (data >> bit_pos) & 1
-                    bit_pos += 1
-        
-        return memory_3d
-    
-    def _calculate_layer_parity(self, memory_3d: List[List[int]]) -> List[int]:
-        """Calculate parity for each layer."""
-        layer_parity = []
+        self.n = self.dies * (self.total_bits + self.parity_bits)
+
+        self._layer_mask = (1 << self.bits_per_layer) - 1
+        self._block_mask = (1 << self.total_bits) - 1
+        # The legacy geometry can hold fewer bits than data_length (e.g. 36 bits
+        # -> 4 x 8); those bits are dropped exactly as before
+        self._data_mask = (1 << min(self.data_length, self.dies * self.total_bits)) - 1
+        self._parity_start = self.dies * self.total_bits
+        self._limbs = -(-self.bits_per_layer // 64)
+
+    def _encode_parity(self, block: int) -> int:
+        """Parity group (layer | column << layers | overall) of one die's data block."""
+        layer_parity = 0
+        column = 0
         for layer in range(self.layers):
-            parity = sum(memory_3d[layer]) % 2
-            layer_parity.append(parity)
-        return layer_parity
-    
-    def _calculate_bit_parity(self, memory_3d: List[List[int]]) -> List[int]:
-        """Calculate parity for each bit position across layers."""
-        bit_parity = []
-        for bit in range(self.bits_per_layer):
-            parity = sum(memory_3d[layer][bit] for layer in range(self.layers)) % 2
-            bit_parity.append(parity)
-        return bit_parity
-    
-    def _calculate_overall_parity(self, memory_3d: List[List[int]]) -> int:
-        """Calculate overall parity for the entire 3D memory."""
-        total_ones = sum(sum(layer) for layer in memory_3d)
-        return total_ones % 2
-    
+            word = (block >> (layer * self.bits_per_layer)) & self._layer_mask
+            layer_parity |= (bin(word).count('1') & 1) << layer
+            column ^= word
+        overall = bin(layer_parity).count('1') & 1
+        return layer_parity | (column << self.layers) | (overall << (self.layers + self.bits_per_layer))
+
     def encode(self, data: int) -> int:
         """
         Encode data for 3D memory with multi-dimensional parity.
-        
+
         Args:
             data: Input data to encode
-            
+
         Returns:
             Encoded codeword with 3D parity
         """
-        # Ensure data fits within data_length
-        if data >= (1 << self.data_length):
-            data = data & ((1 << self.data_length) - 1)
-        
-        # Distribute data across 3D memory
-        memory_3d = self._distribute_data_3d(data)
-        
-        # Calculate multi-dimensional parity
-        layer_parity = self._calculate_layer_parity(memory_3d)
-        bit_parity = self._calculate_bit_parity(memory_3d)
-        overall_parity = self._calculate_overall_parity(memory_3d)
-        
-        # Pack into codeword
-        codeword = 0
-        bit_pos = 0
-        
-        # Pack data bits
-        for layer in range(self.layers):
-            for bit in range(self.bits_per_layer):
-                codeword |= (memory_3d[layer][bit] << bit_pos)
-                bit_pos += 1
-        
-        # Pack layer parity bits
-        for parity in layer_parity:
-            codeword |= (parity << bit_pos)
-            bit_pos += 1
-        
-        # Pack bit parity bits
-        for parity in bit_parity:
-            codeword |= (parity << bit_pos)
-            bit_pos += 1
-        
-        # Pack overall parity bit
-        codeword |= (overall_parity << bit_pos)
-        
+        data &= self._data_mask
+        codeword = data
+        for die in range(self.dies):
+            block = (data >> (die * self.total_bits)) & self._block_mask
+            codeword |= self._encode_parity(block) << (self._parity_start + die * self.parity_bits)
         return codeword
-    
+
     def decode(self, codeword: int) -> Tuple[int, str]:
         """
         Decode 3D memory codeword with error detection and correction.
-        
+
         Args:
             codeword: Codeword to decode
-            
+
         Returns:
             Tuple of (decoded_data, error_type)
         """
-        try:
-            # Extract data and parity bits
-            data_bits = []
-            for layer in range(self.layers):
-                for bit in range(self.bits_per_layer):
-                    data_bits.append((codeword >> (layer * self.bits_per_layer + bit)) & 1)
-            
-            # Extract parity bits
-            parity_start = self.total_bits
-            layer_parity = []
-            for i in range(self.layers):
-                layer_parity.append((codeword >> (parity_start + i)) & 1)
-            
-            bit_parity = []
-            for i in range(self.bits_per_layer):
-                bit_parity.append((codeword >> (parity_start + self.layers + i)) & 1)
-            
-            overall_parity = (codeword >> (parity_start + self.layers + self.bits_per_layer)) & 1
-            
-            # Reconstruct 3D memory
-            memory_3d = []
-            for layer in range(self.layers):
-                layer_bits = []
-                for bit in range(self.bits_per_layer):
-                    layer_bits.append(data_bits[layer * self.bits_per_layer + bit])
-                memory_3d.append(layer_bits)
-            
-            # Check for errors
-            expected_layer_parity = self._calculate_layer_parity(memory_3d)
-            expected_bit_parity = self._calculate_bit_parity(memory_3d)
-            expected_overall_parity = self._calculate_overall_parity(memory_3d)
-            
-            # Detect errors
-            layer_errors = [i for i in range(self.layers) if layer_parity[i] != expected_layer_parity[i]]
-            bit_errors = [i for i in range(self.bits_per_layer) if bit_parity[i] != expected_bit_parity[i]]
-            overall_error = overall_parity != expected_overall_parity
-            
-            # Error correction logic
-            if len(layer_errors) == 1 and len(bit_errors) == 1:
-                # Single bit error detected
-                layer_idx = layer_errors[0]
-                bit_idx = bit_errors[0]
-                memory_3d[layer_idx][bit_idx] ^= 1  # Flip the bit
-                print(f"🔧 3D Memory: Corrected bit at layer {layer_idx}, position {bit_idx}")
-            
-            # Extract corrected data
-            corrected_data = 0
-            bit_pos = 0
+        data = codeword & ((1 << self._parity_start) - 1)
+        parity_mask = (1 << (self.layers + self.bits_per_layer)) - 1
+        detected = False
+        for die in range(self.dies):
+            offset = die * self.total_bits
+            block = (data >> offset) & self._block_mask
+            received = codeword >> (self._parity_start + die * self.parity_bits)
+            # The overall parity never changes the decision, only layer and column syndromes do
+            syndrome = (self._encode_parity(block) ^ received) & parity_mask
+            layer_syndrome = syndrome & ((1 << self.layers) - 1)
+            bit_syndrome = syndrome >> self.layers
+            layer_single = (layer_syndrome & (layer_syndrome - 1)) == 0
+            bit_single = (bit_syndrome & (bit_syndrome - 1)) == 0
+            if layer_syndrome and bit_syndrome and layer_single and bit_single:
+                layer = layer_syndrome.bit_length() - 1
+                data ^= bit_syndrome << (offset + layer * self.bits_per_layer)
+            elif not (layer_single and bit_single):
+                detected = True
+        return data & self._data_mask, 'detected' if detected else 'corrected'
+
+    def _layer_words(self, words: np.ndarray) -> np.ndarray:
+        """(N,) data words -> (N, dies, layers, limbs) uint64 layer words."""
+        shape = (len(words), self.dies, self.layers, self._limbs)
+        out = np.empty(shape, dtype=np.uint64)
+        for die in range(self.dies):
             for layer in range(self.layers):
-                for bit in range(self.bits_per_layer):
-                    if bit_pos < self.data_length:
-                        corrected_data |= (memory_3d[layer][bit] << bit_pos)
-                        bit_pos += 1
-            
-            # Determine error type
-            if len(layer_errors) == 0 and len(bit_errors) == 0 and not overall_error:
-                return corrected_data, 'corrected'
-            elif len(layer_errors) <= 1 and len(bit_errors) <= 1:
-                return corrected_data, 'corrected'
+                base = (die * self.layers + layer) * self.bits_per_layer
+                for limb in range(self._limbs):
+                    width = min(64, self.bits_per_layer - 64 * limb)
+                    field = (words >> (base + 64 * limb)) & ((1 << width) - 1)
+                    out[:, die, layer, limb] = field.astype(np.uint64)
+        return out
+
+    def _limb_words(self, words: np.ndarray, start: int, width: int) -> np.ndarray:
+        """(N, ...) words -> (N, ..., ceil(width / 64)) uint64 limbs of bits [start, start + width)."""
+        limbs = [((words >> (start + lo)) & ((1 << min(64, width - lo)) - 1)).astype(np.uint64)
+                 for lo in range(0, width, 64)]
+        return np.stack(limbs, axis=-1)
+
+    def _pack(self, fields: List[Tuple[np.ndarray, int]], count: int) -> np.ndarray:
+        """OR together (uint64 field array, bit offset) pairs into codeword-width words."""
+        dtype = word_dtype(self.n)
+        out = np.zeros(count, dtype=dtype)
+        for field, offset in fields:
+            if dtype == object:
+                out |= field.astype(object) << offset
             else:
-                return corrected_data, 'detected'
-                
-        except Exception as e:
-            return codeword, 'detected'
-    
+                out |= field << np.uint64(offset)
+        return out
+
+    def _parity_batch(self, layers: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Layer parity bits (N, dies, layers), column limbs (N, dies, limbs), overall (N, dies)."""
+        layer_parity = word_parity(np.bitwise_xor.reduce(layers, axis=3), 64)
+        column = np.bitwise_xor.reduce(layers, axis=2)
+        overall = np.bitwise_xor.reduce(layer_parity, axis=2)
+        return layer_parity, column, overall
+
+    def _parity_fields(self, layer_parity: np.ndarray, column: np.ndarray,
+                       overall: np.ndarray) -> List[Tuple[np.ndarray, int]]:
+        fields = []
+        for die in range(self.dies):
+            base = self._parity_start + die * self.parity_bits
+            for layer in range(self.layers):
+                fields.append((layer_parity[:, die, layer], base + layer))
+            for limb in range(self._limbs):
+                fields.append((column[:, die, limb], base + self.layers + 64 * limb))
+            fields.append((overall[:, die], base + self.layers + self.bits_per_layer))
+        return fields
+
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        data = as_word_array(data, max(self.data_length, self._parity_start)) & self._data_mask
+        layers = self._layer_words(data)
+        fields = [(layers[:, d, l, j], (d * self.layers + l) * self.bits_per_layer + 64 * j)
+                  for d in range(self.dies) for l in range(self.layers) for j in range(self._limbs)]
+        fields += self._parity_fields(*self._parity_batch(layers))
+        return self._pack(fields, len(data))
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        codewords = as_word_array(codewords, self.n)
+        count = len(codewords)
+        layers = self._layer_words(codewords)
+        layer_parity, column, _ = self._parity_batch(layers)
+
+        groups = [codewords >> (self._parity_start + die * self.parity_bits) for die in range(self.dies)]
+        received_layer = np.stack([(g & ((1 << self.layers) - 1)).astype(np.uint64) for g in groups], axis=1)
+        received_column = np.stack([self._limb_words(g, self.layers, self.bits_per_layer) for g in groups],
+                                   axis=1)
+
+        layer_syndrome = received_layer ^ np.bitwise_or.reduce(
+            layer_parity << np.arange(self.layers, dtype=np.uint64), axis=2)       # (N, dies)
+        bit_syndrome = column ^ received_column                                    # (N, dies, limbs)
+        layer_single = (layer_syndrome & (layer_syndrome - np.uint64(1))) == 0
+        nonzero_limbs = (bit_syndrome != 0).sum(axis=2)
+        limb_single = ((bit_syndrome & (bit_syndrome - np.uint64(1))) == 0).all(axis=2)
+        bit_single = (nonzero_limbs <= 1) & limb_single
+        correct = (layer_syndrome != 0) & (nonzero_limbs == 1) & layer_single & bit_single
+        detected = ~(layer_single & bit_single)
+
+        # One-hot layer syndrome times one-hot column syndrome is the error bit
+        layer_hot = ((layer_syndrome[:, :, None] >> np.arange(self.layers, dtype=np.uint64)) & np.uint64(1))
+        flip = np.where(correct[:, :, None, None],
+                        layer_hot[..., None] * bit_syndrome[:, :, None, :], np.uint64(0))
+        layers ^= flip
+
+        fields = [(layers[:, d, l, j], (d * self.layers + l) * self.bits_per_layer + 64 * j)
+                  for d in range(self.dies) for l in range(self.layers) for j in range(self._limbs)]
+        data = self._pack(fields, count) & self._data_mask
+        codes = np.where(detected.any(axis=1), DETECTED, CORRECTED).astype(np.uint8)
+        return data, codes
+
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         """
         Inject error into 3D memory codeword.
-        
+
         Args:
             codeword: Original codeword
             bit_idx: Bit index to flip
-            
+
         Returns:
             Corrupted codeword
         """
         return codeword ^ (1 << bit_idx)
-    
+
     def get_3d_info(self) -> Dict[str, any]:
         """Get 3D memory configuration information."""
         return {
+            'dies': self.dies,
             'layers': self.layers,
             'bits_per_layer': self.bits_per_layer,
             'total_bits': self.total_bits,
             'parity_bits': self.parity_bits,
             'code_length': self.n,
             'data_length': self.data_length
-        }
\ No newline at end of file
+        }
@@ -1,20 +1,24 @@
 from typing import Tuple, List
-from base_ecc import ECCBase
+from base_ecc import ECCBase, CORRECTED, DETECTED, pack_bits, unpack_bits
+from turbo_codec import HARD_LLR, TURBO_MAX_ITER, TurboDecoder
+import numpy as np
 import random
 
 class SimpleTurboCode:
     """Simplified Turbo Code implementation for educational purposes.
     
-    This is a simplified version that demonstrates the basic concepts
-    of Turbo codes without the full complexity of real implementations.
+    Two systematic 1 + D + D^2 constituent encoders around a fixed
+    pseudorandom interleaver, decoded iteratively with max-log-MAP
+    component decoders (see turbo_codec).
     """
     
-    def __init__(self, data_length: int = 8) -> None:
+    def __init__(self, data_length: int = 8, max_iter: int = TURBO_MAX_ITER) -> None:
         """
         Initialize simplified Turbo code.
         
         Args:
             data_length: Length of data in bits
+            max_iter: Maximum turbo iterations per frame
         """
         self.data_length = data_length
         # Simple recursive systematic convolutional (RSC) encoders
@@ -27,6 +31,12 @@ class SimpleTurboCode:
         # Plus 4 tail bits for termination (2 encoders * 2 bits state) -> approx
         # For simple implementation without termination:
         self.n = 3 * self.k
+
+        # Deterministic interleaver (seed 42), built once without touching the global RNG
+        indices = list(range(self.data_length))
+        random.Random(42).shuffle(indices)
+        self.interleaver = indices
+        self.decoder = TurboDecoder(indices, max_iter=max_iter)
         
     def _create_rsc_encoder(self) -> List[int]:
         """Create a simple RSC encoder state."""
@@ -67,13 +77,8 @@ class SimpleTurboCode:
         Returns:
             Interleaved bits
         """
-        # Create a deterministic interleaver for reproducibility
-        random.seed(42)  # Fixed seed for deterministic behavior
-        indices = list(range(len(data_bits)))
-        random.shuffle(indices)
-        
         interleaved = [0] * len(data_bits)
-        for i, new_pos in enumerate(indices):
+        for i, new_pos in enumerate(self.interleaver):
             interleaved[new_pos] = data_bits[i]
             
         return interleaved
@@ -111,48 +116,37 @@ class SimpleTurboCode:
     
     def decode(self, codeword_bits: List[int]) -> Tuple[List[int], str]:
         """
-        Simplified Turbo decoding with error detection.
+        Iterative Turbo decoding of a hard-decision codeword.
         
         Args:
             codeword_bits: Received codeword bits
             
         Returns:
-            Tuple of (decoded_bits, error_type)
+            Tuple of (decoded_bits, error_type); 'detected' when the two
+            component decoders have not agreed after max_iter iterations
         """
         expected_len = 3 * self.data_length
         if len(codeword_bits) < expected_len:
             return [0] * self.data_length, 'detected'
         
-        # Extract systematic and parity bits
-        systematic_bits = codeword_bits[:self.data_length]
-        received_parity1 = codeword_bits[self.data_length:2*self.data_length]
-        received_parity2 = codeword_bits[2*self.data_length:3*self.data_length]
-        
-        # Re-encode to check for errors
-        calc_parity1 = self._rsc_encode(systematic_bits, [0, 0])
-        
-        interleaved_data = self._interleave(systematic_bits)
-        calc_parity2 = self._rsc_encode(interleaved_data, [0, 0])
-        
-        # If parity doesn't match, error is detected
-        if calc_parity1 != received_parity1 or calc_parity2 != received_parity2:
-            return systematic_bits, 'detected'
-        
-        return systematic_bits, 'corrected'
+        llr = HARD_LLR * (1.0 - 2.0 * np.array(codeword_bits[:expected_len], dtype=np.float64))
+        bits, converged, _ = self.decoder.decode_llr(llr)
+        return bits[0].tolist(), 'corrected' if converged[0] else 'detected'
 
 
 class TurboECC(ECCBase):
     """Turbo ECC implementation using simplified Turbo codes."""
     
-    def __init__(self, data_length: int = 8) -> None:
+    def __init__(self, data_length: int = 8, max_iter: int = TURBO_MAX_ITER) -> None:
         """
         Initialize Turbo ECC.
         
         Args:
             data_length: Length of data in bits (default 8)
+            max_iter: Maximum turbo iterations per frame
         """
         self.data_length = data_length
-        self.turbo = SimpleTurboCode(data_length)
+        self.turbo = SimpleTurboCode(data_length, max_iter=max_iter)
         self.n = self.turbo.n
         self.k = self.turbo.k
         
@@ -210,6 +204,30 @@ class TurboECC(ECCBase):
             # If decoding fails, error detected
             return codeword, 'detected'
 
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        return pack_bits(self.turbo.decoder.encode_bits(unpack_bits(data, self.data_length)))
+
+    def decode_llr(self, llr: np.ndarray, max_iter: int = None,
+                   early_stop: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Turbo-decode soft channel LLRs (positive = bit 0).
+
+        Args:
+            llr: (n,) or (B, n) LLRs in codeword bit order.
+            max_iter: Iteration cap (defaults to the constructor's max_iter).
+            early_stop: Retire each frame once its component decoders agree.
+
+        Returns:
+            Tuple of (decoded data words, error codes).
+        """
+        bits, converged, _ = self.turbo.decoder.decode_llr(llr, max_iter, early_stop)
+        codes = np.where(converged, CORRECTED, DETECTED).astype(np.uint8)
+        return pack_bits(bits), codes
+
+    def decode_batch(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        llr = np.where(unpack_bits(codewords, self.n) != 0, -HARD_LLR, HARD_LLR)
+        return self.decode_llr(llr)
+
     def inject_error(self, codeword: int, bit_idx: int) -> int:
         """
         Flip the bit at bit_idx in the codeword.
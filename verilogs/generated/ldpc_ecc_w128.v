@@ -1,4 +1,5 @@
 // Generated ldpc_ecc_w128 - Do not edit manually
+// LDPC matrices: n=256, k=128, seed=0
 module ldpc_ecc_w128 (
     input  wire clk,
     input  wire rst_n,
@@ -15,785 +16,1043 @@ module ldpc_ecc_w128 (
     reg [3:0] state;
     localparam IDLE = 0, CALC_SYNDROME = 1, FLIP_BITS = 2, CHECK_DONE = 3, FINISH = 4;
     reg [4:0] iter_count;
-    localparam MAX_ITER = 10;
+    localparam MAX_ITER = 20;
     
     reg [255:0] current_cw;
+    reg [127:0] received_data;
     wire [127:0] syndrome;
     wire has_error;
     wire [127:0] parity_out;
-    assign parity_out[0] = data_in[10] ^ data_in[44];
-    assign parity_out[1] = data_in[10] ^ data_in[44] ^ data_in[79] ^ data_in[96];
-    assign parity_out[2] = data_in[10] ^ data_in[44] ^ data_in[50] ^ data_in[79] ^ data_in[96] ^ data_in[112] ^ data_in[120];
-    assign parity_out[3] = data_in[10] ^ data_in[40] ^ data_in[44] ^ data_in[50] ^ data_in[51] ^ data_in[57] ^ data_in[79] ^ data_in[96] ^ data_in[112] ^ data_in[120];
-    assign parity_out[4] = data_in[10] ^ data_in[25] ^ data_in[36] ^ data_in[40] ^ data_in[44] ^ data_in[50] ^ data_in[51] ^ data_in[57] ^ data_in[79] ^ data_in[85] ^ data_in[96] ^ data_in[112] ^ data_in[120];
-    assign parity_out[5] = data_in[10] ^ data_in[21] ^ data_in[25] ^ data_in[36] ^ data_in[40] ^ data_in[44] ^ data_in[45] ^ data_in[50] ^ data_in[51] ^ data_in[57] ^ data_in[63] ^ data_in[79] ^ data_in[85] ^ data_in[93] ^ data_in[96] ^ data_in[112] ^ data_in[120];
-    assign parity_out[6] = data_in[10] ^ data_in[21] ^ data_in[25] ^ data_in[36] ^ data_in[40] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[51] ^ data_in[57] ^ data_in[63] ^ data_in[76] ^ data_in[79] ^ data_in[85] ^ data_in[93] ^ data_in[96] ^ data_in[112] ^ data_in[120];
-    assign parity_out[7] = data_in[8] ^ data_in[10] ^ data_in[18] ^ data_in[21] ^ data_in[24] ^ data_in[25] ^ data_in[36] ^ data_in[40] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[51] ^ data_in[54] ^ data_in[57] ^ data_in[63] ^ data_in[76] ^ data_in[79] ^ data_in[85] ^ data_in[93] ^ data_in[96] ^ data_in[112] ^ data_in[120] ^ data_in[123];
-    assign parity_out[8] = data_in[8] ^ data_in[10] ^ data_in[18] ^ data_in[21] ^ data_in[24] ^ data_in[25] ^ data_in[36] ^ data_in[40] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[51] ^ data_in[54] ^ data_in[63] ^ data_in[76] ^ data_in[79] ^ data_in[85] ^ data_in[90] ^ data_in[93] ^ data_in[96] ^ data_in[102] ^ data_in[112] ^ data_in[120] ^ data_in[123];
-    assign parity_out[9] = data_in[8] ^ data_in[10] ^ data_in[18] ^ data_in[21] ^ data_in[24] ^ data_in[25] ^ data_in[36] ^ data_in[40] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[51] ^ data_in[63] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[85] ^ data_in[90] ^ data_in[93] ^ data_in[94] ^ data_in[96] ^ data_in[102] ^ data_in[112] ^ data_in[120];
-    assign parity_out[10] = data_in[8] ^ data_in[10] ^ data_in[18] ^ data_in[21] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[51] ^ data_in[52] ^ data_in[63] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[85] ^ data_in[90] ^ data_in[93] ^ data_in[94] ^ data_in[96] ^ data_in[102] ^ data_in[112] ^ data_in[120];
-    assign parity_out[11] = data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[18] ^ data_in[21] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[51] ^ data_in[55] ^ data_in[63] ^ data_in[64] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[85] ^ data_in[90] ^ data_in[93] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[102] ^ data_in[112] ^ data_in[120];
-    assign parity_out[12] = data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[18] ^ data_in[21] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[51] ^ data_in[55] ^ data_in[63] ^ data_in[64] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[80] ^ data_in[85] ^ data_in[90] ^ data_in[93] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[102] ^ data_in[112] ^ data_in[120];
-    assign parity_out[13] = data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[18] ^ data_in[21] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[51] ^ data_in[55] ^ data_in[63] ^ data_in[64] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[80] ^ data_in[85] ^ data_in[90] ^ data_in[91] ^ data_in[93] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[102] ^ data_in[112] ^ data_in[120];
-    assign parity_out[14] = data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[18] ^ data_in[21] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[51] ^ data_in[55] ^ data_in[63] ^ data_in[64] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[80] ^ data_in[85] ^ data_in[90] ^ data_in[91] ^ data_in[93] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[102] ^ data_in[112] ^ data_in[120];
-    assign parity_out[15] = data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[18] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[51] ^ data_in[55] ^ data_in[59] ^ data_in[63] ^ data_in[64] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[80] ^ data_in[85] ^ data_in[90] ^ data_in[91] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[102] ^ data_in[112] ^ data_in[120] ^ data_in[122];
-    assign parity_out[16] = data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[18] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[51] ^ data_in[55] ^ data_in[59] ^ data_in[63] ^ data_in[64] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[80] ^ data_in[85] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[102] ^ data_in[111] ^ data_in[112] ^ data_in[117] ^ data_in[120] ^ data_in[122];
-    assign parity_out[17] = data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[18] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[51] ^ data_in[55] ^ data_in[59] ^ data_in[63] ^ data_in[64] ^ data_in[67] ^ data_in[69] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[85] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[102] ^ data_in[105] ^ data_in[111] ^ data_in[112] ^ data_in[113] ^ data_in[117] ^ data_in[120] ^ data_in[122];
-    assign parity_out[18] = data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[18] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[51] ^ data_in[55] ^ data_in[56] ^ data_in[59] ^ data_in[63] ^ data_in[64] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[85] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[111] ^ data_in[112] ^ data_in[113] ^ data_in[117] ^ data_in[120] ^ data_in[122];
-    assign parity_out[19] = data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[18] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[51] ^ data_in[55] ^ data_in[56] ^ data_in[59] ^ data_in[63] ^ data_in[64] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[85] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[113] ^ data_in[117] ^ data_in[120] ^ data_in[124];
-    assign parity_out[20] = data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[18] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[51] ^ data_in[55] ^ data_in[56] ^ data_in[59] ^ data_in[63] ^ data_in[64] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[85] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[113] ^ data_in[117] ^ data_in[120] ^ data_in[124];
-    assign parity_out[21] = data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[18] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[51] ^ data_in[55] ^ data_in[56] ^ data_in[59] ^ data_in[63] ^ data_in[64] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[85] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[117] ^ data_in[120] ^ data_in[124];
-    assign parity_out[22] = data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[51] ^ data_in[55] ^ data_in[56] ^ data_in[59] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[85] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[114] ^ data_in[117] ^ data_in[120] ^ data_in[124];
-    assign parity_out[23] = data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[51] ^ data_in[55] ^ data_in[56] ^ data_in[59] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[85] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[101] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[114] ^ data_in[117] ^ data_in[121] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[24] = data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[51] ^ data_in[55] ^ data_in[56] ^ data_in[59] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[85] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[101] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[114] ^ data_in[117] ^ data_in[119] ^ data_in[121] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[25] = data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[51] ^ data_in[55] ^ data_in[56] ^ data_in[59] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[85] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[101] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[114] ^ data_in[117] ^ data_in[119] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[26] = data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[36] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[51] ^ data_in[55] ^ data_in[56] ^ data_in[59] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[85] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[101] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[114] ^ data_in[117] ^ data_in[119] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[27] = data_in[0] ^ data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[36] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[51] ^ data_in[55] ^ data_in[56] ^ data_in[59] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[85] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[101] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[114] ^ data_in[117] ^ data_in[119] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[28] = data_in[0] ^ data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[36] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[51] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[85] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[101] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[114] ^ data_in[117] ^ data_in[119] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[29] = data_in[0] ^ data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[51] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[85] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[101] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[114] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[30] = data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[51] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[85] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[101] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[114] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[31] = data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[16] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[31] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[85] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[101] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[32] = data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[16] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[31] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[85] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[33] = data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[16] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[31] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[34] = data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[16] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[31] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[35] = data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[16] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[31] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[36] = data_in[1] ^ data_in[3] ^ data_in[4] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[16] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[31] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[112] ^ data_in[114] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[37] = data_in[1] ^ data_in[3] ^ data_in[4] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[16] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[31] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[55] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[94] ^ data_in[96] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[110] ^ data_in[112] ^ data_in[114] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[38] = data_in[1] ^ data_in[3] ^ data_in[4] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[16] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[31] ^ data_in[33] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[55] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[110] ^ data_in[112] ^ data_in[114] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[39] = data_in[1] ^ data_in[3] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[16] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[31] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[55] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[84] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[108] ^ data_in[110] ^ data_in[112] ^ data_in[114] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[40] = data_in[1] ^ data_in[3] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[16] ^ data_in[17] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[31] ^ data_in[35] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[55] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[84] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[108] ^ data_in[110] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[41] = data_in[1] ^ data_in[3] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[16] ^ data_in[17] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[31] ^ data_in[35] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[55] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[80] ^ data_in[81] ^ data_in[83] ^ data_in[84] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[108] ^ data_in[110] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[127];
-    assign parity_out[42] = data_in[1] ^ data_in[3] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[16] ^ data_in[17] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[31] ^ data_in[35] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[55] ^ data_in[58] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[108] ^ data_in[110] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[43] = data_in[1] ^ data_in[3] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[16] ^ data_in[17] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[31] ^ data_in[35] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[58] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[108] ^ data_in[110] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[44] = data_in[1] ^ data_in[3] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[16] ^ data_in[17] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[31] ^ data_in[35] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[58] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[80] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[108] ^ data_in[110] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[45] = data_in[1] ^ data_in[3] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[16] ^ data_in[17] ^ data_in[19] ^ data_in[20] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[31] ^ data_in[35] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[58] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[80] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[108] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[46] = data_in[1] ^ data_in[3] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[16] ^ data_in[17] ^ data_in[19] ^ data_in[20] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[31] ^ data_in[35] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[58] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[80] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[47] = data_in[1] ^ data_in[3] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[31] ^ data_in[35] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[48] ^ data_in[49] ^ data_in[53] ^ data_in[58] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[80] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[48] = data_in[1] ^ data_in[3] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[31] ^ data_in[35] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[48] ^ data_in[49] ^ data_in[53] ^ data_in[58] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[80] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[49] = data_in[1] ^ data_in[3] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[31] ^ data_in[35] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[48] ^ data_in[49] ^ data_in[53] ^ data_in[58] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[80] ^ data_in[82] ^ data_in[83] ^ data_in[88] ^ data_in[89] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[50] = data_in[1] ^ data_in[3] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[31] ^ data_in[35] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[48] ^ data_in[49] ^ data_in[53] ^ data_in[58] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[80] ^ data_in[82] ^ data_in[83] ^ data_in[88] ^ data_in[89] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[51] = data_in[1] ^ data_in[3] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[16] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[31] ^ data_in[35] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[48] ^ data_in[49] ^ data_in[53] ^ data_in[58] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[80] ^ data_in[82] ^ data_in[83] ^ data_in[88] ^ data_in[89] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[52] = data_in[1] ^ data_in[3] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[16] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[31] ^ data_in[35] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[48] ^ data_in[49] ^ data_in[53] ^ data_in[58] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[82] ^ data_in[83] ^ data_in[88] ^ data_in[89] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[53] = data_in[3] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[16] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[31] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[48] ^ data_in[49] ^ data_in[53] ^ data_in[58] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[82] ^ data_in[83] ^ data_in[88] ^ data_in[89] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[54] = data_in[3] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[16] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[31] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[48] ^ data_in[49] ^ data_in[53] ^ data_in[58] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[82] ^ data_in[83] ^ data_in[88] ^ data_in[89] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[55] = data_in[3] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[31] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[49] ^ data_in[53] ^ data_in[58] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[82] ^ data_in[83] ^ data_in[88] ^ data_in[89] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[56] = data_in[3] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[31] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[49] ^ data_in[53] ^ data_in[56] ^ data_in[58] ^ data_in[60] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[82] ^ data_in[83] ^ data_in[88] ^ data_in[89] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[57] = data_in[3] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[31] ^ data_in[37] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[49] ^ data_in[53] ^ data_in[56] ^ data_in[58] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[82] ^ data_in[83] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[58] = data_in[3] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[31] ^ data_in[37] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[49] ^ data_in[53] ^ data_in[55] ^ data_in[56] ^ data_in[58] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[82] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[59] = data_in[3] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[31] ^ data_in[37] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[49] ^ data_in[53] ^ data_in[55] ^ data_in[56] ^ data_in[58] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[82] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[109] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[60] = data_in[3] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[31] ^ data_in[37] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[55] ^ data_in[56] ^ data_in[58] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[82] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[109] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[61] = data_in[3] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[31] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[55] ^ data_in[56] ^ data_in[58] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[109] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[62] = data_in[3] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[31] ^ data_in[37] ^ data_in[38] ^ data_in[41] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[109] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[63] = data_in[3] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[31] ^ data_in[37] ^ data_in[38] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[77] ^ data_in[79] ^ data_in[81] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[64] = data_in[0] ^ data_in[3] ^ data_in[6] ^ data_in[8] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[31] ^ data_in[37] ^ data_in[38] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[77] ^ data_in[79] ^ data_in[81] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[65] = data_in[0] ^ data_in[3] ^ data_in[6] ^ data_in[8] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[31] ^ data_in[37] ^ data_in[38] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[77] ^ data_in[79] ^ data_in[81] ^ data_in[86] ^ data_in[89] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[114] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[66] = data_in[0] ^ data_in[3] ^ data_in[6] ^ data_in[8] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[31] ^ data_in[37] ^ data_in[38] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[77] ^ data_in[79] ^ data_in[81] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[114] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[67] = data_in[0] ^ data_in[3] ^ data_in[6] ^ data_in[8] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[31] ^ data_in[37] ^ data_in[38] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[77] ^ data_in[79] ^ data_in[81] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[114] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[127];
-    assign parity_out[68] = data_in[0] ^ data_in[3] ^ data_in[6] ^ data_in[8] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[31] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[77] ^ data_in[79] ^ data_in[81] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[114] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[69] = data_in[0] ^ data_in[3] ^ data_in[6] ^ data_in[8] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[31] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[79] ^ data_in[81] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[92] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[114] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[70] = data_in[0] ^ data_in[3] ^ data_in[6] ^ data_in[8] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[31] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[63] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[79] ^ data_in[81] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[92] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[114] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[71] = data_in[0] ^ data_in[3] ^ data_in[6] ^ data_in[8] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[31] ^ data_in[34] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[63] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[79] ^ data_in[81] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[92] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[114] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[72] = data_in[0] ^ data_in[3] ^ data_in[6] ^ data_in[8] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[31] ^ data_in[34] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[63] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[79] ^ data_in[81] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[92] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[114] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[73] = data_in[0] ^ data_in[3] ^ data_in[6] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[31] ^ data_in[34] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[63] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[79] ^ data_in[81] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[92] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[114] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[74] = data_in[0] ^ data_in[3] ^ data_in[6] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[31] ^ data_in[34] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[63] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[79] ^ data_in[81] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[92] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[114] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[75] = data_in[0] ^ data_in[3] ^ data_in[6] ^ data_in[7] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[31] ^ data_in[34] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[42] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[67] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[92] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[114] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[76] = data_in[0] ^ data_in[3] ^ data_in[6] ^ data_in[7] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[31] ^ data_in[34] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[67] ^ data_in[68] ^ data_in[72] ^ data_in[75] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[92] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[114] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[77] = data_in[0] ^ data_in[1] ^ data_in[6] ^ data_in[7] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[31] ^ data_in[34] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[68] ^ data_in[72] ^ data_in[75] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[92] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[78] = data_in[0] ^ data_in[1] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[31] ^ data_in[34] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[68] ^ data_in[72] ^ data_in[75] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[92] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[79] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[31] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[68] ^ data_in[72] ^ data_in[75] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[80] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[31] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[68] ^ data_in[72] ^ data_in[75] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[81] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[68] ^ data_in[72] ^ data_in[75] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[82] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[68] ^ data_in[72] ^ data_in[75] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[83] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[68] ^ data_in[72] ^ data_in[75] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[84] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[62] ^ data_in[63] ^ data_in[68] ^ data_in[72] ^ data_in[75] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[85] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[62] ^ data_in[63] ^ data_in[68] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[86] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[63] ^ data_in[68] ^ data_in[69] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
-    assign parity_out[87] = data_in[0] ^ data_in[1] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[63] ^ data_in[68] ^ data_in[69] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
-    assign parity_out[88] = data_in[0] ^ data_in[1] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[63] ^ data_in[68] ^ data_in[69] ^ data_in[71] ^ data_in[75] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
-    assign parity_out[89] = data_in[0] ^ data_in[1] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[63] ^ data_in[68] ^ data_in[69] ^ data_in[71] ^ data_in[75] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
-    assign parity_out[90] = data_in[0] ^ data_in[1] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[63] ^ data_in[68] ^ data_in[69] ^ data_in[71] ^ data_in[75] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
-    assign parity_out[91] = data_in[0] ^ data_in[1] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[63] ^ data_in[68] ^ data_in[69] ^ data_in[71] ^ data_in[75] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
-    assign parity_out[92] = data_in[0] ^ data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[68] ^ data_in[69] ^ data_in[71] ^ data_in[75] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
-    assign parity_out[93] = data_in[0] ^ data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[68] ^ data_in[69] ^ data_in[71] ^ data_in[75] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
-    assign parity_out[94] = data_in[0] ^ data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[68] ^ data_in[69] ^ data_in[71] ^ data_in[75] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
-    assign parity_out[95] = data_in[0] ^ data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[68] ^ data_in[69] ^ data_in[71] ^ data_in[75] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
-    assign parity_out[96] = data_in[0] ^ data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[13] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[43] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[75] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
-    assign parity_out[97] = data_in[0] ^ data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
-    assign parity_out[98] = data_in[0] ^ data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[92] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
-    assign parity_out[99] = data_in[0] ^ data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
-    assign parity_out[100] = data_in[0] ^ data_in[1] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[44] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
-    assign parity_out[101] = data_in[0] ^ data_in[1] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[38] ^ data_in[40] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
-    assign parity_out[102] = data_in[0] ^ data_in[1] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[40] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[103] = data_in[0] ^ data_in[1] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[40] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[104] = data_in[0] ^ data_in[1] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[40] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
-    assign parity_out[105] = data_in[0] ^ data_in[1] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[40] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[106] = data_in[0] ^ data_in[1] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[40] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[106] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[107] = data_in[0] ^ data_in[1] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[89] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[106] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[108] = data_in[0] ^ data_in[1] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[65] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[106] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[109] = data_in[0] ^ data_in[1] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[65] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[106] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[110] = data_in[0] ^ data_in[1] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[65] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[106] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[111] = data_in[0] ^ data_in[1] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[62] ^ data_in[65] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[106] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[112] = data_in[0] ^ data_in[1] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[18] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62] ^ data_in[65] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[106] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[113] = data_in[0] ^ data_in[1] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[18] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[106] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[114] = data_in[0] ^ data_in[1] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[18] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[106] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[115] = data_in[0] ^ data_in[1] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[106] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[116] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[106] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[117] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[118] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[119] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[120] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[121] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[122] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[123] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[124] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[125] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign parity_out[126] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[0] = data_in[50] ^ data_in[89] ^ data_in[95];
+    assign parity_out[1] = data_in[38] ^ data_in[50] ^ data_in[65] ^ data_in[74] ^ data_in[89] ^ data_in[95] ^ data_in[101] ^ data_in[119];
+    assign parity_out[2] = data_in[9] ^ data_in[20] ^ data_in[38] ^ data_in[50] ^ data_in[65] ^ data_in[74] ^ data_in[89] ^ data_in[95] ^ data_in[101] ^ data_in[111] ^ data_in[119];
+    assign parity_out[3] = data_in[9] ^ data_in[20] ^ data_in[27] ^ data_in[38] ^ data_in[50] ^ data_in[65] ^ data_in[74] ^ data_in[89] ^ data_in[95] ^ data_in[100] ^ data_in[101] ^ data_in[111] ^ data_in[119];
+    assign parity_out[4] = data_in[9] ^ data_in[20] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[38] ^ data_in[40] ^ data_in[47] ^ data_in[50] ^ data_in[65] ^ data_in[74] ^ data_in[88] ^ data_in[89] ^ data_in[95] ^ data_in[100] ^ data_in[101] ^ data_in[111] ^ data_in[119];
+    assign parity_out[5] = data_in[9] ^ data_in[19] ^ data_in[20] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[38] ^ data_in[40] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[65] ^ data_in[74] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[95] ^ data_in[100] ^ data_in[101] ^ data_in[111] ^ data_in[119];
+    assign parity_out[6] = data_in[2] ^ data_in[9] ^ data_in[10] ^ data_in[19] ^ data_in[20] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[38] ^ data_in[40] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[62] ^ data_in[71] ^ data_in[74] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[95] ^ data_in[100] ^ data_in[101] ^ data_in[111] ^ data_in[116] ^ data_in[119];
+    assign parity_out[7] = data_in[2] ^ data_in[9] ^ data_in[10] ^ data_in[19] ^ data_in[20] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[38] ^ data_in[40] ^ data_in[41] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[62] ^ data_in[64] ^ data_in[71] ^ data_in[74] ^ data_in[81] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[95] ^ data_in[100] ^ data_in[101] ^ data_in[103] ^ data_in[111] ^ data_in[116] ^ data_in[119];
+    assign parity_out[8] = data_in[2] ^ data_in[9] ^ data_in[10] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[38] ^ data_in[40] ^ data_in[41] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[57] ^ data_in[62] ^ data_in[64] ^ data_in[71] ^ data_in[74] ^ data_in[81] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[95] ^ data_in[100] ^ data_in[101] ^ data_in[111] ^ data_in[114] ^ data_in[116] ^ data_in[119];
+    assign parity_out[9] = data_in[2] ^ data_in[9] ^ data_in[10] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[38] ^ data_in[40] ^ data_in[41] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[57] ^ data_in[62] ^ data_in[64] ^ data_in[71] ^ data_in[74] ^ data_in[81] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[95] ^ data_in[100] ^ data_in[101] ^ data_in[111] ^ data_in[114] ^ data_in[116] ^ data_in[119];
+    assign parity_out[10] = data_in[2] ^ data_in[9] ^ data_in[10] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[38] ^ data_in[40] ^ data_in[41] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[57] ^ data_in[60] ^ data_in[62] ^ data_in[64] ^ data_in[71] ^ data_in[74] ^ data_in[77] ^ data_in[81] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[95] ^ data_in[100] ^ data_in[101] ^ data_in[111] ^ data_in[114] ^ data_in[116] ^ data_in[119];
+    assign parity_out[11] = data_in[2] ^ data_in[4] ^ data_in[9] ^ data_in[10] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[38] ^ data_in[40] ^ data_in[41] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[57] ^ data_in[60] ^ data_in[62] ^ data_in[64] ^ data_in[71] ^ data_in[74] ^ data_in[77] ^ data_in[81] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[95] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[111] ^ data_in[114] ^ data_in[116] ^ data_in[119];
+    assign parity_out[12] = data_in[2] ^ data_in[4] ^ data_in[9] ^ data_in[10] ^ data_in[16] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[38] ^ data_in[40] ^ data_in[41] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[57] ^ data_in[60] ^ data_in[62] ^ data_in[64] ^ data_in[66] ^ data_in[71] ^ data_in[74] ^ data_in[77] ^ data_in[81] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[111] ^ data_in[114] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[13] = data_in[2] ^ data_in[4] ^ data_in[9] ^ data_in[10] ^ data_in[16] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[38] ^ data_in[40] ^ data_in[41] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[57] ^ data_in[60] ^ data_in[62] ^ data_in[64] ^ data_in[66] ^ data_in[71] ^ data_in[74] ^ data_in[77] ^ data_in[81] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[14] = data_in[2] ^ data_in[4] ^ data_in[9] ^ data_in[10] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[40] ^ data_in[41] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[62] ^ data_in[64] ^ data_in[66] ^ data_in[71] ^ data_in[74] ^ data_in[77] ^ data_in[81] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[15] = data_in[2] ^ data_in[4] ^ data_in[9] ^ data_in[10] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[41] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[62] ^ data_in[64] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[74] ^ data_in[76] ^ data_in[77] ^ data_in[81] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[114] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[16] = data_in[2] ^ data_in[4] ^ data_in[9] ^ data_in[10] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[41] ^ data_in[44] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[62] ^ data_in[64] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[74] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[81] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[17] = data_in[2] ^ data_in[4] ^ data_in[9] ^ data_in[10] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[41] ^ data_in[44] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[62] ^ data_in[64] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[81] ^ data_in[83] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[18] = data_in[2] ^ data_in[4] ^ data_in[9] ^ data_in[10] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[41] ^ data_in[44] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[62] ^ data_in[64] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[81] ^ data_in[83] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[19] = data_in[2] ^ data_in[4] ^ data_in[9] ^ data_in[10] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[41] ^ data_in[44] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[62] ^ data_in[64] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[81] ^ data_in[83] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[20] = data_in[2] ^ data_in[4] ^ data_in[9] ^ data_in[10] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[41] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[62] ^ data_in[64] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[21] = data_in[2] ^ data_in[4] ^ data_in[9] ^ data_in[10] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[41] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[62] ^ data_in[64] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[22] = data_in[2] ^ data_in[4] ^ data_in[9] ^ data_in[10] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[41] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[62] ^ data_in[64] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[23] = data_in[2] ^ data_in[4] ^ data_in[9] ^ data_in[10] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[41] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[64] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[105] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[24] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[9] ^ data_in[10] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[41] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[64] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[86] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[105] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[25] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[9] ^ data_in[10] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[41] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[64] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[86] ^ data_in[88] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[105] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[26] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[9] ^ data_in[10] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[64] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[86] ^ data_in[88] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[105] ^ data_in[107] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[27] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[9] ^ data_in[10] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[64] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[105] ^ data_in[107] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[28] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[9] ^ data_in[10] ^ data_in[14] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[91] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[105] ^ data_in[107] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[29] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[9] ^ data_in[10] ^ data_in[14] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[91] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[30] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[9] ^ data_in[10] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[39] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[91] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[31] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[39] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[32] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[39] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[33] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[39] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[34] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[39] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[48] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[35] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[39] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[36] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[39] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[92] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[37] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[39] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[92] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[38] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[39] ^ data_in[42] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[92] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[39] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[39] ^ data_in[42] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[92] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[40] = data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[39] ^ data_in[42] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[92] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[109] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[41] = data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[39] ^ data_in[42] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[92] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[100] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[42] = data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[51] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[78] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[92] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[43] = data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[92] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[122];
+    assign parity_out[44] = data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[92] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[115] ^ data_in[116] ^ data_in[119] ^ data_in[120] ^ data_in[122];
+    assign parity_out[45] = data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[115] ^ data_in[119] ^ data_in[120] ^ data_in[122];
+    assign parity_out[46] = data_in[2] ^ data_in[4] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[115] ^ data_in[119] ^ data_in[120] ^ data_in[122];
+    assign parity_out[47] = data_in[2] ^ data_in[4] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[115] ^ data_in[119] ^ data_in[120] ^ data_in[122];
+    assign parity_out[48] = data_in[2] ^ data_in[4] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[51] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[119] ^ data_in[120] ^ data_in[122];
+    assign parity_out[49] = data_in[2] ^ data_in[4] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[98] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[119] ^ data_in[120] ^ data_in[122];
+    assign parity_out[50] = data_in[2] ^ data_in[4] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[13] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[119] ^ data_in[120] ^ data_in[122] ^ data_in[124];
+    assign parity_out[51] = data_in[2] ^ data_in[4] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[13] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[119] ^ data_in[120] ^ data_in[122] ^ data_in[124] ^ data_in[125];
+    assign parity_out[52] = data_in[4] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[13] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[119] ^ data_in[120] ^ data_in[122] ^ data_in[124] ^ data_in[125];
+    assign parity_out[53] = data_in[4] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[13] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[98] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[124] ^ data_in[125];
+    assign parity_out[54] = data_in[4] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[81] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[98] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[124] ^ data_in[125];
+    assign parity_out[55] = data_in[3] ^ data_in[4] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[98] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[108] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[124] ^ data_in[125];
+    assign parity_out[56] = data_in[3] ^ data_in[4] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[98] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[124] ^ data_in[125];
+    assign parity_out[57] = data_in[3] ^ data_in[4] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[124];
+    assign parity_out[58] = data_in[3] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[124];
+    assign parity_out[59] = data_in[3] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[66] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[124] ^ data_in[126];
+    assign parity_out[60] = data_in[3] ^ data_in[5] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[66] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[124] ^ data_in[126];
+    assign parity_out[61] = data_in[3] ^ data_in[5] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[65] ^ data_in[66] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[124] ^ data_in[126];
+    assign parity_out[62] = data_in[5] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[25] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[62] ^ data_in[65] ^ data_in[66] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[124] ^ data_in[126];
+    assign parity_out[63] = data_in[5] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[25] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[65] ^ data_in[66] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[124] ^ data_in[126];
+    assign parity_out[64] = data_in[5] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[25] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[65] ^ data_in[66] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[65] = data_in[5] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[25] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[65] ^ data_in[66] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[82] ^ data_in[86] ^ data_in[87] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[66] = data_in[5] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[33] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[82] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[67] = data_in[5] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[33] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[69] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[79] ^ data_in[82] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[68] = data_in[5] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[33] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[69] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[82] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[91] ^ data_in[94] ^ data_in[95] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[69] = data_in[5] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[33] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[82] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[94] ^ data_in[95] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[70] = data_in[5] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[33] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[82] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[90] ^ data_in[94] ^ data_in[95] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[71] = data_in[5] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[33] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[82] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[90] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[72] = data_in[5] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[90] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[73] = data_in[5] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[90] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[74] = data_in[1] ^ data_in[5] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[90] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[75] = data_in[1] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[30] ^ data_in[31] ^ data_in[33] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[76] = data_in[1] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[33] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[82] ^ data_in[84] ^ data_in[87] ^ data_in[88] ^ data_in[94] ^ data_in[95] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[77] = data_in[1] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[33] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[82] ^ data_in[84] ^ data_in[87] ^ data_in[88] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[78] = data_in[1] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[33] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[82] ^ data_in[84] ^ data_in[87] ^ data_in[88] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[79] = data_in[1] ^ data_in[2] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[33] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[80] ^ data_in[82] ^ data_in[84] ^ data_in[87] ^ data_in[88] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[119] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[80] = data_in[1] ^ data_in[2] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[33] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[82] ^ data_in[84] ^ data_in[87] ^ data_in[88] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[81] = data_in[1] ^ data_in[2] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[33] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[82] ^ data_in[84] ^ data_in[87] ^ data_in[88] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[118] ^ data_in[119] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[82] = data_in[1] ^ data_in[2] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[33] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[84] ^ data_in[87] ^ data_in[88] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[104] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[83] = data_in[1] ^ data_in[2] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[84] ^ data_in[87] ^ data_in[88] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[113] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[84] = data_in[1] ^ data_in[2] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[84] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126];
+    assign parity_out[85] = data_in[1] ^ data_in[2] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[84] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[122] ^ data_in[123] ^ data_in[124];
+    assign parity_out[86] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[84] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[122] ^ data_in[123] ^ data_in[124];
+    assign parity_out[87] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[84] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[122] ^ data_in[123] ^ data_in[124];
+    assign parity_out[88] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[84] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[122] ^ data_in[123] ^ data_in[124];
+    assign parity_out[89] = data_in[0] ^ data_in[2] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[14] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[84] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[122] ^ data_in[123] ^ data_in[124];
+    assign parity_out[90] = data_in[0] ^ data_in[2] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[12] ^ data_in[14] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[76] ^ data_in[84] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124];
+    assign parity_out[91] = data_in[0] ^ data_in[2] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[76] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124];
+    assign parity_out[92] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[76] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124];
+    assign parity_out[93] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[77] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[115] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124];
+    assign parity_out[94] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[77] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[127];
+    assign parity_out[95] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[35] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[77] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
+    assign parity_out[96] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[35] ^ data_in[36] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[77] ^ data_in[79] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
+    assign parity_out[97] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[77] ^ data_in[79] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
+    assign parity_out[98] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[77] ^ data_in[79] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[126] ^ data_in[127];
+    assign parity_out[99] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[77] ^ data_in[79] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[122] ^ data_in[124] ^ data_in[126] ^ data_in[127];
+    assign parity_out[100] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[77] ^ data_in[79] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[122] ^ data_in[124] ^ data_in[126] ^ data_in[127];
+    assign parity_out[101] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[20] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[29] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[77] ^ data_in[79] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[122] ^ data_in[124] ^ data_in[126] ^ data_in[127];
+    assign parity_out[102] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[20] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[77] ^ data_in[79] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[122] ^ data_in[124] ^ data_in[126] ^ data_in[127];
+    assign parity_out[103] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[20] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[77] ^ data_in[79] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[122] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[104] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[20] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[105] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[122] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[105] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[20] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[122] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[106] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[20] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[113] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[122] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[107] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[20] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[113] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[122] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[108] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[80] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[113] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[122] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[109] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[113] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[122] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[110] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[112] ^ data_in[113] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[122] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[111] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[99] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[112] ^ data_in[113] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[122] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[112] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[19] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[112] ^ data_in[113] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[122] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[113] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[19] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[112] ^ data_in[113] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[122] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[114] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[19] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[112] ^ data_in[113] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[115] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[112] ^ data_in[113] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[124] ^ data_in[125] ^ data_in[126];
+    assign parity_out[116] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[112] ^ data_in[113] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[124] ^ data_in[125] ^ data_in[126];
+    assign parity_out[117] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[112] ^ data_in[113] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[124] ^ data_in[125] ^ data_in[126];
+    assign parity_out[118] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[110] ^ data_in[112] ^ data_in[113] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[124] ^ data_in[125] ^ data_in[126];
+    assign parity_out[119] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[113] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[124] ^ data_in[125] ^ data_in[126];
+    assign parity_out[120] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[84] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[113] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126];
+    assign parity_out[121] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[113] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[122] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[113] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[123] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[113] ^ data_in[114] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[124] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[113] ^ data_in[114] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[125] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[68] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[113] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
+    assign parity_out[126] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[113] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
     assign parity_out[127] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63] ^ data_in[64] ^ data_in[65] ^ data_in[66] ^ data_in[67] ^ data_in[68] ^ data_in[69] ^ data_in[70] ^ data_in[71] ^ data_in[72] ^ data_in[73] ^ data_in[74] ^ data_in[75] ^ data_in[76] ^ data_in[77] ^ data_in[78] ^ data_in[79] ^ data_in[80] ^ data_in[81] ^ data_in[82] ^ data_in[83] ^ data_in[84] ^ data_in[85] ^ data_in[86] ^ data_in[87] ^ data_in[88] ^ data_in[89] ^ data_in[90] ^ data_in[91] ^ data_in[92] ^ data_in[93] ^ data_in[94] ^ data_in[95] ^ data_in[96] ^ data_in[97] ^ data_in[98] ^ data_in[99] ^ data_in[100] ^ data_in[101] ^ data_in[102] ^ data_in[103] ^ data_in[104] ^ data_in[105] ^ data_in[106] ^ data_in[107] ^ data_in[108] ^ data_in[109] ^ data_in[110] ^ data_in[111] ^ data_in[112] ^ data_in[113] ^ data_in[114] ^ data_in[115] ^ data_in[116] ^ data_in[117] ^ data_in[118] ^ data_in[119] ^ data_in[120] ^ data_in[121] ^ data_in[122] ^ data_in[123] ^ data_in[124] ^ data_in[125] ^ data_in[126] ^ data_in[127];
-    assign syndrome[0] = current_cw[10] ^ current_cw[44] ^ current_cw[128];
-    assign syndrome[1] = current_cw[10] ^ current_cw[44] ^ current_cw[79] ^ current_cw[96] ^ current_cw[129];
-    assign syndrome[2] = current_cw[10] ^ current_cw[44] ^ current_cw[50] ^ current_cw[79] ^ current_cw[96] ^ current_cw[112] ^ current_cw[120] ^ current_cw[130];
-    assign syndrome[3] = current_cw[10] ^ current_cw[40] ^ current_cw[44] ^ current_cw[50] ^ current_cw[51] ^ current_cw[57] ^ current_cw[79] ^ current_cw[96] ^ current_cw[112] ^ current_cw[120] ^ current_cw[131];
-    assign syndrome[4] = current_cw[10] ^ current_cw[25] ^ current_cw[36] ^ current_cw[40] ^ current_cw[44] ^ current_cw[50] ^ current_cw[51] ^ current_cw[57] ^ current_cw[79] ^ current_cw[85] ^ current_cw[96] ^ current_cw[112] ^ current_cw[120] ^ current_cw[132];
-    assign syndrome[5] = current_cw[10] ^ current_cw[21] ^ current_cw[25] ^ current_cw[36] ^ current_cw[40] ^ current_cw[44] ^ current_cw[45] ^ current_cw[50] ^ current_cw[51] ^ current_cw[57] ^ current_cw[63] ^ current_cw[79] ^ current_cw[85] ^ current_cw[93] ^ current_cw[96] ^ current_cw[112] ^ current_cw[120] ^ current_cw[133];
-    assign syndrome[6] = current_cw[10] ^ current_cw[21] ^ current_cw[25] ^ current_cw[36] ^ current_cw[40] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[51] ^ current_cw[57] ^ current_cw[63] ^ current_cw[76] ^ current_cw[79] ^ current_cw[85] ^ current_cw[93] ^ current_cw[96] ^ current_cw[112] ^ current_cw[120] ^ current_cw[134];
-    assign syndrome[7] = current_cw[8] ^ current_cw[10] ^ current_cw[18] ^ current_cw[21] ^ current_cw[24] ^ current_cw[25] ^ current_cw[36] ^ current_cw[40] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[51] ^ current_cw[54] ^ current_cw[57] ^ current_cw[63] ^ current_cw[76] ^ current_cw[79] ^ current_cw[85] ^ current_cw[93] ^ current_cw[96] ^ current_cw[112] ^ current_cw[120] ^ current_cw[123] ^ current_cw[135];
-    assign syndrome[8] = current_cw[8] ^ current_cw[10] ^ current_cw[18] ^ current_cw[21] ^ current_cw[24] ^ current_cw[25] ^ current_cw[36] ^ current_cw[40] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[51] ^ current_cw[54] ^ current_cw[63] ^ current_cw[76] ^ current_cw[79] ^ current_cw[85] ^ current_cw[90] ^ current_cw[93] ^ current_cw[96] ^ current_cw[102] ^ current_cw[112] ^ current_cw[120] ^ current_cw[123] ^ current_cw[136];
-    assign syndrome[9] = current_cw[8] ^ current_cw[10] ^ current_cw[18] ^ current_cw[21] ^ current_cw[24] ^ current_cw[25] ^ current_cw[36] ^ current_cw[40] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[51] ^ current_cw[63] ^ current_cw[75] ^ current_cw[76] ^ current_cw[79] ^ current_cw[85] ^ current_cw[90] ^ current_cw[93] ^ current_cw[94] ^ current_cw[96] ^ current_cw[102] ^ current_cw[112] ^ current_cw[120] ^ current_cw[137];
-    assign syndrome[10] = current_cw[8] ^ current_cw[10] ^ current_cw[18] ^ current_cw[21] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[51] ^ current_cw[52] ^ current_cw[63] ^ current_cw[75] ^ current_cw[76] ^ current_cw[79] ^ current_cw[85] ^ current_cw[90] ^ current_cw[93] ^ current_cw[94] ^ current_cw[96] ^ current_cw[102] ^ current_cw[112] ^ current_cw[120] ^ current_cw[138];
-    assign syndrome[11] = current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[18] ^ current_cw[21] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[51] ^ current_cw[55] ^ current_cw[63] ^ current_cw[64] ^ current_cw[75] ^ current_cw[76] ^ current_cw[79] ^ current_cw[85] ^ current_cw[90] ^ current_cw[93] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[102] ^ current_cw[112] ^ current_cw[120] ^ current_cw[139];
-    assign syndrome[12] = current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[18] ^ current_cw[21] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[51] ^ current_cw[55] ^ current_cw[63] ^ current_cw[64] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[79] ^ current_cw[80] ^ current_cw[85] ^ current_cw[90] ^ current_cw[93] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[102] ^ current_cw[112] ^ current_cw[120] ^ current_cw[140];
-    assign syndrome[13] = current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[18] ^ current_cw[21] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[51] ^ current_cw[55] ^ current_cw[63] ^ current_cw[64] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[79] ^ current_cw[80] ^ current_cw[85] ^ current_cw[90] ^ current_cw[91] ^ current_cw[93] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[102] ^ current_cw[112] ^ current_cw[120] ^ current_cw[141];
-    assign syndrome[14] = current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[18] ^ current_cw[21] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[51] ^ current_cw[55] ^ current_cw[63] ^ current_cw[64] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[79] ^ current_cw[80] ^ current_cw[85] ^ current_cw[90] ^ current_cw[91] ^ current_cw[93] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[102] ^ current_cw[112] ^ current_cw[120] ^ current_cw[142];
-    assign syndrome[15] = current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[18] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[51] ^ current_cw[55] ^ current_cw[59] ^ current_cw[63] ^ current_cw[64] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[79] ^ current_cw[80] ^ current_cw[85] ^ current_cw[90] ^ current_cw[91] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[102] ^ current_cw[112] ^ current_cw[120] ^ current_cw[122] ^ current_cw[143];
-    assign syndrome[16] = current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[18] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[51] ^ current_cw[55] ^ current_cw[59] ^ current_cw[63] ^ current_cw[64] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[79] ^ current_cw[80] ^ current_cw[85] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[102] ^ current_cw[111] ^ current_cw[112] ^ current_cw[117] ^ current_cw[120] ^ current_cw[122] ^ current_cw[144];
-    assign syndrome[17] = current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[18] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[51] ^ current_cw[55] ^ current_cw[59] ^ current_cw[63] ^ current_cw[64] ^ current_cw[67] ^ current_cw[69] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[85] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[102] ^ current_cw[105] ^ current_cw[111] ^ current_cw[112] ^ current_cw[113] ^ current_cw[117] ^ current_cw[120] ^ current_cw[122] ^ current_cw[145];
-    assign syndrome[18] = current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[18] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[51] ^ current_cw[55] ^ current_cw[56] ^ current_cw[59] ^ current_cw[63] ^ current_cw[64] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[85] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[111] ^ current_cw[112] ^ current_cw[113] ^ current_cw[117] ^ current_cw[120] ^ current_cw[122] ^ current_cw[146];
-    assign syndrome[19] = current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[18] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[51] ^ current_cw[55] ^ current_cw[56] ^ current_cw[59] ^ current_cw[63] ^ current_cw[64] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[85] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[113] ^ current_cw[117] ^ current_cw[120] ^ current_cw[124] ^ current_cw[147];
-    assign syndrome[20] = current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[18] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[51] ^ current_cw[55] ^ current_cw[56] ^ current_cw[59] ^ current_cw[63] ^ current_cw[64] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[85] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[113] ^ current_cw[117] ^ current_cw[120] ^ current_cw[124] ^ current_cw[148];
-    assign syndrome[21] = current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[18] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[51] ^ current_cw[55] ^ current_cw[56] ^ current_cw[59] ^ current_cw[63] ^ current_cw[64] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[85] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[117] ^ current_cw[120] ^ current_cw[124] ^ current_cw[149];
-    assign syndrome[22] = current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[51] ^ current_cw[55] ^ current_cw[56] ^ current_cw[59] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[85] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[114] ^ current_cw[117] ^ current_cw[120] ^ current_cw[124] ^ current_cw[150];
-    assign syndrome[23] = current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[51] ^ current_cw[55] ^ current_cw[56] ^ current_cw[59] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[85] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[101] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[114] ^ current_cw[117] ^ current_cw[121] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[151];
-    assign syndrome[24] = current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[51] ^ current_cw[55] ^ current_cw[56] ^ current_cw[59] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[85] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[101] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[114] ^ current_cw[117] ^ current_cw[119] ^ current_cw[121] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[152];
-    assign syndrome[25] = current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[51] ^ current_cw[55] ^ current_cw[56] ^ current_cw[59] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[85] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[101] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[114] ^ current_cw[117] ^ current_cw[119] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[153];
-    assign syndrome[26] = current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[36] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[51] ^ current_cw[55] ^ current_cw[56] ^ current_cw[59] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[85] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[101] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[114] ^ current_cw[117] ^ current_cw[119] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[154];
-    assign syndrome[27] = current_cw[0] ^ current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[36] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[51] ^ current_cw[55] ^ current_cw[56] ^ current_cw[59] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[85] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[101] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[114] ^ current_cw[117] ^ current_cw[119] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[155];
-    assign syndrome[28] = current_cw[0] ^ current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[36] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[51] ^ current_cw[55] ^ current_cw[56] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[85] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[101] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[114] ^ current_cw[117] ^ current_cw[119] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[156];
-    assign syndrome[29] = current_cw[0] ^ current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[51] ^ current_cw[55] ^ current_cw[56] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[85] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[101] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[114] ^ current_cw[117] ^ current_cw[118] ^ current_cw[119] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[157];
-    assign syndrome[30] = current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[51] ^ current_cw[55] ^ current_cw[56] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[85] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[101] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[114] ^ current_cw[117] ^ current_cw[118] ^ current_cw[119] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[158];
-    assign syndrome[31] = current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[16] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[31] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[55] ^ current_cw[56] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[85] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[101] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[117] ^ current_cw[118] ^ current_cw[119] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[159];
-    assign syndrome[32] = current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[16] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[31] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[55] ^ current_cw[56] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[85] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[117] ^ current_cw[118] ^ current_cw[119] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[160];
-    assign syndrome[33] = current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[16] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[31] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[55] ^ current_cw[56] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[84] ^ current_cw[85] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[117] ^ current_cw[118] ^ current_cw[119] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[161];
-    assign syndrome[34] = current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[16] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[31] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[55] ^ current_cw[56] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[84] ^ current_cw[85] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[117] ^ current_cw[118] ^ current_cw[119] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[162];
-    assign syndrome[35] = current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[16] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[31] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[55] ^ current_cw[56] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[84] ^ current_cw[85] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[163];
-    assign syndrome[36] = current_cw[1] ^ current_cw[3] ^ current_cw[4] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[16] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[31] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[55] ^ current_cw[56] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[84] ^ current_cw[85] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[112] ^ current_cw[114] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[164];
-    assign syndrome[37] = current_cw[1] ^ current_cw[3] ^ current_cw[4] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[16] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[31] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[55] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[84] ^ current_cw[85] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[94] ^ current_cw[96] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[110] ^ current_cw[112] ^ current_cw[114] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[165];
-    assign syndrome[38] = current_cw[1] ^ current_cw[3] ^ current_cw[4] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[16] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[31] ^ current_cw[33] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[55] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[84] ^ current_cw[85] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[110] ^ current_cw[112] ^ current_cw[114] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[166];
-    assign syndrome[39] = current_cw[1] ^ current_cw[3] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[16] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[31] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[55] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[84] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[108] ^ current_cw[110] ^ current_cw[112] ^ current_cw[114] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[167];
-    assign syndrome[40] = current_cw[1] ^ current_cw[3] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[16] ^ current_cw[17] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[31] ^ current_cw[35] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[55] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[70] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[84] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[108] ^ current_cw[110] ^ current_cw[112] ^ current_cw[114] ^ current_cw[115] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[168];
-    assign syndrome[41] = current_cw[1] ^ current_cw[3] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[16] ^ current_cw[17] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[31] ^ current_cw[35] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[55] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[80] ^ current_cw[81] ^ current_cw[83] ^ current_cw[84] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[108] ^ current_cw[110] ^ current_cw[112] ^ current_cw[114] ^ current_cw[115] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[127] ^ current_cw[169];
-    assign syndrome[42] = current_cw[1] ^ current_cw[3] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[16] ^ current_cw[17] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[31] ^ current_cw[35] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[55] ^ current_cw[58] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[108] ^ current_cw[110] ^ current_cw[112] ^ current_cw[114] ^ current_cw[115] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[170];
-    assign syndrome[43] = current_cw[1] ^ current_cw[3] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[16] ^ current_cw[17] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[31] ^ current_cw[35] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[58] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[108] ^ current_cw[110] ^ current_cw[112] ^ current_cw[114] ^ current_cw[115] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[171];
-    assign syndrome[44] = current_cw[1] ^ current_cw[3] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[16] ^ current_cw[17] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[31] ^ current_cw[35] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[58] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[80] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[108] ^ current_cw[110] ^ current_cw[112] ^ current_cw[114] ^ current_cw[115] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[172];
-    assign syndrome[45] = current_cw[1] ^ current_cw[3] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[16] ^ current_cw[17] ^ current_cw[19] ^ current_cw[20] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[31] ^ current_cw[35] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[58] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[80] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[108] ^ current_cw[112] ^ current_cw[114] ^ current_cw[115] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[173];
-    assign syndrome[46] = current_cw[1] ^ current_cw[3] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[11] ^ current_cw[16] ^ current_cw[17] ^ current_cw[19] ^ current_cw[20] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[31] ^ current_cw[35] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[58] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[80] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[112] ^ current_cw[114] ^ current_cw[115] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[174];
-    assign syndrome[47] = current_cw[1] ^ current_cw[3] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[11] ^ current_cw[14] ^ current_cw[16] ^ current_cw[17] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[31] ^ current_cw[35] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[48] ^ current_cw[49] ^ current_cw[53] ^ current_cw[58] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[80] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[112] ^ current_cw[114] ^ current_cw[115] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[175];
-    assign syndrome[48] = current_cw[1] ^ current_cw[3] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[11] ^ current_cw[14] ^ current_cw[16] ^ current_cw[17] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[31] ^ current_cw[35] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[48] ^ current_cw[49] ^ current_cw[53] ^ current_cw[58] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[80] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[112] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[176];
-    assign syndrome[49] = current_cw[1] ^ current_cw[3] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[11] ^ current_cw[14] ^ current_cw[16] ^ current_cw[17] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[31] ^ current_cw[35] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[48] ^ current_cw[49] ^ current_cw[53] ^ current_cw[58] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[79] ^ current_cw[80] ^ current_cw[82] ^ current_cw[83] ^ current_cw[88] ^ current_cw[89] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[112] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[177];
-    assign syndrome[50] = current_cw[1] ^ current_cw[3] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[16] ^ current_cw[17] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[31] ^ current_cw[35] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[48] ^ current_cw[49] ^ current_cw[53] ^ current_cw[58] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[79] ^ current_cw[80] ^ current_cw[82] ^ current_cw[83] ^ current_cw[88] ^ current_cw[89] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[112] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[178];
-    assign syndrome[51] = current_cw[1] ^ current_cw[3] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[16] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[31] ^ current_cw[35] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[48] ^ current_cw[49] ^ current_cw[53] ^ current_cw[58] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[79] ^ current_cw[80] ^ current_cw[82] ^ current_cw[83] ^ current_cw[88] ^ current_cw[89] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[112] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[179];
-    assign syndrome[52] = current_cw[1] ^ current_cw[3] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[16] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[31] ^ current_cw[35] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[48] ^ current_cw[49] ^ current_cw[53] ^ current_cw[58] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[79] ^ current_cw[82] ^ current_cw[83] ^ current_cw[88] ^ current_cw[89] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[112] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[180];
-    assign syndrome[53] = current_cw[3] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[16] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[31] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[48] ^ current_cw[49] ^ current_cw[53] ^ current_cw[58] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[79] ^ current_cw[82] ^ current_cw[83] ^ current_cw[88] ^ current_cw[89] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[112] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[181];
-    assign syndrome[54] = current_cw[3] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[16] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[31] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[48] ^ current_cw[49] ^ current_cw[53] ^ current_cw[58] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[79] ^ current_cw[82] ^ current_cw[83] ^ current_cw[88] ^ current_cw[89] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[182];
-    assign syndrome[55] = current_cw[3] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[31] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[49] ^ current_cw[53] ^ current_cw[58] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[79] ^ current_cw[82] ^ current_cw[83] ^ current_cw[88] ^ current_cw[89] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[183];
-    assign syndrome[56] = current_cw[3] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[31] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[49] ^ current_cw[53] ^ current_cw[56] ^ current_cw[58] ^ current_cw[60] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[79] ^ current_cw[82] ^ current_cw[83] ^ current_cw[88] ^ current_cw[89] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[184];
-    assign syndrome[57] = current_cw[3] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[31] ^ current_cw[37] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[49] ^ current_cw[53] ^ current_cw[56] ^ current_cw[58] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[79] ^ current_cw[82] ^ current_cw[83] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[185];
-    assign syndrome[58] = current_cw[3] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[31] ^ current_cw[37] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[49] ^ current_cw[53] ^ current_cw[55] ^ current_cw[56] ^ current_cw[58] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[66] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[78] ^ current_cw[79] ^ current_cw[82] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[186];
-    assign syndrome[59] = current_cw[3] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[31] ^ current_cw[37] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[49] ^ current_cw[53] ^ current_cw[55] ^ current_cw[56] ^ current_cw[58] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[66] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[78] ^ current_cw[79] ^ current_cw[82] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[109] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[187];
-    assign syndrome[60] = current_cw[3] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[31] ^ current_cw[37] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[55] ^ current_cw[56] ^ current_cw[58] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[66] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[78] ^ current_cw[79] ^ current_cw[82] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[109] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[188];
-    assign syndrome[61] = current_cw[3] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[31] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[55] ^ current_cw[56] ^ current_cw[58] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[66] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[109] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[189];
-    assign syndrome[62] = current_cw[3] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[31] ^ current_cw[37] ^ current_cw[38] ^ current_cw[41] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[66] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[77] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[108] ^ current_cw[109] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[190];
-    assign syndrome[63] = current_cw[3] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[31] ^ current_cw[37] ^ current_cw[38] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[66] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[77] ^ current_cw[79] ^ current_cw[81] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[109] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[191];
-    assign syndrome[64] = current_cw[0] ^ current_cw[3] ^ current_cw[6] ^ current_cw[8] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[31] ^ current_cw[37] ^ current_cw[38] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[66] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[77] ^ current_cw[79] ^ current_cw[81] ^ current_cw[86] ^ current_cw[88] ^ current_cw[89] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[109] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[192];
-    assign syndrome[65] = current_cw[0] ^ current_cw[3] ^ current_cw[6] ^ current_cw[8] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[31] ^ current_cw[37] ^ current_cw[38] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[66] ^ current_cw[67] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[77] ^ current_cw[79] ^ current_cw[81] ^ current_cw[86] ^ current_cw[89] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[109] ^ current_cw[114] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[193];
-    assign syndrome[66] = current_cw[0] ^ current_cw[3] ^ current_cw[6] ^ current_cw[8] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[31] ^ current_cw[37] ^ current_cw[38] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[66] ^ current_cw[67] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[77] ^ current_cw[79] ^ current_cw[81] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[114] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[194];
-    assign syndrome[67] = current_cw[0] ^ current_cw[3] ^ current_cw[6] ^ current_cw[8] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[29] ^ current_cw[31] ^ current_cw[37] ^ current_cw[38] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[66] ^ current_cw[67] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[77] ^ current_cw[79] ^ current_cw[81] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[114] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[127] ^ current_cw[195];
-    assign syndrome[68] = current_cw[0] ^ current_cw[3] ^ current_cw[6] ^ current_cw[8] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[29] ^ current_cw[31] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[66] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[77] ^ current_cw[79] ^ current_cw[81] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[114] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[196];
-    assign syndrome[69] = current_cw[0] ^ current_cw[3] ^ current_cw[6] ^ current_cw[8] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[29] ^ current_cw[31] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[66] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[79] ^ current_cw[81] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[92] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[114] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[197];
-    assign syndrome[70] = current_cw[0] ^ current_cw[3] ^ current_cw[6] ^ current_cw[8] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[29] ^ current_cw[31] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[63] ^ current_cw[65] ^ current_cw[66] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[79] ^ current_cw[81] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[92] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[114] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[198];
-    assign syndrome[71] = current_cw[0] ^ current_cw[3] ^ current_cw[6] ^ current_cw[8] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[29] ^ current_cw[31] ^ current_cw[34] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[63] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[79] ^ current_cw[81] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[92] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[114] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[199];
-    assign syndrome[72] = current_cw[0] ^ current_cw[3] ^ current_cw[6] ^ current_cw[8] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[29] ^ current_cw[31] ^ current_cw[34] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[63] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[79] ^ current_cw[81] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[92] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[114] ^ current_cw[115] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[200];
-    assign syndrome[73] = current_cw[0] ^ current_cw[3] ^ current_cw[6] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[29] ^ current_cw[31] ^ current_cw[34] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[63] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[79] ^ current_cw[81] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[92] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[114] ^ current_cw[115] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[201];
-    assign syndrome[74] = current_cw[0] ^ current_cw[3] ^ current_cw[6] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[29] ^ current_cw[31] ^ current_cw[34] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[63] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[79] ^ current_cw[81] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[92] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[114] ^ current_cw[115] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[202];
-    assign syndrome[75] = current_cw[0] ^ current_cw[3] ^ current_cw[6] ^ current_cw[7] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[29] ^ current_cw[31] ^ current_cw[34] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[42] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[67] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[92] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[114] ^ current_cw[115] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[203];
-    assign syndrome[76] = current_cw[0] ^ current_cw[3] ^ current_cw[6] ^ current_cw[7] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[29] ^ current_cw[31] ^ current_cw[34] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[67] ^ current_cw[68] ^ current_cw[72] ^ current_cw[75] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[92] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[114] ^ current_cw[115] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[204];
-    assign syndrome[77] = current_cw[0] ^ current_cw[1] ^ current_cw[6] ^ current_cw[7] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[29] ^ current_cw[31] ^ current_cw[34] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[68] ^ current_cw[72] ^ current_cw[75] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[92] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[205];
-    assign syndrome[78] = current_cw[0] ^ current_cw[1] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[29] ^ current_cw[31] ^ current_cw[34] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[60] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[68] ^ current_cw[72] ^ current_cw[75] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[92] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[206];
-    assign syndrome[79] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[29] ^ current_cw[31] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[60] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[68] ^ current_cw[72] ^ current_cw[75] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[207];
-    assign syndrome[80] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[29] ^ current_cw[31] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[60] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[68] ^ current_cw[72] ^ current_cw[75] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[97] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[105] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[208];
-    assign syndrome[81] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[29] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[60] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[68] ^ current_cw[72] ^ current_cw[75] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[97] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[209];
-    assign syndrome[82] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[60] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[68] ^ current_cw[72] ^ current_cw[75] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[210];
-    assign syndrome[83] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[60] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[68] ^ current_cw[72] ^ current_cw[75] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[211];
-    assign syndrome[84] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[60] ^ current_cw[62] ^ current_cw[63] ^ current_cw[68] ^ current_cw[72] ^ current_cw[75] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[212];
-    assign syndrome[85] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[60] ^ current_cw[62] ^ current_cw[63] ^ current_cw[68] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[213];
-    assign syndrome[86] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[63] ^ current_cw[68] ^ current_cw[69] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[214];
-    assign syndrome[87] = current_cw[0] ^ current_cw[1] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[63] ^ current_cw[68] ^ current_cw[69] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[215];
-    assign syndrome[88] = current_cw[0] ^ current_cw[1] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[63] ^ current_cw[68] ^ current_cw[69] ^ current_cw[71] ^ current_cw[75] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[216];
-    assign syndrome[89] = current_cw[0] ^ current_cw[1] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[63] ^ current_cw[68] ^ current_cw[69] ^ current_cw[71] ^ current_cw[75] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[217];
-    assign syndrome[90] = current_cw[0] ^ current_cw[1] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[32] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[63] ^ current_cw[68] ^ current_cw[69] ^ current_cw[71] ^ current_cw[75] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[218];
-    assign syndrome[91] = current_cw[0] ^ current_cw[1] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[32] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[63] ^ current_cw[68] ^ current_cw[69] ^ current_cw[71] ^ current_cw[75] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[219];
-    assign syndrome[92] = current_cw[0] ^ current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[32] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[68] ^ current_cw[69] ^ current_cw[71] ^ current_cw[75] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[101] ^ current_cw[102] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[220];
-    assign syndrome[93] = current_cw[0] ^ current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[28] ^ current_cw[29] ^ current_cw[32] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[68] ^ current_cw[69] ^ current_cw[71] ^ current_cw[75] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[101] ^ current_cw[102] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[221];
-    assign syndrome[94] = current_cw[0] ^ current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[28] ^ current_cw[29] ^ current_cw[32] ^ current_cw[34] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[68] ^ current_cw[69] ^ current_cw[71] ^ current_cw[75] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[101] ^ current_cw[102] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[222];
-    assign syndrome[95] = current_cw[0] ^ current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[32] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[68] ^ current_cw[69] ^ current_cw[71] ^ current_cw[75] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[101] ^ current_cw[102] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[223];
-    assign syndrome[96] = current_cw[0] ^ current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[13] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[43] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[75] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[101] ^ current_cw[102] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[224];
-    assign syndrome[97] = current_cw[0] ^ current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[95] ^ current_cw[96] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[225];
-    assign syndrome[98] = current_cw[0] ^ current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[92] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[226];
-    assign syndrome[99] = current_cw[0] ^ current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[11] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[227];
-    assign syndrome[100] = current_cw[0] ^ current_cw[1] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[11] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[44] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[228];
-    assign syndrome[101] = current_cw[0] ^ current_cw[1] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[38] ^ current_cw[40] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[229];
-    assign syndrome[102] = current_cw[0] ^ current_cw[1] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[40] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[230];
-    assign syndrome[103] = current_cw[0] ^ current_cw[1] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[40] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[51] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[231];
-    assign syndrome[104] = current_cw[0] ^ current_cw[1] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[40] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[126] ^ current_cw[127] ^ current_cw[232];
-    assign syndrome[105] = current_cw[0] ^ current_cw[1] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[40] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[233];
-    assign syndrome[106] = current_cw[0] ^ current_cw[1] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[40] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[106] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[234];
-    assign syndrome[107] = current_cw[0] ^ current_cw[1] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[89] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[106] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[235];
-    assign syndrome[108] = current_cw[0] ^ current_cw[1] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[65] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[106] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[236];
-    assign syndrome[109] = current_cw[0] ^ current_cw[1] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[31] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[65] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[106] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[237];
-    assign syndrome[110] = current_cw[0] ^ current_cw[1] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[31] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[65] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[104] ^ current_cw[106] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[238];
-    assign syndrome[111] = current_cw[0] ^ current_cw[1] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[31] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[60] ^ current_cw[62] ^ current_cw[65] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[81] ^ current_cw[82] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[106] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[239];
-    assign syndrome[112] = current_cw[0] ^ current_cw[1] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[16] ^ current_cw[18] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[31] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[62] ^ current_cw[65] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[106] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[240];
-    assign syndrome[113] = current_cw[0] ^ current_cw[1] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[16] ^ current_cw[18] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[31] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[62] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[106] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[241];
-    assign syndrome[114] = current_cw[0] ^ current_cw[1] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[16] ^ current_cw[18] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[31] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[62] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[83] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[106] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[242];
-    assign syndrome[115] = current_cw[0] ^ current_cw[1] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[16] ^ current_cw[18] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[31] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[62] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[83] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[106] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[243];
-    assign syndrome[116] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[16] ^ current_cw[18] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[31] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[62] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[83] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[106] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[244];
-    assign syndrome[117] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[16] ^ current_cw[18] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[31] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[62] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[75] ^ current_cw[76] ^ current_cw[78] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[245];
-    assign syndrome[118] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[31] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[62] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[78] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[246];
-    assign syndrome[119] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[31] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[62] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[78] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[247];
-    assign syndrome[120] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[31] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[62] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[78] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[248];
-    assign syndrome[121] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[31] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[62] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[78] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[249];
-    assign syndrome[122] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[31] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[62] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[78] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[107] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[250];
-    assign syndrome[123] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[31] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[62] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[78] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[107] ^ current_cw[108] ^ current_cw[109] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[251];
-    assign syndrome[124] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[31] ^ current_cw[32] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[62] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[78] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[107] ^ current_cw[108] ^ current_cw[109] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[252];
-    assign syndrome[125] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[62] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[66] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[78] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[107] ^ current_cw[108] ^ current_cw[109] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[253];
-    assign syndrome[126] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[66] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[78] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[107] ^ current_cw[108] ^ current_cw[109] ^ current_cw[111] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[254];
-    assign syndrome[127] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[64] ^ current_cw[65] ^ current_cw[66] ^ current_cw[67] ^ current_cw[68] ^ current_cw[69] ^ current_cw[70] ^ current_cw[71] ^ current_cw[72] ^ current_cw[73] ^ current_cw[74] ^ current_cw[75] ^ current_cw[76] ^ current_cw[77] ^ current_cw[78] ^ current_cw[79] ^ current_cw[80] ^ current_cw[81] ^ current_cw[82] ^ current_cw[83] ^ current_cw[84] ^ current_cw[85] ^ current_cw[86] ^ current_cw[87] ^ current_cw[88] ^ current_cw[89] ^ current_cw[90] ^ current_cw[91] ^ current_cw[92] ^ current_cw[93] ^ current_cw[94] ^ current_cw[95] ^ current_cw[96] ^ current_cw[97] ^ current_cw[98] ^ current_cw[99] ^ current_cw[100] ^ current_cw[101] ^ current_cw[102] ^ current_cw[103] ^ current_cw[104] ^ current_cw[105] ^ current_cw[106] ^ current_cw[107] ^ current_cw[108] ^ current_cw[109] ^ current_cw[110] ^ current_cw[111] ^ current_cw[112] ^ current_cw[113] ^ current_cw[114] ^ current_cw[115] ^ current_cw[116] ^ current_cw[117] ^ current_cw[118] ^ current_cw[119] ^ current_cw[120] ^ current_cw[121] ^ current_cw[122] ^ current_cw[123] ^ current_cw[124] ^ current_cw[125] ^ current_cw[126] ^ current_cw[127] ^ current_cw[255];
+    assign syndrome[0] = current_cw[50] ^ current_cw[89] ^ current_cw[95] ^ current_cw[128];
+    assign syndrome[1] = current_cw[38] ^ current_cw[65] ^ current_cw[74] ^ current_cw[101] ^ current_cw[119] ^ current_cw[128] ^ current_cw[129];
+    assign syndrome[2] = current_cw[9] ^ current_cw[20] ^ current_cw[111] ^ current_cw[129] ^ current_cw[130];
+    assign syndrome[3] = current_cw[27] ^ current_cw[100] ^ current_cw[130] ^ current_cw[131];
+    assign syndrome[4] = current_cw[29] ^ current_cw[34] ^ current_cw[40] ^ current_cw[47] ^ current_cw[88] ^ current_cw[131] ^ current_cw[132];
+    assign syndrome[5] = current_cw[19] ^ current_cw[49] ^ current_cw[91] ^ current_cw[132] ^ current_cw[133];
+    assign syndrome[6] = current_cw[2] ^ current_cw[10] ^ current_cw[62] ^ current_cw[65] ^ current_cw[71] ^ current_cw[116] ^ current_cw[133] ^ current_cw[134];
+    assign syndrome[7] = current_cw[41] ^ current_cw[64] ^ current_cw[81] ^ current_cw[103] ^ current_cw[134] ^ current_cw[135];
+    assign syndrome[8] = current_cw[22] ^ current_cw[57] ^ current_cw[103] ^ current_cw[114] ^ current_cw[135] ^ current_cw[136];
+    assign syndrome[9] = current_cw[23] ^ current_cw[87] ^ current_cw[136] ^ current_cw[137];
+    assign syndrome[10] = current_cw[60] ^ current_cw[77] ^ current_cw[137] ^ current_cw[138];
+    assign syndrome[11] = current_cw[4] ^ current_cw[51] ^ current_cw[99] ^ current_cw[138] ^ current_cw[139];
+    assign syndrome[12] = current_cw[16] ^ current_cw[66] ^ current_cw[94] ^ current_cw[122] ^ current_cw[139] ^ current_cw[140];
+    assign syndrome[13] = current_cw[86] ^ current_cw[110] ^ current_cw[140] ^ current_cw[141];
+    assign syndrome[14] = current_cw[16] ^ current_cw[38] ^ current_cw[56] ^ current_cw[109] ^ current_cw[141] ^ current_cw[142];
+    assign syndrome[15] = current_cw[40] ^ current_cw[68] ^ current_cw[70] ^ current_cw[76] ^ current_cw[112] ^ current_cw[142] ^ current_cw[143];
+    assign syndrome[16] = current_cw[44] ^ current_cw[78] ^ current_cw[115] ^ current_cw[143] ^ current_cw[144];
+    assign syndrome[17] = current_cw[73] ^ current_cw[83] ^ current_cw[87] ^ current_cw[98] ^ current_cw[144] ^ current_cw[145];
+    assign syndrome[18] = current_cw[47] ^ current_cw[145] ^ current_cw[146];
+    assign syndrome[19] = current_cw[35] ^ current_cw[96] ^ current_cw[146] ^ current_cw[147];
+    assign syndrome[20] = current_cw[18] ^ current_cw[43] ^ current_cw[46] ^ current_cw[82] ^ current_cw[102] ^ current_cw[147] ^ current_cw[148];
+    assign syndrome[21] = current_cw[148] ^ current_cw[149];
+    assign syndrome[22] = current_cw[45] ^ current_cw[101] ^ current_cw[149] ^ current_cw[150];
+    assign syndrome[23] = current_cw[48] ^ current_cw[61] ^ current_cw[105] ^ current_cw[150] ^ current_cw[151];
+    assign syndrome[24] = current_cw[0] ^ current_cw[28] ^ current_cw[112] ^ current_cw[151] ^ current_cw[152];
+    assign syndrome[25] = current_cw[6] ^ current_cw[43] ^ current_cw[89] ^ current_cw[152] ^ current_cw[153];
+    assign syndrome[26] = current_cw[41] ^ current_cw[42] ^ current_cw[55] ^ current_cw[107] ^ current_cw[153] ^ current_cw[154];
+    assign syndrome[27] = current_cw[87] ^ current_cw[154] ^ current_cw[155];
+    assign syndrome[28] = current_cw[14] ^ current_cw[64] ^ current_cw[79] ^ current_cw[93] ^ current_cw[155] ^ current_cw[156];
+    assign syndrome[29] = current_cw[55] ^ current_cw[104] ^ current_cw[156] ^ current_cw[157];
+    assign syndrome[30] = current_cw[17] ^ current_cw[24] ^ current_cw[39] ^ current_cw[75] ^ current_cw[157] ^ current_cw[158];
+    assign syndrome[31] = current_cw[7] ^ current_cw[10] ^ current_cw[63] ^ current_cw[88] ^ current_cw[158] ^ current_cw[159];
+    assign syndrome[32] = current_cw[83] ^ current_cw[159] ^ current_cw[160];
+    assign syndrome[33] = current_cw[92] ^ current_cw[160] ^ current_cw[161];
+    assign syndrome[34] = current_cw[25] ^ current_cw[49] ^ current_cw[161] ^ current_cw[162];
+    assign syndrome[35] = current_cw[47] ^ current_cw[60] ^ current_cw[162] ^ current_cw[163];
+    assign syndrome[36] = current_cw[8] ^ current_cw[69] ^ current_cw[77] ^ current_cw[93] ^ current_cw[163] ^ current_cw[164];
+    assign syndrome[37] = current_cw[84] ^ current_cw[164] ^ current_cw[165];
+    assign syndrome[38] = current_cw[84] ^ current_cw[99] ^ current_cw[165] ^ current_cw[166];
+    assign syndrome[39] = current_cw[11] ^ current_cw[12] ^ current_cw[44] ^ current_cw[166] ^ current_cw[167];
+    assign syndrome[40] = current_cw[0] ^ current_cw[110] ^ current_cw[167] ^ current_cw[168];
+    assign syndrome[41] = current_cw[11] ^ current_cw[60] ^ current_cw[108] ^ current_cw[168] ^ current_cw[169];
+    assign syndrome[42] = current_cw[37] ^ current_cw[42] ^ current_cw[100] ^ current_cw[114] ^ current_cw[169] ^ current_cw[170];
+    assign syndrome[43] = current_cw[53] ^ current_cw[78] ^ current_cw[170] ^ current_cw[171];
+    assign syndrome[44] = current_cw[7] ^ current_cw[107] ^ current_cw[120] ^ current_cw[171] ^ current_cw[172];
+    assign syndrome[45] = current_cw[32] ^ current_cw[58] ^ current_cw[72] ^ current_cw[92] ^ current_cw[116] ^ current_cw[172] ^ current_cw[173];
+    assign syndrome[46] = current_cw[6] ^ current_cw[173] ^ current_cw[174];
+    assign syndrome[47] = current_cw[26] ^ current_cw[56] ^ current_cw[58] ^ current_cw[174] ^ current_cw[175];
+    assign syndrome[48] = current_cw[53] ^ current_cw[113] ^ current_cw[175] ^ current_cw[176];
+    assign syndrome[49] = current_cw[49] ^ current_cw[176] ^ current_cw[177];
+    assign syndrome[50] = current_cw[13] ^ current_cw[14] ^ current_cw[54] ^ current_cw[96] ^ current_cw[101] ^ current_cw[124] ^ current_cw[177] ^ current_cw[178];
+    assign syndrome[51] = current_cw[27] ^ current_cw[55] ^ current_cw[125] ^ current_cw[178] ^ current_cw[179];
+    assign syndrome[52] = current_cw[2] ^ current_cw[179] ^ current_cw[180];
+    assign syndrome[53] = current_cw[72] ^ current_cw[118] ^ current_cw[122] ^ current_cw[180] ^ current_cw[181];
+    assign syndrome[54] = current_cw[13] ^ current_cw[99] ^ current_cw[181] ^ current_cw[182];
+    assign syndrome[55] = current_cw[3] ^ current_cw[16] ^ current_cw[81] ^ current_cw[182] ^ current_cw[183];
+    assign syndrome[56] = current_cw[33] ^ current_cw[39] ^ current_cw[108] ^ current_cw[183] ^ current_cw[184];
+    assign syndrome[57] = current_cw[98] ^ current_cw[125] ^ current_cw[184] ^ current_cw[185];
+    assign syndrome[58] = current_cw[4] ^ current_cw[30] ^ current_cw[185] ^ current_cw[186];
+    assign syndrome[59] = current_cw[68] ^ current_cw[126] ^ current_cw[186] ^ current_cw[187];
+    assign syndrome[60] = current_cw[5] ^ current_cw[23] ^ current_cw[42] ^ current_cw[45] ^ current_cw[63] ^ current_cw[187] ^ current_cw[188];
+    assign syndrome[61] = current_cw[37] ^ current_cw[65] ^ current_cw[188] ^ current_cw[189];
+    assign syndrome[62] = current_cw[3] ^ current_cw[26] ^ current_cw[40] ^ current_cw[54] ^ current_cw[61] ^ current_cw[73] ^ current_cw[189] ^ current_cw[190];
+    assign syndrome[63] = current_cw[48] ^ current_cw[61] ^ current_cw[117] ^ current_cw[190] ^ current_cw[191];
+    assign syndrome[64] = current_cw[19] ^ current_cw[123] ^ current_cw[191] ^ current_cw[192];
+    assign syndrome[65] = current_cw[120] ^ current_cw[192] ^ current_cw[193];
+    assign syndrome[66] = current_cw[25] ^ current_cw[34] ^ current_cw[63] ^ current_cw[67] ^ current_cw[71] ^ current_cw[85] ^ current_cw[88] ^ current_cw[97] ^ current_cw[193] ^ current_cw[194];
+    assign syndrome[67] = current_cw[70] ^ current_cw[84] ^ current_cw[194] ^ current_cw[195];
+    assign syndrome[68] = current_cw[27] ^ current_cw[62] ^ current_cw[64] ^ current_cw[79] ^ current_cw[195] ^ current_cw[196];
+    assign syndrome[69] = current_cw[26] ^ current_cw[66] ^ current_cw[91] ^ current_cw[110] ^ current_cw[117] ^ current_cw[196] ^ current_cw[197];
+    assign syndrome[70] = current_cw[52] ^ current_cw[90] ^ current_cw[197] ^ current_cw[198];
+    assign syndrome[71] = current_cw[54] ^ current_cw[70] ^ current_cw[97] ^ current_cw[122] ^ current_cw[198] ^ current_cw[199];
+    assign syndrome[72] = current_cw[31] ^ current_cw[85] ^ current_cw[199] ^ current_cw[200];
+    assign syndrome[73] = current_cw[15] ^ current_cw[28] ^ current_cw[107] ^ current_cw[200] ^ current_cw[201];
+    assign syndrome[74] = current_cw[1] ^ current_cw[108] ^ current_cw[201] ^ current_cw[202];
+    assign syndrome[75] = current_cw[7] ^ current_cw[29] ^ current_cw[32] ^ current_cw[48] ^ current_cw[90] ^ current_cw[202] ^ current_cw[203];
+    assign syndrome[76] = current_cw[29] ^ current_cw[43] ^ current_cw[50] ^ current_cw[86] ^ current_cw[203] ^ current_cw[204];
+    assign syndrome[77] = current_cw[59] ^ current_cw[96] ^ current_cw[109] ^ current_cw[204] ^ current_cw[205];
+    assign syndrome[78] = current_cw[80] ^ current_cw[205] ^ current_cw[206];
+    assign syndrome[79] = current_cw[2] ^ current_cw[97] ^ current_cw[118] ^ current_cw[206] ^ current_cw[207];
+    assign syndrome[80] = current_cw[35] ^ current_cw[53] ^ current_cw[71] ^ current_cw[80] ^ current_cw[118] ^ current_cw[207] ^ current_cw[208];
+    assign syndrome[81] = current_cw[12] ^ current_cw[17] ^ current_cw[208] ^ current_cw[209];
+    assign syndrome[82] = current_cw[35] ^ current_cw[52] ^ current_cw[82] ^ current_cw[95] ^ current_cw[117] ^ current_cw[209] ^ current_cw[210];
+    assign syndrome[83] = current_cw[33] ^ current_cw[73] ^ current_cw[104] ^ current_cw[210] ^ current_cw[211];
+    assign syndrome[84] = current_cw[57] ^ current_cw[89] ^ current_cw[103] ^ current_cw[113] ^ current_cw[211] ^ current_cw[212];
+    assign syndrome[85] = current_cw[106] ^ current_cw[126] ^ current_cw[212] ^ current_cw[213];
+    assign syndrome[86] = current_cw[0] ^ current_cw[14] ^ current_cw[119] ^ current_cw[213] ^ current_cw[214];
+    assign syndrome[87] = current_cw[12] ^ current_cw[30] ^ current_cw[31] ^ current_cw[112] ^ current_cw[214] ^ current_cw[215];
+    assign syndrome[88] = current_cw[25] ^ current_cw[215] ^ current_cw[216];
+    assign syndrome[89] = current_cw[1] ^ current_cw[15] ^ current_cw[102] ^ current_cw[216] ^ current_cw[217];
+    assign syndrome[90] = current_cw[56] ^ current_cw[72] ^ current_cw[74] ^ current_cw[75] ^ current_cw[120] ^ current_cw[121] ^ current_cw[217] ^ current_cw[218];
+    assign syndrome[91] = current_cw[6] ^ current_cw[9] ^ current_cw[11] ^ current_cw[86] ^ current_cw[218] ^ current_cw[219];
+    assign syndrome[92] = current_cw[4] ^ current_cw[21] ^ current_cw[219] ^ current_cw[220];
+    assign syndrome[93] = current_cw[15] ^ current_cw[22] ^ current_cw[46] ^ current_cw[76] ^ current_cw[77] ^ current_cw[220] ^ current_cw[221];
+    assign syndrome[94] = current_cw[46] ^ current_cw[59] ^ current_cw[116] ^ current_cw[127] ^ current_cw[221] ^ current_cw[222];
+    assign syndrome[95] = current_cw[44] ^ current_cw[105] ^ current_cw[126] ^ current_cw[222] ^ current_cw[223];
+    assign syndrome[96] = current_cw[36] ^ current_cw[50] ^ current_cw[79] ^ current_cw[223] ^ current_cw[224];
+    assign syndrome[97] = current_cw[37] ^ current_cw[224] ^ current_cw[225];
+    assign syndrome[98] = current_cw[21] ^ current_cw[66] ^ current_cw[225] ^ current_cw[226];
+    assign syndrome[99] = current_cw[121] ^ current_cw[123] ^ current_cw[226] ^ current_cw[227];
+    assign syndrome[100] = current_cw[106] ^ current_cw[227] ^ current_cw[228];
+    assign syndrome[101] = current_cw[18] ^ current_cw[62] ^ current_cw[95] ^ current_cw[105] ^ current_cw[115] ^ current_cw[228] ^ current_cw[229];
+    assign syndrome[102] = current_cw[24] ^ current_cw[28] ^ current_cw[93] ^ current_cw[229] ^ current_cw[230];
+    assign syndrome[103] = current_cw[94] ^ current_cw[125] ^ current_cw[230] ^ current_cw[231];
+    assign syndrome[104] = current_cw[8] ^ current_cw[9] ^ current_cw[76] ^ current_cw[82] ^ current_cw[231] ^ current_cw[232];
+    assign syndrome[105] = current_cw[13] ^ current_cw[19] ^ current_cw[75] ^ current_cw[106] ^ current_cw[232] ^ current_cw[233];
+    assign syndrome[106] = current_cw[113] ^ current_cw[233] ^ current_cw[234];
+    assign syndrome[107] = current_cw[5] ^ current_cw[32] ^ current_cw[39] ^ current_cw[51] ^ current_cw[68] ^ current_cw[234] ^ current_cw[235];
+    assign syndrome[108] = current_cw[1] ^ current_cw[20] ^ current_cw[34] ^ current_cw[67] ^ current_cw[80] ^ current_cw[235] ^ current_cw[236];
+    assign syndrome[109] = current_cw[31] ^ current_cw[36] ^ current_cw[57] ^ current_cw[81] ^ current_cw[92] ^ current_cw[104] ^ current_cw[236] ^ current_cw[237];
+    assign syndrome[110] = current_cw[41] ^ current_cw[102] ^ current_cw[111] ^ current_cw[124] ^ current_cw[237] ^ current_cw[238];
+    assign syndrome[111] = current_cw[23] ^ current_cw[124] ^ current_cw[238] ^ current_cw[239];
+    assign syndrome[112] = current_cw[24] ^ current_cw[51] ^ current_cw[98] ^ current_cw[100] ^ current_cw[239] ^ current_cw[240];
+    assign syndrome[113] = current_cw[17] ^ current_cw[30] ^ current_cw[74] ^ current_cw[240] ^ current_cw[241];
+    assign syndrome[114] = current_cw[52] ^ current_cw[58] ^ current_cw[121] ^ current_cw[241] ^ current_cw[242];
+    assign syndrome[115] = current_cw[10] ^ current_cw[18] ^ current_cw[33] ^ current_cw[127] ^ current_cw[242] ^ current_cw[243];
+    assign syndrome[116] = current_cw[59] ^ current_cw[78] ^ current_cw[91] ^ current_cw[243] ^ current_cw[244];
+    assign syndrome[117] = current_cw[69] ^ current_cw[244] ^ current_cw[245];
+    assign syndrome[118] = current_cw[119] ^ current_cw[245] ^ current_cw[246];
+    assign syndrome[119] = current_cw[90] ^ current_cw[109] ^ current_cw[111] ^ current_cw[246] ^ current_cw[247];
+    assign syndrome[120] = current_cw[22] ^ current_cw[123] ^ current_cw[247] ^ current_cw[248];
+    assign syndrome[121] = current_cw[3] ^ current_cw[20] ^ current_cw[83] ^ current_cw[85] ^ current_cw[127] ^ current_cw[248] ^ current_cw[249];
+    assign syndrome[122] = current_cw[249] ^ current_cw[250];
+    assign syndrome[123] = current_cw[5] ^ current_cw[38] ^ current_cw[114] ^ current_cw[250] ^ current_cw[251];
+    assign syndrome[124] = current_cw[36] ^ current_cw[45] ^ current_cw[67] ^ current_cw[251] ^ current_cw[252];
+    assign syndrome[125] = current_cw[8] ^ current_cw[21] ^ current_cw[115] ^ current_cw[252] ^ current_cw[253];
+    assign syndrome[126] = current_cw[69] ^ current_cw[253] ^ current_cw[254];
+    assign syndrome[127] = current_cw[94] ^ current_cw[254] ^ current_cw[255];
     assign has_error = |syndrome;
-    wire [6:0] sum_0 = { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_0 = (sum_0 >= 7'd34);
-    wire [6:0] sum_1 = { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_1 = (sum_1 >= 7'd40);
-    wire [4:0] sum_2 = { 4'd0, syndrome[79] } + { 4'd0, syndrome[80] } + { 4'd0, syndrome[81] } + { 4'd0, syndrome[82] } + { 4'd0, syndrome[83] } + { 4'd0, syndrome[84] } + { 4'd0, syndrome[85] } + { 4'd0, syndrome[86] } + { 4'd0, syndrome[116] } + { 4'd0, syndrome[117] } + { 4'd0, syndrome[118] } + { 4'd0, syndrome[119] } + { 4'd0, syndrome[120] } + { 4'd0, syndrome[121] } + { 4'd0, syndrome[122] } + { 4'd0, syndrome[123] } + { 4'd0, syndrome[124] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_2 = (sum_2 >= 5'd10);
-    wire [5:0] sum_3 = { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] } + { 5'd0, syndrome[64] } + { 5'd0, syndrome[65] } + { 5'd0, syndrome[66] } + { 5'd0, syndrome[67] } + { 5'd0, syndrome[68] } + { 5'd0, syndrome[69] } + { 5'd0, syndrome[70] } + { 5'd0, syndrome[71] } + { 5'd0, syndrome[72] } + { 5'd0, syndrome[73] } + { 5'd0, syndrome[74] } + { 5'd0, syndrome[75] } + { 5'd0, syndrome[76] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_3 = (sum_3 >= 6'd22);
-    wire [4:0] sum_4 = { 4'd0, syndrome[36] } + { 4'd0, syndrome[37] } + { 4'd0, syndrome[38] } + { 4'd0, syndrome[109] } + { 4'd0, syndrome[110] } + { 4'd0, syndrome[111] } + { 4'd0, syndrome[112] } + { 4'd0, syndrome[113] } + { 4'd0, syndrome[114] } + { 4'd0, syndrome[115] } + { 4'd0, syndrome[116] } + { 4'd0, syndrome[117] } + { 4'd0, syndrome[118] } + { 4'd0, syndrome[119] } + { 4'd0, syndrome[120] } + { 4'd0, syndrome[121] } + { 4'd0, syndrome[122] } + { 4'd0, syndrome[123] } + { 4'd0, syndrome[124] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_4 = (sum_4 >= 5'd11);
-    wire [5:0] sum_5 = { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_5 = (sum_5 >= 6'd19);
-    wire [6:0] sum_6 = { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_6 = (sum_6 >= 7'd33);
-    wire [6:0] sum_7 = { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_7 = (sum_7 >= 7'd53);
-    wire [6:0] sum_8 = { 6'd0, syndrome[7] } + { 6'd0, syndrome[8] } + { 6'd0, syndrome[9] } + { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_8 = (sum_8 >= 7'd58);
-    wire [5:0] sum_9 = { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_9 = (sum_9 >= 6'd18);
-    wire [6:0] sum_10 = { 6'd0, syndrome[0] } + { 6'd0, syndrome[1] } + { 6'd0, syndrome[2] } + { 6'd0, syndrome[3] } + { 6'd0, syndrome[4] } + { 6'd0, syndrome[5] } + { 6'd0, syndrome[6] } + { 6'd0, syndrome[7] } + { 6'd0, syndrome[8] } + { 6'd0, syndrome[9] } + { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_10 = (sum_10 >= 7'd48);
-    wire [5:0] sum_11 = { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[99] } + { 5'd0, syndrome[100] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_11 = (sum_11 >= 6'd22);
-    wire [6:0] sum_12 = { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_12 = (sum_12 >= 7'd34);
-    wire [5:0] sum_13 = { 5'd0, syndrome[73] } + { 5'd0, syndrome[90] } + { 5'd0, syndrome[91] } + { 5'd0, syndrome[92] } + { 5'd0, syndrome[93] } + { 5'd0, syndrome[94] } + { 5'd0, syndrome[95] } + { 5'd0, syndrome[96] } + { 5'd0, syndrome[97] } + { 5'd0, syndrome[98] } + { 5'd0, syndrome[99] } + { 5'd0, syndrome[100] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_13 = (sum_13 >= 6'd20);
-    wire [6:0] sum_14 = { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_14 = (sum_14 >= 7'd40);
-    wire [5:0] sum_15 = { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] } + { 5'd0, syndrome[64] } + { 5'd0, syndrome[65] } + { 5'd0, syndrome[66] } + { 5'd0, syndrome[67] } + { 5'd0, syndrome[68] } + { 5'd0, syndrome[69] } + { 5'd0, syndrome[70] } + { 5'd0, syndrome[71] } + { 5'd0, syndrome[72] } + { 5'd0, syndrome[73] } + { 5'd0, syndrome[74] } + { 5'd0, syndrome[75] } + { 5'd0, syndrome[76] } + { 5'd0, syndrome[77] } + { 5'd0, syndrome[78] } + { 5'd0, syndrome[79] } + { 5'd0, syndrome[80] } + { 5'd0, syndrome[81] } + { 5'd0, syndrome[82] } + { 5'd0, syndrome[83] } + { 5'd0, syndrome[84] } + { 5'd0, syndrome[85] } + { 5'd0, syndrome[86] } + { 5'd0, syndrome[87] } + { 5'd0, syndrome[88] } + { 5'd0, syndrome[89] } + { 5'd0, syndrome[90] } + { 5'd0, syndrome[91] } + { 5'd0, syndrome[92] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_15 = (sum_15 >= 6'd22);
-    wire [5:0] sum_16 = { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] } + { 5'd0, syndrome[64] } + { 5'd0, syndrome[65] } + { 5'd0, syndrome[66] } + { 5'd0, syndrome[67] } + { 5'd0, syndrome[68] } + { 5'd0, syndrome[69] } + { 5'd0, syndrome[70] } + { 5'd0, syndrome[71] } + { 5'd0, syndrome[72] } + { 5'd0, syndrome[73] } + { 5'd0, syndrome[74] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_16 = (sum_16 >= 6'd30);
-    wire [4:0] sum_17 = { 4'd0, syndrome[40] } + { 4'd0, syndrome[41] } + { 4'd0, syndrome[42] } + { 4'd0, syndrome[43] } + { 4'd0, syndrome[44] } + { 4'd0, syndrome[45] } + { 4'd0, syndrome[46] } + { 4'd0, syndrome[47] } + { 4'd0, syndrome[48] } + { 4'd0, syndrome[49] } + { 4'd0, syndrome[50] } + { 4'd0, syndrome[118] } + { 4'd0, syndrome[119] } + { 4'd0, syndrome[120] } + { 4'd0, syndrome[121] } + { 4'd0, syndrome[122] } + { 4'd0, syndrome[123] } + { 4'd0, syndrome[124] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_17 = (sum_17 >= 5'd11);
-    wire [4:0] sum_18 = { 4'd0, syndrome[7] } + { 4'd0, syndrome[8] } + { 4'd0, syndrome[9] } + { 4'd0, syndrome[10] } + { 4'd0, syndrome[11] } + { 4'd0, syndrome[12] } + { 4'd0, syndrome[13] } + { 4'd0, syndrome[14] } + { 4'd0, syndrome[15] } + { 4'd0, syndrome[16] } + { 4'd0, syndrome[17] } + { 4'd0, syndrome[18] } + { 4'd0, syndrome[19] } + { 4'd0, syndrome[20] } + { 4'd0, syndrome[21] } + { 4'd0, syndrome[112] } + { 4'd0, syndrome[113] } + { 4'd0, syndrome[114] } + { 4'd0, syndrome[115] } + { 4'd0, syndrome[116] } + { 4'd0, syndrome[117] } + { 4'd0, syndrome[118] } + { 4'd0, syndrome[119] } + { 4'd0, syndrome[120] } + { 4'd0, syndrome[121] } + { 4'd0, syndrome[122] } + { 4'd0, syndrome[123] } + { 4'd0, syndrome[124] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_18 = (sum_18 >= 5'd16);
-    wire [5:0] sum_19 = { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] } + { 5'd0, syndrome[64] } + { 5'd0, syndrome[65] } + { 5'd0, syndrome[66] } + { 5'd0, syndrome[67] } + { 5'd0, syndrome[68] } + { 5'd0, syndrome[69] } + { 5'd0, syndrome[70] } + { 5'd0, syndrome[71] } + { 5'd0, syndrome[72] } + { 5'd0, syndrome[73] } + { 5'd0, syndrome[74] } + { 5'd0, syndrome[75] } + { 5'd0, syndrome[76] } + { 5'd0, syndrome[77] } + { 5'd0, syndrome[78] } + { 5'd0, syndrome[79] } + { 5'd0, syndrome[80] } + { 5'd0, syndrome[81] } + { 5'd0, syndrome[82] } + { 5'd0, syndrome[83] } + { 5'd0, syndrome[84] } + { 5'd0, syndrome[85] } + { 5'd0, syndrome[86] } + { 5'd0, syndrome[87] } + { 5'd0, syndrome[88] } + { 5'd0, syndrome[89] } + { 5'd0, syndrome[90] } + { 5'd0, syndrome[91] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_19 = (sum_19 >= 6'd30);
-    wire [4:0] sum_20 = { 4'd0, syndrome[45] } + { 4'd0, syndrome[46] } + { 4'd0, syndrome[47] } + { 4'd0, syndrome[48] } + { 4'd0, syndrome[49] } + { 4'd0, syndrome[50] } + { 4'd0, syndrome[51] } + { 4'd0, syndrome[52] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[122] } + { 4'd0, syndrome[123] } + { 4'd0, syndrome[124] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_20 = (sum_20 >= 5'd9);
-    wire [6:0] sum_21 = { 6'd0, syndrome[5] } + { 6'd0, syndrome[6] } + { 6'd0, syndrome[7] } + { 6'd0, syndrome[8] } + { 6'd0, syndrome[9] } + { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_21 = (sum_21 >= 7'd46);
-    wire [5:0] sum_22 = { 5'd0, syndrome[78] } + { 5'd0, syndrome[79] } + { 5'd0, syndrome[80] } + { 5'd0, syndrome[81] } + { 5'd0, syndrome[82] } + { 5'd0, syndrome[83] } + { 5'd0, syndrome[84] } + { 5'd0, syndrome[85] } + { 5'd0, syndrome[86] } + { 5'd0, syndrome[87] } + { 5'd0, syndrome[88] } + { 5'd0, syndrome[89] } + { 5'd0, syndrome[90] } + { 5'd0, syndrome[91] } + { 5'd0, syndrome[92] } + { 5'd0, syndrome[93] } + { 5'd0, syndrome[94] } + { 5'd0, syndrome[95] } + { 5'd0, syndrome[96] } + { 5'd0, syndrome[97] } + { 5'd0, syndrome[98] } + { 5'd0, syndrome[99] } + { 5'd0, syndrome[100] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_22 = (sum_22 >= 6'd22);
-    wire [6:0] sum_23 = { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_23 = (sum_23 >= 7'd56);
-    wire [6:0] sum_24 = { 6'd0, syndrome[7] } + { 6'd0, syndrome[8] } + { 6'd0, syndrome[9] } + { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_24 = (sum_24 >= 7'd46);
-    wire [6:0] sum_25 = { 6'd0, syndrome[4] } + { 6'd0, syndrome[5] } + { 6'd0, syndrome[6] } + { 6'd0, syndrome[7] } + { 6'd0, syndrome[8] } + { 6'd0, syndrome[9] } + { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_25 = (sum_25 >= 7'd58);
-    wire [6:0] sum_26 = { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_26 = (sum_26 >= 7'd56);
-    wire [6:0] sum_27 = { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_27 = (sum_27 >= 7'd34);
-    wire [5:0] sum_28 = { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[82] } + { 5'd0, syndrome[83] } + { 5'd0, syndrome[84] } + { 5'd0, syndrome[85] } + { 5'd0, syndrome[86] } + { 5'd0, syndrome[87] } + { 5'd0, syndrome[88] } + { 5'd0, syndrome[89] } + { 5'd0, syndrome[90] } + { 5'd0, syndrome[91] } + { 5'd0, syndrome[92] } + { 5'd0, syndrome[93] } + { 5'd0, syndrome[94] } + { 5'd0, syndrome[95] } + { 5'd0, syndrome[96] } + { 5'd0, syndrome[97] } + { 5'd0, syndrome[98] } + { 5'd0, syndrome[99] } + { 5'd0, syndrome[100] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_28 = (sum_28 >= 6'd32);
-    wire [5:0] sum_29 = { 5'd0, syndrome[67] } + { 5'd0, syndrome[68] } + { 5'd0, syndrome[69] } + { 5'd0, syndrome[70] } + { 5'd0, syndrome[71] } + { 5'd0, syndrome[72] } + { 5'd0, syndrome[73] } + { 5'd0, syndrome[74] } + { 5'd0, syndrome[75] } + { 5'd0, syndrome[76] } + { 5'd0, syndrome[77] } + { 5'd0, syndrome[78] } + { 5'd0, syndrome[79] } + { 5'd0, syndrome[80] } + { 5'd0, syndrome[81] } + { 5'd0, syndrome[82] } + { 5'd0, syndrome[83] } + { 5'd0, syndrome[84] } + { 5'd0, syndrome[85] } + { 5'd0, syndrome[86] } + { 5'd0, syndrome[87] } + { 5'd0, syndrome[88] } + { 5'd0, syndrome[89] } + { 5'd0, syndrome[90] } + { 5'd0, syndrome[91] } + { 5'd0, syndrome[92] } + { 5'd0, syndrome[93] } + { 5'd0, syndrome[94] } + { 5'd0, syndrome[95] } + { 5'd0, syndrome[96] } + { 5'd0, syndrome[97] } + { 5'd0, syndrome[98] } + { 5'd0, syndrome[99] } + { 5'd0, syndrome[100] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_29 = (sum_29 >= 6'd27);
-    wire [4:0] sum_30 = { 4'd0, syndrome[96] } + { 4'd0, syndrome[97] } + { 4'd0, syndrome[98] } + { 4'd0, syndrome[99] } + { 4'd0, syndrome[100] } + { 4'd0, syndrome[101] } + { 4'd0, syndrome[102] } + { 4'd0, syndrome[103] } + { 4'd0, syndrome[104] } + { 4'd0, syndrome[105] } + { 4'd0, syndrome[106] } + { 4'd0, syndrome[107] } + { 4'd0, syndrome[108] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_30 = (sum_30 >= 5'd8);
-    wire [6:0] sum_31 = { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_31 = (sum_31 >= 7'd40);
-    wire [4:0] sum_32 = { 4'd0, syndrome[90] } + { 4'd0, syndrome[91] } + { 4'd0, syndrome[92] } + { 4'd0, syndrome[93] } + { 4'd0, syndrome[94] } + { 4'd0, syndrome[95] } + { 4'd0, syndrome[96] } + { 4'd0, syndrome[97] } + { 4'd0, syndrome[98] } + { 4'd0, syndrome[99] } + { 4'd0, syndrome[100] } + { 4'd0, syndrome[101] } + { 4'd0, syndrome[102] } + { 4'd0, syndrome[103] } + { 4'd0, syndrome[104] } + { 4'd0, syndrome[105] } + { 4'd0, syndrome[106] } + { 4'd0, syndrome[124] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_32 = (sum_32 >= 5'd11);
-    wire [4:0] sum_33 = { 4'd0, syndrome[38] } + { 4'd0, syndrome[109] } + { 4'd0, syndrome[110] } + { 4'd0, syndrome[111] } + { 4'd0, syndrome[112] } + { 4'd0, syndrome[113] } + { 4'd0, syndrome[114] } + { 4'd0, syndrome[115] } + { 4'd0, syndrome[116] } + { 4'd0, syndrome[117] } + { 4'd0, syndrome[118] } + { 4'd0, syndrome[119] } + { 4'd0, syndrome[120] } + { 4'd0, syndrome[121] } + { 4'd0, syndrome[122] } + { 4'd0, syndrome[123] } + { 4'd0, syndrome[124] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_33 = (sum_33 >= 5'd10);
-    wire [6:0] sum_34 = { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_34 = (sum_34 >= 7'd36);
-    wire [5:0] sum_35 = { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[95] } + { 5'd0, syndrome[96] } + { 5'd0, syndrome[97] } + { 5'd0, syndrome[98] } + { 5'd0, syndrome[99] } + { 5'd0, syndrome[100] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_35 = (sum_35 >= 6'd23);
-    wire [6:0] sum_36 = { 6'd0, syndrome[4] } + { 6'd0, syndrome[5] } + { 6'd0, syndrome[6] } + { 6'd0, syndrome[7] } + { 6'd0, syndrome[8] } + { 6'd0, syndrome[9] } + { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_36 = (sum_36 >= 7'd47);
-    wire [6:0] sum_37 = { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_37 = (sum_37 >= 7'd36);
-    wire [6:0] sum_38 = { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_38 = (sum_38 >= 7'd57);
-    wire [5:0] sum_39 = { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_39 = (sum_39 >= 6'd18);
-    wire [6:0] sum_40 = { 6'd0, syndrome[3] } + { 6'd0, syndrome[4] } + { 6'd0, syndrome[5] } + { 6'd0, syndrome[6] } + { 6'd0, syndrome[7] } + { 6'd0, syndrome[8] } + { 6'd0, syndrome[9] } + { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_40 = (sum_40 >= 7'd35);
-    wire [5:0] sum_41 = { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_41 = (sum_41 >= 6'd28);
-    wire [6:0] sum_42 = { 6'd0, syndrome[6] } + { 6'd0, syndrome[7] } + { 6'd0, syndrome[8] } + { 6'd0, syndrome[9] } + { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_42 = (sum_42 >= 7'd44);
-    wire [4:0] sum_43 = { 4'd0, syndrome[96] } + { 4'd0, syndrome[110] } + { 4'd0, syndrome[111] } + { 4'd0, syndrome[112] } + { 4'd0, syndrome[113] } + { 4'd0, syndrome[114] } + { 4'd0, syndrome[115] } + { 4'd0, syndrome[116] } + { 4'd0, syndrome[117] } + { 4'd0, syndrome[118] } + { 4'd0, syndrome[119] } + { 4'd0, syndrome[120] } + { 4'd0, syndrome[121] } + { 4'd0, syndrome[122] } + { 4'd0, syndrome[123] } + { 4'd0, syndrome[124] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_43 = (sum_43 >= 5'd10);
-    wire [6:0] sum_44 = { 6'd0, syndrome[0] } + { 6'd0, syndrome[1] } + { 6'd0, syndrome[2] } + { 6'd0, syndrome[3] } + { 6'd0, syndrome[4] } + { 6'd0, syndrome[5] } + { 6'd0, syndrome[6] } + { 6'd0, syndrome[7] } + { 6'd0, syndrome[8] } + { 6'd0, syndrome[9] } + { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_44 = (sum_44 >= 7'd57);
-    wire [5:0] sum_45 = { 5'd0, syndrome[5] } + { 5'd0, syndrome[6] } + { 5'd0, syndrome[7] } + { 5'd0, syndrome[8] } + { 5'd0, syndrome[9] } + { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_45 = (sum_45 >= 6'd27);
-    wire [5:0] sum_46 = { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_46 = (sum_46 >= 6'd21);
-    wire [6:0] sum_47 = { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_47 = (sum_47 >= 7'd43);
-    wire [6:0] sum_48 = { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_48 = (sum_48 >= 7'd43);
-    wire [6:0] sum_49 = { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_49 = (sum_49 >= 7'd35);
-    wire [4:0] sum_50 = { 4'd0, syndrome[2] } + { 4'd0, syndrome[3] } + { 4'd0, syndrome[4] } + { 4'd0, syndrome[5] } + { 4'd0, syndrome[104] } + { 4'd0, syndrome[105] } + { 4'd0, syndrome[106] } + { 4'd0, syndrome[107] } + { 4'd0, syndrome[108] } + { 4'd0, syndrome[109] } + { 4'd0, syndrome[110] } + { 4'd0, syndrome[111] } + { 4'd0, syndrome[112] } + { 4'd0, syndrome[113] } + { 4'd0, syndrome[114] } + { 4'd0, syndrome[115] } + { 4'd0, syndrome[116] } + { 4'd0, syndrome[117] } + { 4'd0, syndrome[118] } + { 4'd0, syndrome[119] } + { 4'd0, syndrome[120] } + { 4'd0, syndrome[121] } + { 4'd0, syndrome[122] } + { 4'd0, syndrome[123] } + { 4'd0, syndrome[124] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_50 = (sum_50 >= 5'd14);
-    wire [6:0] sum_51 = { 6'd0, syndrome[3] } + { 6'd0, syndrome[4] } + { 6'd0, syndrome[5] } + { 6'd0, syndrome[6] } + { 6'd0, syndrome[7] } + { 6'd0, syndrome[8] } + { 6'd0, syndrome[9] } + { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_51 = (sum_51 >= 7'd40);
-    wire [4:0] sum_52 = { 4'd0, syndrome[10] } + { 4'd0, syndrome[113] } + { 4'd0, syndrome[114] } + { 4'd0, syndrome[115] } + { 4'd0, syndrome[116] } + { 4'd0, syndrome[117] } + { 4'd0, syndrome[118] } + { 4'd0, syndrome[119] } + { 4'd0, syndrome[120] } + { 4'd0, syndrome[121] } + { 4'd0, syndrome[122] } + { 4'd0, syndrome[123] } + { 4'd0, syndrome[124] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_52 = (sum_52 >= 5'd8);
-    wire [6:0] sum_53 = { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_53 = (sum_53 >= 7'd37);
-    wire [6:0] sum_54 = { 6'd0, syndrome[7] } + { 6'd0, syndrome[8] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_54 = (sum_54 >= 7'd34);
-    wire [6:0] sum_55 = { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_55 = (sum_55 >= 7'd51);
-    wire [6:0] sum_56 = { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_56 = (sum_56 >= 7'd46);
-    wire [5:0] sum_57 = { 5'd0, syndrome[3] } + { 5'd0, syndrome[4] } + { 5'd0, syndrome[5] } + { 5'd0, syndrome[6] } + { 5'd0, syndrome[7] } + { 5'd0, syndrome[92] } + { 5'd0, syndrome[93] } + { 5'd0, syndrome[94] } + { 5'd0, syndrome[95] } + { 5'd0, syndrome[96] } + { 5'd0, syndrome[97] } + { 5'd0, syndrome[98] } + { 5'd0, syndrome[99] } + { 5'd0, syndrome[100] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_57 = (sum_57 >= 6'd21);
-    wire [6:0] sum_58 = { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_58 = (sum_58 >= 7'd33);
-    wire [4:0] sum_59 = { 4'd0, syndrome[15] } + { 4'd0, syndrome[16] } + { 4'd0, syndrome[17] } + { 4'd0, syndrome[18] } + { 4'd0, syndrome[19] } + { 4'd0, syndrome[20] } + { 4'd0, syndrome[21] } + { 4'd0, syndrome[22] } + { 4'd0, syndrome[23] } + { 4'd0, syndrome[24] } + { 4'd0, syndrome[25] } + { 4'd0, syndrome[26] } + { 4'd0, syndrome[27] } + { 4'd0, syndrome[112] } + { 4'd0, syndrome[113] } + { 4'd0, syndrome[114] } + { 4'd0, syndrome[115] } + { 4'd0, syndrome[116] } + { 4'd0, syndrome[117] } + { 4'd0, syndrome[118] } + { 4'd0, syndrome[119] } + { 4'd0, syndrome[120] } + { 4'd0, syndrome[121] } + { 4'd0, syndrome[122] } + { 4'd0, syndrome[123] } + { 4'd0, syndrome[124] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_59 = (sum_59 >= 5'd15);
-    wire [6:0] sum_60 = { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_60 = (sum_60 >= 7'd41);
-    wire [4:0] sum_61 = { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] } + { 4'd0, syndrome[64] } + { 4'd0, syndrome[65] } + { 4'd0, syndrome[66] } + { 4'd0, syndrome[67] } + { 4'd0, syndrome[68] } + { 4'd0, syndrome[69] } + { 4'd0, syndrome[70] } + { 4'd0, syndrome[71] } + { 4'd0, syndrome[72] } + { 4'd0, syndrome[73] } + { 4'd0, syndrome[74] } + { 4'd0, syndrome[75] } + { 4'd0, syndrome[76] } + { 4'd0, syndrome[77] } + { 4'd0, syndrome[78] } + { 4'd0, syndrome[79] } + { 4'd0, syndrome[80] } + { 4'd0, syndrome[81] } + { 4'd0, syndrome[82] } + { 4'd0, syndrome[83] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_61 = (sum_61 >= 5'd12);
-    wire [5:0] sum_62 = { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[75] } + { 5'd0, syndrome[76] } + { 5'd0, syndrome[77] } + { 5'd0, syndrome[78] } + { 5'd0, syndrome[79] } + { 5'd0, syndrome[80] } + { 5'd0, syndrome[81] } + { 5'd0, syndrome[82] } + { 5'd0, syndrome[83] } + { 5'd0, syndrome[84] } + { 5'd0, syndrome[85] } + { 5'd0, syndrome[86] } + { 5'd0, syndrome[87] } + { 5'd0, syndrome[88] } + { 5'd0, syndrome[89] } + { 5'd0, syndrome[90] } + { 5'd0, syndrome[91] } + { 5'd0, syndrome[92] } + { 5'd0, syndrome[93] } + { 5'd0, syndrome[94] } + { 5'd0, syndrome[95] } + { 5'd0, syndrome[96] } + { 5'd0, syndrome[97] } + { 5'd0, syndrome[98] } + { 5'd0, syndrome[99] } + { 5'd0, syndrome[100] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_62 = (sum_62 >= 6'd28);
-    wire [6:0] sum_63 = { 6'd0, syndrome[5] } + { 6'd0, syndrome[6] } + { 6'd0, syndrome[7] } + { 6'd0, syndrome[8] } + { 6'd0, syndrome[9] } + { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_63 = (sum_63 >= 7'd46);
-    wire [6:0] sum_64 = { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_64 = (sum_64 >= 7'd33);
-    wire [6:0] sum_65 = { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_65 = (sum_65 >= 7'd36);
-    wire [4:0] sum_66 = { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] } + { 4'd0, syndrome[64] } + { 4'd0, syndrome[65] } + { 4'd0, syndrome[66] } + { 4'd0, syndrome[67] } + { 4'd0, syndrome[68] } + { 4'd0, syndrome[69] } + { 4'd0, syndrome[70] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_66 = (sum_66 >= 5'd8);
-    wire [6:0] sum_67 = { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_67 = (sum_67 >= 7'd38);
-    wire [6:0] sum_68 = { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_68 = (sum_68 >= 7'd40);
-    wire [6:0] sum_69 = { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_69 = (sum_69 >= 7'd38);
-    wire [5:0] sum_70 = { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[96] } + { 5'd0, syndrome[97] } + { 5'd0, syndrome[98] } + { 5'd0, syndrome[99] } + { 5'd0, syndrome[100] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_70 = (sum_70 >= 6'd23);
-    wire [6:0] sum_71 = { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_71 = (sum_71 >= 7'd39);
-    wire [5:0] sum_72 = { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] } + { 5'd0, syndrome[64] } + { 5'd0, syndrome[65] } + { 5'd0, syndrome[66] } + { 5'd0, syndrome[67] } + { 5'd0, syndrome[68] } + { 5'd0, syndrome[69] } + { 5'd0, syndrome[70] } + { 5'd0, syndrome[71] } + { 5'd0, syndrome[72] } + { 5'd0, syndrome[73] } + { 5'd0, syndrome[74] } + { 5'd0, syndrome[75] } + { 5'd0, syndrome[76] } + { 5'd0, syndrome[77] } + { 5'd0, syndrome[78] } + { 5'd0, syndrome[79] } + { 5'd0, syndrome[80] } + { 5'd0, syndrome[81] } + { 5'd0, syndrome[82] } + { 5'd0, syndrome[83] } + { 5'd0, syndrome[84] } + { 5'd0, syndrome[85] } + { 5'd0, syndrome[86] } + { 5'd0, syndrome[87] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_72 = (sum_72 >= 6'd29);
-    wire [5:0] sum_73 = { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_73 = (sum_73 >= 6'd26);
-    wire [5:0] sum_74 = { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_74 = (sum_74 >= 6'd20);
-    wire [6:0] sum_75 = { 6'd0, syndrome[9] } + { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_75 = (sum_75 >= 7'd58);
-    wire [6:0] sum_76 = { 6'd0, syndrome[6] } + { 6'd0, syndrome[7] } + { 6'd0, syndrome[8] } + { 6'd0, syndrome[9] } + { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_76 = (sum_76 >= 7'd44);
-    wire [5:0] sum_77 = { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] } + { 5'd0, syndrome[64] } + { 5'd0, syndrome[65] } + { 5'd0, syndrome[66] } + { 5'd0, syndrome[67] } + { 5'd0, syndrome[68] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_77 = (sum_77 >= 6'd20);
-    wire [5:0] sum_78 = { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[81] } + { 5'd0, syndrome[82] } + { 5'd0, syndrome[83] } + { 5'd0, syndrome[84] } + { 5'd0, syndrome[85] } + { 5'd0, syndrome[86] } + { 5'd0, syndrome[87] } + { 5'd0, syndrome[88] } + { 5'd0, syndrome[89] } + { 5'd0, syndrome[90] } + { 5'd0, syndrome[91] } + { 5'd0, syndrome[92] } + { 5'd0, syndrome[93] } + { 5'd0, syndrome[94] } + { 5'd0, syndrome[95] } + { 5'd0, syndrome[96] } + { 5'd0, syndrome[97] } + { 5'd0, syndrome[98] } + { 5'd0, syndrome[99] } + { 5'd0, syndrome[100] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_78 = (sum_78 >= 6'd26);
-    wire [6:0] sum_79 = { 6'd0, syndrome[1] } + { 6'd0, syndrome[2] } + { 6'd0, syndrome[3] } + { 6'd0, syndrome[4] } + { 6'd0, syndrome[5] } + { 6'd0, syndrome[6] } + { 6'd0, syndrome[7] } + { 6'd0, syndrome[8] } + { 6'd0, syndrome[9] } + { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_79 = (sum_79 >= 7'd49);
-    wire [5:0] sum_80 = { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_80 = (sum_80 >= 6'd28);
-    wire [6:0] sum_81 = { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_81 = (sum_81 >= 7'd47);
-    wire [6:0] sum_82 = { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_82 = (sum_82 >= 7'd37);
-    wire [5:0] sum_83 = { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_83 = (sum_83 >= 6'd26);
-    wire [4:0] sum_84 = { 4'd0, syndrome[33] } + { 4'd0, syndrome[34] } + { 4'd0, syndrome[35] } + { 4'd0, syndrome[36] } + { 4'd0, syndrome[37] } + { 4'd0, syndrome[38] } + { 4'd0, syndrome[39] } + { 4'd0, syndrome[40] } + { 4'd0, syndrome[41] } + { 4'd0, syndrome[42] } + { 4'd0, syndrome[43] } + { 4'd0, syndrome[44] } + { 4'd0, syndrome[45] } + { 4'd0, syndrome[46] } + { 4'd0, syndrome[47] } + { 4'd0, syndrome[48] } + { 4'd0, syndrome[117] } + { 4'd0, syndrome[118] } + { 4'd0, syndrome[119] } + { 4'd0, syndrome[120] } + { 4'd0, syndrome[121] } + { 4'd0, syndrome[122] } + { 4'd0, syndrome[123] } + { 4'd0, syndrome[124] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_84 = (sum_84 >= 5'd14);
-    wire [5:0] sum_85 = { 5'd0, syndrome[4] } + { 5'd0, syndrome[5] } + { 5'd0, syndrome[6] } + { 5'd0, syndrome[7] } + { 5'd0, syndrome[8] } + { 5'd0, syndrome[9] } + { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_85 = (sum_85 >= 6'd29);
-    wire [6:0] sum_86 = { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_86 = (sum_86 >= 7'd42);
-    wire [5:0] sum_87 = { 5'd0, syndrome[66] } + { 5'd0, syndrome[67] } + { 5'd0, syndrome[68] } + { 5'd0, syndrome[69] } + { 5'd0, syndrome[70] } + { 5'd0, syndrome[71] } + { 5'd0, syndrome[72] } + { 5'd0, syndrome[73] } + { 5'd0, syndrome[74] } + { 5'd0, syndrome[75] } + { 5'd0, syndrome[76] } + { 5'd0, syndrome[77] } + { 5'd0, syndrome[78] } + { 5'd0, syndrome[87] } + { 5'd0, syndrome[88] } + { 5'd0, syndrome[89] } + { 5'd0, syndrome[90] } + { 5'd0, syndrome[91] } + { 5'd0, syndrome[92] } + { 5'd0, syndrome[93] } + { 5'd0, syndrome[94] } + { 5'd0, syndrome[95] } + { 5'd0, syndrome[96] } + { 5'd0, syndrome[97] } + { 5'd0, syndrome[98] } + { 5'd0, syndrome[99] } + { 5'd0, syndrome[100] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_87 = (sum_87 >= 6'd27);
-    wire [5:0] sum_88 = { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] } + { 5'd0, syndrome[64] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_88 = (sum_88 >= 6'd32);
-    wire [6:0] sum_89 = { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_89 = (sum_89 >= 7'd55);
-    wire [5:0] sum_90 = { 5'd0, syndrome[8] } + { 5'd0, syndrome[9] } + { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_90 = (sum_90 >= 6'd26);
-    wire [5:0] sum_91 = { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[78] } + { 5'd0, syndrome[79] } + { 5'd0, syndrome[80] } + { 5'd0, syndrome[81] } + { 5'd0, syndrome[82] } + { 5'd0, syndrome[83] } + { 5'd0, syndrome[84] } + { 5'd0, syndrome[85] } + { 5'd0, syndrome[86] } + { 5'd0, syndrome[87] } + { 5'd0, syndrome[88] } + { 5'd0, syndrome[89] } + { 5'd0, syndrome[90] } + { 5'd0, syndrome[91] } + { 5'd0, syndrome[92] } + { 5'd0, syndrome[93] } + { 5'd0, syndrome[94] } + { 5'd0, syndrome[95] } + { 5'd0, syndrome[96] } + { 5'd0, syndrome[97] } + { 5'd0, syndrome[98] } + { 5'd0, syndrome[99] } + { 5'd0, syndrome[100] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_91 = (sum_91 >= 6'd32);
-    wire [5:0] sum_92 = { 5'd0, syndrome[69] } + { 5'd0, syndrome[70] } + { 5'd0, syndrome[71] } + { 5'd0, syndrome[72] } + { 5'd0, syndrome[73] } + { 5'd0, syndrome[74] } + { 5'd0, syndrome[75] } + { 5'd0, syndrome[76] } + { 5'd0, syndrome[77] } + { 5'd0, syndrome[78] } + { 5'd0, syndrome[98] } + { 5'd0, syndrome[99] } + { 5'd0, syndrome[100] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_92 = (sum_92 >= 6'd20);
-    wire [5:0] sum_93 = { 5'd0, syndrome[5] } + { 5'd0, syndrome[6] } + { 5'd0, syndrome[7] } + { 5'd0, syndrome[8] } + { 5'd0, syndrome[9] } + { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[99] } + { 5'd0, syndrome[100] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_93 = (sum_93 >= 6'd20);
-    wire [6:0] sum_94 = { 6'd0, syndrome[9] } + { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_94 = (sum_94 >= 7'd33);
-    wire [4:0] sum_95 = { 4'd0, syndrome[97] } + { 4'd0, syndrome[98] } + { 4'd0, syndrome[99] } + { 4'd0, syndrome[100] } + { 4'd0, syndrome[101] } + { 4'd0, syndrome[102] } + { 4'd0, syndrome[103] } + { 4'd0, syndrome[104] } + { 4'd0, syndrome[105] } + { 4'd0, syndrome[106] } + { 4'd0, syndrome[116] } + { 4'd0, syndrome[117] } + { 4'd0, syndrome[118] } + { 4'd0, syndrome[119] } + { 4'd0, syndrome[120] } + { 4'd0, syndrome[121] } + { 4'd0, syndrome[122] } + { 4'd0, syndrome[123] } + { 4'd0, syndrome[124] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_95 = (sum_95 >= 5'd11);
-    wire [6:0] sum_96 = { 6'd0, syndrome[1] } + { 6'd0, syndrome[2] } + { 6'd0, syndrome[3] } + { 6'd0, syndrome[4] } + { 6'd0, syndrome[5] } + { 6'd0, syndrome[6] } + { 6'd0, syndrome[7] } + { 6'd0, syndrome[8] } + { 6'd0, syndrome[9] } + { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_96 = (sum_96 >= 7'd57);
-    wire [6:0] sum_97 = { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_97 = (sum_97 >= 7'd42);
-    wire [6:0] sum_98 = { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_98 = (sum_98 >= 7'd58);
-    wire [6:0] sum_99 = { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_99 = (sum_99 >= 7'd40);
-    wire [5:0] sum_100 = { 5'd0, syndrome[69] } + { 5'd0, syndrome[70] } + { 5'd0, syndrome[71] } + { 5'd0, syndrome[72] } + { 5'd0, syndrome[73] } + { 5'd0, syndrome[74] } + { 5'd0, syndrome[75] } + { 5'd0, syndrome[76] } + { 5'd0, syndrome[77] } + { 5'd0, syndrome[78] } + { 5'd0, syndrome[79] } + { 5'd0, syndrome[80] } + { 5'd0, syndrome[81] } + { 5'd0, syndrome[82] } + { 5'd0, syndrome[83] } + { 5'd0, syndrome[84] } + { 5'd0, syndrome[85] } + { 5'd0, syndrome[86] } + { 5'd0, syndrome[87] } + { 5'd0, syndrome[88] } + { 5'd0, syndrome[89] } + { 5'd0, syndrome[90] } + { 5'd0, syndrome[91] } + { 5'd0, syndrome[97] } + { 5'd0, syndrome[98] } + { 5'd0, syndrome[99] } + { 5'd0, syndrome[100] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_100 = (sum_100 >= 6'd27);
-    wire [6:0] sum_101 = { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_101 = (sum_101 >= 7'd46);
-    wire [6:0] sum_102 = { 6'd0, syndrome[8] } + { 6'd0, syndrome[9] } + { 6'd0, syndrome[10] } + { 6'd0, syndrome[11] } + { 6'd0, syndrome[12] } + { 6'd0, syndrome[13] } + { 6'd0, syndrome[14] } + { 6'd0, syndrome[15] } + { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_102 = (sum_102 >= 7'd56);
-    wire [4:0] sum_103 = { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[111] } + { 4'd0, syndrome[112] } + { 4'd0, syndrome[113] } + { 4'd0, syndrome[114] } + { 4'd0, syndrome[115] } + { 4'd0, syndrome[116] } + { 4'd0, syndrome[117] } + { 4'd0, syndrome[118] } + { 4'd0, syndrome[119] } + { 4'd0, syndrome[120] } + { 4'd0, syndrome[121] } + { 4'd0, syndrome[122] } + { 4'd0, syndrome[123] } + { 4'd0, syndrome[124] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_103 = (sum_103 >= 5'd11);
-    wire [6:0] sum_104 = { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_104 = (sum_104 >= 7'd48);
-    wire [6:0] sum_105 = { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_105 = (sum_105 >= 7'd38);
-    wire [4:0] sum_106 = { 4'd0, syndrome[39] } + { 4'd0, syndrome[40] } + { 4'd0, syndrome[41] } + { 4'd0, syndrome[42] } + { 4'd0, syndrome[43] } + { 4'd0, syndrome[44] } + { 4'd0, syndrome[45] } + { 4'd0, syndrome[106] } + { 4'd0, syndrome[107] } + { 4'd0, syndrome[108] } + { 4'd0, syndrome[109] } + { 4'd0, syndrome[110] } + { 4'd0, syndrome[111] } + { 4'd0, syndrome[112] } + { 4'd0, syndrome[113] } + { 4'd0, syndrome[114] } + { 4'd0, syndrome[115] } + { 4'd0, syndrome[116] } + { 4'd0, syndrome[117] } + { 4'd0, syndrome[118] } + { 4'd0, syndrome[119] } + { 4'd0, syndrome[120] } + { 4'd0, syndrome[121] } + { 4'd0, syndrome[122] } + { 4'd0, syndrome[123] } + { 4'd0, syndrome[124] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_106 = (sum_106 >= 5'd15);
-    wire [4:0] sum_107 = { 4'd0, syndrome[94] } + { 4'd0, syndrome[95] } + { 4'd0, syndrome[96] } + { 4'd0, syndrome[97] } + { 4'd0, syndrome[98] } + { 4'd0, syndrome[99] } + { 4'd0, syndrome[100] } + { 4'd0, syndrome[101] } + { 4'd0, syndrome[102] } + { 4'd0, syndrome[103] } + { 4'd0, syndrome[104] } + { 4'd0, syndrome[105] } + { 4'd0, syndrome[106] } + { 4'd0, syndrome[107] } + { 4'd0, syndrome[108] } + { 4'd0, syndrome[109] } + { 4'd0, syndrome[110] } + { 4'd0, syndrome[111] } + { 4'd0, syndrome[112] } + { 4'd0, syndrome[121] } + { 4'd0, syndrome[122] } + { 4'd0, syndrome[123] } + { 4'd0, syndrome[124] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_107 = (sum_107 >= 5'd13);
-    wire [4:0] sum_108 = { 4'd0, syndrome[37] } + { 4'd0, syndrome[38] } + { 4'd0, syndrome[39] } + { 4'd0, syndrome[40] } + { 4'd0, syndrome[41] } + { 4'd0, syndrome[42] } + { 4'd0, syndrome[43] } + { 4'd0, syndrome[44] } + { 4'd0, syndrome[45] } + { 4'd0, syndrome[46] } + { 4'd0, syndrome[47] } + { 4'd0, syndrome[48] } + { 4'd0, syndrome[49] } + { 4'd0, syndrome[50] } + { 4'd0, syndrome[51] } + { 4'd0, syndrome[52] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[123] } + { 4'd0, syndrome[124] } + { 4'd0, syndrome[125] } + { 4'd0, syndrome[126] } + { 4'd0, syndrome[127] };
-    wire flip_108 = (sum_108 >= 5'd16);
-    wire [3:0] sum_109 = { 3'd0, syndrome[59] } + { 3'd0, syndrome[60] } + { 3'd0, syndrome[61] } + { 3'd0, syndrome[62] } + { 3'd0, syndrome[63] } + { 3'd0, syndrome[64] } + { 3'd0, syndrome[65] } + { 3'd0, syndrome[123] } + { 3'd0, syndrome[124] } + { 3'd0, syndrome[125] } + { 3'd0, syndrome[126] } + { 3'd0, syndrome[127] };
-    wire flip_109 = (sum_109 >= 4'd6);
-    wire [3:0] sum_110 = { 3'd0, syndrome[37] } + { 3'd0, syndrome[38] } + { 3'd0, syndrome[39] } + { 3'd0, syndrome[40] } + { 3'd0, syndrome[41] } + { 3'd0, syndrome[42] } + { 3'd0, syndrome[43] } + { 3'd0, syndrome[44] } + { 3'd0, syndrome[127] };
-    wire flip_110 = (sum_110 >= 4'd5);
-    wire [5:0] sum_111 = { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[88] } + { 5'd0, syndrome[89] } + { 5'd0, syndrome[90] } + { 5'd0, syndrome[91] } + { 5'd0, syndrome[92] } + { 5'd0, syndrome[93] } + { 5'd0, syndrome[94] } + { 5'd0, syndrome[95] } + { 5'd0, syndrome[96] } + { 5'd0, syndrome[97] } + { 5'd0, syndrome[98] } + { 5'd0, syndrome[99] } + { 5'd0, syndrome[100] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_111 = (sum_111 >= 6'd22);
-    wire [5:0] sum_112 = { 5'd0, syndrome[2] } + { 5'd0, syndrome[3] } + { 5'd0, syndrome[4] } + { 5'd0, syndrome[5] } + { 5'd0, syndrome[6] } + { 5'd0, syndrome[7] } + { 5'd0, syndrome[8] } + { 5'd0, syndrome[9] } + { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[127] };
-    wire flip_112 = (sum_112 >= 6'd27);
-    wire [2:0] sum_113 = { 2'd0, syndrome[17] } + { 2'd0, syndrome[18] } + { 2'd0, syndrome[19] } + { 2'd0, syndrome[20] } + { 2'd0, syndrome[127] };
-    wire flip_113 = (sum_113 >= 3'd3);
-    wire [6:0] sum_114 = { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_114 = (sum_114 >= 7'd51);
-    wire [6:0] sum_115 = { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_115 = (sum_115 >= 7'd41);
-    wire [6:0] sum_116 = { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_116 = (sum_116 >= 7'd36);
-    wire [6:0] sum_117 = { 6'd0, syndrome[16] } + { 6'd0, syndrome[17] } + { 6'd0, syndrome[18] } + { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_117 = (sum_117 >= 7'd43);
-    wire [6:0] sum_118 = { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_118 = (sum_118 >= 7'd43);
-    wire [5:0] sum_119 = { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_119 = (sum_119 >= 6'd18);
-    wire [5:0] sum_120 = { 5'd0, syndrome[2] } + { 5'd0, syndrome[3] } + { 5'd0, syndrome[4] } + { 5'd0, syndrome[5] } + { 5'd0, syndrome[6] } + { 5'd0, syndrome[7] } + { 5'd0, syndrome[8] } + { 5'd0, syndrome[9] } + { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_120 = (sum_120 >= 6'd23);
-    wire [6:0] sum_121 = { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_121 = (sum_121 >= 7'd42);
-    wire [5:0] sum_122 = { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[79] } + { 5'd0, syndrome[80] } + { 5'd0, syndrome[81] } + { 5'd0, syndrome[82] } + { 5'd0, syndrome[83] } + { 5'd0, syndrome[84] } + { 5'd0, syndrome[85] } + { 5'd0, syndrome[86] } + { 5'd0, syndrome[87] } + { 5'd0, syndrome[88] } + { 5'd0, syndrome[89] } + { 5'd0, syndrome[90] } + { 5'd0, syndrome[91] } + { 5'd0, syndrome[92] } + { 5'd0, syndrome[93] } + { 5'd0, syndrome[94] } + { 5'd0, syndrome[95] } + { 5'd0, syndrome[96] } + { 5'd0, syndrome[97] } + { 5'd0, syndrome[98] } + { 5'd0, syndrome[99] } + { 5'd0, syndrome[100] } + { 5'd0, syndrome[101] } + { 5'd0, syndrome[102] } + { 5'd0, syndrome[103] } + { 5'd0, syndrome[104] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_122 = (sum_122 >= 6'd27);
-    wire [6:0] sum_123 = { 6'd0, syndrome[7] } + { 6'd0, syndrome[8] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_123 = (sum_123 >= 7'd53);
-    wire [6:0] sum_124 = { 6'd0, syndrome[19] } + { 6'd0, syndrome[20] } + { 6'd0, syndrome[21] } + { 6'd0, syndrome[22] } + { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_124 = (sum_124 >= 7'd54);
-    wire [5:0] sum_125 = { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[105] } + { 5'd0, syndrome[106] } + { 5'd0, syndrome[107] } + { 5'd0, syndrome[108] } + { 5'd0, syndrome[109] } + { 5'd0, syndrome[110] } + { 5'd0, syndrome[111] } + { 5'd0, syndrome[112] } + { 5'd0, syndrome[113] } + { 5'd0, syndrome[114] } + { 5'd0, syndrome[115] } + { 5'd0, syndrome[116] } + { 5'd0, syndrome[117] } + { 5'd0, syndrome[118] } + { 5'd0, syndrome[119] } + { 5'd0, syndrome[120] } + { 5'd0, syndrome[121] } + { 5'd0, syndrome[122] } + { 5'd0, syndrome[123] } + { 5'd0, syndrome[124] } + { 5'd0, syndrome[125] } + { 5'd0, syndrome[126] } + { 5'd0, syndrome[127] };
-    wire flip_125 = (sum_125 >= 6'd18);
-    wire [6:0] sum_126 = { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[86] } + { 6'd0, syndrome[87] } + { 6'd0, syndrome[88] } + { 6'd0, syndrome[89] } + { 6'd0, syndrome[90] } + { 6'd0, syndrome[91] } + { 6'd0, syndrome[92] } + { 6'd0, syndrome[93] } + { 6'd0, syndrome[94] } + { 6'd0, syndrome[95] } + { 6'd0, syndrome[96] } + { 6'd0, syndrome[97] } + { 6'd0, syndrome[98] } + { 6'd0, syndrome[99] } + { 6'd0, syndrome[100] } + { 6'd0, syndrome[101] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_126 = (sum_126 >= 7'd39);
-    wire [6:0] sum_127 = { 6'd0, syndrome[23] } + { 6'd0, syndrome[24] } + { 6'd0, syndrome[25] } + { 6'd0, syndrome[26] } + { 6'd0, syndrome[27] } + { 6'd0, syndrome[28] } + { 6'd0, syndrome[29] } + { 6'd0, syndrome[30] } + { 6'd0, syndrome[31] } + { 6'd0, syndrome[32] } + { 6'd0, syndrome[33] } + { 6'd0, syndrome[34] } + { 6'd0, syndrome[35] } + { 6'd0, syndrome[36] } + { 6'd0, syndrome[37] } + { 6'd0, syndrome[38] } + { 6'd0, syndrome[39] } + { 6'd0, syndrome[40] } + { 6'd0, syndrome[41] } + { 6'd0, syndrome[42] } + { 6'd0, syndrome[43] } + { 6'd0, syndrome[44] } + { 6'd0, syndrome[45] } + { 6'd0, syndrome[46] } + { 6'd0, syndrome[47] } + { 6'd0, syndrome[48] } + { 6'd0, syndrome[49] } + { 6'd0, syndrome[50] } + { 6'd0, syndrome[51] } + { 6'd0, syndrome[52] } + { 6'd0, syndrome[53] } + { 6'd0, syndrome[54] } + { 6'd0, syndrome[55] } + { 6'd0, syndrome[56] } + { 6'd0, syndrome[57] } + { 6'd0, syndrome[58] } + { 6'd0, syndrome[59] } + { 6'd0, syndrome[60] } + { 6'd0, syndrome[61] } + { 6'd0, syndrome[62] } + { 6'd0, syndrome[63] } + { 6'd0, syndrome[64] } + { 6'd0, syndrome[65] } + { 6'd0, syndrome[66] } + { 6'd0, syndrome[67] } + { 6'd0, syndrome[68] } + { 6'd0, syndrome[69] } + { 6'd0, syndrome[70] } + { 6'd0, syndrome[71] } + { 6'd0, syndrome[72] } + { 6'd0, syndrome[73] } + { 6'd0, syndrome[74] } + { 6'd0, syndrome[75] } + { 6'd0, syndrome[76] } + { 6'd0, syndrome[77] } + { 6'd0, syndrome[78] } + { 6'd0, syndrome[79] } + { 6'd0, syndrome[80] } + { 6'd0, syndrome[81] } + { 6'd0, syndrome[82] } + { 6'd0, syndrome[83] } + { 6'd0, syndrome[84] } + { 6'd0, syndrome[85] } + { 6'd0, syndrome[102] } + { 6'd0, syndrome[103] } + { 6'd0, syndrome[104] } + { 6'd0, syndrome[105] } + { 6'd0, syndrome[106] } + { 6'd0, syndrome[107] } + { 6'd0, syndrome[108] } + { 6'd0, syndrome[109] } + { 6'd0, syndrome[110] } + { 6'd0, syndrome[111] } + { 6'd0, syndrome[112] } + { 6'd0, syndrome[113] } + { 6'd0, syndrome[114] } + { 6'd0, syndrome[115] } + { 6'd0, syndrome[116] } + { 6'd0, syndrome[117] } + { 6'd0, syndrome[118] } + { 6'd0, syndrome[119] } + { 6'd0, syndrome[120] } + { 6'd0, syndrome[121] } + { 6'd0, syndrome[122] } + { 6'd0, syndrome[123] } + { 6'd0, syndrome[124] } + { 6'd0, syndrome[125] } + { 6'd0, syndrome[126] } + { 6'd0, syndrome[127] };
-    wire flip_127 = (sum_127 >= 7'd45);
-    wire [0:0] sum_128 = syndrome[0];
-    wire flip_128 = (sum_128 >= 1'd1);
-    wire [0:0] sum_129 = syndrome[1];
-    wire flip_129 = (sum_129 >= 1'd1);
-    wire [0:0] sum_130 = syndrome[2];
-    wire flip_130 = (sum_130 >= 1'd1);
-    wire [0:0] sum_131 = syndrome[3];
-    wire flip_131 = (sum_131 >= 1'd1);
-    wire [0:0] sum_132 = syndrome[4];
-    wire flip_132 = (sum_132 >= 1'd1);
-    wire [0:0] sum_133 = syndrome[5];
-    wire flip_133 = (sum_133 >= 1'd1);
-    wire [0:0] sum_134 = syndrome[6];
-    wire flip_134 = (sum_134 >= 1'd1);
-    wire [0:0] sum_135 = syndrome[7];
-    wire flip_135 = (sum_135 >= 1'd1);
-    wire [0:0] sum_136 = syndrome[8];
-    wire flip_136 = (sum_136 >= 1'd1);
-    wire [0:0] sum_137 = syndrome[9];
-    wire flip_137 = (sum_137 >= 1'd1);
-    wire [0:0] sum_138 = syndrome[10];
-    wire flip_138 = (sum_138 >= 1'd1);
-    wire [0:0] sum_139 = syndrome[11];
-    wire flip_139 = (sum_139 >= 1'd1);
-    wire [0:0] sum_140 = syndrome[12];
-    wire flip_140 = (sum_140 >= 1'd1);
-    wire [0:0] sum_141 = syndrome[13];
-    wire flip_141 = (sum_141 >= 1'd1);
-    wire [0:0] sum_142 = syndrome[14];
-    wire flip_142 = (sum_142 >= 1'd1);
-    wire [0:0] sum_143 = syndrome[15];
-    wire flip_143 = (sum_143 >= 1'd1);
-    wire [0:0] sum_144 = syndrome[16];
-    wire flip_144 = (sum_144 >= 1'd1);
-    wire [0:0] sum_145 = syndrome[17];
-    wire flip_145 = (sum_145 >= 1'd1);
-    wire [0:0] sum_146 = syndrome[18];
-    wire flip_146 = (sum_146 >= 1'd1);
-    wire [0:0] sum_147 = syndrome[19];
-    wire flip_147 = (sum_147 >= 1'd1);
-    wire [0:0] sum_148 = syndrome[20];
-    wire flip_148 = (sum_148 >= 1'd1);
-    wire [0:0] sum_149 = syndrome[21];
-    wire flip_149 = (sum_149 >= 1'd1);
-    wire [0:0] sum_150 = syndrome[22];
-    wire flip_150 = (sum_150 >= 1'd1);
-    wire [0:0] sum_151 = syndrome[23];
-    wire flip_151 = (sum_151 >= 1'd1);
-    wire [0:0] sum_152 = syndrome[24];
-    wire flip_152 = (sum_152 >= 1'd1);
-    wire [0:0] sum_153 = syndrome[25];
-    wire flip_153 = (sum_153 >= 1'd1);
-    wire [0:0] sum_154 = syndrome[26];
-    wire flip_154 = (sum_154 >= 1'd1);
-    wire [0:0] sum_155 = syndrome[27];
-    wire flip_155 = (sum_155 >= 1'd1);
-    wire [0:0] sum_156 = syndrome[28];
-    wire flip_156 = (sum_156 >= 1'd1);
-    wire [0:0] sum_157 = syndrome[29];
-    wire flip_157 = (sum_157 >= 1'd1);
-    wire [0:0] sum_158 = syndrome[30];
-    wire flip_158 = (sum_158 >= 1'd1);
-    wire [0:0] sum_159 = syndrome[31];
-    wire flip_159 = (sum_159 >= 1'd1);
-    wire [0:0] sum_160 = syndrome[32];
-    wire flip_160 = (sum_160 >= 1'd1);
-    wire [0:0] sum_161 = syndrome[33];
-    wire flip_161 = (sum_161 >= 1'd1);
-    wire [0:0] sum_162 = syndrome[34];
-    wire flip_162 = (sum_162 >= 1'd1);
-    wire [0:0] sum_163 = syndrome[35];
-    wire flip_163 = (sum_163 >= 1'd1);
-    wire [0:0] sum_164 = syndrome[36];
-    wire flip_164 = (sum_164 >= 1'd1);
-    wire [0:0] sum_165 = syndrome[37];
-    wire flip_165 = (sum_165 >= 1'd1);
-    wire [0:0] sum_166 = syndrome[38];
-    wire flip_166 = (sum_166 >= 1'd1);
-    wire [0:0] sum_167 = syndrome[39];
-    wire flip_167 = (sum_167 >= 1'd1);
-    wire [0:0] sum_168 = syndrome[40];
-    wire flip_168 = (sum_168 >= 1'd1);
-    wire [0:0] sum_169 = syndrome[41];
-    wire flip_169 = (sum_169 >= 1'd1);
-    wire [0:0] sum_170 = syndrome[42];
-    wire flip_170 = (sum_170 >= 1'd1);
-    wire [0:0] sum_171 = syndrome[43];
-    wire flip_171 = (sum_171 >= 1'd1);
-    wire [0:0] sum_172 = syndrome[44];
-    wire flip_172 = (sum_172 >= 1'd1);
-    wire [0:0] sum_173 = syndrome[45];
-    wire flip_173 = (sum_173 >= 1'd1);
-    wire [0:0] sum_174 = syndrome[46];
-    wire flip_174 = (sum_174 >= 1'd1);
-    wire [0:0] sum_175 = syndrome[47];
-    wire flip_175 = (sum_175 >= 1'd1);
-    wire [0:0] sum_176 = syndrome[48];
-    wire flip_176 = (sum_176 >= 1'd1);
-    wire [0:0] sum_177 = syndrome[49];
-    wire flip_177 = (sum_177 >= 1'd1);
-    wire [0:0] sum_178 = syndrome[50];
-    wire flip_178 = (sum_178 >= 1'd1);
-    wire [0:0] sum_179 = syndrome[51];
-    wire flip_179 = (sum_179 >= 1'd1);
-    wire [0:0] sum_180 = syndrome[52];
-    wire flip_180 = (sum_180 >= 1'd1);
-    wire [0:0] sum_181 = syndrome[53];
-    wire flip_181 = (sum_181 >= 1'd1);
-    wire [0:0] sum_182 = syndrome[54];
-    wire flip_182 = (sum_182 >= 1'd1);
-    wire [0:0] sum_183 = syndrome[55];
-    wire flip_183 = (sum_183 >= 1'd1);
-    wire [0:0] sum_184 = syndrome[56];
-    wire flip_184 = (sum_184 >= 1'd1);
-    wire [0:0] sum_185 = syndrome[57];
-    wire flip_185 = (sum_185 >= 1'd1);
-    wire [0:0] sum_186 = syndrome[58];
-    wire flip_186 = (sum_186 >= 1'd1);
-    wire [0:0] sum_187 = syndrome[59];
-    wire flip_187 = (sum_187 >= 1'd1);
-    wire [0:0] sum_188 = syndrome[60];
-    wire flip_188 = (sum_188 >= 1'd1);
-    wire [0:0] sum_189 = syndrome[61];
-    wire flip_189 = (sum_189 >= 1'd1);
-    wire [0:0] sum_190 = syndrome[62];
-    wire flip_190 = (sum_190 >= 1'd1);
-    wire [0:0] sum_191 = syndrome[63];
-    wire flip_191 = (sum_191 >= 1'd1);
-    wire [0:0] sum_192 = syndrome[64];
-    wire flip_192 = (sum_192 >= 1'd1);
-    wire [0:0] sum_193 = syndrome[65];
-    wire flip_193 = (sum_193 >= 1'd1);
-    wire [0:0] sum_194 = syndrome[66];
-    wire flip_194 = (sum_194 >= 1'd1);
-    wire [0:0] sum_195 = syndrome[67];
-    wire flip_195 = (sum_195 >= 1'd1);
-    wire [0:0] sum_196 = syndrome[68];
-    wire flip_196 = (sum_196 >= 1'd1);
-    wire [0:0] sum_197 = syndrome[69];
-    wire flip_197 = (sum_197 >= 1'd1);
-    wire [0:0] sum_198 = syndrome[70];
-    wire flip_198 = (sum_198 >= 1'd1);
-    wire [0:0] sum_199 = syndrome[71];
-    wire flip_199 = (sum_199 >= 1'd1);
-    wire [0:0] sum_200 = syndrome[72];
-    wire flip_200 = (sum_200 >= 1'd1);
-    wire [0:0] sum_201 = syndrome[73];
-    wire flip_201 = (sum_201 >= 1'd1);
-    wire [0:0] sum_202 = syndrome[74];
-    wire flip_202 = (sum_202 >= 1'd1);
-    wire [0:0] sum_203 = syndrome[75];
-    wire flip_203 = (sum_203 >= 1'd1);
-    wire [0:0] sum_204 = syndrome[76];
-    wire flip_204 = (sum_204 >= 1'd1);
-    wire [0:0] sum_205 = syndrome[77];
-    wire flip_205 = (sum_205 >= 1'd1);
-    wire [0:0] sum_206 = syndrome[78];
-    wire flip_206 = (sum_206 >= 1'd1);
-    wire [0:0] sum_207 = syndrome[79];
-    wire flip_207 = (sum_207 >= 1'd1);
-    wire [0:0] sum_208 = syndrome[80];
-    wire flip_208 = (sum_208 >= 1'd1);
-    wire [0:0] sum_209 = syndrome[81];
-    wire flip_209 = (sum_209 >= 1'd1);
-    wire [0:0] sum_210 = syndrome[82];
-    wire flip_210 = (sum_210 >= 1'd1);
-    wire [0:0] sum_211 = syndrome[83];
-    wire flip_211 = (sum_211 >= 1'd1);
-    wire [0:0] sum_212 = syndrome[84];
-    wire flip_212 = (sum_212 >= 1'd1);
-    wire [0:0] sum_213 = syndrome[85];
-    wire flip_213 = (sum_213 >= 1'd1);
-    wire [0:0] sum_214 = syndrome[86];
-    wire flip_214 = (sum_214 >= 1'd1);
-    wire [0:0] sum_215 = syndrome[87];
-    wire flip_215 = (sum_215 >= 1'd1);
-    wire [0:0] sum_216 = syndrome[88];
-    wire flip_216 = (sum_216 >= 1'd1);
-    wire [0:0] sum_217 = syndrome[89];
-    wire flip_217 = (sum_217 >= 1'd1);
-    wire [0:0] sum_218 = syndrome[90];
-    wire flip_218 = (sum_218 >= 1'd1);
-    wire [0:0] sum_219 = syndrome[91];
-    wire flip_219 = (sum_219 >= 1'd1);
-    wire [0:0] sum_220 = syndrome[92];
-    wire flip_220 = (sum_220 >= 1'd1);
-    wire [0:0] sum_221 = syndrome[93];
-    wire flip_221 = (sum_221 >= 1'd1);
-    wire [0:0] sum_222 = syndrome[94];
-    wire flip_222 = (sum_222 >= 1'd1);
-    wire [0:0] sum_223 = syndrome[95];
-    wire flip_223 = (sum_223 >= 1'd1);
-    wire [0:0] sum_224 = syndrome[96];
-    wire flip_224 = (sum_224 >= 1'd1);
-    wire [0:0] sum_225 = syndrome[97];
-    wire flip_225 = (sum_225 >= 1'd1);
-    wire [0:0] sum_226 = syndrome[98];
-    wire flip_226 = (sum_226 >= 1'd1);
-    wire [0:0] sum_227 = syndrome[99];
-    wire flip_227 = (sum_227 >= 1'd1);
-    wire [0:0] sum_228 = syndrome[100];
-    wire flip_228 = (sum_228 >= 1'd1);
-    wire [0:0] sum_229 = syndrome[101];
-    wire flip_229 = (sum_229 >= 1'd1);
-    wire [0:0] sum_230 = syndrome[102];
-    wire flip_230 = (sum_230 >= 1'd1);
-    wire [0:0] sum_231 = syndrome[103];
-    wire flip_231 = (sum_231 >= 1'd1);
-    wire [0:0] sum_232 = syndrome[104];
-    wire flip_232 = (sum_232 >= 1'd1);
-    wire [0:0] sum_233 = syndrome[105];
-    wire flip_233 = (sum_233 >= 1'd1);
-    wire [0:0] sum_234 = syndrome[106];
-    wire flip_234 = (sum_234 >= 1'd1);
-    wire [0:0] sum_235 = syndrome[107];
-    wire flip_235 = (sum_235 >= 1'd1);
-    wire [0:0] sum_236 = syndrome[108];
-    wire flip_236 = (sum_236 >= 1'd1);
-    wire [0:0] sum_237 = syndrome[109];
-    wire flip_237 = (sum_237 >= 1'd1);
-    wire [0:0] sum_238 = syndrome[110];
-    wire flip_238 = (sum_238 >= 1'd1);
-    wire [0:0] sum_239 = syndrome[111];
-    wire flip_239 = (sum_239 >= 1'd1);
-    wire [0:0] sum_240 = syndrome[112];
-    wire flip_240 = (sum_240 >= 1'd1);
-    wire [0:0] sum_241 = syndrome[113];
-    wire flip_241 = (sum_241 >= 1'd1);
-    wire [0:0] sum_242 = syndrome[114];
-    wire flip_242 = (sum_242 >= 1'd1);
-    wire [0:0] sum_243 = syndrome[115];
-    wire flip_243 = (sum_243 >= 1'd1);
-    wire [0:0] sum_244 = syndrome[116];
-    wire flip_244 = (sum_244 >= 1'd1);
-    wire [0:0] sum_245 = syndrome[117];
-    wire flip_245 = (sum_245 >= 1'd1);
-    wire [0:0] sum_246 = syndrome[118];
-    wire flip_246 = (sum_246 >= 1'd1);
-    wire [0:0] sum_247 = syndrome[119];
-    wire flip_247 = (sum_247 >= 1'd1);
-    wire [0:0] sum_248 = syndrome[120];
-    wire flip_248 = (sum_248 >= 1'd1);
-    wire [0:0] sum_249 = syndrome[121];
-    wire flip_249 = (sum_249 >= 1'd1);
-    wire [0:0] sum_250 = syndrome[122];
-    wire flip_250 = (sum_250 >= 1'd1);
-    wire [0:0] sum_251 = syndrome[123];
-    wire flip_251 = (sum_251 >= 1'd1);
-    wire [0:0] sum_252 = syndrome[124];
-    wire flip_252 = (sum_252 >= 1'd1);
-    wire [0:0] sum_253 = syndrome[125];
-    wire flip_253 = (sum_253 >= 1'd1);
-    wire [0:0] sum_254 = syndrome[126];
-    wire flip_254 = (sum_254 >= 1'd1);
-    wire [0:0] sum_255 = syndrome[127];
-    wire flip_255 = (sum_255 >= 1'd1);
+    wire [1:0] sum_0 = { 1'd0, syndrome[24] } + { 1'd0, syndrome[40] } + { 1'd0, syndrome[86] };
+    wire [1:0] sum_1 = { 1'd0, syndrome[74] } + { 1'd0, syndrome[89] } + { 1'd0, syndrome[108] };
+    wire [1:0] sum_2 = { 1'd0, syndrome[6] } + { 1'd0, syndrome[52] } + { 1'd0, syndrome[79] };
+    wire [1:0] sum_3 = { 1'd0, syndrome[55] } + { 1'd0, syndrome[62] } + { 1'd0, syndrome[121] };
+    wire [1:0] sum_4 = { 1'd0, syndrome[11] } + { 1'd0, syndrome[58] } + { 1'd0, syndrome[92] };
+    wire [1:0] sum_5 = { 1'd0, syndrome[60] } + { 1'd0, syndrome[107] } + { 1'd0, syndrome[123] };
+    wire [1:0] sum_6 = { 1'd0, syndrome[25] } + { 1'd0, syndrome[46] } + { 1'd0, syndrome[91] };
+    wire [1:0] sum_7 = { 1'd0, syndrome[31] } + { 1'd0, syndrome[44] } + { 1'd0, syndrome[75] };
+    wire [1:0] sum_8 = { 1'd0, syndrome[36] } + { 1'd0, syndrome[104] } + { 1'd0, syndrome[125] };
+    wire [1:0] sum_9 = { 1'd0, syndrome[2] } + { 1'd0, syndrome[91] } + { 1'd0, syndrome[104] };
+    wire [1:0] sum_10 = { 1'd0, syndrome[6] } + { 1'd0, syndrome[31] } + { 1'd0, syndrome[115] };
+    wire [1:0] sum_11 = { 1'd0, syndrome[39] } + { 1'd0, syndrome[41] } + { 1'd0, syndrome[91] };
+    wire [1:0] sum_12 = { 1'd0, syndrome[39] } + { 1'd0, syndrome[81] } + { 1'd0, syndrome[87] };
+    wire [1:0] sum_13 = { 1'd0, syndrome[50] } + { 1'd0, syndrome[54] } + { 1'd0, syndrome[105] };
+    wire [1:0] sum_14 = { 1'd0, syndrome[28] } + { 1'd0, syndrome[50] } + { 1'd0, syndrome[86] };
+    wire [1:0] sum_15 = { 1'd0, syndrome[73] } + { 1'd0, syndrome[89] } + { 1'd0, syndrome[93] };
+    wire [1:0] sum_16 = { 1'd0, syndrome[12] } + { 1'd0, syndrome[14] } + { 1'd0, syndrome[55] };
+    wire [1:0] sum_17 = { 1'd0, syndrome[30] } + { 1'd0, syndrome[81] } + { 1'd0, syndrome[113] };
+    wire [1:0] sum_18 = { 1'd0, syndrome[20] } + { 1'd0, syndrome[101] } + { 1'd0, syndrome[115] };
+    wire [1:0] sum_19 = { 1'd0, syndrome[5] } + { 1'd0, syndrome[64] } + { 1'd0, syndrome[105] };
+    wire [1:0] sum_20 = { 1'd0, syndrome[2] } + { 1'd0, syndrome[108] } + { 1'd0, syndrome[121] };
+    wire [1:0] sum_21 = { 1'd0, syndrome[92] } + { 1'd0, syndrome[98] } + { 1'd0, syndrome[125] };
+    wire [1:0] sum_22 = { 1'd0, syndrome[8] } + { 1'd0, syndrome[93] } + { 1'd0, syndrome[120] };
+    wire [1:0] sum_23 = { 1'd0, syndrome[9] } + { 1'd0, syndrome[60] } + { 1'd0, syndrome[111] };
+    wire [1:0] sum_24 = { 1'd0, syndrome[30] } + { 1'd0, syndrome[102] } + { 1'd0, syndrome[112] };
+    wire [1:0] sum_25 = { 1'd0, syndrome[34] } + { 1'd0, syndrome[66] } + { 1'd0, syndrome[88] };
+    wire [1:0] sum_26 = { 1'd0, syndrome[47] } + { 1'd0, syndrome[62] } + { 1'd0, syndrome[69] };
+    wire [1:0] sum_27 = { 1'd0, syndrome[3] } + { 1'd0, syndrome[51] } + { 1'd0, syndrome[68] };
+    wire [1:0] sum_28 = { 1'd0, syndrome[24] } + { 1'd0, syndrome[73] } + { 1'd0, syndrome[102] };
+    wire [1:0] sum_29 = { 1'd0, syndrome[4] } + { 1'd0, syndrome[75] } + { 1'd0, syndrome[76] };
+    wire [1:0] sum_30 = { 1'd0, syndrome[58] } + { 1'd0, syndrome[87] } + { 1'd0, syndrome[113] };
+    wire [1:0] sum_31 = { 1'd0, syndrome[72] } + { 1'd0, syndrome[87] } + { 1'd0, syndrome[109] };
+    wire [1:0] sum_32 = { 1'd0, syndrome[45] } + { 1'd0, syndrome[75] } + { 1'd0, syndrome[107] };
+    wire [1:0] sum_33 = { 1'd0, syndrome[56] } + { 1'd0, syndrome[83] } + { 1'd0, syndrome[115] };
+    wire [1:0] sum_34 = { 1'd0, syndrome[4] } + { 1'd0, syndrome[66] } + { 1'd0, syndrome[108] };
+    wire [1:0] sum_35 = { 1'd0, syndrome[19] } + { 1'd0, syndrome[80] } + { 1'd0, syndrome[82] };
+    wire [1:0] sum_36 = { 1'd0, syndrome[96] } + { 1'd0, syndrome[109] } + { 1'd0, syndrome[124] };
+    wire [1:0] sum_37 = { 1'd0, syndrome[42] } + { 1'd0, syndrome[61] } + { 1'd0, syndrome[97] };
+    wire [1:0] sum_38 = { 1'd0, syndrome[1] } + { 1'd0, syndrome[14] } + { 1'd0, syndrome[123] };
+    wire [1:0] sum_39 = { 1'd0, syndrome[30] } + { 1'd0, syndrome[56] } + { 1'd0, syndrome[107] };
+    wire [1:0] sum_40 = { 1'd0, syndrome[4] } + { 1'd0, syndrome[15] } + { 1'd0, syndrome[62] };
+    wire [1:0] sum_41 = { 1'd0, syndrome[7] } + { 1'd0, syndrome[26] } + { 1'd0, syndrome[110] };
+    wire [1:0] sum_42 = { 1'd0, syndrome[26] } + { 1'd0, syndrome[42] } + { 1'd0, syndrome[60] };
+    wire [1:0] sum_43 = { 1'd0, syndrome[20] } + { 1'd0, syndrome[25] } + { 1'd0, syndrome[76] };
+    wire [1:0] sum_44 = { 1'd0, syndrome[16] } + { 1'd0, syndrome[39] } + { 1'd0, syndrome[95] };
+    wire [1:0] sum_45 = { 1'd0, syndrome[22] } + { 1'd0, syndrome[60] } + { 1'd0, syndrome[124] };
+    wire [1:0] sum_46 = { 1'd0, syndrome[20] } + { 1'd0, syndrome[93] } + { 1'd0, syndrome[94] };
+    wire [1:0] sum_47 = { 1'd0, syndrome[4] } + { 1'd0, syndrome[18] } + { 1'd0, syndrome[35] };
+    wire [1:0] sum_48 = { 1'd0, syndrome[23] } + { 1'd0, syndrome[63] } + { 1'd0, syndrome[75] };
+    wire [1:0] sum_49 = { 1'd0, syndrome[5] } + { 1'd0, syndrome[34] } + { 1'd0, syndrome[49] };
+    wire [1:0] sum_50 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[76] } + { 1'd0, syndrome[96] };
+    wire [1:0] sum_51 = { 1'd0, syndrome[11] } + { 1'd0, syndrome[107] } + { 1'd0, syndrome[112] };
+    wire [1:0] sum_52 = { 1'd0, syndrome[70] } + { 1'd0, syndrome[82] } + { 1'd0, syndrome[114] };
+    wire [1:0] sum_53 = { 1'd0, syndrome[43] } + { 1'd0, syndrome[48] } + { 1'd0, syndrome[80] };
+    wire [1:0] sum_54 = { 1'd0, syndrome[50] } + { 1'd0, syndrome[62] } + { 1'd0, syndrome[71] };
+    wire [1:0] sum_55 = { 1'd0, syndrome[26] } + { 1'd0, syndrome[29] } + { 1'd0, syndrome[51] };
+    wire [1:0] sum_56 = { 1'd0, syndrome[14] } + { 1'd0, syndrome[47] } + { 1'd0, syndrome[90] };
+    wire [1:0] sum_57 = { 1'd0, syndrome[8] } + { 1'd0, syndrome[84] } + { 1'd0, syndrome[109] };
+    wire [1:0] sum_58 = { 1'd0, syndrome[45] } + { 1'd0, syndrome[47] } + { 1'd0, syndrome[114] };
+    wire [1:0] sum_59 = { 1'd0, syndrome[77] } + { 1'd0, syndrome[94] } + { 1'd0, syndrome[116] };
+    wire [1:0] sum_60 = { 1'd0, syndrome[10] } + { 1'd0, syndrome[35] } + { 1'd0, syndrome[41] };
+    wire [1:0] sum_61 = { 1'd0, syndrome[23] } + { 1'd0, syndrome[62] } + { 1'd0, syndrome[63] };
+    wire [1:0] sum_62 = { 1'd0, syndrome[6] } + { 1'd0, syndrome[68] } + { 1'd0, syndrome[101] };
+    wire [1:0] sum_63 = { 1'd0, syndrome[31] } + { 1'd0, syndrome[60] } + { 1'd0, syndrome[66] };
+    wire [1:0] sum_64 = { 1'd0, syndrome[7] } + { 1'd0, syndrome[28] } + { 1'd0, syndrome[68] };
+    wire [1:0] sum_65 = { 1'd0, syndrome[1] } + { 1'd0, syndrome[6] } + { 1'd0, syndrome[61] };
+    wire [1:0] sum_66 = { 1'd0, syndrome[12] } + { 1'd0, syndrome[69] } + { 1'd0, syndrome[98] };
+    wire [1:0] sum_67 = { 1'd0, syndrome[66] } + { 1'd0, syndrome[108] } + { 1'd0, syndrome[124] };
+    wire [1:0] sum_68 = { 1'd0, syndrome[15] } + { 1'd0, syndrome[59] } + { 1'd0, syndrome[107] };
+    wire [1:0] sum_69 = { 1'd0, syndrome[36] } + { 1'd0, syndrome[117] } + { 1'd0, syndrome[126] };
+    wire [1:0] sum_70 = { 1'd0, syndrome[15] } + { 1'd0, syndrome[67] } + { 1'd0, syndrome[71] };
+    wire [1:0] sum_71 = { 1'd0, syndrome[6] } + { 1'd0, syndrome[66] } + { 1'd0, syndrome[80] };
+    wire [1:0] sum_72 = { 1'd0, syndrome[45] } + { 1'd0, syndrome[53] } + { 1'd0, syndrome[90] };
+    wire [1:0] sum_73 = { 1'd0, syndrome[17] } + { 1'd0, syndrome[62] } + { 1'd0, syndrome[83] };
+    wire [1:0] sum_74 = { 1'd0, syndrome[1] } + { 1'd0, syndrome[90] } + { 1'd0, syndrome[113] };
+    wire [1:0] sum_75 = { 1'd0, syndrome[30] } + { 1'd0, syndrome[90] } + { 1'd0, syndrome[105] };
+    wire [1:0] sum_76 = { 1'd0, syndrome[15] } + { 1'd0, syndrome[93] } + { 1'd0, syndrome[104] };
+    wire [1:0] sum_77 = { 1'd0, syndrome[10] } + { 1'd0, syndrome[36] } + { 1'd0, syndrome[93] };
+    wire [1:0] sum_78 = { 1'd0, syndrome[16] } + { 1'd0, syndrome[43] } + { 1'd0, syndrome[116] };
+    wire [1:0] sum_79 = { 1'd0, syndrome[28] } + { 1'd0, syndrome[68] } + { 1'd0, syndrome[96] };
+    wire [1:0] sum_80 = { 1'd0, syndrome[78] } + { 1'd0, syndrome[80] } + { 1'd0, syndrome[108] };
+    wire [1:0] sum_81 = { 1'd0, syndrome[7] } + { 1'd0, syndrome[55] } + { 1'd0, syndrome[109] };
+    wire [1:0] sum_82 = { 1'd0, syndrome[20] } + { 1'd0, syndrome[82] } + { 1'd0, syndrome[104] };
+    wire [1:0] sum_83 = { 1'd0, syndrome[17] } + { 1'd0, syndrome[32] } + { 1'd0, syndrome[121] };
+    wire [1:0] sum_84 = { 1'd0, syndrome[37] } + { 1'd0, syndrome[38] } + { 1'd0, syndrome[67] };
+    wire [1:0] sum_85 = { 1'd0, syndrome[66] } + { 1'd0, syndrome[72] } + { 1'd0, syndrome[121] };
+    wire [1:0] sum_86 = { 1'd0, syndrome[13] } + { 1'd0, syndrome[76] } + { 1'd0, syndrome[91] };
+    wire [1:0] sum_87 = { 1'd0, syndrome[9] } + { 1'd0, syndrome[17] } + { 1'd0, syndrome[27] };
+    wire [1:0] sum_88 = { 1'd0, syndrome[4] } + { 1'd0, syndrome[31] } + { 1'd0, syndrome[66] };
+    wire [1:0] sum_89 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[25] } + { 1'd0, syndrome[84] };
+    wire [1:0] sum_90 = { 1'd0, syndrome[70] } + { 1'd0, syndrome[75] } + { 1'd0, syndrome[119] };
+    wire [1:0] sum_91 = { 1'd0, syndrome[5] } + { 1'd0, syndrome[69] } + { 1'd0, syndrome[116] };
+    wire [1:0] sum_92 = { 1'd0, syndrome[33] } + { 1'd0, syndrome[45] } + { 1'd0, syndrome[109] };
+    wire [1:0] sum_93 = { 1'd0, syndrome[28] } + { 1'd0, syndrome[36] } + { 1'd0, syndrome[102] };
+    wire [1:0] sum_94 = { 1'd0, syndrome[12] } + { 1'd0, syndrome[103] } + { 1'd0, syndrome[127] };
+    wire [1:0] sum_95 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[82] } + { 1'd0, syndrome[101] };
+    wire [1:0] sum_96 = { 1'd0, syndrome[19] } + { 1'd0, syndrome[50] } + { 1'd0, syndrome[77] };
+    wire [1:0] sum_97 = { 1'd0, syndrome[66] } + { 1'd0, syndrome[71] } + { 1'd0, syndrome[79] };
+    wire [1:0] sum_98 = { 1'd0, syndrome[17] } + { 1'd0, syndrome[57] } + { 1'd0, syndrome[112] };
+    wire [1:0] sum_99 = { 1'd0, syndrome[11] } + { 1'd0, syndrome[38] } + { 1'd0, syndrome[54] };
+    wire [1:0] sum_100 = { 1'd0, syndrome[3] } + { 1'd0, syndrome[42] } + { 1'd0, syndrome[112] };
+    wire [1:0] sum_101 = { 1'd0, syndrome[1] } + { 1'd0, syndrome[22] } + { 1'd0, syndrome[50] };
+    wire [1:0] sum_102 = { 1'd0, syndrome[20] } + { 1'd0, syndrome[89] } + { 1'd0, syndrome[110] };
+    wire [1:0] sum_103 = { 1'd0, syndrome[7] } + { 1'd0, syndrome[8] } + { 1'd0, syndrome[84] };
+    wire [1:0] sum_104 = { 1'd0, syndrome[29] } + { 1'd0, syndrome[83] } + { 1'd0, syndrome[109] };
+    wire [1:0] sum_105 = { 1'd0, syndrome[23] } + { 1'd0, syndrome[95] } + { 1'd0, syndrome[101] };
+    wire [1:0] sum_106 = { 1'd0, syndrome[85] } + { 1'd0, syndrome[100] } + { 1'd0, syndrome[105] };
+    wire [1:0] sum_107 = { 1'd0, syndrome[26] } + { 1'd0, syndrome[44] } + { 1'd0, syndrome[73] };
+    wire [1:0] sum_108 = { 1'd0, syndrome[41] } + { 1'd0, syndrome[56] } + { 1'd0, syndrome[74] };
+    wire [1:0] sum_109 = { 1'd0, syndrome[14] } + { 1'd0, syndrome[77] } + { 1'd0, syndrome[119] };
+    wire [1:0] sum_110 = { 1'd0, syndrome[13] } + { 1'd0, syndrome[40] } + { 1'd0, syndrome[69] };
+    wire [1:0] sum_111 = { 1'd0, syndrome[2] } + { 1'd0, syndrome[110] } + { 1'd0, syndrome[119] };
+    wire [1:0] sum_112 = { 1'd0, syndrome[15] } + { 1'd0, syndrome[24] } + { 1'd0, syndrome[87] };
+    wire [1:0] sum_113 = { 1'd0, syndrome[48] } + { 1'd0, syndrome[84] } + { 1'd0, syndrome[106] };
+    wire [1:0] sum_114 = { 1'd0, syndrome[8] } + { 1'd0, syndrome[42] } + { 1'd0, syndrome[123] };
+    wire [1:0] sum_115 = { 1'd0, syndrome[16] } + { 1'd0, syndrome[101] } + { 1'd0, syndrome[125] };
+    wire [1:0] sum_116 = { 1'd0, syndrome[6] } + { 1'd0, syndrome[45] } + { 1'd0, syndrome[94] };
+    wire [1:0] sum_117 = { 1'd0, syndrome[63] } + { 1'd0, syndrome[69] } + { 1'd0, syndrome[82] };
+    wire [1:0] sum_118 = { 1'd0, syndrome[53] } + { 1'd0, syndrome[79] } + { 1'd0, syndrome[80] };
+    wire [1:0] sum_119 = { 1'd0, syndrome[1] } + { 1'd0, syndrome[86] } + { 1'd0, syndrome[118] };
+    wire [1:0] sum_120 = { 1'd0, syndrome[44] } + { 1'd0, syndrome[65] } + { 1'd0, syndrome[90] };
+    wire [1:0] sum_121 = { 1'd0, syndrome[90] } + { 1'd0, syndrome[99] } + { 1'd0, syndrome[114] };
+    wire [1:0] sum_122 = { 1'd0, syndrome[12] } + { 1'd0, syndrome[53] } + { 1'd0, syndrome[71] };
+    wire [1:0] sum_123 = { 1'd0, syndrome[64] } + { 1'd0, syndrome[99] } + { 1'd0, syndrome[120] };
+    wire [1:0] sum_124 = { 1'd0, syndrome[50] } + { 1'd0, syndrome[110] } + { 1'd0, syndrome[111] };
+    wire [1:0] sum_125 = { 1'd0, syndrome[51] } + { 1'd0, syndrome[57] } + { 1'd0, syndrome[103] };
+    wire [1:0] sum_126 = { 1'd0, syndrome[59] } + { 1'd0, syndrome[85] } + { 1'd0, syndrome[95] };
+    wire [1:0] sum_127 = { 1'd0, syndrome[94] } + { 1'd0, syndrome[115] } + { 1'd0, syndrome[121] };
+    wire [1:0] sum_128 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[1] };
+    wire [1:0] sum_129 = { 1'd0, syndrome[1] } + { 1'd0, syndrome[2] };
+    wire [1:0] sum_130 = { 1'd0, syndrome[2] } + { 1'd0, syndrome[3] };
+    wire [1:0] sum_131 = { 1'd0, syndrome[3] } + { 1'd0, syndrome[4] };
+    wire [1:0] sum_132 = { 1'd0, syndrome[4] } + { 1'd0, syndrome[5] };
+    wire [1:0] sum_133 = { 1'd0, syndrome[5] } + { 1'd0, syndrome[6] };
+    wire [1:0] sum_134 = { 1'd0, syndrome[6] } + { 1'd0, syndrome[7] };
+    wire [1:0] sum_135 = { 1'd0, syndrome[7] } + { 1'd0, syndrome[8] };
+    wire [1:0] sum_136 = { 1'd0, syndrome[8] } + { 1'd0, syndrome[9] };
+    wire [1:0] sum_137 = { 1'd0, syndrome[9] } + { 1'd0, syndrome[10] };
+    wire [1:0] sum_138 = { 1'd0, syndrome[10] } + { 1'd0, syndrome[11] };
+    wire [1:0] sum_139 = { 1'd0, syndrome[11] } + { 1'd0, syndrome[12] };
+    wire [1:0] sum_140 = { 1'd0, syndrome[12] } + { 1'd0, syndrome[13] };
+    wire [1:0] sum_141 = { 1'd0, syndrome[13] } + { 1'd0, syndrome[14] };
+    wire [1:0] sum_142 = { 1'd0, syndrome[14] } + { 1'd0, syndrome[15] };
+    wire [1:0] sum_143 = { 1'd0, syndrome[15] } + { 1'd0, syndrome[16] };
+    wire [1:0] sum_144 = { 1'd0, syndrome[16] } + { 1'd0, syndrome[17] };
+    wire [1:0] sum_145 = { 1'd0, syndrome[17] } + { 1'd0, syndrome[18] };
+    wire [1:0] sum_146 = { 1'd0, syndrome[18] } + { 1'd0, syndrome[19] };
+    wire [1:0] sum_147 = { 1'd0, syndrome[19] } + { 1'd0, syndrome[20] };
+    wire [1:0] sum_148 = { 1'd0, syndrome[20] } + { 1'd0, syndrome[21] };
+    wire [1:0] sum_149 = { 1'd0, syndrome[21] } + { 1'd0, syndrome[22] };
+    wire [1:0] sum_150 = { 1'd0, syndrome[22] } + { 1'd0, syndrome[23] };
+    wire [1:0] sum_151 = { 1'd0, syndrome[23] } + { 1'd0, syndrome[24] };
+    wire [1:0] sum_152 = { 1'd0, syndrome[24] } + { 1'd0, syndrome[25] };
+    wire [1:0] sum_153 = { 1'd0, syndrome[25] } + { 1'd0, syndrome[26] };
+    wire [1:0] sum_154 = { 1'd0, syndrome[26] } + { 1'd0, syndrome[27] };
+    wire [1:0] sum_155 = { 1'd0, syndrome[27] } + { 1'd0, syndrome[28] };
+    wire [1:0] sum_156 = { 1'd0, syndrome[28] } + { 1'd0, syndrome[29] };
+    wire [1:0] sum_157 = { 1'd0, syndrome[29] } + { 1'd0, syndrome[30] };
+    wire [1:0] sum_158 = { 1'd0, syndrome[30] } + { 1'd0, syndrome[31] };
+    wire [1:0] sum_159 = { 1'd0, syndrome[31] } + { 1'd0, syndrome[32] };
+    wire [1:0] sum_160 = { 1'd0, syndrome[32] } + { 1'd0, syndrome[33] };
+    wire [1:0] sum_161 = { 1'd0, syndrome[33] } + { 1'd0, syndrome[34] };
+    wire [1:0] sum_162 = { 1'd0, syndrome[34] } + { 1'd0, syndrome[35] };
+    wire [1:0] sum_163 = { 1'd0, syndrome[35] } + { 1'd0, syndrome[36] };
+    wire [1:0] sum_164 = { 1'd0, syndrome[36] } + { 1'd0, syndrome[37] };
+    wire [1:0] sum_165 = { 1'd0, syndrome[37] } + { 1'd0, syndrome[38] };
+    wire [1:0] sum_166 = { 1'd0, syndrome[38] } + { 1'd0, syndrome[39] };
+    wire [1:0] sum_167 = { 1'd0, syndrome[39] } + { 1'd0, syndrome[40] };
+    wire [1:0] sum_168 = { 1'd0, syndrome[40] } + { 1'd0, syndrome[41] };
+    wire [1:0] sum_169 = { 1'd0, syndrome[41] } + { 1'd0, syndrome[42] };
+    wire [1:0] sum_170 = { 1'd0, syndrome[42] } + { 1'd0, syndrome[43] };
+    wire [1:0] sum_171 = { 1'd0, syndrome[43] } + { 1'd0, syndrome[44] };
+    wire [1:0] sum_172 = { 1'd0, syndrome[44] } + { 1'd0, syndrome[45] };
+    wire [1:0] sum_173 = { 1'd0, syndrome[45] } + { 1'd0, syndrome[46] };
+    wire [1:0] sum_174 = { 1'd0, syndrome[46] } + { 1'd0, syndrome[47] };
+    wire [1:0] sum_175 = { 1'd0, syndrome[47] } + { 1'd0, syndrome[48] };
+    wire [1:0] sum_176 = { 1'd0, syndrome[48] } + { 1'd0, syndrome[49] };
+    wire [1:0] sum_177 = { 1'd0, syndrome[49] } + { 1'd0, syndrome[50] };
+    wire [1:0] sum_178 = { 1'd0, syndrome[50] } + { 1'd0, syndrome[51] };
+    wire [1:0] sum_179 = { 1'd0, syndrome[51] } + { 1'd0, syndrome[52] };
+    wire [1:0] sum_180 = { 1'd0, syndrome[52] } + { 1'd0, syndrome[53] };
+    wire [1:0] sum_181 = { 1'd0, syndrome[53] } + { 1'd0, syndrome[54] };
+    wire [1:0] sum_182 = { 1'd0, syndrome[54] } + { 1'd0, syndrome[55] };
+    wire [1:0] sum_183 = { 1'd0, syndrome[55] } + { 1'd0, syndrome[56] };
+    wire [1:0] sum_184 = { 1'd0, syndrome[56] } + { 1'd0, syndrome[57] };
+    wire [1:0] sum_185 = { 1'd0, syndrome[57] } + { 1'd0, syndrome[58] };
+    wire [1:0] sum_186 = { 1'd0, syndrome[58] } + { 1'd0, syndrome[59] };
+    wire [1:0] sum_187 = { 1'd0, syndrome[59] } + { 1'd0, syndrome[60] };
+    wire [1:0] sum_188 = { 1'd0, syndrome[60] } + { 1'd0, syndrome[61] };
+    wire [1:0] sum_189 = { 1'd0, syndrome[61] } + { 1'd0, syndrome[62] };
+    wire [1:0] sum_190 = { 1'd0, syndrome[62] } + { 1'd0, syndrome[63] };
+    wire [1:0] sum_191 = { 1'd0, syndrome[63] } + { 1'd0, syndrome[64] };
+    wire [1:0] sum_192 = { 1'd0, syndrome[64] } + { 1'd0, syndrome[65] };
+    wire [1:0] sum_193 = { 1'd0, syndrome[65] } + { 1'd0, syndrome[66] };
+    wire [1:0] sum_194 = { 1'd0, syndrome[66] } + { 1'd0, syndrome[67] };
+    wire [1:0] sum_195 = { 1'd0, syndrome[67] } + { 1'd0, syndrome[68] };
+    wire [1:0] sum_196 = { 1'd0, syndrome[68] } + { 1'd0, syndrome[69] };
+    wire [1:0] sum_197 = { 1'd0, syndrome[69] } + { 1'd0, syndrome[70] };
+    wire [1:0] sum_198 = { 1'd0, syndrome[70] } + { 1'd0, syndrome[71] };
+    wire [1:0] sum_199 = { 1'd0, syndrome[71] } + { 1'd0, syndrome[72] };
+    wire [1:0] sum_200 = { 1'd0, syndrome[72] } + { 1'd0, syndrome[73] };
+    wire [1:0] sum_201 = { 1'd0, syndrome[73] } + { 1'd0, syndrome[74] };
+    wire [1:0] sum_202 = { 1'd0, syndrome[74] } + { 1'd0, syndrome[75] };
+    wire [1:0] sum_203 = { 1'd0, syndrome[75] } + { 1'd0, syndrome[76] };
+    wire [1:0] sum_204 = { 1'd0, syndrome[76] } + { 1'd0, syndrome[77] };
+    wire [1:0] sum_205 = { 1'd0, syndrome[77] } + { 1'd0, syndrome[78] };
+    wire [1:0] sum_206 = { 1'd0, syndrome[78] } + { 1'd0, syndrome[79] };
+    wire [1:0] sum_207 = { 1'd0, syndrome[79] } + { 1'd0, syndrome[80] };
+    wire [1:0] sum_208 = { 1'd0, syndrome[80] } + { 1'd0, syndrome[81] };
+    wire [1:0] sum_209 = { 1'd0, syndrome[81] } + { 1'd0, syndrome[82] };
+    wire [1:0] sum_210 = { 1'd0, syndrome[82] } + { 1'd0, syndrome[83] };
+    wire [1:0] sum_211 = { 1'd0, syndrome[83] } + { 1'd0, syndrome[84] };
+    wire [1:0] sum_212 = { 1'd0, syndrome[84] } + { 1'd0, syndrome[85] };
+    wire [1:0] sum_213 = { 1'd0, syndrome[85] } + { 1'd0, syndrome[86] };
+    wire [1:0] sum_214 = { 1'd0, syndrome[86] } + { 1'd0, syndrome[87] };
+    wire [1:0] sum_215 = { 1'd0, syndrome[87] } + { 1'd0, syndrome[88] };
+    wire [1:0] sum_216 = { 1'd0, syndrome[88] } + { 1'd0, syndrome[89] };
+    wire [1:0] sum_217 = { 1'd0, syndrome[89] } + { 1'd0, syndrome[90] };
+    wire [1:0] sum_218 = { 1'd0, syndrome[90] } + { 1'd0, syndrome[91] };
+    wire [1:0] sum_219 = { 1'd0, syndrome[91] } + { 1'd0, syndrome[92] };
+    wire [1:0] sum_220 = { 1'd0, syndrome[92] } + { 1'd0, syndrome[93] };
+    wire [1:0] sum_221 = { 1'd0, syndrome[93] } + { 1'd0, syndrome[94] };
+    wire [1:0] sum_222 = { 1'd0, syndrome[94] } + { 1'd0, syndrome[95] };
+    wire [1:0] sum_223 = { 1'd0, syndrome[95] } + { 1'd0, syndrome[96] };
+    wire [1:0] sum_224 = { 1'd0, syndrome[96] } + { 1'd0, syndrome[97] };
+    wire [1:0] sum_225 = { 1'd0, syndrome[97] } + { 1'd0, syndrome[98] };
+    wire [1:0] sum_226 = { 1'd0, syndrome[98] } + { 1'd0, syndrome[99] };
+    wire [1:0] sum_227 = { 1'd0, syndrome[99] } + { 1'd0, syndrome[100] };
+    wire [1:0] sum_228 = { 1'd0, syndrome[100] } + { 1'd0, syndrome[101] };
+    wire [1:0] sum_229 = { 1'd0, syndrome[101] } + { 1'd0, syndrome[102] };
+    wire [1:0] sum_230 = { 1'd0, syndrome[102] } + { 1'd0, syndrome[103] };
+    wire [1:0] sum_231 = { 1'd0, syndrome[103] } + { 1'd0, syndrome[104] };
+    wire [1:0] sum_232 = { 1'd0, syndrome[104] } + { 1'd0, syndrome[105] };
+    wire [1:0] sum_233 = { 1'd0, syndrome[105] } + { 1'd0, syndrome[106] };
+    wire [1:0] sum_234 = { 1'd0, syndrome[106] } + { 1'd0, syndrome[107] };
+    wire [1:0] sum_235 = { 1'd0, syndrome[107] } + { 1'd0, syndrome[108] };
+    wire [1:0] sum_236 = { 1'd0, syndrome[108] } + { 1'd0, syndrome[109] };
+    wire [1:0] sum_237 = { 1'd0, syndrome[109] } + { 1'd0, syndrome[110] };
+    wire [1:0] sum_238 = { 1'd0, syndrome[110] } + { 1'd0, syndrome[111] };
+    wire [1:0] sum_239 = { 1'd0, syndrome[111] } + { 1'd0, syndrome[112] };
+    wire [1:0] sum_240 = { 1'd0, syndrome[112] } + { 1'd0, syndrome[113] };
+    wire [1:0] sum_241 = { 1'd0, syndrome[113] } + { 1'd0, syndrome[114] };
+    wire [1:0] sum_242 = { 1'd0, syndrome[114] } + { 1'd0, syndrome[115] };
+    wire [1:0] sum_243 = { 1'd0, syndrome[115] } + { 1'd0, syndrome[116] };
+    wire [1:0] sum_244 = { 1'd0, syndrome[116] } + { 1'd0, syndrome[117] };
+    wire [1:0] sum_245 = { 1'd0, syndrome[117] } + { 1'd0, syndrome[118] };
+    wire [1:0] sum_246 = { 1'd0, syndrome[118] } + { 1'd0, syndrome[119] };
+    wire [1:0] sum_247 = { 1'd0, syndrome[119] } + { 1'd0, syndrome[120] };
+    wire [1:0] sum_248 = { 1'd0, syndrome[120] } + { 1'd0, syndrome[121] };
+    wire [1:0] sum_249 = { 1'd0, syndrome[121] } + { 1'd0, syndrome[122] };
+    wire [1:0] sum_250 = { 1'd0, syndrome[122] } + { 1'd0, syndrome[123] };
+    wire [1:0] sum_251 = { 1'd0, syndrome[123] } + { 1'd0, syndrome[124] };
+    wire [1:0] sum_252 = { 1'd0, syndrome[124] } + { 1'd0, syndrome[125] };
+    wire [1:0] sum_253 = { 1'd0, syndrome[125] } + { 1'd0, syndrome[126] };
+    wire [1:0] sum_254 = { 1'd0, syndrome[126] } + { 1'd0, syndrome[127] };
+    wire [1:0] sum_255 = { 1'd0, syndrome[127] };
+    wire [1:0] best_votes_0_0 = (sum_0 >= sum_1) ? sum_0 : sum_1;
+    wire [7:0] best_idx_0_0 = (sum_0 >= sum_1) ? 8'd0 : 8'd1;
+    wire [1:0] best_votes_0_1 = (sum_2 >= sum_3) ? sum_2 : sum_3;
+    wire [7:0] best_idx_0_1 = (sum_2 >= sum_3) ? 8'd2 : 8'd3;
+    wire [1:0] best_votes_0_2 = (sum_4 >= sum_5) ? sum_4 : sum_5;
+    wire [7:0] best_idx_0_2 = (sum_4 >= sum_5) ? 8'd4 : 8'd5;
+    wire [1:0] best_votes_0_3 = (sum_6 >= sum_7) ? sum_6 : sum_7;
+    wire [7:0] best_idx_0_3 = (sum_6 >= sum_7) ? 8'd6 : 8'd7;
+    wire [1:0] best_votes_0_4 = (sum_8 >= sum_9) ? sum_8 : sum_9;
+    wire [7:0] best_idx_0_4 = (sum_8 >= sum_9) ? 8'd8 : 8'd9;
+    wire [1:0] best_votes_0_5 = (sum_10 >= sum_11) ? sum_10 : sum_11;
+    wire [7:0] best_idx_0_5 = (sum_10 >= sum_11) ? 8'd10 : 8'd11;
+    wire [1:0] best_votes_0_6 = (sum_12 >= sum_13) ? sum_12 : sum_13;
+    wire [7:0] best_idx_0_6 = (sum_12 >= sum_13) ? 8'd12 : 8'd13;
+    wire [1:0] best_votes_0_7 = (sum_14 >= sum_15) ? sum_14 : sum_15;
+    wire [7:0] best_idx_0_7 = (sum_14 >= sum_15) ? 8'd14 : 8'd15;
+    wire [1:0] best_votes_0_8 = (sum_16 >= sum_17) ? sum_16 : sum_17;
+    wire [7:0] best_idx_0_8 = (sum_16 >= sum_17) ? 8'd16 : 8'd17;
+    wire [1:0] best_votes_0_9 = (sum_18 >= sum_19) ? sum_18 : sum_19;
+    wire [7:0] best_idx_0_9 = (sum_18 >= sum_19) ? 8'd18 : 8'd19;
+    wire [1:0] best_votes_0_10 = (sum_20 >= sum_21) ? sum_20 : sum_21;
+    wire [7:0] best_idx_0_10 = (sum_20 >= sum_21) ? 8'd20 : 8'd21;
+    wire [1:0] best_votes_0_11 = (sum_22 >= sum_23) ? sum_22 : sum_23;
+    wire [7:0] best_idx_0_11 = (sum_22 >= sum_23) ? 8'd22 : 8'd23;
+    wire [1:0] best_votes_0_12 = (sum_24 >= sum_25) ? sum_24 : sum_25;
+    wire [7:0] best_idx_0_12 = (sum_24 >= sum_25) ? 8'd24 : 8'd25;
+    wire [1:0] best_votes_0_13 = (sum_26 >= sum_27) ? sum_26 : sum_27;
+    wire [7:0] best_idx_0_13 = (sum_26 >= sum_27) ? 8'd26 : 8'd27;
+    wire [1:0] best_votes_0_14 = (sum_28 >= sum_29) ? sum_28 : sum_29;
+    wire [7:0] best_idx_0_14 = (sum_28 >= sum_29) ? 8'd28 : 8'd29;
+    wire [1:0] best_votes_0_15 = (sum_30 >= sum_31) ? sum_30 : sum_31;
+    wire [7:0] best_idx_0_15 = (sum_30 >= sum_31) ? 8'd30 : 8'd31;
+    wire [1:0] best_votes_0_16 = (sum_32 >= sum_33) ? sum_32 : sum_33;
+    wire [7:0] best_idx_0_16 = (sum_32 >= sum_33) ? 8'd32 : 8'd33;
+    wire [1:0] best_votes_0_17 = (sum_34 >= sum_35) ? sum_34 : sum_35;
+    wire [7:0] best_idx_0_17 = (sum_34 >= sum_35) ? 8'd34 : 8'd35;
+    wire [1:0] best_votes_0_18 = (sum_36 >= sum_37) ? sum_36 : sum_37;
+    wire [7:0] best_idx_0_18 = (sum_36 >= sum_37) ? 8'd36 : 8'd37;
+    wire [1:0] best_votes_0_19 = (sum_38 >= sum_39) ? sum_38 : sum_39;
+    wire [7:0] best_idx_0_19 = (sum_38 >= sum_39) ? 8'd38 : 8'd39;
+    wire [1:0] best_votes_0_20 = (sum_40 >= sum_41) ? sum_40 : sum_41;
+    wire [7:0] best_idx_0_20 = (sum_40 >= sum_41) ? 8'd40 : 8'd41;
+    wire [1:0] best_votes_0_21 = (sum_42 >= sum_43) ? sum_42 : sum_43;
+    wire [7:0] best_idx_0_21 = (sum_42 >= sum_43) ? 8'd42 : 8'd43;
+    wire [1:0] best_votes_0_22 = (sum_44 >= sum_45) ? sum_44 : sum_45;
+    wire [7:0] best_idx_0_22 = (sum_44 >= sum_45) ? 8'd44 : 8'd45;
+    wire [1:0] best_votes_0_23 = (sum_46 >= sum_47) ? sum_46 : sum_47;
+    wire [7:0] best_idx_0_23 = (sum_46 >= sum_47) ? 8'd46 : 8'd47;
+    wire [1:0] best_votes_0_24 = (sum_48 >= sum_49) ? sum_48 : sum_49;
+    wire [7:0] best_idx_0_24 = (sum_48 >= sum_49) ? 8'd48 : 8'd49;
+    wire [1:0] best_votes_0_25 = (sum_50 >= sum_51) ? sum_50 : sum_51;
+    wire [7:0] best_idx_0_25 = (sum_50 >= sum_51) ? 8'd50 : 8'd51;
+    wire [1:0] best_votes_0_26 = (sum_52 >= sum_53) ? sum_52 : sum_53;
+    wire [7:0] best_idx_0_26 = (sum_52 >= sum_53) ? 8'd52 : 8'd53;
+    wire [1:0] best_votes_0_27 = (sum_54 >= sum_55) ? sum_54 : sum_55;
+    wire [7:0] best_idx_0_27 = (sum_54 >= sum_55) ? 8'd54 : 8'd55;
+    wire [1:0] best_votes_0_28 = (sum_56 >= sum_57) ? sum_56 : sum_57;
+    wire [7:0] best_idx_0_28 = (sum_56 >= sum_57) ? 8'd56 : 8'd57;
+    wire [1:0] best_votes_0_29 = (sum_58 >= sum_59) ? sum_58 : sum_59;
+    wire [7:0] best_idx_0_29 = (sum_58 >= sum_59) ? 8'd58 : 8'd59;
+    wire [1:0] best_votes_0_30 = (sum_60 >= sum_61) ? sum_60 : sum_61;
+    wire [7:0] best_idx_0_30 = (sum_60 >= sum_61) ? 8'd60 : 8'd61;
+    wire [1:0] best_votes_0_31 = (sum_62 >= sum_63) ? sum_62 : sum_63;
+    wire [7:0] best_idx_0_31 = (sum_62 >= sum_63) ? 8'd62 : 8'd63;
+    wire [1:0] best_votes_0_32 = (sum_64 >= sum_65) ? sum_64 : sum_65;
+    wire [7:0] best_idx_0_32 = (sum_64 >= sum_65) ? 8'd64 : 8'd65;
+    wire [1:0] best_votes_0_33 = (sum_66 >= sum_67) ? sum_66 : sum_67;
+    wire [7:0] best_idx_0_33 = (sum_66 >= sum_67) ? 8'd66 : 8'd67;
+    wire [1:0] best_votes_0_34 = (sum_68 >= sum_69) ? sum_68 : sum_69;
+    wire [7:0] best_idx_0_34 = (sum_68 >= sum_69) ? 8'd68 : 8'd69;
+    wire [1:0] best_votes_0_35 = (sum_70 >= sum_71) ? sum_70 : sum_71;
+    wire [7:0] best_idx_0_35 = (sum_70 >= sum_71) ? 8'd70 : 8'd71;
+    wire [1:0] best_votes_0_36 = (sum_72 >= sum_73) ? sum_72 : sum_73;
+    wire [7:0] best_idx_0_36 = (sum_72 >= sum_73) ? 8'd72 : 8'd73;
+    wire [1:0] best_votes_0_37 = (sum_74 >= sum_75) ? sum_74 : sum_75;
+    wire [7:0] best_idx_0_37 = (sum_74 >= sum_75) ? 8'd74 : 8'd75;
+    wire [1:0] best_votes_0_38 = (sum_76 >= sum_77) ? sum_76 : sum_77;
+    wire [7:0] best_idx_0_38 = (sum_76 >= sum_77) ? 8'd76 : 8'd77;
+    wire [1:0] best_votes_0_39 = (sum_78 >= sum_79) ? sum_78 : sum_79;
+    wire [7:0] best_idx_0_39 = (sum_78 >= sum_79) ? 8'd78 : 8'd79;
+    wire [1:0] best_votes_0_40 = (sum_80 >= sum_81) ? sum_80 : sum_81;
+    wire [7:0] best_idx_0_40 = (sum_80 >= sum_81) ? 8'd80 : 8'd81;
+    wire [1:0] best_votes_0_41 = (sum_82 >= sum_83) ? sum_82 : sum_83;
+    wire [7:0] best_idx_0_41 = (sum_82 >= sum_83) ? 8'd82 : 8'd83;
+    wire [1:0] best_votes_0_42 = (sum_84 >= sum_85) ? sum_84 : sum_85;
+    wire [7:0] best_idx_0_42 = (sum_84 >= sum_85) ? 8'd84 : 8'd85;
+    wire [1:0] best_votes_0_43 = (sum_86 >= sum_87) ? sum_86 : sum_87;
+    wire [7:0] best_idx_0_43 = (sum_86 >= sum_87) ? 8'd86 : 8'd87;
+    wire [1:0] best_votes_0_44 = (sum_88 >= sum_89) ? sum_88 : sum_89;
+    wire [7:0] best_idx_0_44 = (sum_88 >= sum_89) ? 8'd88 : 8'd89;
+    wire [1:0] best_votes_0_45 = (sum_90 >= sum_91) ? sum_90 : sum_91;
+    wire [7:0] best_idx_0_45 = (sum_90 >= sum_91) ? 8'd90 : 8'd91;
+    wire [1:0] best_votes_0_46 = (sum_92 >= sum_93) ? sum_92 : sum_93;
+    wire [7:0] best_idx_0_46 = (sum_92 >= sum_93) ? 8'd92 : 8'd93;
+    wire [1:0] best_votes_0_47 = (sum_94 >= sum_95) ? sum_94 : sum_95;
+    wire [7:0] best_idx_0_47 = (sum_94 >= sum_95) ? 8'd94 : 8'd95;
+    wire [1:0] best_votes_0_48 = (sum_96 >= sum_97) ? sum_96 : sum_97;
+    wire [7:0] best_idx_0_48 = (sum_96 >= sum_97) ? 8'd96 : 8'd97;
+    wire [1:0] best_votes_0_49 = (sum_98 >= sum_99) ? sum_98 : sum_99;
+    wire [7:0] best_idx_0_49 = (sum_98 >= sum_99) ? 8'd98 : 8'd99;
+    wire [1:0] best_votes_0_50 = (sum_100 >= sum_101) ? sum_100 : sum_101;
+    wire [7:0] best_idx_0_50 = (sum_100 >= sum_101) ? 8'd100 : 8'd101;
+    wire [1:0] best_votes_0_51 = (sum_102 >= sum_103) ? sum_102 : sum_103;
+    wire [7:0] best_idx_0_51 = (sum_102 >= sum_103) ? 8'd102 : 8'd103;
+    wire [1:0] best_votes_0_52 = (sum_104 >= sum_105) ? sum_104 : sum_105;
+    wire [7:0] best_idx_0_52 = (sum_104 >= sum_105) ? 8'd104 : 8'd105;
+    wire [1:0] best_votes_0_53 = (sum_106 >= sum_107) ? sum_106 : sum_107;
+    wire [7:0] best_idx_0_53 = (sum_106 >= sum_107) ? 8'd106 : 8'd107;
+    wire [1:0] best_votes_0_54 = (sum_108 >= sum_109) ? sum_108 : sum_109;
+    wire [7:0] best_idx_0_54 = (sum_108 >= sum_109) ? 8'd108 : 8'd109;
+    wire [1:0] best_votes_0_55 = (sum_110 >= sum_111) ? sum_110 : sum_111;
+    wire [7:0] best_idx_0_55 = (sum_110 >= sum_111) ? 8'd110 : 8'd111;
+    wire [1:0] best_votes_0_56 = (sum_112 >= sum_113) ? sum_112 : sum_113;
+    wire [7:0] best_idx_0_56 = (sum_112 >= sum_113) ? 8'd112 : 8'd113;
+    wire [1:0] best_votes_0_57 = (sum_114 >= sum_115) ? sum_114 : sum_115;
+    wire [7:0] best_idx_0_57 = (sum_114 >= sum_115) ? 8'd114 : 8'd115;
+    wire [1:0] best_votes_0_58 = (sum_116 >= sum_117) ? sum_116 : sum_117;
+    wire [7:0] best_idx_0_58 = (sum_116 >= sum_117) ? 8'd116 : 8'd117;
+    wire [1:0] best_votes_0_59 = (sum_118 >= sum_119) ? sum_118 : sum_119;
+    wire [7:0] best_idx_0_59 = (sum_118 >= sum_119) ? 8'd118 : 8'd119;
+    wire [1:0] best_votes_0_60 = (sum_120 >= sum_121) ? sum_120 : sum_121;
+    wire [7:0] best_idx_0_60 = (sum_120 >= sum_121) ? 8'd120 : 8'd121;
+    wire [1:0] best_votes_0_61 = (sum_122 >= sum_123) ? sum_122 : sum_123;
+    wire [7:0] best_idx_0_61 = (sum_122 >= sum_123) ? 8'd122 : 8'd123;
+    wire [1:0] best_votes_0_62 = (sum_124 >= sum_125) ? sum_124 : sum_125;
+    wire [7:0] best_idx_0_62 = (sum_124 >= sum_125) ? 8'd124 : 8'd125;
+    wire [1:0] best_votes_0_63 = (sum_126 >= sum_127) ? sum_126 : sum_127;
+    wire [7:0] best_idx_0_63 = (sum_126 >= sum_127) ? 8'd126 : 8'd127;
+    wire [1:0] best_votes_0_64 = (sum_128 >= sum_129) ? sum_128 : sum_129;
+    wire [7:0] best_idx_0_64 = (sum_128 >= sum_129) ? 8'd128 : 8'd129;
+    wire [1:0] best_votes_0_65 = (sum_130 >= sum_131) ? sum_130 : sum_131;
+    wire [7:0] best_idx_0_65 = (sum_130 >= sum_131) ? 8'd130 : 8'd131;
+    wire [1:0] best_votes_0_66 = (sum_132 >= sum_133) ? sum_132 : sum_133;
+    wire [7:0] best_idx_0_66 = (sum_132 >= sum_133) ? 8'd132 : 8'd133;
+    wire [1:0] best_votes_0_67 = (sum_134 >= sum_135) ? sum_134 : sum_135;
+    wire [7:0] best_idx_0_67 = (sum_134 >= sum_135) ? 8'd134 : 8'd135;
+    wire [1:0] best_votes_0_68 = (sum_136 >= sum_137) ? sum_136 : sum_137;
+    wire [7:0] best_idx_0_68 = (sum_136 >= sum_137) ? 8'd136 : 8'd137;
+    wire [1:0] best_votes_0_69 = (sum_138 >= sum_139) ? sum_138 : sum_139;
+    wire [7:0] best_idx_0_69 = (sum_138 >= sum_139) ? 8'd138 : 8'd139;
+    wire [1:0] best_votes_0_70 = (sum_140 >= sum_141) ? sum_140 : sum_141;
+    wire [7:0] best_idx_0_70 = (sum_140 >= sum_141) ? 8'd140 : 8'd141;
+    wire [1:0] best_votes_0_71 = (sum_142 >= sum_143) ? sum_142 : sum_143;
+    wire [7:0] best_idx_0_71 = (sum_142 >= sum_143) ? 8'd142 : 8'd143;
+    wire [1:0] best_votes_0_72 = (sum_144 >= sum_145) ? sum_144 : sum_145;
+    wire [7:0] best_idx_0_72 = (sum_144 >= sum_145) ? 8'd144 : 8'd145;
+    wire [1:0] best_votes_0_73 = (sum_146 >= sum_147) ? sum_146 : sum_147;
+    wire [7:0] best_idx_0_73 = (sum_146 >= sum_147) ? 8'd146 : 8'd147;
+    wire [1:0] best_votes_0_74 = (sum_148 >= sum_149) ? sum_148 : sum_149;
+    wire [7:0] best_idx_0_74 = (sum_148 >= sum_149) ? 8'd148 : 8'd149;
+    wire [1:0] best_votes_0_75 = (sum_150 >= sum_151) ? sum_150 : sum_151;
+    wire [7:0] best_idx_0_75 = (sum_150 >= sum_151) ? 8'd150 : 8'd151;
+    wire [1:0] best_votes_0_76 = (sum_152 >= sum_153) ? sum_152 : sum_153;
+    wire [7:0] best_idx_0_76 = (sum_152 >= sum_153) ? 8'd152 : 8'd153;
+    wire [1:0] best_votes_0_77 = (sum_154 >= sum_155) ? sum_154 : sum_155;
+    wire [7:0] best_idx_0_77 = (sum_154 >= sum_155) ? 8'd154 : 8'd155;
+    wire [1:0] best_votes_0_78 = (sum_156 >= sum_157) ? sum_156 : sum_157;
+    wire [7:0] best_idx_0_78 = (sum_156 >= sum_157) ? 8'd156 : 8'd157;
+    wire [1:0] best_votes_0_79 = (sum_158 >= sum_159) ? sum_158 : sum_159;
+    wire [7:0] best_idx_0_79 = (sum_158 >= sum_159) ? 8'd158 : 8'd159;
+    wire [1:0] best_votes_0_80 = (sum_160 >= sum_161) ? sum_160 : sum_161;
+    wire [7:0] best_idx_0_80 = (sum_160 >= sum_161) ? 8'd160 : 8'd161;
+    wire [1:0] best_votes_0_81 = (sum_162 >= sum_163) ? sum_162 : sum_163;
+    wire [7:0] best_idx_0_81 = (sum_162 >= sum_163) ? 8'd162 : 8'd163;
+    wire [1:0] best_votes_0_82 = (sum_164 >= sum_165) ? sum_164 : sum_165;
+    wire [7:0] best_idx_0_82 = (sum_164 >= sum_165) ? 8'd164 : 8'd165;
+    wire [1:0] best_votes_0_83 = (sum_166 >= sum_167) ? sum_166 : sum_167;
+    wire [7:0] best_idx_0_83 = (sum_166 >= sum_167) ? 8'd166 : 8'd167;
+    wire [1:0] best_votes_0_84 = (sum_168 >= sum_169) ? sum_168 : sum_169;
+    wire [7:0] best_idx_0_84 = (sum_168 >= sum_169) ? 8'd168 : 8'd169;
+    wire [1:0] best_votes_0_85 = (sum_170 >= sum_171) ? sum_170 : sum_171;
+    wire [7:0] best_idx_0_85 = (sum_170 >= sum_171) ? 8'd170 : 8'd171;
+    wire [1:0] best_votes_0_86 = (sum_172 >= sum_173) ? sum_172 : sum_173;
+    wire [7:0] best_idx_0_86 = (sum_172 >= sum_173) ? 8'd172 : 8'd173;
+    wire [1:0] best_votes_0_87 = (sum_174 >= sum_175) ? sum_174 : sum_175;
+    wire [7:0] best_idx_0_87 = (sum_174 >= sum_175) ? 8'd174 : 8'd175;
+    wire [1:0] best_votes_0_88 = (sum_176 >= sum_177) ? sum_176 : sum_177;
+    wire [7:0] best_idx_0_88 = (sum_176 >= sum_177) ? 8'd176 : 8'd177;
+    wire [1:0] best_votes_0_89 = (sum_178 >= sum_179) ? sum_178 : sum_179;
+    wire [7:0] best_idx_0_89 = (sum_178 >= sum_179) ? 8'd178 : 8'd179;
+    wire [1:0] best_votes_0_90 = (sum_180 >= sum_181) ? sum_180 : sum_181;
+    wire [7:0] best_idx_0_90 = (sum_180 >= sum_181) ? 8'd180 : 8'd181;
+    wire [1:0] best_votes_0_91 = (sum_182 >= sum_183) ? sum_182 : sum_183;
+    wire [7:0] best_idx_0_91 = (sum_182 >= sum_183) ? 8'd182 : 8'd183;
+    wire [1:0] best_votes_0_92 = (sum_184 >= sum_185) ? sum_184 : sum_185;
+    wire [7:0] best_idx_0_92 = (sum_184 >= sum_185) ? 8'd184 : 8'd185;
+    wire [1:0] best_votes_0_93 = (sum_186 >= sum_187) ? sum_186 : sum_187;
+    wire [7:0] best_idx_0_93 = (sum_186 >= sum_187) ? 8'd186 : 8'd187;
+    wire [1:0] best_votes_0_94 = (sum_188 >= sum_189) ? sum_188 : sum_189;
+    wire [7:0] best_idx_0_94 = (sum_188 >= sum_189) ? 8'd188 : 8'd189;
+    wire [1:0] best_votes_0_95 = (sum_190 >= sum_191) ? sum_190 : sum_191;
+    wire [7:0] best_idx_0_95 = (sum_190 >= sum_191) ? 8'd190 : 8'd191;
+    wire [1:0] best_votes_0_96 = (sum_192 >= sum_193) ? sum_192 : sum_193;
+    wire [7:0] best_idx_0_96 = (sum_192 >= sum_193) ? 8'd192 : 8'd193;
+    wire [1:0] best_votes_0_97 = (sum_194 >= sum_195) ? sum_194 : sum_195;
+    wire [7:0] best_idx_0_97 = (sum_194 >= sum_195) ? 8'd194 : 8'd195;
+    wire [1:0] best_votes_0_98 = (sum_196 >= sum_197) ? sum_196 : sum_197;
+    wire [7:0] best_idx_0_98 = (sum_196 >= sum_197) ? 8'd196 : 8'd197;
+    wire [1:0] best_votes_0_99 = (sum_198 >= sum_199) ? sum_198 : sum_199;
+    wire [7:0] best_idx_0_99 = (sum_198 >= sum_199) ? 8'd198 : 8'd199;
+    wire [1:0] best_votes_0_100 = (sum_200 >= sum_201) ? sum_200 : sum_201;
+    wire [7:0] best_idx_0_100 = (sum_200 >= sum_201) ? 8'd200 : 8'd201;
+    wire [1:0] best_votes_0_101 = (sum_202 >= sum_203) ? sum_202 : sum_203;
+    wire [7:0] best_idx_0_101 = (sum_202 >= sum_203) ? 8'd202 : 8'd203;
+    wire [1:0] best_votes_0_102 = (sum_204 >= sum_205) ? sum_204 : sum_205;
+    wire [7:0] best_idx_0_102 = (sum_204 >= sum_205) ? 8'd204 : 8'd205;
+    wire [1:0] best_votes_0_103 = (sum_206 >= sum_207) ? sum_206 : sum_207;
+    wire [7:0] best_idx_0_103 = (sum_206 >= sum_207) ? 8'd206 : 8'd207;
+    wire [1:0] best_votes_0_104 = (sum_208 >= sum_209) ? sum_208 : sum_209;
+    wire [7:0] best_idx_0_104 = (sum_208 >= sum_209) ? 8'd208 : 8'd209;
+    wire [1:0] best_votes_0_105 = (sum_210 >= sum_211) ? sum_210 : sum_211;
+    wire [7:0] best_idx_0_105 = (sum_210 >= sum_211) ? 8'd210 : 8'd211;
+    wire [1:0] best_votes_0_106 = (sum_212 >= sum_213) ? sum_212 : sum_213;
+    wire [7:0] best_idx_0_106 = (sum_212 >= sum_213) ? 8'd212 : 8'd213;
+    wire [1:0] best_votes_0_107 = (sum_214 >= sum_215) ? sum_214 : sum_215;
+    wire [7:0] best_idx_0_107 = (sum_214 >= sum_215) ? 8'd214 : 8'd215;
+    wire [1:0] best_votes_0_108 = (sum_216 >= sum_217) ? sum_216 : sum_217;
+    wire [7:0] best_idx_0_108 = (sum_216 >= sum_217) ? 8'd216 : 8'd217;
+    wire [1:0] best_votes_0_109 = (sum_218 >= sum_219) ? sum_218 : sum_219;
+    wire [7:0] best_idx_0_109 = (sum_218 >= sum_219) ? 8'd218 : 8'd219;
+    wire [1:0] best_votes_0_110 = (sum_220 >= sum_221) ? sum_220 : sum_221;
+    wire [7:0] best_idx_0_110 = (sum_220 >= sum_221) ? 8'd220 : 8'd221;
+    wire [1:0] best_votes_0_111 = (sum_222 >= sum_223) ? sum_222 : sum_223;
+    wire [7:0] best_idx_0_111 = (sum_222 >= sum_223) ? 8'd222 : 8'd223;
+    wire [1:0] best_votes_0_112 = (sum_224 >= sum_225) ? sum_224 : sum_225;
+    wire [7:0] best_idx_0_112 = (sum_224 >= sum_225) ? 8'd224 : 8'd225;
+    wire [1:0] best_votes_0_113 = (sum_226 >= sum_227) ? sum_226 : sum_227;
+    wire [7:0] best_idx_0_113 = (sum_226 >= sum_227) ? 8'd226 : 8'd227;
+    wire [1:0] best_votes_0_114 = (sum_228 >= sum_229) ? sum_228 : sum_229;
+    wire [7:0] best_idx_0_114 = (sum_228 >= sum_229) ? 8'd228 : 8'd229;
+    wire [1:0] best_votes_0_115 = (sum_230 >= sum_231) ? sum_230 : sum_231;
+    wire [7:0] best_idx_0_115 = (sum_230 >= sum_231) ? 8'd230 : 8'd231;
+    wire [1:0] best_votes_0_116 = (sum_232 >= sum_233) ? sum_232 : sum_233;
+    wire [7:0] best_idx_0_116 = (sum_232 >= sum_233) ? 8'd232 : 8'd233;
+    wire [1:0] best_votes_0_117 = (sum_234 >= sum_235) ? sum_234 : sum_235;
+    wire [7:0] best_idx_0_117 = (sum_234 >= sum_235) ? 8'd234 : 8'd235;
+    wire [1:0] best_votes_0_118 = (sum_236 >= sum_237) ? sum_236 : sum_237;
+    wire [7:0] best_idx_0_118 = (sum_236 >= sum_237) ? 8'd236 : 8'd237;
+    wire [1:0] best_votes_0_119 = (sum_238 >= sum_239) ? sum_238 : sum_239;
+    wire [7:0] best_idx_0_119 = (sum_238 >= sum_239) ? 8'd238 : 8'd239;
+    wire [1:0] best_votes_0_120 = (sum_240 >= sum_241) ? sum_240 : sum_241;
+    wire [7:0] best_idx_0_120 = (sum_240 >= sum_241) ? 8'd240 : 8'd241;
+    wire [1:0] best_votes_0_121 = (sum_242 >= sum_243) ? sum_242 : sum_243;
+    wire [7:0] best_idx_0_121 = (sum_242 >= sum_243) ? 8'd242 : 8'd243;
+    wire [1:0] best_votes_0_122 = (sum_244 >= sum_245) ? sum_244 : sum_245;
+    wire [7:0] best_idx_0_122 = (sum_244 >= sum_245) ? 8'd244 : 8'd245;
+    wire [1:0] best_votes_0_123 = (sum_246 >= sum_247) ? sum_246 : sum_247;
+    wire [7:0] best_idx_0_123 = (sum_246 >= sum_247) ? 8'd246 : 8'd247;
+    wire [1:0] best_votes_0_124 = (sum_248 >= sum_249) ? sum_248 : sum_249;
+    wire [7:0] best_idx_0_124 = (sum_248 >= sum_249) ? 8'd248 : 8'd249;
+    wire [1:0] best_votes_0_125 = (sum_250 >= sum_251) ? sum_250 : sum_251;
+    wire [7:0] best_idx_0_125 = (sum_250 >= sum_251) ? 8'd250 : 8'd251;
+    wire [1:0] best_votes_0_126 = (sum_252 >= sum_253) ? sum_252 : sum_253;
+    wire [7:0] best_idx_0_126 = (sum_252 >= sum_253) ? 8'd252 : 8'd253;
+    wire [1:0] best_votes_0_127 = (sum_254 >= sum_255) ? sum_254 : sum_255;
+    wire [7:0] best_idx_0_127 = (sum_254 >= sum_255) ? 8'd254 : 8'd255;
+    wire [1:0] best_votes_1_0 = (best_votes_0_0 >= best_votes_0_1) ? best_votes_0_0 : best_votes_0_1;
+    wire [7:0] best_idx_1_0 = (best_votes_0_0 >= best_votes_0_1) ? best_idx_0_0 : best_idx_0_1;
+    wire [1:0] best_votes_1_1 = (best_votes_0_2 >= best_votes_0_3) ? best_votes_0_2 : best_votes_0_3;
+    wire [7:0] best_idx_1_1 = (best_votes_0_2 >= best_votes_0_3) ? best_idx_0_2 : best_idx_0_3;
+    wire [1:0] best_votes_1_2 = (best_votes_0_4 >= best_votes_0_5) ? best_votes_0_4 : best_votes_0_5;
+    wire [7:0] best_idx_1_2 = (best_votes_0_4 >= best_votes_0_5) ? best_idx_0_4 : best_idx_0_5;
+    wire [1:0] best_votes_1_3 = (best_votes_0_6 >= best_votes_0_7) ? best_votes_0_6 : best_votes_0_7;
+    wire [7:0] best_idx_1_3 = (best_votes_0_6 >= best_votes_0_7) ? best_idx_0_6 : best_idx_0_7;
+    wire [1:0] best_votes_1_4 = (best_votes_0_8 >= best_votes_0_9) ? best_votes_0_8 : best_votes_0_9;
+    wire [7:0] best_idx_1_4 = (best_votes_0_8 >= best_votes_0_9) ? best_idx_0_8 : best_idx_0_9;
+    wire [1:0] best_votes_1_5 = (best_votes_0_10 >= best_votes_0_11) ? best_votes_0_10 : best_votes_0_11;
+    wire [7:0] best_idx_1_5 = (best_votes_0_10 >= best_votes_0_11) ? best_idx_0_10 : best_idx_0_11;
+    wire [1:0] best_votes_1_6 = (best_votes_0_12 >= best_votes_0_13) ? best_votes_0_12 : best_votes_0_13;
+    wire [7:0] best_idx_1_6 = (best_votes_0_12 >= best_votes_0_13) ? best_idx_0_12 : best_idx_0_13;
+    wire [1:0] best_votes_1_7 = (best_votes_0_14 >= best_votes_0_15) ? best_votes_0_14 : best_votes_0_15;
+    wire [7:0] best_idx_1_7 = (best_votes_0_14 >= best_votes_0_15) ? best_idx_0_14 : best_idx_0_15;
+    wire [1:0] best_votes_1_8 = (best_votes_0_16 >= best_votes_0_17) ? best_votes_0_16 : best_votes_0_17;
+    wire [7:0] best_idx_1_8 = (best_votes_0_16 >= best_votes_0_17) ? best_idx_0_16 : best_idx_0_17;
+    wire [1:0] best_votes_1_9 = (best_votes_0_18 >= best_votes_0_19) ? best_votes_0_18 : best_votes_0_19;
+    wire [7:0] best_idx_1_9 = (best_votes_0_18 >= best_votes_0_19) ? best_idx_0_18 : best_idx_0_19;
+    wire [1:0] best_votes_1_10 = (best_votes_0_20 >= best_votes_0_21) ? best_votes_0_20 : best_votes_0_21;
+    wire [7:0] best_idx_1_10 = (best_votes_0_20 >= best_votes_0_21) ? best_idx_0_20 : best_idx_0_21;
+    wire [1:0] best_votes_1_11 = (best_votes_0_22 >= best_votes_0_23) ? best_votes_0_22 : best_votes_0_23;
+    wire [7:0] best_idx_1_11 = (best_votes_0_22 >= best_votes_0_23) ? best_idx_0_22 : best_idx_0_23;
+    wire [1:0] best_votes_1_12 = (best_votes_0_24 >= best_votes_0_25) ? best_votes_0_24 : best_votes_0_25;
+    wire [7:0] best_idx_1_12 = (best_votes_0_24 >= best_votes_0_25) ? best_idx_0_24 : best_idx_0_25;
+    wire [1:0] best_votes_1_13 = (best_votes_0_26 >= best_votes_0_27) ? best_votes_0_26 : best_votes_0_27;
+    wire [7:0] best_idx_1_13 = (best_votes_0_26 >= best_votes_0_27) ? best_idx_0_26 : best_idx_0_27;
+    wire [1:0] best_votes_1_14 = (best_votes_0_28 >= best_votes_0_29) ? best_votes_0_28 : best_votes_0_29;
+    wire [7:0] best_idx_1_14 = (best_votes_0_28 >= best_votes_0_29) ? best_idx_0_28 : best_idx_0_29;
+    wire [1:0] best_votes_1_15 = (best_votes_0_30 >= best_votes_0_31) ? best_votes_0_30 : best_votes_0_31;
+    wire [7:0] best_idx_1_15 = (best_votes_0_30 >= best_votes_0_31) ? best_idx_0_30 : best_idx_0_31;
+    wire [1:0] best_votes_1_16 = (best_votes_0_32 >= best_votes_0_33) ? best_votes_0_32 : best_votes_0_33;
+    wire [7:0] best_idx_1_16 = (best_votes_0_32 >= best_votes_0_33) ? best_idx_0_32 : best_idx_0_33;
+    wire [1:0] best_votes_1_17 = (best_votes_0_34 >= best_votes_0_35) ? best_votes_0_34 : best_votes_0_35;
+    wire [7:0] best_idx_1_17 = (best_votes_0_34 >= best_votes_0_35) ? best_idx_0_34 : best_idx_0_35;
+    wire [1:0] best_votes_1_18 = (best_votes_0_36 >= best_votes_0_37) ? best_votes_0_36 : best_votes_0_37;
+    wire [7:0] best_idx_1_18 = (best_votes_0_36 >= best_votes_0_37) ? best_idx_0_36 : best_idx_0_37;
+    wire [1:0] best_votes_1_19 = (best_votes_0_38 >= best_votes_0_39) ? best_votes_0_38 : best_votes_0_39;
+    wire [7:0] best_idx_1_19 = (best_votes_0_38 >= best_votes_0_39) ? best_idx_0_38 : best_idx_0_39;
+    wire [1:0] best_votes_1_20 = (best_votes_0_40 >= best_votes_0_41) ? best_votes_0_40 : best_votes_0_41;
+    wire [7:0] best_idx_1_20 = (best_votes_0_40 >= best_votes_0_41) ? best_idx_0_40 : best_idx_0_41;
+    wire [1:0] best_votes_1_21 = (best_votes_0_42 >= best_votes_0_43) ? best_votes_0_42 : best_votes_0_43;
+    wire [7:0] best_idx_1_21 = (best_votes_0_42 >= best_votes_0_43) ? best_idx_0_42 : best_idx_0_43;
+    wire [1:0] best_votes_1_22 = (best_votes_0_44 >= best_votes_0_45) ? best_votes_0_44 : best_votes_0_45;
+    wire [7:0] best_idx_1_22 = (best_votes_0_44 >= best_votes_0_45) ? best_idx_0_44 : best_idx_0_45;
+    wire [1:0] best_votes_1_23 = (best_votes_0_46 >= best_votes_0_47) ? best_votes_0_46 : best_votes_0_47;
+    wire [7:0] best_idx_1_23 = (best_votes_0_46 >= best_votes_0_47) ? best_idx_0_46 : best_idx_0_47;
+    wire [1:0] best_votes_1_24 = (best_votes_0_48 >= best_votes_0_49) ? best_votes_0_48 : best_votes_0_49;
+    wire [7:0] best_idx_1_24 = (best_votes_0_48 >= best_votes_0_49) ? best_idx_0_48 : best_idx_0_49;
+    wire [1:0] best_votes_1_25 = (best_votes_0_50 >= best_votes_0_51) ? best_votes_0_50 : best_votes_0_51;
+    wire [7:0] best_idx_1_25 = (best_votes_0_50 >= best_votes_0_51) ? best_idx_0_50 : best_idx_0_51;
+    wire [1:0] best_votes_1_26 = (best_votes_0_52 >= best_votes_0_53) ? best_votes_0_52 : best_votes_0_53;
+    wire [7:0] best_idx_1_26 = (best_votes_0_52 >= best_votes_0_53) ? best_idx_0_52 : best_idx_0_53;
+    wire [1:0] best_votes_1_27 = (best_votes_0_54 >= best_votes_0_55) ? best_votes_0_54 : best_votes_0_55;
+    wire [7:0] best_idx_1_27 = (best_votes_0_54 >= best_votes_0_55) ? best_idx_0_54 : best_idx_0_55;
+    wire [1:0] best_votes_1_28 = (best_votes_0_56 >= best_votes_0_57) ? best_votes_0_56 : best_votes_0_57;
+    wire [7:0] best_idx_1_28 = (best_votes_0_56 >= best_votes_0_57) ? best_idx_0_56 : best_idx_0_57;
+    wire [1:0] best_votes_1_29 = (best_votes_0_58 >= best_votes_0_59) ? best_votes_0_58 : best_votes_0_59;
+    wire [7:0] best_idx_1_29 = (best_votes_0_58 >= best_votes_0_59) ? best_idx_0_58 : best_idx_0_59;
+    wire [1:0] best_votes_1_30 = (best_votes_0_60 >= best_votes_0_61) ? best_votes_0_60 : best_votes_0_61;
+    wire [7:0] best_idx_1_30 = (best_votes_0_60 >= best_votes_0_61) ? best_idx_0_60 : best_idx_0_61;
+    wire [1:0] best_votes_1_31 = (best_votes_0_62 >= best_votes_0_63) ? best_votes_0_62 : best_votes_0_63;
+    wire [7:0] best_idx_1_31 = (best_votes_0_62 >= best_votes_0_63) ? best_idx_0_62 : best_idx_0_63;
+    wire [1:0] best_votes_1_32 = (best_votes_0_64 >= best_votes_0_65) ? best_votes_0_64 : best_votes_0_65;
+    wire [7:0] best_idx_1_32 = (best_votes_0_64 >= best_votes_0_65) ? best_idx_0_64 : best_idx_0_65;
+    wire [1:0] best_votes_1_33 = (best_votes_0_66 >= best_votes_0_67) ? best_votes_0_66 : best_votes_0_67;
+    wire [7:0] best_idx_1_33 = (best_votes_0_66 >= best_votes_0_67) ? best_idx_0_66 : best_idx_0_67;
+    wire [1:0] best_votes_1_34 = (best_votes_0_68 >= best_votes_0_69) ? best_votes_0_68 : best_votes_0_69;
+    wire [7:0] best_idx_1_34 = (best_votes_0_68 >= best_votes_0_69) ? best_idx_0_68 : best_idx_0_69;
+    wire [1:0] best_votes_1_35 = (best_votes_0_70 >= best_votes_0_71) ? best_votes_0_70 : best_votes_0_71;
+    wire [7:0] best_idx_1_35 = (best_votes_0_70 >= best_votes_0_71) ? best_idx_0_70 : best_idx_0_71;
+    wire [1:0] best_votes_1_36 = (best_votes_0_72 >= best_votes_0_73) ? best_votes_0_72 : best_votes_0_73;
+    wire [7:0] best_idx_1_36 = (best_votes_0_72 >= best_votes_0_73) ? best_idx_0_72 : best_idx_0_73;
+    wire [1:0] best_votes_1_37 = (best_votes_0_74 >= best_votes_0_75) ? best_votes_0_74 : best_votes_0_75;
+    wire [7:0] best_idx_1_37 = (best_votes_0_74 >= best_votes_0_75) ? best_idx_0_74 : best_idx_0_75;
+    wire [1:0] best_votes_1_38 = (best_votes_0_76 >= best_votes_0_77) ? best_votes_0_76 : best_votes_0_77;
+    wire [7:0] best_idx_1_38 = (best_votes_0_76 >= best_votes_0_77) ? best_idx_0_76 : best_idx_0_77;
+    wire [1:0] best_votes_1_39 = (best_votes_0_78 >= best_votes_0_79) ? best_votes_0_78 : best_votes_0_79;
+    wire [7:0] best_idx_1_39 = (best_votes_0_78 >= best_votes_0_79) ? best_idx_0_78 : best_idx_0_79;
+    wire [1:0] best_votes_1_40 = (best_votes_0_80 >= best_votes_0_81) ? best_votes_0_80 : best_votes_0_81;
+    wire [7:0] best_idx_1_40 = (best_votes_0_80 >= best_votes_0_81) ? best_idx_0_80 : best_idx_0_81;
+    wire [1:0] best_votes_1_41 = (best_votes_0_82 >= best_votes_0_83) ? best_votes_0_82 : best_votes_0_83;
+    wire [7:0] best_idx_1_41 = (best_votes_0_82 >= best_votes_0_83) ? best_idx_0_82 : best_idx_0_83;
+    wire [1:0] best_votes_1_42 = (best_votes_0_84 >= best_votes_0_85) ? best_votes_0_84 : best_votes_0_85;
+    wire [7:0] best_idx_1_42 = (best_votes_0_84 >= best_votes_0_85) ? best_idx_0_84 : best_idx_0_85;
+    wire [1:0] best_votes_1_43 = (best_votes_0_86 >= best_votes_0_87) ? best_votes_0_86 : best_votes_0_87;
+    wire [7:0] best_idx_1_43 = (best_votes_0_86 >= best_votes_0_87) ? best_idx_0_86 : best_idx_0_87;
+    wire [1:0] best_votes_1_44 = (best_votes_0_88 >= best_votes_0_89) ? best_votes_0_88 : best_votes_0_89;
+    wire [7:0] best_idx_1_44 = (best_votes_0_88 >= best_votes_0_89) ? best_idx_0_88 : best_idx_0_89;
+    wire [1:0] best_votes_1_45 = (best_votes_0_90 >= best_votes_0_91) ? best_votes_0_90 : best_votes_0_91;
+    wire [7:0] best_idx_1_45 = (best_votes_0_90 >= best_votes_0_91) ? best_idx_0_90 : best_idx_0_91;
+    wire [1:0] best_votes_1_46 = (best_votes_0_92 >= best_votes_0_93) ? best_votes_0_92 : best_votes_0_93;
+    wire [7:0] best_idx_1_46 = (best_votes_0_92 >= best_votes_0_93) ? best_idx_0_92 : best_idx_0_93;
+    wire [1:0] best_votes_1_47 = (best_votes_0_94 >= best_votes_0_95) ? best_votes_0_94 : best_votes_0_95;
+    wire [7:0] best_idx_1_47 = (best_votes_0_94 >= best_votes_0_95) ? best_idx_0_94 : best_idx_0_95;
+    wire [1:0] best_votes_1_48 = (best_votes_0_96 >= best_votes_0_97) ? best_votes_0_96 : best_votes_0_97;
+    wire [7:0] best_idx_1_48 = (best_votes_0_96 >= best_votes_0_97) ? best_idx_0_96 : best_idx_0_97;
+    wire [1:0] best_votes_1_49 = (best_votes_0_98 >= best_votes_0_99) ? best_votes_0_98 : best_votes_0_99;
+    wire [7:0] best_idx_1_49 = (best_votes_0_98 >= best_votes_0_99) ? best_idx_0_98 : best_idx_0_99;
+    wire [1:0] best_votes_1_50 = (best_votes_0_100 >= best_votes_0_101) ? best_votes_0_100 : best_votes_0_101;
+    wire [7:0] best_idx_1_50 = (best_votes_0_100 >= best_votes_0_101) ? best_idx_0_100 : best_idx_0_101;
+    wire [1:0] best_votes_1_51 = (best_votes_0_102 >= best_votes_0_103) ? best_votes_0_102 : best_votes_0_103;
+    wire [7:0] best_idx_1_51 = (best_votes_0_102 >= best_votes_0_103) ? best_idx_0_102 : best_idx_0_103;
+    wire [1:0] best_votes_1_52 = (best_votes_0_104 >= best_votes_0_105) ? best_votes_0_104 : best_votes_0_105;
+    wire [7:0] best_idx_1_52 = (best_votes_0_104 >= best_votes_0_105) ? best_idx_0_104 : best_idx_0_105;
+    wire [1:0] best_votes_1_53 = (best_votes_0_106 >= best_votes_0_107) ? best_votes_0_106 : best_votes_0_107;
+    wire [7:0] best_idx_1_53 = (best_votes_0_106 >= best_votes_0_107) ? best_idx_0_106 : best_idx_0_107;
+    wire [1:0] best_votes_1_54 = (best_votes_0_108 >= best_votes_0_109) ? best_votes_0_108 : best_votes_0_109;
+    wire [7:0] best_idx_1_54 = (best_votes_0_108 >= best_votes_0_109) ? best_idx_0_108 : best_idx_0_109;
+    wire [1:0] best_votes_1_55 = (best_votes_0_110 >= best_votes_0_111) ? best_votes_0_110 : best_votes_0_111;
+    wire [7:0] best_idx_1_55 = (best_votes_0_110 >= best_votes_0_111) ? best_idx_0_110 : best_idx_0_111;
+    wire [1:0] best_votes_1_56 = (best_votes_0_112 >= best_votes_0_113) ? best_votes_0_112 : best_votes_0_113;
+    wire [7:0] best_idx_1_56 = (best_votes_0_112 >= best_votes_0_113) ? best_idx_0_112 : best_idx_0_113;
+    wire [1:0] best_votes_1_57 = (best_votes_0_114 >= best_votes_0_115) ? best_votes_0_114 : best_votes_0_115;
+    wire [7:0] best_idx_1_57 = (best_votes_0_114 >= best_votes_0_115) ? best_idx_0_114 : best_idx_0_115;
+    wire [1:0] best_votes_1_58 = (best_votes_0_116 >= best_votes_0_117) ? best_votes_0_116 : best_votes_0_117;
+    wire [7:0] best_idx_1_58 = (best_votes_0_116 >= best_votes_0_117) ? best_idx_0_116 : best_idx_0_117;
+    wire [1:0] best_votes_1_59 = (best_votes_0_118 >= best_votes_0_119) ? best_votes_0_118 : best_votes_0_119;
+    wire [7:0] best_idx_1_59 = (best_votes_0_118 >= best_votes_0_119) ? best_idx_0_118 : best_idx_0_119;
+    wire [1:0] best_votes_1_60 = (best_votes_0_120 >= best_votes_0_121) ? best_votes_0_120 : best_votes_0_121;
+    wire [7:0] best_idx_1_60 = (best_votes_0_120 >= best_votes_0_121) ? best_idx_0_120 : best_idx_0_121;
+    wire [1:0] best_votes_1_61 = (best_votes_0_122 >= best_votes_0_123) ? best_votes_0_122 : best_votes_0_123;
+    wire [7:0] best_idx_1_61 = (best_votes_0_122 >= best_votes_0_123) ? best_idx_0_122 : best_idx_0_123;
+    wire [1:0] best_votes_1_62 = (best_votes_0_124 >= best_votes_0_125) ? best_votes_0_124 : best_votes_0_125;
+    wire [7:0] best_idx_1_62 = (best_votes_0_124 >= best_votes_0_125) ? best_idx_0_124 : best_idx_0_125;
+    wire [1:0] best_votes_1_63 = (best_votes_0_126 >= best_votes_0_127) ? best_votes_0_126 : best_votes_0_127;
+    wire [7:0] best_idx_1_63 = (best_votes_0_126 >= best_votes_0_127) ? best_idx_0_126 : best_idx_0_127;
+    wire [1:0] best_votes_2_0 = (best_votes_1_0 >= best_votes_1_1) ? best_votes_1_0 : best_votes_1_1;
+    wire [7:0] best_idx_2_0 = (best_votes_1_0 >= best_votes_1_1) ? best_idx_1_0 : best_idx_1_1;
+    wire [1:0] best_votes_2_1 = (best_votes_1_2 >= best_votes_1_3) ? best_votes_1_2 : best_votes_1_3;
+    wire [7:0] best_idx_2_1 = (best_votes_1_2 >= best_votes_1_3) ? best_idx_1_2 : best_idx_1_3;
+    wire [1:0] best_votes_2_2 = (best_votes_1_4 >= best_votes_1_5) ? best_votes_1_4 : best_votes_1_5;
+    wire [7:0] best_idx_2_2 = (best_votes_1_4 >= best_votes_1_5) ? best_idx_1_4 : best_idx_1_5;
+    wire [1:0] best_votes_2_3 = (best_votes_1_6 >= best_votes_1_7) ? best_votes_1_6 : best_votes_1_7;
+    wire [7:0] best_idx_2_3 = (best_votes_1_6 >= best_votes_1_7) ? best_idx_1_6 : best_idx_1_7;
+    wire [1:0] best_votes_2_4 = (best_votes_1_8 >= best_votes_1_9) ? best_votes_1_8 : best_votes_1_9;
+    wire [7:0] best_idx_2_4 = (best_votes_1_8 >= best_votes_1_9) ? best_idx_1_8 : best_idx_1_9;
+    wire [1:0] best_votes_2_5 = (best_votes_1_10 >= best_votes_1_11) ? best_votes_1_10 : best_votes_1_11;
+    wire [7:0] best_idx_2_5 = (best_votes_1_10 >= best_votes_1_11) ? best_idx_1_10 : best_idx_1_11;
+    wire [1:0] best_votes_2_6 = (best_votes_1_12 >= best_votes_1_13) ? best_votes_1_12 : best_votes_1_13;
+    wire [7:0] best_idx_2_6 = (best_votes_1_12 >= best_votes_1_13) ? best_idx_1_12 : best_idx_1_13;
+    wire [1:0] best_votes_2_7 = (best_votes_1_14 >= best_votes_1_15) ? best_votes_1_14 : best_votes_1_15;
+    wire [7:0] best_idx_2_7 = (best_votes_1_14 >= best_votes_1_15) ? best_idx_1_14 : best_idx_1_15;
+    wire [1:0] best_votes_2_8 = (best_votes_1_16 >= best_votes_1_17) ? best_votes_1_16 : best_votes_1_17;
+    wire [7:0] best_idx_2_8 = (best_votes_1_16 >= best_votes_1_17) ? best_idx_1_16 : best_idx_1_17;
+    wire [1:0] best_votes_2_9 = (best_votes_1_18 >= best_votes_1_19) ? best_votes_1_18 : best_votes_1_19;
+    wire [7:0] best_idx_2_9 = (best_votes_1_18 >= best_votes_1_19) ? best_idx_1_18 : best_idx_1_19;
+    wire [1:0] best_votes_2_10 = (best_votes_1_20 >= best_votes_1_21) ? best_votes_1_20 : best_votes_1_21;
+    wire [7:0] best_idx_2_10 = (best_votes_1_20 >= best_votes_1_21) ? best_idx_1_20 : best_idx_1_21;
+    wire [1:0] best_votes_2_11 = (best_votes_1_22 >= best_votes_1_23) ? best_votes_1_22 : best_votes_1_23;
+    wire [7:0] best_idx_2_11 = (best_votes_1_22 >= best_votes_1_23) ? best_idx_1_22 : best_idx_1_23;
+    wire [1:0] best_votes_2_12 = (best_votes_1_24 >= best_votes_1_25) ? best_votes_1_24 : best_votes_1_25;
+    wire [7:0] best_idx_2_12 = (best_votes_1_24 >= best_votes_1_25) ? best_idx_1_24 : best_idx_1_25;
+    wire [1:0] best_votes_2_13 = (best_votes_1_26 >= best_votes_1_27) ? best_votes_1_26 : best_votes_1_27;
+    wire [7:0] best_idx_2_13 = (best_votes_1_26 >= best_votes_1_27) ? best_idx_1_26 : best_idx_1_27;
+    wire [1:0] best_votes_2_14 = (best_votes_1_28 >= best_votes_1_29) ? best_votes_1_28 : best_votes_1_29;
+    wire [7:0] best_idx_2_14 = (best_votes_1_28 >= best_votes_1_29) ? best_idx_1_28 : best_idx_1_29;
+    wire [1:0] best_votes_2_15 = (best_votes_1_30 >= best_votes_1_31) ? best_votes_1_30 : best_votes_1_31;
+    wire [7:0] best_idx_2_15 = (best_votes_1_30 >= best_votes_1_31) ? best_idx_1_30 : best_idx_1_31;
+    wire [1:0] best_votes_2_16 = (best_votes_1_32 >= best_votes_1_33) ? best_votes_1_32 : best_votes_1_33;
+    wire [7:0] best_idx_2_16 = (best_votes_1_32 >= best_votes_1_33) ? best_idx_1_32 : best_idx_1_33;
+    wire [1:0] best_votes_2_17 = (best_votes_1_34 >= best_votes_1_35) ? best_votes_1_34 : best_votes_1_35;
+    wire [7:0] best_idx_2_17 = (best_votes_1_34 >= best_votes_1_35) ? best_idx_1_34 : best_idx_1_35;
+    wire [1:0] best_votes_2_18 = (best_votes_1_36 >= best_votes_1_37) ? best_votes_1_36 : best_votes_1_37;
+    wire [7:0] best_idx_2_18 = (best_votes_1_36 >= best_votes_1_37) ? best_idx_1_36 : best_idx_1_37;
+    wire [1:0] best_votes_2_19 = (best_votes_1_38 >= best_votes_1_39) ? best_votes_1_38 : best_votes_1_39;
+    wire [7:0] best_idx_2_19 = (best_votes_1_38 >= best_votes_1_39) ? best_idx_1_38 : best_idx_1_39;
+    wire [1:0] best_votes_2_20 = (best_votes_1_40 >= best_votes_1_41) ? best_votes_1_40 : best_votes_1_41;
+    wire [7:0] best_idx_2_20 = (best_votes_1_40 >= best_votes_1_41) ? best_idx_1_40 : best_idx_1_41;
+    wire [1:0] best_votes_2_21 = (best_votes_1_42 >= best_votes_1_43) ? best_votes_1_42 : best_votes_1_43;
+    wire [7:0] best_idx_2_21 = (best_votes_1_42 >= best_votes_1_43) ? best_idx_1_42 : best_idx_1_43;
+    wire [1:0] best_votes_2_22 = (best_votes_1_44 >= best_votes_1_45) ? best_votes_1_44 : best_votes_1_45;
+    wire [7:0] best_idx_2_22 = (best_votes_1_44 >= best_votes_1_45) ? best_idx_1_44 : best_idx_1_45;
+    wire [1:0] best_votes_2_23 = (best_votes_1_46 >= best_votes_1_47) ? best_votes_1_46 : best_votes_1_47;
+    wire [7:0] best_idx_2_23 = (best_votes_1_46 >= best_votes_1_47) ? best_idx_1_46 : best_idx_1_47;
+    wire [1:0] best_votes_2_24 = (best_votes_1_48 >= best_votes_1_49) ? best_votes_1_48 : best_votes_1_49;
+    wire [7:0] best_idx_2_24 = (best_votes_1_48 >= best_votes_1_49) ? best_idx_1_48 : best_idx_1_49;
+    wire [1:0] best_votes_2_25 = (best_votes_1_50 >= best_votes_1_51) ? best_votes_1_50 : best_votes_1_51;
+    wire [7:0] best_idx_2_25 = (best_votes_1_50 >= best_votes_1_51) ? best_idx_1_50 : best_idx_1_51;
+    wire [1:0] best_votes_2_26 = (best_votes_1_52 >= best_votes_1_53) ? best_votes_1_52 : best_votes_1_53;
+    wire [7:0] best_idx_2_26 = (best_votes_1_52 >= best_votes_1_53) ? best_idx_1_52 : best_idx_1_53;
+    wire [1:0] best_votes_2_27 = (best_votes_1_54 >= best_votes_1_55) ? best_votes_1_54 : best_votes_1_55;
+    wire [7:0] best_idx_2_27 = (best_votes_1_54 >= best_votes_1_55) ? best_idx_1_54 : best_idx_1_55;
+    wire [1:0] best_votes_2_28 = (best_votes_1_56 >= best_votes_1_57) ? best_votes_1_56 : best_votes_1_57;
+    wire [7:0] best_idx_2_28 = (best_votes_1_56 >= best_votes_1_57) ? best_idx_1_56 : best_idx_1_57;
+    wire [1:0] best_votes_2_29 = (best_votes_1_58 >= best_votes_1_59) ? best_votes_1_58 : best_votes_1_59;
+    wire [7:0] best_idx_2_29 = (best_votes_1_58 >= best_votes_1_59) ? best_idx_1_58 : best_idx_1_59;
+    wire [1:0] best_votes_2_30 = (best_votes_1_60 >= best_votes_1_61) ? best_votes_1_60 : best_votes_1_61;
+    wire [7:0] best_idx_2_30 = (best_votes_1_60 >= best_votes_1_61) ? best_idx_1_60 : best_idx_1_61;
+    wire [1:0] best_votes_2_31 = (best_votes_1_62 >= best_votes_1_63) ? best_votes_1_62 : best_votes_1_63;
+    wire [7:0] best_idx_2_31 = (best_votes_1_62 >= best_votes_1_63) ? best_idx_1_62 : best_idx_1_63;
+    wire [1:0] best_votes_3_0 = (best_votes_2_0 >= best_votes_2_1) ? best_votes_2_0 : best_votes_2_1;
+    wire [7:0] best_idx_3_0 = (best_votes_2_0 >= best_votes_2_1) ? best_idx_2_0 : best_idx_2_1;
+    wire [1:0] best_votes_3_1 = (best_votes_2_2 >= best_votes_2_3) ? best_votes_2_2 : best_votes_2_3;
+    wire [7:0] best_idx_3_1 = (best_votes_2_2 >= best_votes_2_3) ? best_idx_2_2 : best_idx_2_3;
+    wire [1:0] best_votes_3_2 = (best_votes_2_4 >= best_votes_2_5) ? best_votes_2_4 : best_votes_2_5;
+    wire [7:0] best_idx_3_2 = (best_votes_2_4 >= best_votes_2_5) ? best_idx_2_4 : best_idx_2_5;
+    wire [1:0] best_votes_3_3 = (best_votes_2_6 >= best_votes_2_7) ? best_votes_2_6 : best_votes_2_7;
+    wire [7:0] best_idx_3_3 = (best_votes_2_6 >= best_votes_2_7) ? best_idx_2_6 : best_idx_2_7;
+    wire [1:0] best_votes_3_4 = (best_votes_2_8 >= best_votes_2_9) ? best_votes_2_8 : best_votes_2_9;
+    wire [7:0] best_idx_3_4 = (best_votes_2_8 >= best_votes_2_9) ? best_idx_2_8 : best_idx_2_9;
+    wire [1:0] best_votes_3_5 = (best_votes_2_10 >= best_votes_2_11) ? best_votes_2_10 : best_votes_2_11;
+    wire [7:0] best_idx_3_5 = (best_votes_2_10 >= best_votes_2_11) ? best_idx_2_10 : best_idx_2_11;
+    wire [1:0] best_votes_3_6 = (best_votes_2_12 >= best_votes_2_13) ? best_votes_2_12 : best_votes_2_13;
+    wire [7:0] best_idx_3_6 = (best_votes_2_12 >= best_votes_2_13) ? best_idx_2_12 : best_idx_2_13;
+    wire [1:0] best_votes_3_7 = (best_votes_2_14 >= best_votes_2_15) ? best_votes_2_14 : best_votes_2_15;
+    wire [7:0] best_idx_3_7 = (best_votes_2_14 >= best_votes_2_15) ? best_idx_2_14 : best_idx_2_15;
+    wire [1:0] best_votes_3_8 = (best_votes_2_16 >= best_votes_2_17) ? best_votes_2_16 : best_votes_2_17;
+    wire [7:0] best_idx_3_8 = (best_votes_2_16 >= best_votes_2_17) ? best_idx_2_16 : best_idx_2_17;
+    wire [1:0] best_votes_3_9 = (best_votes_2_18 >= best_votes_2_19) ? best_votes_2_18 : best_votes_2_19;
+    wire [7:0] best_idx_3_9 = (best_votes_2_18 >= best_votes_2_19) ? best_idx_2_18 : best_idx_2_19;
+    wire [1:0] best_votes_3_10 = (best_votes_2_20 >= best_votes_2_21) ? best_votes_2_20 : best_votes_2_21;
+    wire [7:0] best_idx_3_10 = (best_votes_2_20 >= best_votes_2_21) ? best_idx_2_20 : best_idx_2_21;
+    wire [1:0] best_votes_3_11 = (best_votes_2_22 >= best_votes_2_23) ? best_votes_2_22 : best_votes_2_23;
+    wire [7:0] best_idx_3_11 = (best_votes_2_22 >= best_votes_2_23) ? best_idx_2_22 : best_idx_2_23;
+    wire [1:0] best_votes_3_12 = (best_votes_2_24 >= best_votes_2_25) ? best_votes_2_24 : best_votes_2_25;
+    wire [7:0] best_idx_3_12 = (best_votes_2_24 >= best_votes_2_25) ? best_idx_2_24 : best_idx_2_25;
+    wire [1:0] best_votes_3_13 = (best_votes_2_26 >= best_votes_2_27) ? best_votes_2_26 : best_votes_2_27;
+    wire [7:0] best_idx_3_13 = (best_votes_2_26 >= best_votes_2_27) ? best_idx_2_26 : best_idx_2_27;
+    wire [1:0] best_votes_3_14 = (best_votes_2_28 >= best_votes_2_29) ? best_votes_2_28 : best_votes_2_29;
+    wire [7:0] best_idx_3_14 = (best_votes_2_28 >= best_votes_2_29) ? best_idx_2_28 : best_idx_2_29;
+    wire [1:0] best_votes_3_15 = (best_votes_2_30 >= best_votes_2_31) ? best_votes_2_30 : best_votes_2_31;
+    wire [7:0] best_idx_3_15 = (best_votes_2_30 >= best_votes_2_31) ? best_idx_2_30 : best_idx_2_31;
+    wire [1:0] best_votes_4_0 = (best_votes_3_0 >= best_votes_3_1) ? best_votes_3_0 : best_votes_3_1;
+    wire [7:0] best_idx_4_0 = (best_votes_3_0 >= best_votes_3_1) ? best_idx_3_0 : best_idx_3_1;
+    wire [1:0] best_votes_4_1 = (best_votes_3_2 >= best_votes_3_3) ? best_votes_3_2 : best_votes_3_3;
+    wire [7:0] best_idx_4_1 = (best_votes_3_2 >= best_votes_3_3) ? best_idx_3_2 : best_idx_3_3;
+    wire [1:0] best_votes_4_2 = (best_votes_3_4 >= best_votes_3_5) ? best_votes_3_4 : best_votes_3_5;
+    wire [7:0] best_idx_4_2 = (best_votes_3_4 >= best_votes_3_5) ? best_idx_3_4 : best_idx_3_5;
+    wire [1:0] best_votes_4_3 = (best_votes_3_6 >= best_votes_3_7) ? best_votes_3_6 : best_votes_3_7;
+    wire [7:0] best_idx_4_3 = (best_votes_3_6 >= best_votes_3_7) ? best_idx_3_6 : best_idx_3_7;
+    wire [1:0] best_votes_4_4 = (best_votes_3_8 >= best_votes_3_9) ? best_votes_3_8 : best_votes_3_9;
+    wire [7:0] best_idx_4_4 = (best_votes_3_8 >= best_votes_3_9) ? best_idx_3_8 : best_idx_3_9;
+    wire [1:0] best_votes_4_5 = (best_votes_3_10 >= best_votes_3_11) ? best_votes_3_10 : best_votes_3_11;
+    wire [7:0] best_idx_4_5 = (best_votes_3_10 >= best_votes_3_11) ? best_idx_3_10 : best_idx_3_11;
+    wire [1:0] best_votes_4_6 = (best_votes_3_12 >= best_votes_3_13) ? best_votes_3_12 : best_votes_3_13;
+    wire [7:0] best_idx_4_6 = (best_votes_3_12 >= best_votes_3_13) ? best_idx_3_12 : best_idx_3_13;
+    wire [1:0] best_votes_4_7 = (best_votes_3_14 >= best_votes_3_15) ? best_votes_3_14 : best_votes_3_15;
+    wire [7:0] best_idx_4_7 = (best_votes_3_14 >= best_votes_3_15) ? best_idx_3_14 : best_idx_3_15;
+    wire [1:0] best_votes_5_0 = (best_votes_4_0 >= best_votes_4_1) ? best_votes_4_0 : best_votes_4_1;
+    wire [7:0] best_idx_5_0 = (best_votes_4_0 >= best_votes_4_1) ? best_idx_4_0 : best_idx_4_1;
+    wire [1:0] best_votes_5_1 = (best_votes_4_2 >= best_votes_4_3) ? best_votes_4_2 : best_votes_4_3;
+    wire [7:0] best_idx_5_1 = (best_votes_4_2 >= best_votes_4_3) ? best_idx_4_2 : best_idx_4_3;
+    wire [1:0] best_votes_5_2 = (best_votes_4_4 >= best_votes_4_5) ? best_votes_4_4 : best_votes_4_5;
+    wire [7:0] best_idx_5_2 = (best_votes_4_4 >= best_votes_4_5) ? best_idx_4_4 : best_idx_4_5;
+    wire [1:0] best_votes_5_3 = (best_votes_4_6 >= best_votes_4_7) ? best_votes_4_6 : best_votes_4_7;
+    wire [7:0] best_idx_5_3 = (best_votes_4_6 >= best_votes_4_7) ? best_idx_4_6 : best_idx_4_7;
+    wire [1:0] best_votes_6_0 = (best_votes_5_0 >= best_votes_5_1) ? best_votes_5_0 : best_votes_5_1;
+    wire [7:0] best_idx_6_0 = (best_votes_5_0 >= best_votes_5_1) ? best_idx_5_0 : best_idx_5_1;
+    wire [1:0] best_votes_6_1 = (best_votes_5_2 >= best_votes_5_3) ? best_votes_5_2 : best_votes_5_3;
+    wire [7:0] best_idx_6_1 = (best_votes_5_2 >= best_votes_5_3) ? best_idx_5_2 : best_idx_5_3;
+    wire [1:0] best_votes_7_0 = (best_votes_6_0 >= best_votes_6_1) ? best_votes_6_0 : best_votes_6_1;
+    wire [7:0] best_idx_7_0 = (best_votes_6_0 >= best_votes_6_1) ? best_idx_6_0 : best_idx_6_1;
+    wire [1:0] best_votes = best_votes_7_0;
+    wire [7:0] best_idx = best_idx_7_0;
     always @(posedge clk or negedge rst_n) begin
         if (!rst_n) begin
             state <= IDLE;
             current_cw <= 0;
+            received_data <= 0;
             iter_count <= 0;
             codeword_out <= 0;
             data_out <= 0;
@@ -812,6 +1071,7 @@ module ldpc_ecc_w128 (
             else if (decode_en && state == IDLE) begin
                 state <= CALC_SYNDROME;
                 current_cw <= codeword_in;
+                received_data <= codeword_in[127:0];
                 iter_count <= 0;
             end
             
@@ -820,277 +1080,23 @@ module ldpc_ecc_w128 (
                     CALC_SYNDROME: begin
                         if (!has_error) begin
                              state <= FINISH;
-                        end else if (iter_count == MAX_ITER) begin
+                        end else if (iter_count == MAX_ITER || best_votes == 0) begin
                              state <= FINISH;
                         end else begin
                              state <= FLIP_BITS;
                         end
                     end
                     FLIP_BITS: begin
-                        // Apply flips
-                        current_cw[0] <= current_cw[0] ^ flip_0;
-                        current_cw[1] <= current_cw[1] ^ flip_1;
-                        current_cw[2] <= current_cw[2] ^ flip_2;
-                        current_cw[3] <= current_cw[3] ^ flip_3;
-                        current_cw[4] <= current_cw[4] ^ flip_4;
-                        current_cw[5] <= current_cw[5] ^ flip_5;
-                        current_cw[6] <= current_cw[6] ^ flip_6;
-                        current_cw[7] <= current_cw[7] ^ flip_7;
-                        current_cw[8] <= current_cw[8] ^ flip_8;
-                        current_cw[9] <= current_cw[9] ^ flip_9;
-                        current_cw[10] <= current_cw[10] ^ flip_10;
-                        current_cw[11] <= current_cw[11] ^ flip_11;
-                        current_cw[12] <= current_cw[12] ^ flip_12;
-                        current_cw[13] <= current_cw[13] ^ flip_13;
-                        current_cw[14] <= current_cw[14] ^ flip_14;
-                        current_cw[15] <= current_cw[15] ^ flip_15;
-                        current_cw[16] <= current_cw[16] ^ flip_16;
-                        current_cw[17] <= current_cw[17] ^ flip_17;
-                        current_cw[18] <= current_cw[18] ^ flip_18;
-                        current_cw[19] <= current_cw[19] ^ flip_19;
-                        current_cw[20] <= current_cw[20] ^ flip_20;
-                        current_cw[21] <= current_cw[21] ^ flip_21;
-                        current_cw[22] <= current_cw[22] ^ flip_22;
-                        current_cw[23] <= current_cw[23] ^ flip_23;
-                        current_cw[24] <= current_cw[24] ^ flip_24;
-                        current_cw[25] <= current_cw[25] ^ flip_25;
-                        current_cw[26] <= current_cw[26] ^ flip_26;
-                        current_cw[27] <= current_cw[27] ^ flip_27;
-                        current_cw[28] <= current_cw[28] ^ flip_28;
-                        current_cw[29] <= current_cw[29] ^ flip_29;
-                        current_cw[30] <= current_cw[30] ^ flip_30;
-                        current_cw[31] <= current_cw[31] ^ flip_31;
-                        current_cw[32] <= current_cw[32] ^ flip_32;
-                        current_cw[33] <= current_cw[33] ^ flip_33;
-                        current_cw[34] <= current_cw[34] ^ flip_34;
-                        current_cw[35] <= current_cw[35] ^ flip_35;
-                        current_cw[36] <= current_cw[36] ^ flip_36;
-                        current_cw[37] <= current_cw[37] ^ flip_37;
-                        current_cw[38] <= current_cw[38] ^ flip_38;
-                        current_cw[39] <= current_cw[39] ^ flip_39;
-                        current_cw[40] <= current_cw[40] ^ flip_40;
-                        current_cw[41] <= current_cw[41] ^ flip_41;
-                        current_cw[42] <= current_cw[42] ^ flip_42;
-                        current_cw[43] <= current_cw[43] ^ flip_43;
-                        current_cw[44] <= current_cw[44] ^ flip_44;
-                        current_cw[45] <= current_cw[45] ^ flip_45;
-                        current_cw[46] <= current_cw[46] ^ flip_46;
-                        current_cw[47] <= current_cw[47] ^ flip_47;
-                        current_cw[48] <= current_cw[48] ^ flip_48;
-                        current_cw[49] <= current_cw[49] ^ flip_49;
-                        current_cw[50] <= current_cw[50] ^ flip_50;
-                        current_cw[51] <= current_cw[51] ^ flip_51;
-                        current_cw[52] <= current_cw[52] ^ flip_52;
-                        current_cw[53] <= current_cw[53] ^ flip_53;
-                        current_cw[54] <= current_cw[54] ^ flip_54;
-                        current_cw[55] <= current_cw[55] ^ flip_55;
-                        current_cw[56] <= current_cw[56] ^ flip_56;
-                        current_cw[57] <= current_cw[57] ^ flip_57;
-                        current_cw[58] <= current_cw[58] ^ flip_58;
-                        current_cw[59] <= current_cw[59] ^ flip_59;
-                        current_cw[60] <= current_cw[60] ^ flip_60;
-                        current_cw[61] <= current_cw[61] ^ flip_61;
-                        current_cw[62] <= current_cw[62] ^ flip_62;
-                        current_cw[63] <= current_cw[63] ^ flip_63;
-                        current_cw[64] <= current_cw[64] ^ flip_64;
-                        current_cw[65] <= current_cw[65] ^ flip_65;
-                        current_cw[66] <= current_cw[66] ^ flip_66;
-                        current_cw[67] <= current_cw[67] ^ flip_67;
-                        current_cw[68] <= current_cw[68] ^ flip_68;
-                        current_cw[69] <= current_cw[69] ^ flip_69;
-                        current_cw[70] <= current_cw[70] ^ flip_70;
-                        current_cw[71] <= current_cw[71] ^ flip_71;
-                        current_cw[72] <= current_cw[72] ^ flip_72;
-                        current_cw[73] <= current_cw[73] ^ flip_73;
-                        current_cw[74] <= current_cw[74] ^ flip_74;
-                        current_cw[75] <= current_cw[75] ^ flip_75;
-                        current_cw[76] <= current_cw[76] ^ flip_76;
-                        current_cw[77] <= current_cw[77] ^ flip_77;
-                        current_cw[78] <= current_cw[78] ^ flip_78;
-                        current_cw[79] <= current_cw[79] ^ flip_79;
-                        current_cw[80] <= current_cw[80] ^ flip_80;
-                        current_cw[81] <= current_cw[81] ^ flip_81;
-                        current_cw[82] <= current_cw[82] ^ flip_82;
-                        current_cw[83] <= current_cw[83] ^ flip_83;
-                        current_cw[84] <= current_cw[84] ^ flip_84;
-                        current_cw[85] <= current_cw[85] ^ flip_85;
-                        current_cw[86] <= current_cw[86] ^ flip_86;
-                        current_cw[87] <= current_cw[87] ^ flip_87;
-                        current_cw[88] <= current_cw[88] ^ flip_88;
-                        current_cw[89] <= current_cw[89] ^ flip_89;
-                        current_cw[90] <= current_cw[90] ^ flip_90;
-                        current_cw[91] <= current_cw[91] ^ flip_91;
-                        current_cw[92] <= current_cw[92] ^ flip_92;
-                        current_cw[93] <= current_cw[93] ^ flip_93;
-                        current_cw[94] <= current_cw[94] ^ flip_94;
-                        current_cw[95] <= current_cw[95] ^ flip_95;
-                        current_cw[96] <= current_cw[96] ^ flip_96;
-                        current_cw[97] <= current_cw[97] ^ flip_97;
-                        current_cw[98] <= current_cw[98] ^ flip_98;
-                        current_cw[99] <= current_cw[99] ^ flip_99;
-                        current_cw[100] <= current_cw[100] ^ flip_100;
-                        current_cw[101] <= current_cw[101] ^ flip_101;
-                        current_cw[102] <= current_cw[102] ^ flip_102;
-                        current_cw[103] <= current_cw[103] ^ flip_103;
-                        current_cw[104] <= current_cw[104] ^ flip_104;
-                        current_cw[105] <= current_cw[105] ^ flip_105;
-                        current_cw[106] <= current_cw[106] ^ flip_106;
-                        current_cw[107] <= current_cw[107] ^ flip_107;
-                        current_cw[108] <= current_cw[108] ^ flip_108;
-                        current_cw[109] <= current_cw[109] ^ flip_109;
-                        current_cw[110] <= current_cw[110] ^ flip_110;
-                        current_cw[111] <= current_cw[111] ^ flip_111;
-                        current_cw[112] <= current_cw[112] ^ flip_112;
-                        current_cw[113] <= current_cw[113] ^ flip_113;
-                        current_cw[114] <= current_cw[114] ^ flip_114;
-                        current_cw[115] <= current_cw[115] ^ flip_115;
-                        current_cw[116] <= current_cw[116] ^ flip_116;
-                        current_cw[117] <= current_cw[117] ^ flip_117;
-                        current_cw[118] <= current_cw[118] ^ flip_118;
-                        current_cw[119] <= current_cw[119] ^ flip_119;
-                        current_cw[120] <= current_cw[120] ^ flip_120;
-                        current_cw[121] <= current_cw[121] ^ flip_121;
-                        current_cw[122] <= current_cw[122] ^ flip_122;
-                        current_cw[123] <= current_cw[123] ^ flip_123;
-                        current_cw[124] <= current_cw[124] ^ flip_124;
-                        current_cw[125] <= current_cw[125] ^ flip_125;
-                        current_cw[126] <= current_cw[126] ^ flip_126;
-                        current_cw[127] <= current_cw[127] ^ flip_127;
-                        current_cw[128] <= current_cw[128] ^ flip_128;
-                        current_cw[129] <= current_cw[129] ^ flip_129;
-                        current_cw[130] <= current_cw[130] ^ flip_130;
-                        current_cw[131] <= current_cw[131] ^ flip_131;
-                        current_cw[132] <= current_cw[132] ^ flip_132;
-                        current_cw[133] <= current_cw[133] ^ flip_133;
-                        current_cw[134] <= current_cw[134] ^ flip_134;
-                        current_cw[135] <= current_cw[135] ^ flip_135;
-                        current_cw[136] <= current_cw[136] ^ flip_136;
-                        current_cw[137] <= current_cw[137] ^ flip_137;
-                        current_cw[138] <= current_cw[138] ^ flip_138;
-                        current_cw[139] <= current_cw[139] ^ flip_139;
-                        current_cw[140] <= current_cw[140] ^ flip_140;
-                        current_cw[141] <= current_cw[141] ^ flip_141;
-                        current_cw[142] <= current_cw[142] ^ flip_142;
-                        current_cw[143] <= current_cw[143] ^ flip_143;
-                        current_cw[144] <= current_cw[144] ^ flip_144;
-                        current_cw[145] <= current_cw[145] ^ flip_145;
-                        current_cw[146] <= current_cw[146] ^ flip_146;
-                        current_cw[147] <= current_cw[147] ^ flip_147;
-                        current_cw[148] <= current_cw[148] ^ flip_148;
-                        current_cw[149] <= current_cw[149] ^ flip_149;
-                        current_cw[150] <= current_cw[150] ^ flip_150;
-                        current_cw[151] <= current_cw[151] ^ flip_151;
-                        current_cw[152] <= current_cw[152] ^ flip_152;
-                        current_cw[153] <= current_cw[153] ^ flip_153;
-                        current_cw[154] <= current_cw[154] ^ flip_154;
-                        current_cw[155] <= current_cw[155] ^ flip_155;
-                        current_cw[156] <= current_cw[156] ^ flip_156;
-                        current_cw[157] <= current_cw[157] ^ flip_157;
-                        current_cw[158] <= current_cw[158] ^ flip_158;
-                        current_cw[159] <= current_cw[159] ^ flip_159;
-                        current_cw[160] <= current_cw[160] ^ flip_160;
-                        current_cw[161] <= current_cw[161] ^ flip_161;
-                        current_cw[162] <= current_cw[162] ^ flip_162;
-                        current_cw[163] <= current_cw[163] ^ flip_163;
-                        current_cw[164] <= current_cw[164] ^ flip_164;
-                        current_cw[165] <= current_cw[165] ^ flip_165;
-                        current_cw[166] <= current_cw[166] ^ flip_166;
-                        current_cw[167] <= current_cw[167] ^ flip_167;
-                        current_cw[168] <= current_cw[168] ^ flip_168;
-                        current_cw[169] <= current_cw[169] ^ flip_169;
-                        current_cw[170] <= current_cw[170] ^ flip_170;
-                        current_cw[171] <= current_cw[171] ^ flip_171;
-                        current_cw[172] <= current_cw[172] ^ flip_172;
-                        current_cw[173] <= current_cw[173] ^ flip_173;
-                        current_cw[174] <= current_cw[174] ^ flip_174;
-                        current_cw[175] <= current_cw[175] ^ flip_175;
-                        current_cw[176] <= current_cw[176] ^ flip_176;
-                        current_cw[177] <= current_cw[177] ^ flip_177;
-                        current_cw[178] <= current_cw[178] ^ flip_178;
-                        current_cw[179] <= current_cw[179] ^ flip_179;
-                        current_cw[180] <= current_cw[180] ^ flip_180;
-                        current_cw[181] <= current_cw[181] ^ flip_181;
-                        current_cw[182] <= current_cw[182] ^ flip_182;
-                        current_cw[183] <= current_cw[183] ^ flip_183;
-                        current_cw[184] <= current_cw[184] ^ flip_184;
-                        current_cw[185] <= current_cw[185] ^ flip_185;
-                        current_cw[186] <= current_cw[186] ^ flip_186;
-                        current_cw[187] <= current_cw[187] ^ flip_187;
-                        current_cw[188] <= current_cw[188] ^ flip_188;
-                        current_cw[189] <= current_cw[189] ^ flip_189;
-                        current_cw[190] <= current_cw[190] ^ flip_190;
-                        current_cw[191] <= current_cw[191] ^ flip_191;
-                        current_cw[192] <= current_cw[192] ^ flip_192;
-                        current_cw[193] <= current_cw[193] ^ flip_193;
-                        current_cw[194] <= current_cw[194] ^ flip_194;
-                        current_cw[195] <= current_cw[195] ^ flip_195;
-                        current_cw[196] <= current_cw[196] ^ flip_196;
-                        current_cw[197] <= current_cw[197] ^ flip_197;
-                        current_cw[198] <= current_cw[198] ^ flip_198;
-                        current_cw[199] <= current_cw[199] ^ flip_199;
-                        current_cw[200] <= current_cw[200] ^ flip_200;
-                        current_cw[201] <= current_cw[201] ^ flip_201;
-                        current_cw[202] <= current_cw[202] ^ flip_202;
-                        current_cw[203] <= current_cw[203] ^ flip_203;
-                        current_cw[204] <= current_cw[204] ^ flip_204;
-                        current_cw[205] <= current_cw[205] ^ flip_205;
-                        current_cw[206] <= current_cw[206] ^ flip_206;
-                        current_cw[207] <= current_cw[207] ^ flip_207;
-                        current_cw[208] <= current_cw[208] ^ flip_208;
-                        current_cw[209] <= current_cw[209] ^ flip_209;
-                        current_cw[210] <= current_cw[210] ^ flip_210;
-                        current_cw[211] <= current_cw[211] ^ flip_211;
-                        current_cw[212] <= current_cw[212] ^ flip_212;
-                        current_cw[213] <= current_cw[213] ^ flip_213;
-                        current_cw[214] <= current_cw[214] ^ flip_214;
-                        current_cw[215] <= current_cw[215] ^ flip_215;
-                        current_cw[216] <= current_cw[216] ^ flip_216;
-                        current_cw[217] <= current_cw[217] ^ flip_217;
-                        current_cw[218] <= current_cw[218] ^ flip_218;
-                        current_cw[219] <= current_cw[219] ^ flip_219;
-                        current_cw[220] <= current_cw[220] ^ flip_220;
-                        current_cw[221] <= current_cw[221] ^ flip_221;
-                        current_cw[222] <= current_cw[222] ^ flip_222;
-                        current_cw[223] <= current_cw[223] ^ flip_223;
-                        current_cw[224] <= current_cw[224] ^ flip_224;
-                        current_cw[225] <= current_cw[225] ^ flip_225;
-                        current_cw[226] <= current_cw[226] ^ flip_226;
-                        current_cw[227] <= current_cw[227] ^ flip_227;
-                        current_cw[228] <= current_cw[228] ^ flip_228;
-                        current_cw[229] <= current_cw[229] ^ flip_229;
-                        current_cw[230] <= current_cw[230] ^ flip_230;
-                        current_cw[231] <= current_cw[231] ^ flip_231;
-                        current_cw[232] <= current_cw[232] ^ flip_232;
-                        current_cw[233] <= current_cw[233] ^ flip_233;
-                        current_cw[234] <= current_cw[234] ^ flip_234;
-                        current_cw[235] <= current_cw[235] ^ flip_235;
-                        current_cw[236] <= current_cw[236] ^ flip_236;
-                        current_cw[237] <= current_cw[237] ^ flip_237;
-                        current_cw[238] <= current_cw[238] ^ flip_238;
-                        current_cw[239] <= current_cw[239] ^ flip_239;
-                        current_cw[240] <= current_cw[240] ^ flip_240;
-                        current_cw[241] <= current_cw[241] ^ flip_241;
-                        current_cw[242] <= current_cw[242] ^ flip_242;
-                        current_cw[243] <= current_cw[243] ^ flip_243;
-                        current_cw[244] <= current_cw[244] ^ flip_244;
-                        current_cw[245] <= current_cw[245] ^ flip_245;
-                        current_cw[246] <= current_cw[246] ^ flip_246;
-                        current_cw[247] <= current_cw[247] ^ flip_247;
-                        current_cw[248] <= current_cw[248] ^ flip_248;
-                        current_cw[249] <= current_cw[249] ^ flip_249;
-                        current_cw[250] <= current_cw[250] ^ flip_250;
-                        current_cw[251] <= current_cw[251] ^ flip_251;
-                        current_cw[252] <= current_cw[252] ^ flip_252;
-                        current_cw[253] <= current_cw[253] ^ flip_253;
-                        current_cw[254] <= current_cw[254] ^ flip_254;
-                        current_cw[255] <= current_cw[255] ^ flip_255;
+                        // Flip the lowest-index variable with the most unsatisfied checks
+                        current_cw[best_idx] <= ~current_cw[best_idx];
                         iter_count <= iter_count + 1;
                         state <= CALC_SYNDROME;
                     end
                     FINISH: begin
-                        data_out <= current_cw[127:0];
+                        // On failure return the received data bits, as LDPCEngine does
+                        data_out <= has_error ? received_data : current_cw[127:0];
                         error_detected <= has_error;
-                        error_corrected <= (has_error == 0); // Approx
+                        error_corrected <= (has_error == 0);
                         valid_out <= 1'b1;
                         state <= IDLE;
                     end
@@ -1,4 +1,5 @@
 // Generated ldpc_ecc_w32 - Do not edit manually
+// LDPC matrices: n=64, k=32, seed=0
 module ldpc_ecc_w32 (
     input  wire clk,
     input  wire rst_n,
@@ -15,209 +16,275 @@ module ldpc_ecc_w32 (
     reg [3:0] state;
     localparam IDLE = 0, CALC_SYNDROME = 1, FLIP_BITS = 2, CHECK_DONE = 3, FINISH = 4;
     reg [4:0] iter_count;
-    localparam MAX_ITER = 10;
+    localparam MAX_ITER = 20;
     
     reg [63:0] current_cw;
+    reg [31:0] received_data;
     wire [31:0] syndrome;
     wire has_error;
     wire [31:0] parity_out;
-    assign parity_out[0] = data_in[23] ^ data_in[26];
-    assign parity_out[1] = data_in[12] ^ data_in[15] ^ data_in[19] ^ data_in[23] ^ data_in[26] ^ data_in[31];
-    assign parity_out[2] = data_in[10] ^ data_in[15] ^ data_in[19] ^ data_in[23] ^ data_in[26] ^ data_in[31];
-    assign parity_out[3] = data_in[2] ^ data_in[7] ^ data_in[10] ^ data_in[15] ^ data_in[19] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[31];
-    assign parity_out[4] = data_in[2] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[14] ^ data_in[15] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[31];
-    assign parity_out[5] = data_in[3] ^ data_in[7] ^ data_in[9] ^ data_in[14] ^ data_in[18] ^ data_in[19] ^ data_in[21] ^ data_in[23] ^ data_in[27] ^ data_in[31];
-    assign parity_out[6] = data_in[0] ^ data_in[3] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[14] ^ data_in[18] ^ data_in[21] ^ data_in[23] ^ data_in[27] ^ data_in[31];
-    assign parity_out[7] = data_in[0] ^ data_in[3] ^ data_in[8] ^ data_in[9] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[21] ^ data_in[23] ^ data_in[27] ^ data_in[30] ^ data_in[31];
-    assign parity_out[8] = data_in[0] ^ data_in[3] ^ data_in[8] ^ data_in[9] ^ data_in[13] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[21] ^ data_in[23] ^ data_in[27] ^ data_in[30] ^ data_in[31];
-    assign parity_out[9] = data_in[0] ^ data_in[8] ^ data_in[9] ^ data_in[13] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[21] ^ data_in[23] ^ data_in[27] ^ data_in[30] ^ data_in[31];
-    assign parity_out[10] = data_in[8] ^ data_in[9] ^ data_in[13] ^ data_in[14] ^ data_in[18] ^ data_in[21] ^ data_in[27] ^ data_in[30] ^ data_in[31];
-    assign parity_out[11] = data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[18] ^ data_in[21] ^ data_in[24] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31];
-    assign parity_out[12] = data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[18] ^ data_in[21] ^ data_in[24] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31];
-    assign parity_out[13] = data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[20] ^ data_in[21] ^ data_in[24] ^ data_in[27] ^ data_in[29] ^ data_in[30] ^ data_in[31];
-    assign parity_out[14] = data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[15] ^ data_in[16] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[30] ^ data_in[31];
-    assign parity_out[15] = data_in[4] ^ data_in[6] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[15] ^ data_in[16] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[30] ^ data_in[31];
-    assign parity_out[16] = data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[15] ^ data_in[16] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[30] ^ data_in[31];
-    assign parity_out[17] = data_in[3] ^ data_in[5] ^ data_in[6] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[15] ^ data_in[16] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[30] ^ data_in[31];
-    assign parity_out[18] = data_in[3] ^ data_in[5] ^ data_in[6] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[15] ^ data_in[16] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[30] ^ data_in[31];
-    assign parity_out[19] = data_in[3] ^ data_in[5] ^ data_in[6] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[15] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[30] ^ data_in[31];
-    assign parity_out[20] = data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[15] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[29] ^ data_in[31];
-    assign parity_out[21] = data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[15] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31];
-    assign parity_out[22] = data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31];
-    assign parity_out[23] = data_in[1] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[10] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31];
-    assign parity_out[24] = data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[10] ^ data_in[12] ^ data_in[13] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31];
-    assign parity_out[25] = data_in[3] ^ data_in[4] ^ data_in[7] ^ data_in[10] ^ data_in[12] ^ data_in[13] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31];
-    assign parity_out[26] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[7] ^ data_in[10] ^ data_in[12] ^ data_in[13] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31];
-    assign parity_out[27] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[7] ^ data_in[10] ^ data_in[12] ^ data_in[13] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31];
-    assign parity_out[28] = data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31];
-    assign parity_out[29] = data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30];
-    assign parity_out[30] = data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31];
+    assign parity_out[0] = data_in[13] ^ data_in[14];
+    assign parity_out[1] = data_in[13] ^ data_in[14];
+    assign parity_out[2] = data_in[11] ^ data_in[13] ^ data_in[14] ^ data_in[26] ^ data_in[27];
+    assign parity_out[3] = data_in[11] ^ data_in[13] ^ data_in[14] ^ data_in[18] ^ data_in[26] ^ data_in[27] ^ data_in[31];
+    assign parity_out[4] = data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[18] ^ data_in[26] ^ data_in[27] ^ data_in[31];
+    assign parity_out[5] = data_in[4] ^ data_in[6] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[18] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[31];
+    assign parity_out[6] = data_in[4] ^ data_in[6] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[18] ^ data_in[21] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[30] ^ data_in[31];
+    assign parity_out[7] = data_in[4] ^ data_in[6] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[16] ^ data_in[18] ^ data_in[21] ^ data_in[27] ^ data_in[28] ^ data_in[30] ^ data_in[31];
+    assign parity_out[8] = data_in[4] ^ data_in[6] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[16] ^ data_in[18] ^ data_in[21] ^ data_in[22] ^ data_in[28] ^ data_in[30];
+    assign parity_out[9] = data_in[4] ^ data_in[6] ^ data_in[10] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[18] ^ data_in[22] ^ data_in[28] ^ data_in[30];
+    assign parity_out[10] = data_in[0] ^ data_in[4] ^ data_in[6] ^ data_in[10] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[18] ^ data_in[28] ^ data_in[29] ^ data_in[30];
+    assign parity_out[11] = data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[10] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[18] ^ data_in[20] ^ data_in[28] ^ data_in[29] ^ data_in[30];
+    assign parity_out[12] = data_in[1] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[10] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[18] ^ data_in[21] ^ data_in[28] ^ data_in[29] ^ data_in[30];
+    assign parity_out[13] = data_in[1] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[18] ^ data_in[21] ^ data_in[22] ^ data_in[28] ^ data_in[29] ^ data_in[30];
+    assign parity_out[14] = data_in[1] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[21] ^ data_in[22] ^ data_in[28] ^ data_in[29] ^ data_in[30];
+    assign parity_out[15] = data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[28] ^ data_in[29];
+    assign parity_out[16] = data_in[4] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[28] ^ data_in[29];
+    assign parity_out[17] = data_in[4] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29];
+    assign parity_out[18] = data_in[4] ^ data_in[5] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28];
+    assign parity_out[19] = data_in[5] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26];
+    assign parity_out[20] = data_in[3] ^ data_in[5] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26];
+    assign parity_out[21] = data_in[2] ^ data_in[3] ^ data_in[5] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27];
+    assign parity_out[22] = data_in[0] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[10] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27];
+    assign parity_out[23] = data_in[0] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[10] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28];
+    assign parity_out[24] = data_in[0] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28];
+    assign parity_out[25] = data_in[0] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[30] ^ data_in[31];
+    assign parity_out[26] = data_in[0] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[30] ^ data_in[31];
+    assign parity_out[27] = data_in[0] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[30] ^ data_in[31];
+    assign parity_out[28] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[30] ^ data_in[31];
+    assign parity_out[29] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31];
+    assign parity_out[30] = data_in[0] ^ data_in[1] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31];
     assign parity_out[31] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31];
-    assign syndrome[0] = current_cw[23] ^ current_cw[26] ^ current_cw[32];
-    assign syndrome[1] = current_cw[12] ^ current_cw[15] ^ current_cw[19] ^ current_cw[23] ^ current_cw[26] ^ current_cw[31] ^ current_cw[33];
-    assign syndrome[2] = current_cw[10] ^ current_cw[15] ^ current_cw[19] ^ current_cw[23] ^ current_cw[26] ^ current_cw[31] ^ current_cw[34];
-    assign syndrome[3] = current_cw[2] ^ current_cw[7] ^ current_cw[10] ^ current_cw[15] ^ current_cw[19] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[31] ^ current_cw[35];
-    assign syndrome[4] = current_cw[2] ^ current_cw[7] ^ current_cw[9] ^ current_cw[10] ^ current_cw[14] ^ current_cw[15] ^ current_cw[19] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[31] ^ current_cw[36];
-    assign syndrome[5] = current_cw[3] ^ current_cw[7] ^ current_cw[9] ^ current_cw[14] ^ current_cw[18] ^ current_cw[19] ^ current_cw[21] ^ current_cw[23] ^ current_cw[27] ^ current_cw[31] ^ current_cw[37];
-    assign syndrome[6] = current_cw[0] ^ current_cw[3] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[14] ^ current_cw[18] ^ current_cw[21] ^ current_cw[23] ^ current_cw[27] ^ current_cw[31] ^ current_cw[38];
-    assign syndrome[7] = current_cw[0] ^ current_cw[3] ^ current_cw[8] ^ current_cw[9] ^ current_cw[14] ^ current_cw[17] ^ current_cw[18] ^ current_cw[21] ^ current_cw[23] ^ current_cw[27] ^ current_cw[30] ^ current_cw[31] ^ current_cw[39];
-    assign syndrome[8] = current_cw[0] ^ current_cw[3] ^ current_cw[8] ^ current_cw[9] ^ current_cw[13] ^ current_cw[14] ^ current_cw[17] ^ current_cw[18] ^ current_cw[21] ^ current_cw[23] ^ current_cw[27] ^ current_cw[30] ^ current_cw[31] ^ current_cw[40];
-    assign syndrome[9] = current_cw[0] ^ current_cw[8] ^ current_cw[9] ^ current_cw[13] ^ current_cw[14] ^ current_cw[17] ^ current_cw[18] ^ current_cw[21] ^ current_cw[23] ^ current_cw[27] ^ current_cw[30] ^ current_cw[31] ^ current_cw[41];
-    assign syndrome[10] = current_cw[8] ^ current_cw[9] ^ current_cw[13] ^ current_cw[14] ^ current_cw[18] ^ current_cw[21] ^ current_cw[27] ^ current_cw[30] ^ current_cw[31] ^ current_cw[42];
-    assign syndrome[11] = current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[18] ^ current_cw[21] ^ current_cw[24] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[43];
-    assign syndrome[12] = current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[18] ^ current_cw[21] ^ current_cw[24] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[44];
-    assign syndrome[13] = current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[20] ^ current_cw[21] ^ current_cw[24] ^ current_cw[27] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[45];
-    assign syndrome[14] = current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[15] ^ current_cw[16] ^ current_cw[20] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[30] ^ current_cw[31] ^ current_cw[46];
-    assign syndrome[15] = current_cw[4] ^ current_cw[6] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[15] ^ current_cw[16] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[30] ^ current_cw[31] ^ current_cw[47];
-    assign syndrome[16] = current_cw[3] ^ current_cw[4] ^ current_cw[6] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[15] ^ current_cw[16] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[30] ^ current_cw[31] ^ current_cw[48];
-    assign syndrome[17] = current_cw[3] ^ current_cw[5] ^ current_cw[6] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[15] ^ current_cw[16] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[30] ^ current_cw[31] ^ current_cw[49];
-    assign syndrome[18] = current_cw[3] ^ current_cw[5] ^ current_cw[6] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[15] ^ current_cw[16] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[30] ^ current_cw[31] ^ current_cw[50];
-    assign syndrome[19] = current_cw[3] ^ current_cw[5] ^ current_cw[6] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[15] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[30] ^ current_cw[31] ^ current_cw[51];
-    assign syndrome[20] = current_cw[3] ^ current_cw[4] ^ current_cw[6] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[15] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[29] ^ current_cw[31] ^ current_cw[52];
-    assign syndrome[21] = current_cw[3] ^ current_cw[4] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[15] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[53];
-    assign syndrome[22] = current_cw[3] ^ current_cw[4] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[12] ^ current_cw[15] ^ current_cw[16] ^ current_cw[18] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[54];
-    assign syndrome[23] = current_cw[1] ^ current_cw[3] ^ current_cw[4] ^ current_cw[6] ^ current_cw[7] ^ current_cw[10] ^ current_cw[12] ^ current_cw[15] ^ current_cw[16] ^ current_cw[18] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[55];
-    assign syndrome[24] = current_cw[3] ^ current_cw[4] ^ current_cw[6] ^ current_cw[7] ^ current_cw[10] ^ current_cw[12] ^ current_cw[13] ^ current_cw[15] ^ current_cw[16] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[56];
-    assign syndrome[25] = current_cw[3] ^ current_cw[4] ^ current_cw[7] ^ current_cw[10] ^ current_cw[12] ^ current_cw[13] ^ current_cw[15] ^ current_cw[16] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[57];
-    assign syndrome[26] = current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[7] ^ current_cw[10] ^ current_cw[12] ^ current_cw[13] ^ current_cw[15] ^ current_cw[16] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[58];
-    assign syndrome[27] = current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[7] ^ current_cw[10] ^ current_cw[12] ^ current_cw[13] ^ current_cw[15] ^ current_cw[16] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[59];
-    assign syndrome[28] = current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[6] ^ current_cw[7] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[15] ^ current_cw[16] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[60];
-    assign syndrome[29] = current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[15] ^ current_cw[16] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[61];
-    assign syndrome[30] = current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[62];
-    assign syndrome[31] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[63];
+    assign syndrome[0] = current_cw[13] ^ current_cw[14] ^ current_cw[32];
+    assign syndrome[1] = current_cw[32] ^ current_cw[33];
+    assign syndrome[2] = current_cw[11] ^ current_cw[26] ^ current_cw[27] ^ current_cw[33] ^ current_cw[34];
+    assign syndrome[3] = current_cw[18] ^ current_cw[31] ^ current_cw[34] ^ current_cw[35];
+    assign syndrome[4] = current_cw[12] ^ current_cw[16] ^ current_cw[35] ^ current_cw[36];
+    assign syndrome[5] = current_cw[4] ^ current_cw[6] ^ current_cw[28] ^ current_cw[36] ^ current_cw[37];
+    assign syndrome[6] = current_cw[9] ^ current_cw[10] ^ current_cw[21] ^ current_cw[30] ^ current_cw[37] ^ current_cw[38];
+    assign syndrome[7] = current_cw[14] ^ current_cw[26] ^ current_cw[38] ^ current_cw[39];
+    assign syndrome[8] = current_cw[22] ^ current_cw[27] ^ current_cw[31] ^ current_cw[39] ^ current_cw[40];
+    assign syndrome[9] = current_cw[9] ^ current_cw[11] ^ current_cw[14] ^ current_cw[21] ^ current_cw[40] ^ current_cw[41];
+    assign syndrome[10] = current_cw[0] ^ current_cw[16] ^ current_cw[22] ^ current_cw[29] ^ current_cw[41] ^ current_cw[42];
+    assign syndrome[11] = current_cw[0] ^ current_cw[3] ^ current_cw[20] ^ current_cw[42] ^ current_cw[43];
+    assign syndrome[12] = current_cw[1] ^ current_cw[7] ^ current_cw[20] ^ current_cw[21] ^ current_cw[43] ^ current_cw[44];
+    assign syndrome[13] = current_cw[10] ^ current_cw[15] ^ current_cw[22] ^ current_cw[44] ^ current_cw[45];
+    assign syndrome[14] = current_cw[16] ^ current_cw[45] ^ current_cw[46];
+    assign syndrome[15] = current_cw[1] ^ current_cw[3] ^ current_cw[19] ^ current_cw[23] ^ current_cw[30] ^ current_cw[46] ^ current_cw[47];
+    assign syndrome[16] = current_cw[6] ^ current_cw[7] ^ current_cw[20] ^ current_cw[24] ^ current_cw[25] ^ current_cw[47] ^ current_cw[48];
+    assign syndrome[17] = current_cw[12] ^ current_cw[19] ^ current_cw[26] ^ current_cw[48] ^ current_cw[49];
+    assign syndrome[18] = current_cw[5] ^ current_cw[29] ^ current_cw[49] ^ current_cw[50];
+    assign syndrome[19] = current_cw[4] ^ current_cw[24] ^ current_cw[28] ^ current_cw[50] ^ current_cw[51];
+    assign syndrome[20] = current_cw[3] ^ current_cw[17] ^ current_cw[51] ^ current_cw[52];
+    assign syndrome[21] = current_cw[2] ^ current_cw[27] ^ current_cw[52] ^ current_cw[53];
+    assign syndrome[22] = current_cw[0] ^ current_cw[4] ^ current_cw[10] ^ current_cw[12] ^ current_cw[18] ^ current_cw[53] ^ current_cw[54];
+    assign syndrome[23] = current_cw[5] ^ current_cw[28] ^ current_cw[54] ^ current_cw[55];
+    assign syndrome[24] = current_cw[6] ^ current_cw[8] ^ current_cw[11] ^ current_cw[13] ^ current_cw[23] ^ current_cw[55] ^ current_cw[56];
+    assign syndrome[25] = current_cw[5] ^ current_cw[7] ^ current_cw[15] ^ current_cw[18] ^ current_cw[30] ^ current_cw[31] ^ current_cw[56] ^ current_cw[57];
+    assign syndrome[26] = current_cw[19] ^ current_cw[57] ^ current_cw[58];
+    assign syndrome[27] = current_cw[17] ^ current_cw[25] ^ current_cw[58] ^ current_cw[59];
+    assign syndrome[28] = current_cw[1] ^ current_cw[25] ^ current_cw[59] ^ current_cw[60];
+    assign syndrome[29] = current_cw[8] ^ current_cw[17] ^ current_cw[29] ^ current_cw[60] ^ current_cw[61];
+    assign syndrome[30] = current_cw[2] ^ current_cw[8] ^ current_cw[9] ^ current_cw[13] ^ current_cw[61] ^ current_cw[62];
+    assign syndrome[31] = current_cw[2] ^ current_cw[15] ^ current_cw[23] ^ current_cw[24] ^ current_cw[62] ^ current_cw[63];
     assign has_error = |syndrome;
-    wire [2:0] sum_0 = { 2'd0, syndrome[6] } + { 2'd0, syndrome[7] } + { 2'd0, syndrome[8] } + { 2'd0, syndrome[9] } + { 2'd0, syndrome[31] };
-    wire flip_0 = (sum_0 >= 3'd3);
-    wire [2:0] sum_1 = { 2'd0, syndrome[23] } + { 2'd0, syndrome[28] } + { 2'd0, syndrome[29] } + { 2'd0, syndrome[30] } + { 2'd0, syndrome[31] };
-    wire flip_1 = (sum_1 >= 3'd3);
-    wire [3:0] sum_2 = { 3'd0, syndrome[3] } + { 3'd0, syndrome[4] } + { 3'd0, syndrome[26] } + { 3'd0, syndrome[27] } + { 3'd0, syndrome[28] } + { 3'd0, syndrome[29] } + { 3'd0, syndrome[30] } + { 3'd0, syndrome[31] };
-    wire flip_2 = (sum_2 >= 4'd4);
-    wire [4:0] sum_3 = { 4'd0, syndrome[5] } + { 4'd0, syndrome[6] } + { 4'd0, syndrome[7] } + { 4'd0, syndrome[8] } + { 4'd0, syndrome[16] } + { 4'd0, syndrome[17] } + { 4'd0, syndrome[18] } + { 4'd0, syndrome[19] } + { 4'd0, syndrome[20] } + { 4'd0, syndrome[21] } + { 4'd0, syndrome[22] } + { 4'd0, syndrome[23] } + { 4'd0, syndrome[24] } + { 4'd0, syndrome[25] } + { 4'd0, syndrome[26] } + { 4'd0, syndrome[27] } + { 4'd0, syndrome[28] } + { 4'd0, syndrome[29] } + { 4'd0, syndrome[30] } + { 4'd0, syndrome[31] };
-    wire flip_3 = (sum_3 >= 5'd10);
-    wire [3:0] sum_4 = { 3'd0, syndrome[15] } + { 3'd0, syndrome[16] } + { 3'd0, syndrome[20] } + { 3'd0, syndrome[21] } + { 3'd0, syndrome[22] } + { 3'd0, syndrome[23] } + { 3'd0, syndrome[24] } + { 3'd0, syndrome[25] } + { 3'd0, syndrome[26] } + { 3'd0, syndrome[27] } + { 3'd0, syndrome[28] } + { 3'd0, syndrome[29] } + { 3'd0, syndrome[30] } + { 3'd0, syndrome[31] };
-    wire flip_4 = (sum_4 >= 4'd7);
-    wire [2:0] sum_5 = { 2'd0, syndrome[17] } + { 2'd0, syndrome[18] } + { 2'd0, syndrome[19] } + { 2'd0, syndrome[29] } + { 2'd0, syndrome[30] } + { 2'd0, syndrome[31] };
-    wire flip_5 = (sum_5 >= 3'd3);
-    wire [3:0] sum_6 = { 3'd0, syndrome[15] } + { 3'd0, syndrome[16] } + { 3'd0, syndrome[17] } + { 3'd0, syndrome[18] } + { 3'd0, syndrome[19] } + { 3'd0, syndrome[20] } + { 3'd0, syndrome[21] } + { 3'd0, syndrome[22] } + { 3'd0, syndrome[23] } + { 3'd0, syndrome[24] } + { 3'd0, syndrome[28] } + { 3'd0, syndrome[29] } + { 3'd0, syndrome[30] } + { 3'd0, syndrome[31] };
-    wire flip_6 = (sum_6 >= 4'd7);
-    wire [3:0] sum_7 = { 3'd0, syndrome[3] } + { 3'd0, syndrome[4] } + { 3'd0, syndrome[5] } + { 3'd0, syndrome[6] } + { 3'd0, syndrome[21] } + { 3'd0, syndrome[22] } + { 3'd0, syndrome[23] } + { 3'd0, syndrome[24] } + { 3'd0, syndrome[25] } + { 3'd0, syndrome[26] } + { 3'd0, syndrome[27] } + { 3'd0, syndrome[28] } + { 3'd0, syndrome[29] } + { 3'd0, syndrome[30] } + { 3'd0, syndrome[31] };
-    wire flip_7 = (sum_7 >= 4'd8);
-    wire [4:0] sum_8 = { 4'd0, syndrome[6] } + { 4'd0, syndrome[7] } + { 4'd0, syndrome[8] } + { 4'd0, syndrome[9] } + { 4'd0, syndrome[10] } + { 4'd0, syndrome[11] } + { 4'd0, syndrome[12] } + { 4'd0, syndrome[13] } + { 4'd0, syndrome[14] } + { 4'd0, syndrome[15] } + { 4'd0, syndrome[16] } + { 4'd0, syndrome[17] } + { 4'd0, syndrome[18] } + { 4'd0, syndrome[19] } + { 4'd0, syndrome[20] } + { 4'd0, syndrome[21] } + { 4'd0, syndrome[22] } + { 4'd0, syndrome[30] } + { 4'd0, syndrome[31] };
-    wire flip_8 = (sum_8 >= 5'd10);
-    wire [4:0] sum_9 = { 4'd0, syndrome[4] } + { 4'd0, syndrome[5] } + { 4'd0, syndrome[6] } + { 4'd0, syndrome[7] } + { 4'd0, syndrome[8] } + { 4'd0, syndrome[9] } + { 4'd0, syndrome[10] } + { 4'd0, syndrome[11] } + { 4'd0, syndrome[12] } + { 4'd0, syndrome[13] } + { 4'd0, syndrome[14] } + { 4'd0, syndrome[15] } + { 4'd0, syndrome[16] } + { 4'd0, syndrome[17] } + { 4'd0, syndrome[18] } + { 4'd0, syndrome[19] } + { 4'd0, syndrome[20] } + { 4'd0, syndrome[28] } + { 4'd0, syndrome[29] } + { 4'd0, syndrome[30] } + { 4'd0, syndrome[31] };
-    wire flip_9 = (sum_9 >= 5'd11);
-    wire [4:0] sum_10 = { 4'd0, syndrome[2] } + { 4'd0, syndrome[3] } + { 4'd0, syndrome[4] } + { 4'd0, syndrome[11] } + { 4'd0, syndrome[12] } + { 4'd0, syndrome[13] } + { 4'd0, syndrome[14] } + { 4'd0, syndrome[15] } + { 4'd0, syndrome[16] } + { 4'd0, syndrome[17] } + { 4'd0, syndrome[18] } + { 4'd0, syndrome[19] } + { 4'd0, syndrome[20] } + { 4'd0, syndrome[21] } + { 4'd0, syndrome[22] } + { 4'd0, syndrome[23] } + { 4'd0, syndrome[24] } + { 4'd0, syndrome[25] } + { 4'd0, syndrome[26] } + { 4'd0, syndrome[27] } + { 4'd0, syndrome[28] } + { 4'd0, syndrome[29] } + { 4'd0, syndrome[30] } + { 4'd0, syndrome[31] };
-    wire flip_10 = (sum_10 >= 5'd12);
-    wire [3:0] sum_11 = { 3'd0, syndrome[11] } + { 3'd0, syndrome[12] } + { 3'd0, syndrome[13] } + { 3'd0, syndrome[14] } + { 3'd0, syndrome[15] } + { 3'd0, syndrome[16] } + { 3'd0, syndrome[28] } + { 3'd0, syndrome[29] } + { 3'd0, syndrome[30] } + { 3'd0, syndrome[31] };
-    wire flip_11 = (sum_11 >= 4'd5);
-    wire [3:0] sum_12 = { 3'd0, syndrome[1] } + { 3'd0, syndrome[22] } + { 3'd0, syndrome[23] } + { 3'd0, syndrome[24] } + { 3'd0, syndrome[25] } + { 3'd0, syndrome[26] } + { 3'd0, syndrome[27] } + { 3'd0, syndrome[28] } + { 3'd0, syndrome[29] } + { 3'd0, syndrome[30] } + { 3'd0, syndrome[31] };
-    wire flip_12 = (sum_12 >= 4'd6);
-    wire [3:0] sum_13 = { 3'd0, syndrome[8] } + { 3'd0, syndrome[9] } + { 3'd0, syndrome[10] } + { 3'd0, syndrome[24] } + { 3'd0, syndrome[25] } + { 3'd0, syndrome[26] } + { 3'd0, syndrome[27] } + { 3'd0, syndrome[28] } + { 3'd0, syndrome[29] } + { 3'd0, syndrome[30] } + { 3'd0, syndrome[31] };
-    wire flip_13 = (sum_13 >= 4'd6);
-    wire [3:0] sum_14 = { 3'd0, syndrome[4] } + { 3'd0, syndrome[5] } + { 3'd0, syndrome[6] } + { 3'd0, syndrome[7] } + { 3'd0, syndrome[8] } + { 3'd0, syndrome[9] } + { 3'd0, syndrome[10] } + { 3'd0, syndrome[30] } + { 3'd0, syndrome[31] };
-    wire flip_14 = (sum_14 >= 4'd5);
-    wire [4:0] sum_15 = { 4'd0, syndrome[1] } + { 4'd0, syndrome[2] } + { 4'd0, syndrome[3] } + { 4'd0, syndrome[4] } + { 4'd0, syndrome[14] } + { 4'd0, syndrome[15] } + { 4'd0, syndrome[16] } + { 4'd0, syndrome[17] } + { 4'd0, syndrome[18] } + { 4'd0, syndrome[19] } + { 4'd0, syndrome[20] } + { 4'd0, syndrome[21] } + { 4'd0, syndrome[22] } + { 4'd0, syndrome[23] } + { 4'd0, syndrome[24] } + { 4'd0, syndrome[25] } + { 4'd0, syndrome[26] } + { 4'd0, syndrome[27] } + { 4'd0, syndrome[28] } + { 4'd0, syndrome[29] } + { 4'd0, syndrome[30] } + { 4'd0, syndrome[31] };
-    wire flip_15 = (sum_15 >= 5'd11);
-    wire [3:0] sum_16 = { 3'd0, syndrome[14] } + { 3'd0, syndrome[15] } + { 3'd0, syndrome[16] } + { 3'd0, syndrome[17] } + { 3'd0, syndrome[18] } + { 3'd0, syndrome[22] } + { 3'd0, syndrome[23] } + { 3'd0, syndrome[24] } + { 3'd0, syndrome[25] } + { 3'd0, syndrome[26] } + { 3'd0, syndrome[27] } + { 3'd0, syndrome[28] } + { 3'd0, syndrome[29] } + { 3'd0, syndrome[30] } + { 3'd0, syndrome[31] };
-    wire flip_16 = (sum_16 >= 4'd8);
-    wire [2:0] sum_17 = { 2'd0, syndrome[7] } + { 2'd0, syndrome[8] } + { 2'd0, syndrome[9] } + { 2'd0, syndrome[31] };
-    wire flip_17 = (sum_17 >= 3'd2);
-    wire [4:0] sum_18 = { 4'd0, syndrome[5] } + { 4'd0, syndrome[6] } + { 4'd0, syndrome[7] } + { 4'd0, syndrome[8] } + { 4'd0, syndrome[9] } + { 4'd0, syndrome[10] } + { 4'd0, syndrome[11] } + { 4'd0, syndrome[12] } + { 4'd0, syndrome[22] } + { 4'd0, syndrome[23] } + { 4'd0, syndrome[24] } + { 4'd0, syndrome[25] } + { 4'd0, syndrome[26] } + { 4'd0, syndrome[27] } + { 4'd0, syndrome[28] } + { 4'd0, syndrome[29] } + { 4'd0, syndrome[30] } + { 4'd0, syndrome[31] };
-    wire flip_18 = (sum_18 >= 5'd9);
-    wire [3:0] sum_19 = { 3'd0, syndrome[1] } + { 3'd0, syndrome[2] } + { 3'd0, syndrome[3] } + { 3'd0, syndrome[4] } + { 3'd0, syndrome[5] } + { 3'd0, syndrome[24] } + { 3'd0, syndrome[25] } + { 3'd0, syndrome[26] } + { 3'd0, syndrome[27] } + { 3'd0, syndrome[28] } + { 3'd0, syndrome[29] } + { 3'd0, syndrome[30] } + { 3'd0, syndrome[31] };
-    wire flip_19 = (sum_19 >= 4'd7);
-    wire [3:0] sum_20 = { 3'd0, syndrome[13] } + { 3'd0, syndrome[14] } + { 3'd0, syndrome[20] } + { 3'd0, syndrome[21] } + { 3'd0, syndrome[22] } + { 3'd0, syndrome[23] } + { 3'd0, syndrome[24] } + { 3'd0, syndrome[25] } + { 3'd0, syndrome[26] } + { 3'd0, syndrome[27] } + { 3'd0, syndrome[28] } + { 3'd0, syndrome[29] } + { 3'd0, syndrome[30] } + { 3'd0, syndrome[31] };
-    wire flip_20 = (sum_20 >= 4'd7);
-    wire [3:0] sum_21 = { 3'd0, syndrome[4] } + { 3'd0, syndrome[5] } + { 3'd0, syndrome[6] } + { 3'd0, syndrome[7] } + { 3'd0, syndrome[8] } + { 3'd0, syndrome[9] } + { 3'd0, syndrome[10] } + { 3'd0, syndrome[11] } + { 3'd0, syndrome[12] } + { 3'd0, syndrome[13] } + { 3'd0, syndrome[14] } + { 3'd0, syndrome[29] } + { 3'd0, syndrome[30] } + { 3'd0, syndrome[31] };
-    wire flip_21 = (sum_21 >= 4'd7);
-    wire [3:0] sum_22 = { 3'd0, syndrome[4] } + { 3'd0, syndrome[19] } + { 3'd0, syndrome[20] } + { 3'd0, syndrome[21] } + { 3'd0, syndrome[22] } + { 3'd0, syndrome[23] } + { 3'd0, syndrome[24] } + { 3'd0, syndrome[25] } + { 3'd0, syndrome[26] } + { 3'd0, syndrome[27] } + { 3'd0, syndrome[28] } + { 3'd0, syndrome[29] } + { 3'd0, syndrome[30] } + { 3'd0, syndrome[31] };
-    wire flip_22 = (sum_22 >= 4'd7);
-    wire [4:0] sum_23 = { 4'd0, syndrome[0] } + { 4'd0, syndrome[1] } + { 4'd0, syndrome[2] } + { 4'd0, syndrome[3] } + { 4'd0, syndrome[4] } + { 4'd0, syndrome[5] } + { 4'd0, syndrome[6] } + { 4'd0, syndrome[7] } + { 4'd0, syndrome[8] } + { 4'd0, syndrome[9] } + { 4'd0, syndrome[14] } + { 4'd0, syndrome[15] } + { 4'd0, syndrome[16] } + { 4'd0, syndrome[17] } + { 4'd0, syndrome[18] } + { 4'd0, syndrome[19] } + { 4'd0, syndrome[20] } + { 4'd0, syndrome[21] } + { 4'd0, syndrome[22] } + { 4'd0, syndrome[23] } + { 4'd0, syndrome[24] } + { 4'd0, syndrome[25] } + { 4'd0, syndrome[26] } + { 4'd0, syndrome[27] } + { 4'd0, syndrome[28] } + { 4'd0, syndrome[29] } + { 4'd0, syndrome[30] } + { 4'd0, syndrome[31] };
-    wire flip_23 = (sum_23 >= 5'd14);
-    wire [3:0] sum_24 = { 3'd0, syndrome[11] } + { 3'd0, syndrome[12] } + { 3'd0, syndrome[13] } + { 3'd0, syndrome[14] } + { 3'd0, syndrome[15] } + { 3'd0, syndrome[16] } + { 3'd0, syndrome[17] } + { 3'd0, syndrome[18] } + { 3'd0, syndrome[19] } + { 3'd0, syndrome[20] } + { 3'd0, syndrome[21] } + { 3'd0, syndrome[22] } + { 3'd0, syndrome[23] } + { 3'd0, syndrome[31] };
-    wire flip_24 = (sum_24 >= 4'd7);
-    wire [4:0] sum_25 = { 4'd0, syndrome[3] } + { 4'd0, syndrome[14] } + { 4'd0, syndrome[15] } + { 4'd0, syndrome[16] } + { 4'd0, syndrome[17] } + { 4'd0, syndrome[18] } + { 4'd0, syndrome[19] } + { 4'd0, syndrome[20] } + { 4'd0, syndrome[21] } + { 4'd0, syndrome[22] } + { 4'd0, syndrome[23] } + { 4'd0, syndrome[24] } + { 4'd0, syndrome[25] } + { 4'd0, syndrome[26] } + { 4'd0, syndrome[27] } + { 4'd0, syndrome[28] } + { 4'd0, syndrome[29] } + { 4'd0, syndrome[30] } + { 4'd0, syndrome[31] };
-    wire flip_25 = (sum_25 >= 5'd10);
-    wire [4:0] sum_26 = { 4'd0, syndrome[0] } + { 4'd0, syndrome[1] } + { 4'd0, syndrome[2] } + { 4'd0, syndrome[3] } + { 4'd0, syndrome[17] } + { 4'd0, syndrome[18] } + { 4'd0, syndrome[19] } + { 4'd0, syndrome[20] } + { 4'd0, syndrome[21] } + { 4'd0, syndrome[22] } + { 4'd0, syndrome[23] } + { 4'd0, syndrome[24] } + { 4'd0, syndrome[25] } + { 4'd0, syndrome[26] } + { 4'd0, syndrome[27] } + { 4'd0, syndrome[28] } + { 4'd0, syndrome[29] } + { 4'd0, syndrome[30] } + { 4'd0, syndrome[31] };
-    wire flip_26 = (sum_26 >= 5'd10);
-    wire [3:0] sum_27 = { 3'd0, syndrome[5] } + { 3'd0, syndrome[6] } + { 3'd0, syndrome[7] } + { 3'd0, syndrome[8] } + { 3'd0, syndrome[9] } + { 3'd0, syndrome[10] } + { 3'd0, syndrome[11] } + { 3'd0, syndrome[12] } + { 3'd0, syndrome[13] } + { 3'd0, syndrome[30] } + { 3'd0, syndrome[31] };
-    wire flip_27 = (sum_27 >= 4'd6);
-    wire [3:0] sum_28 = { 3'd0, syndrome[11] } + { 3'd0, syndrome[12] } + { 3'd0, syndrome[21] } + { 3'd0, syndrome[22] } + { 3'd0, syndrome[23] } + { 3'd0, syndrome[24] } + { 3'd0, syndrome[25] } + { 3'd0, syndrome[26] } + { 3'd0, syndrome[27] } + { 3'd0, syndrome[28] } + { 3'd0, syndrome[29] } + { 3'd0, syndrome[30] } + { 3'd0, syndrome[31] };
-    wire flip_28 = (sum_28 >= 4'd7);
-    wire [3:0] sum_29 = { 3'd0, syndrome[11] } + { 3'd0, syndrome[12] } + { 3'd0, syndrome[13] } + { 3'd0, syndrome[20] } + { 3'd0, syndrome[21] } + { 3'd0, syndrome[22] } + { 3'd0, syndrome[23] } + { 3'd0, syndrome[24] } + { 3'd0, syndrome[25] } + { 3'd0, syndrome[26] } + { 3'd0, syndrome[27] } + { 3'd0, syndrome[28] } + { 3'd0, syndrome[29] } + { 3'd0, syndrome[30] } + { 3'd0, syndrome[31] };
-    wire flip_29 = (sum_29 >= 4'd8);
-    wire [4:0] sum_30 = { 4'd0, syndrome[7] } + { 4'd0, syndrome[8] } + { 4'd0, syndrome[9] } + { 4'd0, syndrome[10] } + { 4'd0, syndrome[11] } + { 4'd0, syndrome[12] } + { 4'd0, syndrome[13] } + { 4'd0, syndrome[14] } + { 4'd0, syndrome[15] } + { 4'd0, syndrome[16] } + { 4'd0, syndrome[17] } + { 4'd0, syndrome[18] } + { 4'd0, syndrome[19] } + { 4'd0, syndrome[21] } + { 4'd0, syndrome[22] } + { 4'd0, syndrome[23] } + { 4'd0, syndrome[24] } + { 4'd0, syndrome[25] } + { 4'd0, syndrome[26] } + { 4'd0, syndrome[27] } + { 4'd0, syndrome[28] } + { 4'd0, syndrome[29] } + { 4'd0, syndrome[30] } + { 4'd0, syndrome[31] };
-    wire flip_30 = (sum_30 >= 5'd12);
-    wire [4:0] sum_31 = { 4'd0, syndrome[1] } + { 4'd0, syndrome[2] } + { 4'd0, syndrome[3] } + { 4'd0, syndrome[4] } + { 4'd0, syndrome[5] } + { 4'd0, syndrome[6] } + { 4'd0, syndrome[7] } + { 4'd0, syndrome[8] } + { 4'd0, syndrome[9] } + { 4'd0, syndrome[10] } + { 4'd0, syndrome[11] } + { 4'd0, syndrome[12] } + { 4'd0, syndrome[13] } + { 4'd0, syndrome[14] } + { 4'd0, syndrome[15] } + { 4'd0, syndrome[16] } + { 4'd0, syndrome[17] } + { 4'd0, syndrome[18] } + { 4'd0, syndrome[19] } + { 4'd0, syndrome[20] } + { 4'd0, syndrome[21] } + { 4'd0, syndrome[22] } + { 4'd0, syndrome[23] } + { 4'd0, syndrome[24] } + { 4'd0, syndrome[25] } + { 4'd0, syndrome[26] } + { 4'd0, syndrome[27] } + { 4'd0, syndrome[28] } + { 4'd0, syndrome[30] } + { 4'd0, syndrome[31] };
-    wire flip_31 = (sum_31 >= 5'd15);
-    wire [0:0] sum_32 = syndrome[0];
-    wire flip_32 = (sum_32 >= 1'd1);
-    wire [0:0] sum_33 = syndrome[1];
-    wire flip_33 = (sum_33 >= 1'd1);
-    wire [0:0] sum_34 = syndrome[2];
-    wire flip_34 = (sum_34 >= 1'd1);
-    wire [0:0] sum_35 = syndrome[3];
-    wire flip_35 = (sum_35 >= 1'd1);
-    wire [0:0] sum_36 = syndrome[4];
-    wire flip_36 = (sum_36 >= 1'd1);
-    wire [0:0] sum_37 = syndrome[5];
-    wire flip_37 = (sum_37 >= 1'd1);
-    wire [0:0] sum_38 = syndrome[6];
-    wire flip_38 = (sum_38 >= 1'd1);
-    wire [0:0] sum_39 = syndrome[7];
-    wire flip_39 = (sum_39 >= 1'd1);
-    wire [0:0] sum_40 = syndrome[8];
-    wire flip_40 = (sum_40 >= 1'd1);
-    wire [0:0] sum_41 = syndrome[9];
-    wire flip_41 = (sum_41 >= 1'd1);
-    wire [0:0] sum_42 = syndrome[10];
-    wire flip_42 = (sum_42 >= 1'd1);
-    wire [0:0] sum_43 = syndrome[11];
-    wire flip_43 = (sum_43 >= 1'd1);
-    wire [0:0] sum_44 = syndrome[12];
-    wire flip_44 = (sum_44 >= 1'd1);
-    wire [0:0] sum_45 = syndrome[13];
-    wire flip_45 = (sum_45 >= 1'd1);
-    wire [0:0] sum_46 = syndrome[14];
-    wire flip_46 = (sum_46 >= 1'd1);
-    wire [0:0] sum_47 = syndrome[15];
-    wire flip_47 = (sum_47 >= 1'd1);
-    wire [0:0] sum_48 = syndrome[16];
-    wire flip_48 = (sum_48 >= 1'd1);
-    wire [0:0] sum_49 = syndrome[17];
-    wire flip_49 = (sum_49 >= 1'd1);
-    wire [0:0] sum_50 = syndrome[18];
-    wire flip_50 = (sum_50 >= 1'd1);
-    wire [0:0] sum_51 = syndrome[19];
-    wire flip_51 = (sum_51 >= 1'd1);
-    wire [0:0] sum_52 = syndrome[20];
-    wire flip_52 = (sum_52 >= 1'd1);
-    wire [0:0] sum_53 = syndrome[21];
-    wire flip_53 = (sum_53 >= 1'd1);
-    wire [0:0] sum_54 = syndrome[22];
-    wire flip_54 = (sum_54 >= 1'd1);
-    wire [0:0] sum_55 = syndrome[23];
-    wire flip_55 = (sum_55 >= 1'd1);
-    wire [0:0] sum_56 = syndrome[24];
-    wire flip_56 = (sum_56 >= 1'd1);
-    wire [0:0] sum_57 = syndrome[25];
-    wire flip_57 = (sum_57 >= 1'd1);
-    wire [0:0] sum_58 = syndrome[26];
-    wire flip_58 = (sum_58 >= 1'd1);
-    wire [0:0] sum_59 = syndrome[27];
-    wire flip_59 = (sum_59 >= 1'd1);
-    wire [0:0] sum_60 = syndrome[28];
-    wire flip_60 = (sum_60 >= 1'd1);
-    wire [0:0] sum_61 = syndrome[29];
-    wire flip_61 = (sum_61 >= 1'd1);
-    wire [0:0] sum_62 = syndrome[30];
-    wire flip_62 = (sum_62 >= 1'd1);
-    wire [0:0] sum_63 = syndrome[31];
-    wire flip_63 = (sum_63 >= 1'd1);
+    wire [1:0] sum_0 = { 1'd0, syndrome[10] } + { 1'd0, syndrome[11] } + { 1'd0, syndrome[22] };
+    wire [1:0] sum_1 = { 1'd0, syndrome[12] } + { 1'd0, syndrome[15] } + { 1'd0, syndrome[28] };
+    wire [1:0] sum_2 = { 1'd0, syndrome[21] } + { 1'd0, syndrome[30] } + { 1'd0, syndrome[31] };
+    wire [1:0] sum_3 = { 1'd0, syndrome[11] } + { 1'd0, syndrome[15] } + { 1'd0, syndrome[20] };
+    wire [1:0] sum_4 = { 1'd0, syndrome[5] } + { 1'd0, syndrome[19] } + { 1'd0, syndrome[22] };
+    wire [1:0] sum_5 = { 1'd0, syndrome[18] } + { 1'd0, syndrome[23] } + { 1'd0, syndrome[25] };
+    wire [1:0] sum_6 = { 1'd0, syndrome[5] } + { 1'd0, syndrome[16] } + { 1'd0, syndrome[24] };
+    wire [1:0] sum_7 = { 1'd0, syndrome[12] } + { 1'd0, syndrome[16] } + { 1'd0, syndrome[25] };
+    wire [1:0] sum_8 = { 1'd0, syndrome[24] } + { 1'd0, syndrome[29] } + { 1'd0, syndrome[30] };
+    wire [1:0] sum_9 = { 1'd0, syndrome[6] } + { 1'd0, syndrome[9] } + { 1'd0, syndrome[30] };
+    wire [1:0] sum_10 = { 1'd0, syndrome[6] } + { 1'd0, syndrome[13] } + { 1'd0, syndrome[22] };
+    wire [1:0] sum_11 = { 1'd0, syndrome[2] } + { 1'd0, syndrome[9] } + { 1'd0, syndrome[24] };
+    wire [1:0] sum_12 = { 1'd0, syndrome[4] } + { 1'd0, syndrome[17] } + { 1'd0, syndrome[22] };
+    wire [1:0] sum_13 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[24] } + { 1'd0, syndrome[30] };
+    wire [1:0] sum_14 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[7] } + { 1'd0, syndrome[9] };
+    wire [1:0] sum_15 = { 1'd0, syndrome[13] } + { 1'd0, syndrome[25] } + { 1'd0, syndrome[31] };
+    wire [1:0] sum_16 = { 1'd0, syndrome[4] } + { 1'd0, syndrome[10] } + { 1'd0, syndrome[14] };
+    wire [1:0] sum_17 = { 1'd0, syndrome[20] } + { 1'd0, syndrome[27] } + { 1'd0, syndrome[29] };
+    wire [1:0] sum_18 = { 1'd0, syndrome[3] } + { 1'd0, syndrome[22] } + { 1'd0, syndrome[25] };
+    wire [1:0] sum_19 = { 1'd0, syndrome[15] } + { 1'd0, syndrome[17] } + { 1'd0, syndrome[26] };
+    wire [1:0] sum_20 = { 1'd0, syndrome[11] } + { 1'd0, syndrome[12] } + { 1'd0, syndrome[16] };
+    wire [1:0] sum_21 = { 1'd0, syndrome[6] } + { 1'd0, syndrome[9] } + { 1'd0, syndrome[12] };
+    wire [1:0] sum_22 = { 1'd0, syndrome[8] } + { 1'd0, syndrome[10] } + { 1'd0, syndrome[13] };
+    wire [1:0] sum_23 = { 1'd0, syndrome[15] } + { 1'd0, syndrome[24] } + { 1'd0, syndrome[31] };
+    wire [1:0] sum_24 = { 1'd0, syndrome[16] } + { 1'd0, syndrome[19] } + { 1'd0, syndrome[31] };
+    wire [1:0] sum_25 = { 1'd0, syndrome[16] } + { 1'd0, syndrome[27] } + { 1'd0, syndrome[28] };
+    wire [1:0] sum_26 = { 1'd0, syndrome[2] } + { 1'd0, syndrome[7] } + { 1'd0, syndrome[17] };
+    wire [1:0] sum_27 = { 1'd0, syndrome[2] } + { 1'd0, syndrome[8] } + { 1'd0, syndrome[21] };
+    wire [1:0] sum_28 = { 1'd0, syndrome[5] } + { 1'd0, syndrome[19] } + { 1'd0, syndrome[23] };
+    wire [1:0] sum_29 = { 1'd0, syndrome[10] } + { 1'd0, syndrome[18] } + { 1'd0, syndrome[29] };
+    wire [1:0] sum_30 = { 1'd0, syndrome[6] } + { 1'd0, syndrome[15] } + { 1'd0, syndrome[25] };
+    wire [1:0] sum_31 = { 1'd0, syndrome[3] } + { 1'd0, syndrome[8] } + { 1'd0, syndrome[25] };
+    wire [1:0] sum_32 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[1] };
+    wire [1:0] sum_33 = { 1'd0, syndrome[1] } + { 1'd0, syndrome[2] };
+    wire [1:0] sum_34 = { 1'd0, syndrome[2] } + { 1'd0, syndrome[3] };
+    wire [1:0] sum_35 = { 1'd0, syndrome[3] } + { 1'd0, syndrome[4] };
+    wire [1:0] sum_36 = { 1'd0, syndrome[4] } + { 1'd0, syndrome[5] };
+    wire [1:0] sum_37 = { 1'd0, syndrome[5] } + { 1'd0, syndrome[6] };
+    wire [1:0] sum_38 = { 1'd0, syndrome[6] } + { 1'd0, syndrome[7] };
+    wire [1:0] sum_39 = { 1'd0, syndrome[7] } + { 1'd0, syndrome[8] };
+    wire [1:0] sum_40 = { 1'd0, syndrome[8] } + { 1'd0, syndrome[9] };
+    wire [1:0] sum_41 = { 1'd0, syndrome[9] } + { 1'd0, syndrome[10] };
+    wire [1:0] sum_42 = { 1'd0, syndrome[10] } + { 1'd0, syndrome[11] };
+    wire [1:0] sum_43 = { 1'd0, syndrome[11] } + { 1'd0, syndrome[12] };
+    wire [1:0] sum_44 = { 1'd0, syndrome[12] } + { 1'd0, syndrome[13] };
+    wire [1:0] sum_45 = { 1'd0, syndrome[13] } + { 1'd0, syndrome[14] };
+    wire [1:0] sum_46 = { 1'd0, syndrome[14] } + { 1'd0, syndrome[15] };
+    wire [1:0] sum_47 = { 1'd0, syndrome[15] } + { 1'd0, syndrome[16] };
+    wire [1:0] sum_48 = { 1'd0, syndrome[16] } + { 1'd0, syndrome[17] };
+    wire [1:0] sum_49 = { 1'd0, syndrome[17] } + { 1'd0, syndrome[18] };
+    wire [1:0] sum_50 = { 1'd0, syndrome[18] } + { 1'd0, syndrome[19] };
+    wire [1:0] sum_51 = { 1'd0, syndrome[19] } + { 1'd0, syndrome[20] };
+    wire [1:0] sum_52 = { 1'd0, syndrome[20] } + { 1'd0, syndrome[21] };
+    wire [1:0] sum_53 = { 1'd0, syndrome[21] } + { 1'd0, syndrome[22] };
+    wire [1:0] sum_54 = { 1'd0, syndrome[22] } + { 1'd0, syndrome[23] };
+    wire [1:0] sum_55 = { 1'd0, syndrome[23] } + { 1'd0, syndrome[24] };
+    wire [1:0] sum_56 = { 1'd0, syndrome[24] } + { 1'd0, syndrome[25] };
+    wire [1:0] sum_57 = { 1'd0, syndrome[25] } + { 1'd0, syndrome[26] };
+    wire [1:0] sum_58 = { 1'd0, syndrome[26] } + { 1'd0, syndrome[27] };
+    wire [1:0] sum_59 = { 1'd0, syndrome[27] } + { 1'd0, syndrome[28] };
+    wire [1:0] sum_60 = { 1'd0, syndrome[28] } + { 1'd0, syndrome[29] };
+    wire [1:0] sum_61 = { 1'd0, syndrome[29] } + { 1'd0, syndrome[30] };
+    wire [1:0] sum_62 = { 1'd0, syndrome[30] } + { 1'd0, syndrome[31] };
+    wire [1:0] sum_63 = { 1'd0, syndrome[31] };
+    wire [1:0] best_votes_0_0 = (sum_0 >= sum_1) ? sum_0 : sum_1;
+    wire [5:0] best_idx_0_0 = (sum_0 >= sum_1) ? 6'd0 : 6'd1;
+    wire [1:0] best_votes_0_1 = (sum_2 >= sum_3) ? sum_2 : sum_3;
+    wire [5:0] best_idx_0_1 = (sum_2 >= sum_3) ? 6'd2 : 6'd3;
+    wire [1:0] best_votes_0_2 = (sum_4 >= sum_5) ? sum_4 : sum_5;
+    wire [5:0] best_idx_0_2 = (sum_4 >= sum_5) ? 6'd4 : 6'd5;
+    wire [1:0] best_votes_0_3 = (sum_6 >= sum_7) ? sum_6 : sum_7;
+    wire [5:0] best_idx_0_3 = (sum_6 >= sum_7) ? 6'd6 : 6'd7;
+    wire [1:0] best_votes_0_4 = (sum_8 >= sum_9) ? sum_8 : sum_9;
+    wire [5:0] best_idx_0_4 = (sum_8 >= sum_9) ? 6'd8 : 6'd9;
+    wire [1:0] best_votes_0_5 = (sum_10 >= sum_11) ? sum_10 : sum_11;
+    wire [5:0] best_idx_0_5 = (sum_10 >= sum_11) ? 6'd10 : 6'd11;
+    wire [1:0] best_votes_0_6 = (sum_12 >= sum_13) ? sum_12 : sum_13;
+    wire [5:0] best_idx_0_6 = (sum_12 >= sum_13) ? 6'd12 : 6'd13;
+    wire [1:0] best_votes_0_7 = (sum_14 >= sum_15) ? sum_14 : sum_15;
+    wire [5:0] best_idx_0_7 = (sum_14 >= sum_15) ? 6'd14 : 6'd15;
+    wire [1:0] best_votes_0_8 = (sum_16 >= sum_17) ? sum_16 : sum_17;
+    wire [5:0] best_idx_0_8 = (sum_16 >= sum_17) ? 6'd16 : 6'd17;
+    wire [1:0] best_votes_0_9 = (sum_18 >= sum_19) ? sum_18 : sum_19;
+    wire [5:0] best_idx_0_9 = (sum_18 >= sum_19) ? 6'd18 : 6'd19;
+    wire [1:0] best_votes_0_10 = (sum_20 >= sum_21) ? sum_20 : sum_21;
+    wire [5:0] best_idx_0_10 = (sum_20 >= sum_21) ? 6'd20 : 6'd21;
+    wire [1:0] best_votes_0_11 = (sum_22 >= sum_23) ? sum_22 : sum_23;
+    wire [5:0] best_idx_0_11 = (sum_22 >= sum_23) ? 6'd22 : 6'd23;
+    wire [1:0] best_votes_0_12 = (sum_24 >= sum_25) ? sum_24 : sum_25;
+    wire [5:0] best_idx_0_12 = (sum_24 >= sum_25) ? 6'd24 : 6'd25;
+    wire [1:0] best_votes_0_13 = (sum_26 >= sum_27) ? sum_26 : sum_27;
+    wire [5:0] best_idx_0_13 = (sum_26 >= sum_27) ? 6'd26 : 6'd27;
+    wire [1:0] best_votes_0_14 = (sum_28 >= sum_29) ? sum_28 : sum_29;
+    wire [5:0] best_idx_0_14 = (sum_28 >= sum_29) ? 6'd28 : 6'd29;
+    wire [1:0] best_votes_0_15 = (sum_30 >= sum_31) ? sum_30 : sum_31;
+    wire [5:0] best_idx_0_15 = (sum_30 >= sum_31) ? 6'd30 : 6'd31;
+    wire [1:0] best_votes_0_16 = (sum_32 >= sum_33) ? sum_32 : sum_33;
+    wire [5:0] best_idx_0_16 = (sum_32 >= sum_33) ? 6'd32 : 6'd33;
+    wire [1:0] best_votes_0_17 = (sum_34 >= sum_35) ? sum_34 : sum_35;
+    wire [5:0] best_idx_0_17 = (sum_34 >= sum_35) ? 6'd34 : 6'd35;
+    wire [1:0] best_votes_0_18 = (sum_36 >= sum_37) ? sum_36 : sum_37;
+    wire [5:0] best_idx_0_18 = (sum_36 >= sum_37) ? 6'd36 : 6'd37;
+    wire [1:0] best_votes_0_19 = (sum_38 >= sum_39) ? sum_38 : sum_39;
+    wire [5:0] best_idx_0_19 = (sum_38 >= sum_39) ? 6'd38 : 6'd39;
+    wire [1:0] best_votes_0_20 = (sum_40 >= sum_41) ? sum_40 : sum_41;
+    wire [5:0] best_idx_0_20 = (sum_40 >= sum_41) ? 6'd40 : 6'd41;
+    wire [1:0] best_votes_0_21 = (sum_42 >= sum_43) ? sum_42 : sum_43;
+    wire [5:0] best_idx_0_21 = (sum_42 >= sum_43) ? 6'd42 : 6'd43;
+    wire [1:0] best_votes_0_22 = (sum_44 >= sum_45) ? sum_44 : sum_45;
+    wire [5:0] best_idx_0_22 = (sum_44 >= sum_45) ? 6'd44 : 6'd45;
+    wire [1:0] best_votes_0_23 = (sum_46 >= sum_47) ? sum_46 : sum_47;
+    wire [5:0] best_idx_0_23 = (sum_46 >= sum_47) ? 6'd46 : 6'd47;
+    wire [1:0] best_votes_0_24 = (sum_48 >= sum_49) ? sum_48 : sum_49;
+    wire [5:0] best_idx_0_24 = (sum_48 >= sum_49) ? 6'd48 : 6'd49;
+    wire [1:0] best_votes_0_25 = (sum_50 >= sum_51) ? sum_50 : sum_51;
+    wire [5:0] best_idx_0_25 = (sum_50 >= sum_51) ? 6'd50 : 6'd51;
+    wire [1:0] best_votes_0_26 = (sum_52 >= sum_53) ? sum_52 : sum_53;
+    wire [5:0] best_idx_0_26 = (sum_52 >= sum_53) ? 6'd52 : 6'd53;
+    wire [1:0] best_votes_0_27 = (sum_54 >= sum_55) ? sum_54 : sum_55;
+    wire [5:0] best_idx_0_27 = (sum_54 >= sum_55) ? 6'd54 : 6'd55;
+    wire [1:0] best_votes_0_28 = (sum_56 >= sum_57) ? sum_56 : sum_57;
+    wire [5:0] best_idx_0_28 = (sum_56 >= sum_57) ? 6'd56 : 6'd57;
+    wire [1:0] best_votes_0_29 = (sum_58 >= sum_59) ? sum_58 : sum_59;
+    wire [5:0] best_idx_0_29 = (sum_58 >= sum_59) ? 6'd58 : 6'd59;
+    wire [1:0] best_votes_0_30 = (sum_60 >= sum_61) ? sum_60 : sum_61;
+    wire [5:0] best_idx_0_30 = (sum_60 >= sum_61) ? 6'd60 : 6'd61;
+    wire [1:0] best_votes_0_31 = (sum_62 >= sum_63) ? sum_62 : sum_63;
+    wire [5:0] best_idx_0_31 = (sum_62 >= sum_63) ? 6'd62 : 6'd63;
+    wire [1:0] best_votes_1_0 = (best_votes_0_0 >= best_votes_0_1) ? best_votes_0_0 : best_votes_0_1;
+    wire [5:0] best_idx_1_0 = (best_votes_0_0 >= best_votes_0_1) ? best_idx_0_0 : best_idx_0_1;
+    wire [1:0] best_votes_1_1 = (best_votes_0_2 >= best_votes_0_3) ? best_votes_0_2 : best_votes_0_3;
+    wire [5:0] best_idx_1_1 = (best_votes_0_2 >= best_votes_0_3) ? best_idx_0_2 : best_idx_0_3;
+    wire [1:0] best_votes_1_2 = (best_votes_0_4 >= best_votes_0_5) ? best_votes_0_4 : best_votes_0_5;
+    wire [5:0] best_idx_1_2 = (best_votes_0_4 >= best_votes_0_5) ? best_idx_0_4 : best_idx_0_5;
+    wire [1:0] best_votes_1_3 = (best_votes_0_6 >= best_votes_0_7) ? best_votes_0_6 : best_votes_0_7;
+    wire [5:0] best_idx_1_3 = (best_votes_0_6 >= best_votes_0_7) ? best_idx_0_6 : best_idx_0_7;
+    wire [1:0] best_votes_1_4 = (best_votes_0_8 >= best_votes_0_9) ? best_votes_0_8 : best_votes_0_9;
+    wire [5:0] best_idx_1_4 = (best_votes_0_8 >= best_votes_0_9) ? best_idx_0_8 : best_idx_0_9;
+    wire [1:0] best_votes_1_5 = (best_votes_0_10 >= best_votes_0_11) ? best_votes_0_10 : best_votes_0_11;
+    wire [5:0] best_idx_1_5 = (best_votes_0_10 >= best_votes_0_11) ? best_idx_0_10 : best_idx_0_11;
+    wire [1:0] best_votes_1_6 = (best_votes_0_12 >= best_votes_0_13) ? best_votes_0_12 : best_votes_0_13;
+    wire [5:0] best_idx_1_6 = (best_votes_0_12 >= best_votes_0_13) ? best_idx_0_12 : best_idx_0_13;
+    wire [1:0] best_votes_1_7 = (best_votes_0_14 >= best_votes_0_15) ? best_votes_0_14 : best_votes_0_15;
+    wire [5:0] best_idx_1_7 = (best_votes_0_14 >= best_votes_0_15) ? best_idx_0_14 : best_idx_0_15;
+    wire [1:0] best_votes_1_8 = (best_votes_0_16 >= best_votes_0_17) ? best_votes_0_16 : best_votes_0_17;
+    wire [5:0] best_idx_1_8 = (best_votes_0_16 >= best_votes_0_17) ? best_idx_0_16 : best_idx_0_17;
+    wire [1:0] best_votes_1_9 = (best_votes_0_18 >= best_votes_0_19) ? best_votes_0_18 : best_votes_0_19;
+    wire [5:0] best_idx_1_9 = (best_votes_0_18 >= best_votes_0_19) ? best_idx_0_18 : best_idx_0_19;
+    wire [1:0] best_votes_1_10 = (best_votes_0_20 >= best_votes_0_21) ? best_votes_0_20 : best_votes_0_21;
+    wire [5:0] best_idx_1_10 = (best_votes_0_20 >= best_votes_0_21) ? best_idx_0_20 : best_idx_0_21;
+    wire [1:0] best_votes_1_11 = (best_votes_0_22 >= best_votes_0_23) ? best_votes_0_22 : best_votes_0_23;
+    wire [5:0] best_idx_1_11 = (best_votes_0_22 >= best_votes_0_23) ? best_idx_0_22 : best_idx_0_23;
+    wire [1:0] best_votes_1_12 = (best_votes_0_24 >= best_votes_0_25) ? best_votes_0_24 : best_votes_0_25;
+    wire [5:0] best_idx_1_12 = (best_votes_0_24 >= best_votes_0_25) ? best_idx_0_24 : best_idx_0_25;
+    wire [1:0] best_votes_1_13 = (best_votes_0_26 >= best_votes_0_27) ? best_votes_0_26 : best_votes_0_27;
+    wire [5:0] best_idx_1_13 = (best_votes_0_26 >= best_votes_0_27) ? best_idx_0_26 : best_idx_0_27;
+    wire [1:0] best_votes_1_14 = (best_votes_0_28 >= best_votes_0_29) ? best_votes_0_28 : best_votes_0_29;
+    wire [5:0] best_idx_1_14 = (best_votes_0_28 >= best_votes_0_29) ? best_idx_0_28 : best_idx_0_29;
+    wire [1:0] best_votes_1_15 = (best_votes_0_30 >= best_votes_0_31) ? best_votes_0_30 : best_votes_0_31;
+    wire [5:0] best_idx_1_15 = (best_votes_0_30 >= best_votes_0_31) ? best_idx_0_30 : best_idx_0_31;
+    wire [1:0] best_votes_2_0 = (best_votes_1_0 >= best_votes_1_1) ? best_votes_1_0 : best_votes_1_1;
+    wire [5:0] best_idx_2_0 = (best_votes_1_0 >= best_votes_1_1) ? best_idx_1_0 : best_idx_1_1;
+    wire [1:0] best_votes_2_1 = (best_votes_1_2 >= best_votes_1_3) ? best_votes_1_2 : best_votes_1_3;
+    wire [5:0] best_idx_2_1 = (best_votes_1_2 >= best_votes_1_3) ? best_idx_1_2 : best_idx_1_3;
+    wire [1:0] best_votes_2_2 = (best_votes_1_4 >= best_votes_1_5) ? best_votes_1_4 : best_votes_1_5;
+    wire [5:0] best_idx_2_2 = (best_votes_1_4 >= best_votes_1_5) ? best_idx_1_4 : best_idx_1_5;
+    wire [1:0] best_votes_2_3 = (best_votes_1_6 >= best_votes_1_7) ? best_votes_1_6 : best_votes_1_7;
+    wire [5:0] best_idx_2_3 = (best_votes_1_6 >= best_votes_1_7) ? best_idx_1_6 : best_idx_1_7;
+    wire [1:0] best_votes_2_4 = (best_votes_1_8 >= best_votes_1_9) ? best_votes_1_8 : best_votes_1_9;
+    wire [5:0] best_idx_2_4 = (best_votes_1_8 >= best_votes_1_9) ? best_idx_1_8 : best_idx_1_9;
+    wire [1:0] best_votes_2_5 = (best_votes_1_10 >= best_votes_1_11) ? best_votes_1_10 : best_votes_1_11;
+    wire [5:0] best_idx_2_5 = (best_votes_1_10 >= best_votes_1_11) ? best_idx_1_10 : best_idx_1_11;
+    wire [1:0] best_votes_2_6 = (best_votes_1_12 >= best_votes_1_13) ? best_votes_1_12 : best_votes_1_13;
+    wire [5:0] best_idx_2_6 = (best_votes_1_12 >= best_votes_1_13) ? best_idx_1_12 : best_idx_1_13;
+    wire [1:0] best_votes_2_7 = (best_votes_1_14 >= best_votes_1_15) ? best_votes_1_14 : best_votes_1_15;
+    wire [5:0] best_idx_2_7 = (best_votes_1_14 >= best_votes_1_15) ? best_idx_1_14 : best_idx_1_15;
+    wire [1:0] best_votes_3_0 = (best_votes_2_0 >= best_votes_2_1) ? best_votes_2_0 : best_votes_2_1;
+    wire [5:0] best_idx_3_0 = (best_votes_2_0 >= best_votes_2_1) ? best_idx_2_0 : best_idx_2_1;
+    wire [1:0] best_votes_3_1 = (best_votes_2_2 >= best_votes_2_3) ? best_votes_2_2 : best_votes_2_3;
+    wire [5:0] best_idx_3_1 = (best_votes_2_2 >= best_votes_2_3) ? best_idx_2_2 : best_idx_2_3;
+    wire [1:0] best_votes_3_2 = (best_votes_2_4 >= best_votes_2_5) ? best_votes_2_4 : best_votes_2_5;
+    wire [5:0] best_idx_3_2 = (best_votes_2_4 >= best_votes_2_5) ? best_idx_2_4 : best_idx_2_5;
+    wire [1:0] best_votes_3_3 = (best_votes_2_6 >= best_votes_2_7) ? best_votes_2_6 : best_votes_2_7;
+    wire [5:0] best_idx_3_3 = (best_votes_2_6 >= best_votes_2_7) ? best_idx_2_6 : best_idx_2_7;
+    wire [1:0] best_votes_4_0 = (best_votes_3_0 >= best_votes_3_1) ? best_votes_3_0 : best_votes_3_1;
+    wire [5:0] best_idx_4_0 = (best_votes_3_0 >= best_votes_3_1) ? best_idx_3_0 : best_idx_3_1;
+    wire [1:0] best_votes_4_1 = (best_votes_3_2 >= best_votes_3_3) ? best_votes_3_2 : best_votes_3_3;
+    wire [5:0] best_idx_4_1 = (best_votes_3_2 >= best_votes_3_3) ? best_idx_3_2 : best_idx_3_3;
+    wire [1:0] best_votes_5_0 = (best_votes_4_0 >= best_votes_4_1) ? best_votes_4_0 : best_votes_4_1;
+    wire [5:0] best_idx_5_0 = (best_votes_4_0 >= best_votes_4_1) ? best_idx_4_0 : best_idx_4_1;
+    wire [1:0] best_votes = best_votes_5_0;
+    wire [5:0] best_idx = best_idx_5_0;
     always @(posedge clk or negedge rst_n) begin
         if (!rst_n) begin
             state <= IDLE;
             current_cw <= 0;
+            received_data <= 0;
             iter_count <= 0;
             codeword_out <= 0;
             data_out <= 0;
@@ -236,6 +303,7 @@ module ldpc_ecc_w32 (
             else if (decode_en && state == IDLE) begin
                 state <= CALC_SYNDROME;
                 current_cw <= codeword_in;
+                received_data <= codeword_in[31:0];
                 iter_count <= 0;
             end
             
@@ -244,85 +312,23 @@ module ldpc_ecc_w32 (
                     CALC_SYNDROME: begin
                         if (!has_error) begin
                              state <= FINISH;
-                        end else if (iter_count == MAX_ITER) begin
+                        end else if (iter_count == MAX_ITER || best_votes == 0) begin
                              state <= FINISH;
                         end else begin
                              state <= FLIP_BITS;
                         end
                     end
                     FLIP_BITS: begin
-                        // Apply flips
-                        current_cw[0] <= current_cw[0] ^ flip_0;
-                        current_cw[1] <= current_cw[1] ^ flip_1;
-                        current_cw[2] <= current_cw[2] ^ flip_2;
-                        current_cw[3] <= current_cw[3] ^ flip_3;
-                        current_cw[4] <= current_cw[4] ^ flip_4;
-                        current_cw[5] <= current_cw[5] ^ flip_5;
-                        current_cw[6] <= current_cw[6] ^ flip_6;
-                        current_cw[7] <= current_cw[7] ^ flip_7;
-                        current_cw[8] <= current_cw[8] ^ flip_8;
-                        current_cw[9] <= current_cw[9] ^ flip_9;
-                        current_cw[10] <= current_cw[10] ^ flip_10;
-                        current_cw[11] <= current_cw[11] ^ flip_11;
-                        current_cw[12] <= current_cw[12] ^ flip_12;
-                        current_cw[13] <= current_cw[13] ^ flip_13;
-                        current_cw[14] <= current_cw[14] ^ flip_14;
-                        current_cw[15] <= current_cw[15] ^ flip_15;
-                        current_cw[16] <= current_cw[16] ^ flip_16;
-                        current_cw[17] <= current_cw[17] ^ flip_17;
-                        current_cw[18] <= current_cw[18] ^ flip_18;
-                        current_cw[19] <= current_cw[19] ^ flip_19;
-                        current_cw[20] <= current_cw[20] ^ flip_20;
-                        current_cw[21] <= current_cw[21] ^ flip_21;
-                        current_cw[22] <= current_cw[22] ^ flip_22;
-                        current_cw[23] <= current_cw[23] ^ flip_23;
-                        current_cw[24] <= current_cw[24] ^ flip_24;
-                        current_cw[25] <= current_cw[25] ^ flip_25;
-                        current_cw[26] <= current_cw[26] ^ flip_26;
-                        current_cw[27] <= current_cw[27] ^ flip_27;
-                        current_cw[28] <= current_cw[28] ^ flip_28;
-                        current_cw[29] <= current_cw[29] ^ flip_29;
-                        current_cw[30] <= current_cw[30] ^ flip_30;
-                        current_cw[31] <= current_cw[31] ^ flip_31;
-                        current_cw[32] <= current_cw[32] ^ flip_32;
-                        current_cw[33] <= current_cw[33] ^ flip_33;
-                        current_cw[34] <= current_cw[34] ^ flip_34;
-                        current_cw[35] <= current_cw[35] ^ flip_35;
-                        current_cw[36] <= current_cw[36] ^ flip_36;
-                        current_cw[37] <= current_cw[37] ^ flip_37;
-                        current_cw[38] <= current_cw[38] ^ flip_38;
-                        current_cw[39] <= current_cw[39] ^ flip_39;
-                        current_cw[40] <= current_cw[40] ^ flip_40;
-                        current_cw[41] <= current_cw[41] ^ flip_41;
-                        current_cw[42] <= current_cw[42] ^ flip_42;
-                        current_cw[43] <= current_cw[43] ^ flip_43;
-                        current_cw[44] <= current_cw[44] ^ flip_44;
-                        current_cw[45] <= current_cw[45] ^ flip_45;
-                        current_cw[46] <= current_cw[46] ^ flip_46;
-                        current_cw[47] <= current_cw[47] ^ flip_47;
-                        current_cw[48] <= current_cw[48] ^ flip_48;
-                        current_cw[49] <= current_cw[49] ^ flip_49;
-                        current_cw[50] <= current_cw[50] ^ flip_50;
-                        current_cw[51] <= current_cw[51] ^ flip_51;
-                        current_cw[52] <= current_cw[52] ^ flip_52;
-                        current_cw[53] <= current_cw[53] ^ flip_53;
-                        current_cw[54] <= current_cw[54] ^ flip_54;
-                        current_cw[55] <= current_cw[55] ^ flip_55;
-                        current_cw[56] <= current_cw[56] ^ flip_56;
-                        current_cw[57] <= current_cw[57] ^ flip_57;
-                        current_cw[58] <= current_cw[58] ^ flip_58;
-                        current_cw[59] <= current_cw[59] ^ flip_59;
-                        current_cw[60] <= current_cw[60] ^ flip_60;
-                        current_cw[61] <= current_cw[61] ^ flip_61;
-                        current_cw[62] <= current_cw[62] ^ flip_62;
-                        current_cw[63] <= current_cw[63] ^ flip_63;
+                        // Flip the lowest-index variable with the most unsatisfied checks
+                        current_cw[best_idx] <= ~current_cw[best_idx];
                         iter_count <= iter_count + 1;
                         state <= CALC_SYNDROME;
                     end
                     FINISH: begin
-                        data_out <= current_cw[31:0];
+                        // On failure return the received data bits, as LDPCEngine does
+                        data_out <= has_error ? received_data : current_cw[31:0];
                         error_detected <= has_error;
-                        error_corrected <= (has_error == 0); // Approx
+                        error_corrected <= (has_error == 0);
                         valid_out <= 1'b1;
                         state <= IDLE;
                     end
@@ -1,4 +1,5 @@
 // Generated ldpc_ecc_w4 - Do not edit manually
+// LDPC matrices: n=8, k=4, seed=0
 module ldpc_ecc_w4 (
     input  wire clk,
     input  wire rst_n,
@@ -15,41 +16,51 @@ module ldpc_ecc_w4 (
     reg [3:0] state;
     localparam IDLE = 0, CALC_SYNDROME = 1, FLIP_BITS = 2, CHECK_DONE = 3, FINISH = 4;
     reg [4:0] iter_count;
-    localparam MAX_ITER = 10;
+    localparam MAX_ITER = 20;
     
     reg [7:0] current_cw;
+    reg [3:0] received_data;
     wire [3:0] syndrome;
     wire has_error;
     wire [3:0] parity_out;
-    assign parity_out[0] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3];
-    assign parity_out[1] = data_in[2] ^ data_in[3];
-    assign parity_out[2] = data_in[1];
+    assign parity_out[0] = data_in[1] ^ data_in[2] ^ data_in[3];
+    assign parity_out[1] = data_in[0] ^ data_in[2];
+    assign parity_out[2] = data_in[1] ^ data_in[3];
     assign parity_out[3] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3];
-    assign syndrome[0] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4];
-    assign syndrome[1] = current_cw[2] ^ current_cw[3] ^ current_cw[5];
-    assign syndrome[2] = current_cw[1] ^ current_cw[6];
-    assign syndrome[3] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[7];
+    assign syndrome[0] = current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4];
+    assign syndrome[1] = current_cw[0] ^ current_cw[1] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5];
+    assign syndrome[2] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[5] ^ current_cw[6];
+    assign syndrome[3] = current_cw[0] ^ current_cw[2] ^ current_cw[6] ^ current_cw[7];
     assign has_error = |syndrome;
-    wire [1:0] sum_0 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[3] };
-    wire flip_0 = (sum_0 >= 2'd1);
-    wire [1:0] sum_1 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[2] } + { 1'd0, syndrome[3] };
-    wire flip_1 = (sum_1 >= 2'd2);
-    wire [1:0] sum_2 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[1] } + { 1'd0, syndrome[3] };
-    wire flip_2 = (sum_2 >= 2'd2);
-    wire [1:0] sum_3 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[1] } + { 1'd0, syndrome[3] };
-    wire flip_3 = (sum_3 >= 2'd2);
-    wire [0:0] sum_4 = syndrome[0];
-    wire flip_4 = (sum_4 >= 1'd1);
-    wire [0:0] sum_5 = syndrome[1];
-    wire flip_5 = (sum_5 >= 1'd1);
-    wire [0:0] sum_6 = syndrome[2];
-    wire flip_6 = (sum_6 >= 1'd1);
-    wire [0:0] sum_7 = syndrome[3];
-    wire flip_7 = (sum_7 >= 1'd1);
+    wire [1:0] sum_0 = { 1'd0, syndrome[1] } + { 1'd0, syndrome[2] } + { 1'd0, syndrome[3] };
+    wire [1:0] sum_1 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[1] } + { 1'd0, syndrome[2] };
+    wire [1:0] sum_2 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[2] } + { 1'd0, syndrome[3] };
+    wire [1:0] sum_3 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[1] } + { 1'd0, syndrome[2] };
+    wire [1:0] sum_4 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[1] };
+    wire [1:0] sum_5 = { 1'd0, syndrome[1] } + { 1'd0, syndrome[2] };
+    wire [1:0] sum_6 = { 1'd0, syndrome[2] } + { 1'd0, syndrome[3] };
+    wire [1:0] sum_7 = { 1'd0, syndrome[3] };
+    wire [1:0] best_votes_0_0 = (sum_0 >= sum_1) ? sum_0 : sum_1;
+    wire [2:0] best_idx_0_0 = (sum_0 >= sum_1) ? 3'd0 : 3'd1;
+    wire [1:0] best_votes_0_1 = (sum_2 >= sum_3) ? sum_2 : sum_3;
+    wire [2:0] best_idx_0_1 = (sum_2 >= sum_3) ? 3'd2 : 3'd3;
+    wire [1:0] best_votes_0_2 = (sum_4 >= sum_5) ? sum_4 : sum_5;
+    wire [2:0] best_idx_0_2 = (sum_4 >= sum_5) ? 3'd4 : 3'd5;
+    wire [1:0] best_votes_0_3 = (sum_6 >= sum_7) ? sum_6 : sum_7;
+    wire [2:0] best_idx_0_3 = (sum_6 >= sum_7) ? 3'd6 : 3'd7;
+    wire [1:0] best_votes_1_0 = (best_votes_0_0 >= best_votes_0_1) ? best_votes_0_0 : best_votes_0_1;
+    wire [2:0] best_idx_1_0 = (best_votes_0_0 >= best_votes_0_1) ? best_idx_0_0 : best_idx_0_1;
+    wire [1:0] best_votes_1_1 = (best_votes_0_2 >= best_votes_0_3) ? best_votes_0_2 : best_votes_0_3;
+    wire [2:0] best_idx_1_1 = (best_votes_0_2 >= best_votes_0_3) ? best_idx_0_2 : best_idx_0_3;
+    wire [1:0] best_votes_2_0 = (best_votes_1_0 >= best_votes_1_1) ? best_votes_1_0 : best_votes_1_1;
+    wire [2:0] best_idx_2_0 = (best_votes_1_0 >= best_votes_1_1) ? best_idx_1_0 : best_idx_1_1;
+    wire [1:0] best_votes = best_votes_2_0;
+    wire [2:0] best_idx = best_idx_2_0;
     always @(posedge clk or negedge rst_n) begin
         if (!rst_n) begin
             state <= IDLE;
             current_cw <= 0;
+            received_data <= 0;
             iter_count <= 0;
             codeword_out <= 0;
             data_out <= 0;
@@ -68,6 +79,7 @@ module ldpc_ecc_w4 (
             else if (decode_en && state == IDLE) begin
                 state <= CALC_SYNDROME;
                 current_cw <= codeword_in;
+                received_data <= codeword_in[3:0];
                 iter_count <= 0;
             end
             
@@ -76,29 +88,23 @@ module ldpc_ecc_w4 (
                     CALC_SYNDROME: begin
                         if (!has_error) begin
                              state <= FINISH;
-                        end else if (iter_count == MAX_ITER) begin
+                        end else if (iter_count == MAX_ITER || best_votes == 0) begin
                              state <= FINISH;
                         end else begin
                              state <= FLIP_BITS;
                         end
                     end
                     FLIP_BITS: begin
-                        // Apply flips
-                        current_cw[0] <= current_cw[0] ^ flip_0;
-                        current_cw[1] <= current_cw[1] ^ flip_1;
-                        current_cw[2] <= current_cw[2] ^ flip_2;
-                        current_cw[3] <= current_cw[3] ^ flip_3;
-                        current_cw[4] <= current_cw[4] ^ flip_4;
-                        current_cw[5] <= current_cw[5] ^ flip_5;
-                        current_cw[6] <= current_cw[6] ^ flip_6;
-                        current_cw[7] <= current_cw[7] ^ flip_7;
+                        // Flip the lowest-index variable with the most unsatisfied checks
+                        current_cw[best_idx] <= ~current_cw[best_idx];
                         iter_count <= iter_count + 1;
                         state <= CALC_SYNDROME;
                     end
                     FINISH: begin
-                        data_out <= current_cw[3:0];
+                        // On failure return the received data bits, as LDPCEngine does
+                        data_out <= has_error ? received_data : current_cw[3:0];
                         error_detected <= has_error;
-                        error_corrected <= (has_error == 0); // Approx
+                        error_corrected <= (has_error == 0);
                         valid_out <= 1'b1;
                         state <= IDLE;
                     end
@@ -1,4 +1,5 @@
 // Generated ldpc_ecc_w64 - Do not edit manually
+// LDPC matrices: n=128, k=64, seed=0
 module ldpc_ecc_w64 (
     input  wire clk,
     input  wire rst_n,
@@ -15,401 +16,531 @@ module ldpc_ecc_w64 (
     reg [3:0] state;
     localparam IDLE = 0, CALC_SYNDROME = 1, FLIP_BITS = 2, CHECK_DONE = 3, FINISH = 4;
     reg [4:0] iter_count;
-    localparam MAX_ITER = 10;
+    localparam MAX_ITER = 20;
     
     reg [127:0] current_cw;
+    reg [63:0] received_data;
     wire [63:0] syndrome;
     wire has_error;
     wire [63:0] parity_out;
-    assign parity_out[0] = data_in[19] ^ data_in[28] ^ data_in[29];
-    assign parity_out[1] = data_in[19] ^ data_in[28] ^ data_in[58];
-    assign parity_out[2] = data_in[5] ^ data_in[19] ^ data_in[28] ^ data_in[38] ^ data_in[58];
-    assign parity_out[3] = data_in[0] ^ data_in[5] ^ data_in[19] ^ data_in[28] ^ data_in[38] ^ data_in[45] ^ data_in[58];
-    assign parity_out[4] = data_in[0] ^ data_in[3] ^ data_in[5] ^ data_in[14] ^ data_in[19] ^ data_in[28] ^ data_in[38] ^ data_in[45] ^ data_in[58];
-    assign parity_out[5] = data_in[0] ^ data_in[3] ^ data_in[5] ^ data_in[11] ^ data_in[14] ^ data_in[19] ^ data_in[28] ^ data_in[45] ^ data_in[58] ^ data_in[60];
-    assign parity_out[6] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[11] ^ data_in[14] ^ data_in[19] ^ data_in[28] ^ data_in[45] ^ data_in[48] ^ data_in[58] ^ data_in[59] ^ data_in[60];
-    assign parity_out[7] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[19] ^ data_in[28] ^ data_in[45] ^ data_in[48] ^ data_in[58] ^ data_in[59] ^ data_in[60];
-    assign parity_out[8] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[19] ^ data_in[28] ^ data_in[45] ^ data_in[48] ^ data_in[58] ^ data_in[59] ^ data_in[60];
-    assign parity_out[9] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[19] ^ data_in[28] ^ data_in[39] ^ data_in[45] ^ data_in[48] ^ data_in[58] ^ data_in[59] ^ data_in[60];
-    assign parity_out[10] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[19] ^ data_in[28] ^ data_in[39] ^ data_in[45] ^ data_in[49] ^ data_in[59] ^ data_in[60];
-    assign parity_out[11] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[19] ^ data_in[23] ^ data_in[28] ^ data_in[39] ^ data_in[41] ^ data_in[45] ^ data_in[49] ^ data_in[59] ^ data_in[60];
-    assign parity_out[12] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[19] ^ data_in[23] ^ data_in[28] ^ data_in[39] ^ data_in[41] ^ data_in[45] ^ data_in[49] ^ data_in[52] ^ data_in[56] ^ data_in[59] ^ data_in[60];
-    assign parity_out[13] = data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[9] ^ data_in[11] ^ data_in[14] ^ data_in[19] ^ data_in[23] ^ data_in[24] ^ data_in[28] ^ data_in[30] ^ data_in[39] ^ data_in[41] ^ data_in[44] ^ data_in[45] ^ data_in[49] ^ data_in[52] ^ data_in[56] ^ data_in[59] ^ data_in[60];
-    assign parity_out[14] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[9] ^ data_in[11] ^ data_in[14] ^ data_in[17] ^ data_in[19] ^ data_in[23] ^ data_in[24] ^ data_in[28] ^ data_in[30] ^ data_in[39] ^ data_in[41] ^ data_in[44] ^ data_in[45] ^ data_in[49] ^ data_in[52] ^ data_in[56] ^ data_in[59] ^ data_in[60] ^ data_in[62];
-    assign parity_out[15] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[9] ^ data_in[11] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[44] ^ data_in[45] ^ data_in[47] ^ data_in[49] ^ data_in[52] ^ data_in[56] ^ data_in[59] ^ data_in[60];
-    assign parity_out[16] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[9] ^ data_in[11] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[39] ^ data_in[41] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[52] ^ data_in[53] ^ data_in[56] ^ data_in[59] ^ data_in[60];
-    assign parity_out[17] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[39] ^ data_in[41] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[52] ^ data_in[53] ^ data_in[56] ^ data_in[59];
-    assign parity_out[18] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[33] ^ data_in[39] ^ data_in[41] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[52] ^ data_in[53] ^ data_in[56] ^ data_in[59];
-    assign parity_out[19] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[33] ^ data_in[39] ^ data_in[41] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[52] ^ data_in[53] ^ data_in[56] ^ data_in[59] ^ data_in[62];
-    assign parity_out[20] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[33] ^ data_in[39] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[52] ^ data_in[53] ^ data_in[56] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[21] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[39] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[52] ^ data_in[53] ^ data_in[56] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[22] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[17] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[37] ^ data_in[39] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[52] ^ data_in[53] ^ data_in[56] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[23] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[17] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[37] ^ data_in[39] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[24] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[17] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[35] ^ data_in[37] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[25] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[17] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[35] ^ data_in[37] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[53] ^ data_in[54] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[26] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[17] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[35] ^ data_in[37] ^ data_in[44] ^ data_in[45] ^ data_in[49] ^ data_in[50] ^ data_in[53] ^ data_in[54] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[27] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[17] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[35] ^ data_in[37] ^ data_in[44] ^ data_in[45] ^ data_in[50] ^ data_in[53] ^ data_in[54] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[28] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[12] ^ data_in[15] ^ data_in[17] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[35] ^ data_in[37] ^ data_in[44] ^ data_in[45] ^ data_in[50] ^ data_in[53] ^ data_in[54] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[29] = data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[12] ^ data_in[15] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[44] ^ data_in[45] ^ data_in[50] ^ data_in[53] ^ data_in[54] ^ data_in[56] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[30] = data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[44] ^ data_in[45] ^ data_in[50] ^ data_in[53] ^ data_in[54] ^ data_in[56] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[31] = data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[34] ^ data_in[36] ^ data_in[37] ^ data_in[44] ^ data_in[45] ^ data_in[50] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[32] = data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[36] ^ data_in[37] ^ data_in[44] ^ data_in[45] ^ data_in[50] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[33] = data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[37] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[50] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[34] = data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[12] ^ data_in[15] ^ data_in[18] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[39] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[50] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[35] = data_in[1] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[12] ^ data_in[15] ^ data_in[18] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[35] ^ data_in[38] ^ data_in[39] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[50] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[36] = data_in[1] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[12] ^ data_in[15] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[35] ^ data_in[38] ^ data_in[39] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[50] ^ data_in[53] ^ data_in[54] ^ data_in[56] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[37] = data_in[1] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[12] ^ data_in[15] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[35] ^ data_in[38] ^ data_in[39] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[50] ^ data_in[53] ^ data_in[54] ^ data_in[56] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[38] = data_in[1] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[12] ^ data_in[15] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[35] ^ data_in[38] ^ data_in[39] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[50] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[56] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[39] = data_in[1] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[12] ^ data_in[15] ^ data_in[18] ^ data_in[20] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[35] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[50] ^ data_in[52] ^ data_in[53] ^ data_in[56] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[40] = data_in[1] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[12] ^ data_in[15] ^ data_in[18] ^ data_in[20] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[35] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[52] ^ data_in[53] ^ data_in[56] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[41] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[12] ^ data_in[15] ^ data_in[18] ^ data_in[20] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[35] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[52] ^ data_in[53] ^ data_in[56] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[42] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[35] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[52] ^ data_in[53] ^ data_in[56] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[43] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[35] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[52] ^ data_in[53] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[44] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[35] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[62];
-    assign parity_out[45] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[23] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[35] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[55] ^ data_in[56] ^ data_in[61] ^ data_in[62];
-    assign parity_out[46] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[35] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[62];
-    assign parity_out[47] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[33] ^ data_in[35] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[62];
-    assign parity_out[48] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[62];
-    assign parity_out[49] = data_in[0] ^ data_in[2] ^ data_in[4] ^ data_in[5] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[62];
-    assign parity_out[50] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[62];
-    assign parity_out[51] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[62];
-    assign parity_out[52] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[62];
-    assign parity_out[53] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[62];
-    assign parity_out[54] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[62];
-    assign parity_out[55] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[62] ^ data_in[63];
-    assign parity_out[56] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[62] ^ data_in[63];
-    assign parity_out[57] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[58] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[59] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[60] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[44] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[61] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign parity_out[62] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
+    assign parity_out[0] = data_in[16] ^ data_in[41] ^ data_in[44];
+    assign parity_out[1] = data_in[16] ^ data_in[37] ^ data_in[41] ^ data_in[44] ^ data_in[50];
+    assign parity_out[2] = data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[20] ^ data_in[35] ^ data_in[37] ^ data_in[41] ^ data_in[50] ^ data_in[61];
+    assign parity_out[3] = data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[20] ^ data_in[24] ^ data_in[26] ^ data_in[35] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[50] ^ data_in[61];
+    assign parity_out[4] = data_in[3] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[20] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[35] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[50] ^ data_in[61];
+    assign parity_out[5] = data_in[3] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[20] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[29] ^ data_in[35] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[50] ^ data_in[61];
+    assign parity_out[6] = data_in[3] ^ data_in[5] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[20] ^ data_in[24] ^ data_in[26] ^ data_in[29] ^ data_in[35] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[50] ^ data_in[60] ^ data_in[61];
+    assign parity_out[7] = data_in[3] ^ data_in[5] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[20] ^ data_in[24] ^ data_in[26] ^ data_in[29] ^ data_in[35] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[50] ^ data_in[60] ^ data_in[61];
+    assign parity_out[8] = data_in[3] ^ data_in[5] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[20] ^ data_in[24] ^ data_in[26] ^ data_in[29] ^ data_in[35] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[47] ^ data_in[50] ^ data_in[60] ^ data_in[61];
+    assign parity_out[9] = data_in[3] ^ data_in[5] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[17] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[29] ^ data_in[32] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[45] ^ data_in[47] ^ data_in[50] ^ data_in[60] ^ data_in[61];
+    assign parity_out[10] = data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[17] ^ data_in[20] ^ data_in[22] ^ data_in[24] ^ data_in[26] ^ data_in[29] ^ data_in[32] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[45] ^ data_in[47] ^ data_in[50] ^ data_in[60] ^ data_in[61];
+    assign parity_out[11] = data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[20] ^ data_in[24] ^ data_in[26] ^ data_in[29] ^ data_in[32] ^ data_in[35] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[45] ^ data_in[47] ^ data_in[50] ^ data_in[60] ^ data_in[61];
+    assign parity_out[12] = data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[20] ^ data_in[24] ^ data_in[26] ^ data_in[29] ^ data_in[32] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[47] ^ data_in[50] ^ data_in[59] ^ data_in[60];
+    assign parity_out[13] = data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[20] ^ data_in[24] ^ data_in[26] ^ data_in[29] ^ data_in[32] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[47] ^ data_in[50] ^ data_in[59] ^ data_in[60];
+    assign parity_out[14] = data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[17] ^ data_in[20] ^ data_in[24] ^ data_in[26] ^ data_in[29] ^ data_in[32] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[47] ^ data_in[59] ^ data_in[60];
+    assign parity_out[15] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[11] ^ data_in[12] ^ data_in[17] ^ data_in[20] ^ data_in[24] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[47] ^ data_in[59] ^ data_in[60];
+    assign parity_out[16] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[11] ^ data_in[12] ^ data_in[17] ^ data_in[20] ^ data_in[24] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[37] ^ data_in[39] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[47] ^ data_in[52] ^ data_in[56] ^ data_in[58] ^ data_in[59] ^ data_in[60];
+    assign parity_out[17] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[11] ^ data_in[12] ^ data_in[17] ^ data_in[20] ^ data_in[24] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[47] ^ data_in[52] ^ data_in[56] ^ data_in[58] ^ data_in[59] ^ data_in[60];
+    assign parity_out[18] = data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[11] ^ data_in[12] ^ data_in[17] ^ data_in[20] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[47] ^ data_in[52] ^ data_in[56] ^ data_in[58] ^ data_in[59] ^ data_in[60];
+    assign parity_out[19] = data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[12] ^ data_in[20] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[32] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[47] ^ data_in[52] ^ data_in[56] ^ data_in[59] ^ data_in[60];
+    assign parity_out[20] = data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[7] ^ data_in[12] ^ data_in[19] ^ data_in[20] ^ data_in[26] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[32] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[47] ^ data_in[52] ^ data_in[56] ^ data_in[59] ^ data_in[60];
+    assign parity_out[21] = data_in[1] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[12] ^ data_in[19] ^ data_in[20] ^ data_in[26] ^ data_in[28] ^ data_in[30] ^ data_in[32] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[47] ^ data_in[52] ^ data_in[56] ^ data_in[60];
+    assign parity_out[22] = data_in[1] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[9] ^ data_in[12] ^ data_in[19] ^ data_in[20] ^ data_in[26] ^ data_in[28] ^ data_in[30] ^ data_in[32] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[47] ^ data_in[52] ^ data_in[56] ^ data_in[59] ^ data_in[60] ^ data_in[62];
+    assign parity_out[23] = data_in[1] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[9] ^ data_in[12] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[26] ^ data_in[28] ^ data_in[30] ^ data_in[32] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[47] ^ data_in[52] ^ data_in[56] ^ data_in[59] ^ data_in[60] ^ data_in[62];
+    assign parity_out[24] = data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[12] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[26] ^ data_in[28] ^ data_in[30] ^ data_in[32] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[47] ^ data_in[52] ^ data_in[54] ^ data_in[56] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62];
+    assign parity_out[25] = data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[26] ^ data_in[28] ^ data_in[30] ^ data_in[32] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[52] ^ data_in[54] ^ data_in[56] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62];
+    assign parity_out[26] = data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[28] ^ data_in[30] ^ data_in[32] ^ data_in[37] ^ data_in[38] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[56] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62];
+    assign parity_out[27] = data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[16] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[28] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[37] ^ data_in[38] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[56] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62];
+    assign parity_out[28] = data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[16] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[37] ^ data_in[38] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[52] ^ data_in[54] ^ data_in[56] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62];
+    assign parity_out[29] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[16] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[37] ^ data_in[38] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62];
+    assign parity_out[30] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[16] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[27] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[37] ^ data_in[38] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62];
+    assign parity_out[31] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[16] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[27] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62];
+    assign parity_out[32] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[16] ^ data_in[20] ^ data_in[21] ^ data_in[23] ^ data_in[27] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62];
+    assign parity_out[33] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[16] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[27] ^ data_in[28] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[62] ^ data_in[63];
+    assign parity_out[34] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[11] ^ data_in[16] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[28] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[63];
+    assign parity_out[35] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[11] ^ data_in[15] ^ data_in[16] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[28] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[63];
+    assign parity_out[36] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[11] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[28] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[49] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[63];
+    assign parity_out[37] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[11] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[28] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60];
+    assign parity_out[38] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[11] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[28] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60];
+    assign parity_out[39] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[52] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60];
+    assign parity_out[40] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[30] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60];
+    assign parity_out[41] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[7] ^ data_in[8] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[30] ^ data_in[31] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[46] ^ data_in[47] ^ data_in[54] ^ data_in[55] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60];
+    assign parity_out[42] = data_in[0] ^ data_in[4] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[30] ^ data_in[31] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[58] ^ data_in[59] ^ data_in[60];
+    assign parity_out[43] = data_in[3] ^ data_in[4] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[27] ^ data_in[28] ^ data_in[30] ^ data_in[31] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[58] ^ data_in[59] ^ data_in[60];
+    assign parity_out[44] = data_in[3] ^ data_in[4] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[30] ^ data_in[31] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[40] ^ data_in[47] ^ data_in[48] ^ data_in[51] ^ data_in[54] ^ data_in[55] ^ data_in[58] ^ data_in[59] ^ data_in[60];
+    assign parity_out[45] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[30] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[45] ^ data_in[47] ^ data_in[48] ^ data_in[51] ^ data_in[55] ^ data_in[58] ^ data_in[59] ^ data_in[60];
+    assign parity_out[46] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[30] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[45] ^ data_in[48] ^ data_in[51] ^ data_in[55] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62];
+    assign parity_out[47] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[30] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[40] ^ data_in[45] ^ data_in[48] ^ data_in[50] ^ data_in[51] ^ data_in[55] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
+    assign parity_out[48] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[35] ^ data_in[37] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[45] ^ data_in[48] ^ data_in[50] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
+    assign parity_out[49] = data_in[0] ^ data_in[3] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[35] ^ data_in[37] ^ data_in[38] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[45] ^ data_in[48] ^ data_in[50] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
+    assign parity_out[50] = data_in[0] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[35] ^ data_in[37] ^ data_in[38] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[45] ^ data_in[48] ^ data_in[50] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
+    assign parity_out[51] = data_in[0] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[42] ^ data_in[43] ^ data_in[45] ^ data_in[50] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
+    assign parity_out[52] = data_in[0] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[47] ^ data_in[50] ^ data_in[55] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
+    assign parity_out[53] = data_in[0] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[55] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
+    assign parity_out[54] = data_in[0] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[55] ^ data_in[56] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
+    assign parity_out[55] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[40] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[52] ^ data_in[55] ^ data_in[56] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
+    assign parity_out[56] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[47] ^ data_in[48] ^ data_in[50] ^ data_in[52] ^ data_in[55] ^ data_in[56] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
+    assign parity_out[57] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[52] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
+    assign parity_out[58] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[52] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
+    assign parity_out[59] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[52] ^ data_in[53] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
+    assign parity_out[60] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
+    assign parity_out[61] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
+    assign parity_out[62] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
     assign parity_out[63] = data_in[0] ^ data_in[1] ^ data_in[2] ^ data_in[3] ^ data_in[4] ^ data_in[5] ^ data_in[6] ^ data_in[7] ^ data_in[8] ^ data_in[9] ^ data_in[10] ^ data_in[11] ^ data_in[12] ^ data_in[13] ^ data_in[14] ^ data_in[15] ^ data_in[16] ^ data_in[17] ^ data_in[18] ^ data_in[19] ^ data_in[20] ^ data_in[21] ^ data_in[22] ^ data_in[23] ^ data_in[24] ^ data_in[25] ^ data_in[26] ^ data_in[27] ^ data_in[28] ^ data_in[29] ^ data_in[30] ^ data_in[31] ^ data_in[32] ^ data_in[33] ^ data_in[34] ^ data_in[35] ^ data_in[36] ^ data_in[37] ^ data_in[38] ^ data_in[39] ^ data_in[40] ^ data_in[41] ^ data_in[42] ^ data_in[43] ^ data_in[44] ^ data_in[45] ^ data_in[46] ^ data_in[47] ^ data_in[48] ^ data_in[49] ^ data_in[50] ^ data_in[51] ^ data_in[52] ^ data_in[53] ^ data_in[54] ^ data_in[55] ^ data_in[56] ^ data_in[57] ^ data_in[58] ^ data_in[59] ^ data_in[60] ^ data_in[61] ^ data_in[62] ^ data_in[63];
-    assign syndrome[0] = current_cw[19] ^ current_cw[28] ^ current_cw[29] ^ current_cw[64];
-    assign syndrome[1] = current_cw[19] ^ current_cw[28] ^ current_cw[58] ^ current_cw[65];
-    assign syndrome[2] = current_cw[5] ^ current_cw[19] ^ current_cw[28] ^ current_cw[38] ^ current_cw[58] ^ current_cw[66];
-    assign syndrome[3] = current_cw[0] ^ current_cw[5] ^ current_cw[19] ^ current_cw[28] ^ current_cw[38] ^ current_cw[45] ^ current_cw[58] ^ current_cw[67];
-    assign syndrome[4] = current_cw[0] ^ current_cw[3] ^ current_cw[5] ^ current_cw[14] ^ current_cw[19] ^ current_cw[28] ^ current_cw[38] ^ current_cw[45] ^ current_cw[58] ^ current_cw[68];
-    assign syndrome[5] = current_cw[0] ^ current_cw[3] ^ current_cw[5] ^ current_cw[11] ^ current_cw[14] ^ current_cw[19] ^ current_cw[28] ^ current_cw[45] ^ current_cw[58] ^ current_cw[60] ^ current_cw[69];
-    assign syndrome[6] = current_cw[0] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[11] ^ current_cw[14] ^ current_cw[19] ^ current_cw[28] ^ current_cw[45] ^ current_cw[48] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[70];
-    assign syndrome[7] = current_cw[0] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[19] ^ current_cw[28] ^ current_cw[45] ^ current_cw[48] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[71];
-    assign syndrome[8] = current_cw[0] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[19] ^ current_cw[28] ^ current_cw[45] ^ current_cw[48] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[72];
-    assign syndrome[9] = current_cw[0] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[19] ^ current_cw[28] ^ current_cw[39] ^ current_cw[45] ^ current_cw[48] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[73];
-    assign syndrome[10] = current_cw[0] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[9] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[19] ^ current_cw[28] ^ current_cw[39] ^ current_cw[45] ^ current_cw[49] ^ current_cw[59] ^ current_cw[60] ^ current_cw[74];
-    assign syndrome[11] = current_cw[0] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[9] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[19] ^ current_cw[23] ^ current_cw[28] ^ current_cw[39] ^ current_cw[41] ^ current_cw[45] ^ current_cw[49] ^ current_cw[59] ^ current_cw[60] ^ current_cw[75];
-    assign syndrome[12] = current_cw[0] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[9] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[19] ^ current_cw[23] ^ current_cw[28] ^ current_cw[39] ^ current_cw[41] ^ current_cw[45] ^ current_cw[49] ^ current_cw[52] ^ current_cw[56] ^ current_cw[59] ^ current_cw[60] ^ current_cw[76];
-    assign syndrome[13] = current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[9] ^ current_cw[11] ^ current_cw[14] ^ current_cw[19] ^ current_cw[23] ^ current_cw[24] ^ current_cw[28] ^ current_cw[30] ^ current_cw[39] ^ current_cw[41] ^ current_cw[44] ^ current_cw[45] ^ current_cw[49] ^ current_cw[52] ^ current_cw[56] ^ current_cw[59] ^ current_cw[60] ^ current_cw[77];
-    assign syndrome[14] = current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[9] ^ current_cw[11] ^ current_cw[14] ^ current_cw[17] ^ current_cw[19] ^ current_cw[23] ^ current_cw[24] ^ current_cw[28] ^ current_cw[30] ^ current_cw[39] ^ current_cw[41] ^ current_cw[44] ^ current_cw[45] ^ current_cw[49] ^ current_cw[52] ^ current_cw[56] ^ current_cw[59] ^ current_cw[60] ^ current_cw[62] ^ current_cw[78];
-    assign syndrome[15] = current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[9] ^ current_cw[11] ^ current_cw[14] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[23] ^ current_cw[24] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[44] ^ current_cw[45] ^ current_cw[47] ^ current_cw[49] ^ current_cw[52] ^ current_cw[56] ^ current_cw[59] ^ current_cw[60] ^ current_cw[79];
-    assign syndrome[16] = current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[9] ^ current_cw[11] ^ current_cw[14] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[23] ^ current_cw[24] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[39] ^ current_cw[41] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[52] ^ current_cw[53] ^ current_cw[56] ^ current_cw[59] ^ current_cw[60] ^ current_cw[80];
-    assign syndrome[17] = current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[9] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[23] ^ current_cw[24] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[39] ^ current_cw[41] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[52] ^ current_cw[53] ^ current_cw[56] ^ current_cw[59] ^ current_cw[81];
-    assign syndrome[18] = current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[9] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[17] ^ current_cw[18] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[33] ^ current_cw[39] ^ current_cw[41] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[52] ^ current_cw[53] ^ current_cw[56] ^ current_cw[59] ^ current_cw[82];
-    assign syndrome[19] = current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[17] ^ current_cw[18] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[33] ^ current_cw[39] ^ current_cw[41] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[52] ^ current_cw[53] ^ current_cw[56] ^ current_cw[59] ^ current_cw[62] ^ current_cw[83];
-    assign syndrome[20] = current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[17] ^ current_cw[18] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[33] ^ current_cw[39] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[52] ^ current_cw[53] ^ current_cw[56] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[84];
-    assign syndrome[21] = current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[9] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[17] ^ current_cw[18] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[39] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[52] ^ current_cw[53] ^ current_cw[56] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[85];
-    assign syndrome[22] = current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[17] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[37] ^ current_cw[39] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[52] ^ current_cw[53] ^ current_cw[56] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[86];
-    assign syndrome[23] = current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[17] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[37] ^ current_cw[39] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[87];
-    assign syndrome[24] = current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[17] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[35] ^ current_cw[37] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[88];
-    assign syndrome[25] = current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[17] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[35] ^ current_cw[37] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[53] ^ current_cw[54] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[89];
-    assign syndrome[26] = current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[17] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[35] ^ current_cw[37] ^ current_cw[44] ^ current_cw[45] ^ current_cw[49] ^ current_cw[50] ^ current_cw[53] ^ current_cw[54] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[90];
-    assign syndrome[27] = current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[17] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[35] ^ current_cw[37] ^ current_cw[44] ^ current_cw[45] ^ current_cw[50] ^ current_cw[53] ^ current_cw[54] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[91];
-    assign syndrome[28] = current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[9] ^ current_cw[10] ^ current_cw[12] ^ current_cw[15] ^ current_cw[17] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[35] ^ current_cw[37] ^ current_cw[44] ^ current_cw[45] ^ current_cw[50] ^ current_cw[53] ^ current_cw[54] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[92];
-    assign syndrome[29] = current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[9] ^ current_cw[10] ^ current_cw[12] ^ current_cw[15] ^ current_cw[17] ^ current_cw[18] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[44] ^ current_cw[45] ^ current_cw[50] ^ current_cw[53] ^ current_cw[54] ^ current_cw[56] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[93];
-    assign syndrome[30] = current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[9] ^ current_cw[10] ^ current_cw[12] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[44] ^ current_cw[45] ^ current_cw[50] ^ current_cw[53] ^ current_cw[54] ^ current_cw[56] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[94];
-    assign syndrome[31] = current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[9] ^ current_cw[10] ^ current_cw[12] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[34] ^ current_cw[36] ^ current_cw[37] ^ current_cw[44] ^ current_cw[45] ^ current_cw[50] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[95];
-    assign syndrome[32] = current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[12] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[36] ^ current_cw[37] ^ current_cw[44] ^ current_cw[45] ^ current_cw[50] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[96];
-    assign syndrome[33] = current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[12] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[37] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[50] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[97];
-    assign syndrome[34] = current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[12] ^ current_cw[15] ^ current_cw[18] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[39] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[50] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[98];
-    assign syndrome[35] = current_cw[1] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[12] ^ current_cw[15] ^ current_cw[18] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[35] ^ current_cw[38] ^ current_cw[39] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[50] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[99];
-    assign syndrome[36] = current_cw[1] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[12] ^ current_cw[15] ^ current_cw[18] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[35] ^ current_cw[38] ^ current_cw[39] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[50] ^ current_cw[53] ^ current_cw[54] ^ current_cw[56] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[100];
-    assign syndrome[37] = current_cw[1] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[12] ^ current_cw[15] ^ current_cw[18] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[35] ^ current_cw[38] ^ current_cw[39] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[50] ^ current_cw[53] ^ current_cw[54] ^ current_cw[56] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[101];
-    assign syndrome[38] = current_cw[1] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[12] ^ current_cw[15] ^ current_cw[18] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[35] ^ current_cw[38] ^ current_cw[39] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[50] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[56] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[102];
-    assign syndrome[39] = current_cw[1] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[12] ^ current_cw[15] ^ current_cw[18] ^ current_cw[20] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[35] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[50] ^ current_cw[52] ^ current_cw[53] ^ current_cw[56] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[103];
-    assign syndrome[40] = current_cw[1] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[12] ^ current_cw[15] ^ current_cw[18] ^ current_cw[20] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[35] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[52] ^ current_cw[53] ^ current_cw[56] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[104];
-    assign syndrome[41] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[12] ^ current_cw[15] ^ current_cw[18] ^ current_cw[20] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[35] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[52] ^ current_cw[53] ^ current_cw[56] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[105];
-    assign syndrome[42] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[15] ^ current_cw[16] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[35] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[52] ^ current_cw[53] ^ current_cw[56] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[106];
-    assign syndrome[43] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[15] ^ current_cw[16] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[29] ^ current_cw[30] ^ current_cw[32] ^ current_cw[35] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[52] ^ current_cw[53] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[107];
-    assign syndrome[44] = current_cw[0] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[15] ^ current_cw[16] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[35] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[62] ^ current_cw[108];
-    assign syndrome[45] = current_cw[0] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[15] ^ current_cw[16] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[23] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[35] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[55] ^ current_cw[56] ^ current_cw[61] ^ current_cw[62] ^ current_cw[109];
-    assign syndrome[46] = current_cw[0] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[7] ^ current_cw[8] ^ current_cw[11] ^ current_cw[12] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[35] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[62] ^ current_cw[110];
-    assign syndrome[47] = current_cw[0] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[8] ^ current_cw[11] ^ current_cw[12] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[33] ^ current_cw[35] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[62] ^ current_cw[111];
-    assign syndrome[48] = current_cw[0] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[28] ^ current_cw[29] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[62] ^ current_cw[112];
-    assign syndrome[49] = current_cw[0] ^ current_cw[2] ^ current_cw[4] ^ current_cw[5] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[62] ^ current_cw[113];
-    assign syndrome[50] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[62] ^ current_cw[114];
-    assign syndrome[51] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[62] ^ current_cw[115];
-    assign syndrome[52] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[31] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[62] ^ current_cw[116];
-    assign syndrome[53] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[6] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[31] ^ current_cw[32] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[62] ^ current_cw[117];
-    assign syndrome[54] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[31] ^ current_cw[32] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[62] ^ current_cw[118];
-    assign syndrome[55] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[31] ^ current_cw[32] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[62] ^ current_cw[63] ^ current_cw[119];
-    assign syndrome[56] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[31] ^ current_cw[32] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[62] ^ current_cw[63] ^ current_cw[120];
-    assign syndrome[57] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[31] ^ current_cw[32] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[121];
-    assign syndrome[58] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[31] ^ current_cw[32] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[122];
-    assign syndrome[59] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[123];
-    assign syndrome[60] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[22] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[44] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[124];
-    assign syndrome[61] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[22] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[125];
-    assign syndrome[62] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[126];
-    assign syndrome[63] = current_cw[0] ^ current_cw[1] ^ current_cw[2] ^ current_cw[3] ^ current_cw[4] ^ current_cw[5] ^ current_cw[6] ^ current_cw[7] ^ current_cw[8] ^ current_cw[9] ^ current_cw[10] ^ current_cw[11] ^ current_cw[12] ^ current_cw[13] ^ current_cw[14] ^ current_cw[15] ^ current_cw[16] ^ current_cw[17] ^ current_cw[18] ^ current_cw[19] ^ current_cw[20] ^ current_cw[21] ^ current_cw[22] ^ current_cw[23] ^ current_cw[24] ^ current_cw[25] ^ current_cw[26] ^ current_cw[27] ^ current_cw[28] ^ current_cw[29] ^ current_cw[30] ^ current_cw[31] ^ current_cw[32] ^ current_cw[33] ^ current_cw[34] ^ current_cw[35] ^ current_cw[36] ^ current_cw[37] ^ current_cw[38] ^ current_cw[39] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[43] ^ current_cw[44] ^ current_cw[45] ^ current_cw[46] ^ current_cw[47] ^ current_cw[48] ^ current_cw[49] ^ current_cw[50] ^ current_cw[51] ^ current_cw[52] ^ current_cw[53] ^ current_cw[54] ^ current_cw[55] ^ current_cw[56] ^ current_cw[57] ^ current_cw[58] ^ current_cw[59] ^ current_cw[60] ^ current_cw[61] ^ current_cw[62] ^ current_cw[63] ^ current_cw[127];
+    assign syndrome[0] = current_cw[16] ^ current_cw[41] ^ current_cw[44] ^ current_cw[64];
+    assign syndrome[1] = current_cw[37] ^ current_cw[50] ^ current_cw[64] ^ current_cw[65];
+    assign syndrome[2] = current_cw[13] ^ current_cw[14] ^ current_cw[20] ^ current_cw[35] ^ current_cw[44] ^ current_cw[61] ^ current_cw[65] ^ current_cw[66];
+    assign syndrome[3] = current_cw[24] ^ current_cw[26] ^ current_cw[40] ^ current_cw[41] ^ current_cw[42] ^ current_cw[66] ^ current_cw[67];
+    assign syndrome[4] = current_cw[3] ^ current_cw[23] ^ current_cw[67] ^ current_cw[68];
+    assign syndrome[5] = current_cw[17] ^ current_cw[29] ^ current_cw[68] ^ current_cw[69];
+    assign syndrome[6] = current_cw[5] ^ current_cw[23] ^ current_cw[60] ^ current_cw[69] ^ current_cw[70];
+    assign syndrome[7] = current_cw[12] ^ current_cw[43] ^ current_cw[70] ^ current_cw[71];
+    assign syndrome[8] = current_cw[47] ^ current_cw[71] ^ current_cw[72];
+    assign syndrome[9] = current_cw[16] ^ current_cw[22] ^ current_cw[32] ^ current_cw[39] ^ current_cw[45] ^ current_cw[72] ^ current_cw[73];
+    assign syndrome[10] = current_cw[4] ^ current_cw[73] ^ current_cw[74];
+    assign syndrome[11] = current_cw[11] ^ current_cw[13] ^ current_cw[22] ^ current_cw[74] ^ current_cw[75];
+    assign syndrome[12] = current_cw[35] ^ current_cw[43] ^ current_cw[59] ^ current_cw[61] ^ current_cw[75] ^ current_cw[76];
+    assign syndrome[13] = current_cw[7] ^ current_cw[76] ^ current_cw[77];
+    assign syndrome[14] = current_cw[50] ^ current_cw[77] ^ current_cw[78];
+    assign syndrome[15] = current_cw[2] ^ current_cw[14] ^ current_cw[28] ^ current_cw[78] ^ current_cw[79];
+    assign syndrome[16] = current_cw[52] ^ current_cw[56] ^ current_cw[58] ^ current_cw[79] ^ current_cw[80];
+    assign syndrome[17] = current_cw[39] ^ current_cw[80] ^ current_cw[81];
+    assign syndrome[18] = current_cw[24] ^ current_cw[81] ^ current_cw[82];
+    assign syndrome[19] = current_cw[1] ^ current_cw[11] ^ current_cw[17] ^ current_cw[58] ^ current_cw[82] ^ current_cw[83];
+    assign syndrome[20] = current_cw[19] ^ current_cw[30] ^ current_cw[83] ^ current_cw[84];
+    assign syndrome[21] = current_cw[2] ^ current_cw[6] ^ current_cw[7] ^ current_cw[29] ^ current_cw[59] ^ current_cw[84] ^ current_cw[85];
+    assign syndrome[22] = current_cw[9] ^ current_cw[59] ^ current_cw[62] ^ current_cw[85] ^ current_cw[86];
+    assign syndrome[23] = current_cw[21] ^ current_cw[86] ^ current_cw[87];
+    assign syndrome[24] = current_cw[1] ^ current_cw[9] ^ current_cw[54] ^ current_cw[58] ^ current_cw[87] ^ current_cw[88];
+    assign syndrome[25] = current_cw[12] ^ current_cw[46] ^ current_cw[88] ^ current_cw[89];
+    assign syndrome[26] = current_cw[26] ^ current_cw[38] ^ current_cw[53] ^ current_cw[89] ^ current_cw[90];
+    assign syndrome[27] = current_cw[6] ^ current_cw[16] ^ current_cw[31] ^ current_cw[90] ^ current_cw[91];
+    assign syndrome[28] = current_cw[28] ^ current_cw[53] ^ current_cw[91] ^ current_cw[92];
+    assign syndrome[29] = current_cw[0] ^ current_cw[23] ^ current_cw[55] ^ current_cw[57] ^ current_cw[92] ^ current_cw[93];
+    assign syndrome[30] = current_cw[27] ^ current_cw[56] ^ current_cw[93] ^ current_cw[94];
+    assign syndrome[31] = current_cw[5] ^ current_cw[19] ^ current_cw[38] ^ current_cw[94] ^ current_cw[95];
+    assign syndrome[32] = current_cw[33] ^ current_cw[45] ^ current_cw[95] ^ current_cw[96];
+    assign syndrome[33] = current_cw[22] ^ current_cw[28] ^ current_cw[36] ^ current_cw[63] ^ current_cw[96] ^ current_cw[97];
+    assign syndrome[34] = current_cw[11] ^ current_cw[27] ^ current_cw[49] ^ current_cw[62] ^ current_cw[97] ^ current_cw[98];
+    assign syndrome[35] = current_cw[15] ^ current_cw[30] ^ current_cw[60] ^ current_cw[98] ^ current_cw[99];
+    assign syndrome[36] = current_cw[17] ^ current_cw[60] ^ current_cw[99] ^ current_cw[100];
+    assign syndrome[37] = current_cw[49] ^ current_cw[63] ^ current_cw[100] ^ current_cw[101];
+    assign syndrome[38] = current_cw[25] ^ current_cw[101] ^ current_cw[102];
+    assign syndrome[39] = current_cw[7] ^ current_cw[8] ^ current_cw[18] ^ current_cw[27] ^ current_cw[32] ^ current_cw[34] ^ current_cw[102] ^ current_cw[103];
+    assign syndrome[40] = current_cw[12] ^ current_cw[21] ^ current_cw[30] ^ current_cw[52] ^ current_cw[103] ^ current_cw[104];
+    assign syndrome[41] = current_cw[35] ^ current_cw[104] ^ current_cw[105];
+    assign syndrome[42] = current_cw[3] ^ current_cw[9] ^ current_cw[10] ^ current_cw[33] ^ current_cw[42] ^ current_cw[48] ^ current_cw[51] ^ current_cw[57] ^ current_cw[105] ^ current_cw[106];
+    assign syndrome[43] = current_cw[0] ^ current_cw[3] ^ current_cw[24] ^ current_cw[106] ^ current_cw[107];
+    assign syndrome[44] = current_cw[26] ^ current_cw[37] ^ current_cw[46] ^ current_cw[107] ^ current_cw[108];
+    assign syndrome[45] = current_cw[0] ^ current_cw[21] ^ current_cw[31] ^ current_cw[34] ^ current_cw[37] ^ current_cw[45] ^ current_cw[54] ^ current_cw[108] ^ current_cw[109];
+    assign syndrome[46] = current_cw[6] ^ current_cw[47] ^ current_cw[61] ^ current_cw[62] ^ current_cw[109] ^ current_cw[110];
+    assign syndrome[47] = current_cw[50] ^ current_cw[63] ^ current_cw[110] ^ current_cw[111];
+    assign syndrome[48] = current_cw[10] ^ current_cw[29] ^ current_cw[36] ^ current_cw[42] ^ current_cw[43] ^ current_cw[51] ^ current_cw[55] ^ current_cw[111] ^ current_cw[112];
+    assign syndrome[49] = current_cw[4] ^ current_cw[38] ^ current_cw[112] ^ current_cw[113];
+    assign syndrome[50] = current_cw[4] ^ current_cw[14] ^ current_cw[31] ^ current_cw[113] ^ current_cw[114];
+    assign syndrome[51] = current_cw[2] ^ current_cw[18] ^ current_cw[32] ^ current_cw[36] ^ current_cw[40] ^ current_cw[48] ^ current_cw[114] ^ current_cw[115];
+    assign syndrome[52] = current_cw[44] ^ current_cw[47] ^ current_cw[55] ^ current_cw[115] ^ current_cw[116];
+    assign syndrome[53] = current_cw[48] ^ current_cw[116] ^ current_cw[117];
+    assign syndrome[54] = current_cw[20] ^ current_cw[25] ^ current_cw[56] ^ current_cw[117] ^ current_cw[118];
+    assign syndrome[55] = current_cw[1] ^ current_cw[8] ^ current_cw[18] ^ current_cw[40] ^ current_cw[52] ^ current_cw[118] ^ current_cw[119];
+    assign syndrome[56] = current_cw[20] ^ current_cw[41] ^ current_cw[119] ^ current_cw[120];
+    assign syndrome[57] = current_cw[15] ^ current_cw[34] ^ current_cw[39] ^ current_cw[49] ^ current_cw[57] ^ current_cw[120] ^ current_cw[121];
+    assign syndrome[58] = current_cw[13] ^ current_cw[25] ^ current_cw[121] ^ current_cw[122];
+    assign syndrome[59] = current_cw[19] ^ current_cw[33] ^ current_cw[53] ^ current_cw[122] ^ current_cw[123];
+    assign syndrome[60] = current_cw[5] ^ current_cw[15] ^ current_cw[54] ^ current_cw[123] ^ current_cw[124];
+    assign syndrome[61] = current_cw[10] ^ current_cw[46] ^ current_cw[124] ^ current_cw[125];
+    assign syndrome[62] = current_cw[125] ^ current_cw[126];
+    assign syndrome[63] = current_cw[8] ^ current_cw[51] ^ current_cw[126] ^ current_cw[127];
     assign has_error = |syndrome;
-    wire [5:0] sum_0 = { 5'd0, syndrome[3] } + { 5'd0, syndrome[4] } + { 5'd0, syndrome[5] } + { 5'd0, syndrome[6] } + { 5'd0, syndrome[7] } + { 5'd0, syndrome[8] } + { 5'd0, syndrome[9] } + { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_0 = (sum_0 >= 6'd17);
-    wire [4:0] sum_1 = { 4'd0, syndrome[35] } + { 4'd0, syndrome[36] } + { 4'd0, syndrome[37] } + { 4'd0, syndrome[38] } + { 4'd0, syndrome[39] } + { 4'd0, syndrome[40] } + { 4'd0, syndrome[41] } + { 4'd0, syndrome[42] } + { 4'd0, syndrome[43] } + { 4'd0, syndrome[50] } + { 4'd0, syndrome[51] } + { 4'd0, syndrome[52] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_1 = (sum_1 >= 5'd12);
-    wire [5:0] sum_2 = { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_2 = (sum_2 >= 6'd19);
-    wire [5:0] sum_3 = { 5'd0, syndrome[4] } + { 5'd0, syndrome[5] } + { 5'd0, syndrome[6] } + { 5'd0, syndrome[7] } + { 5'd0, syndrome[8] } + { 5'd0, syndrome[9] } + { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_3 = (sum_3 >= 6'd21);
-    wire [5:0] sum_4 = { 5'd0, syndrome[6] } + { 5'd0, syndrome[7] } + { 5'd0, syndrome[8] } + { 5'd0, syndrome[9] } + { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_4 = (sum_4 >= 6'd28);
-    wire [5:0] sum_5 = { 5'd0, syndrome[2] } + { 5'd0, syndrome[3] } + { 5'd0, syndrome[4] } + { 5'd0, syndrome[5] } + { 5'd0, syndrome[6] } + { 5'd0, syndrome[7] } + { 5'd0, syndrome[8] } + { 5'd0, syndrome[9] } + { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_5 = (sum_5 >= 6'd28);
-    wire [3:0] sum_6 = { 3'd0, syndrome[48] } + { 3'd0, syndrome[53] } + { 3'd0, syndrome[54] } + { 3'd0, syndrome[55] } + { 3'd0, syndrome[56] } + { 3'd0, syndrome[57] } + { 3'd0, syndrome[58] } + { 3'd0, syndrome[59] } + { 3'd0, syndrome[60] } + { 3'd0, syndrome[61] } + { 3'd0, syndrome[62] } + { 3'd0, syndrome[63] };
-    wire flip_6 = (sum_6 >= 4'd6);
-    wire [5:0] sum_7 = { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_7 = (sum_7 >= 6'd19);
-    wire [5:0] sum_8 = { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_8 = (sum_8 >= 6'd17);
-    wire [5:0] sum_9 = { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_9 = (sum_9 >= 6'd24);
-    wire [5:0] sum_10 = { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_10 = (sum_10 >= 6'd20);
-    wire [5:0] sum_11 = { 5'd0, syndrome[5] } + { 5'd0, syndrome[6] } + { 5'd0, syndrome[7] } + { 5'd0, syndrome[8] } + { 5'd0, syndrome[9] } + { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_11 = (sum_11 >= 6'd23);
-    wire [5:0] sum_12 = { 5'd0, syndrome[7] } + { 5'd0, syndrome[8] } + { 5'd0, syndrome[9] } + { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_12 = (sum_12 >= 6'd27);
-    wire [4:0] sum_13 = { 4'd0, syndrome[22] } + { 4'd0, syndrome[23] } + { 4'd0, syndrome[24] } + { 4'd0, syndrome[25] } + { 4'd0, syndrome[26] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_13 = (sum_13 >= 5'd8);
-    wire [4:0] sum_14 = { 4'd0, syndrome[4] } + { 4'd0, syndrome[5] } + { 4'd0, syndrome[6] } + { 4'd0, syndrome[7] } + { 4'd0, syndrome[8] } + { 4'd0, syndrome[9] } + { 4'd0, syndrome[10] } + { 4'd0, syndrome[11] } + { 4'd0, syndrome[12] } + { 4'd0, syndrome[13] } + { 4'd0, syndrome[14] } + { 4'd0, syndrome[15] } + { 4'd0, syndrome[16] } + { 4'd0, syndrome[17] } + { 4'd0, syndrome[18] } + { 4'd0, syndrome[19] } + { 4'd0, syndrome[20] } + { 4'd0, syndrome[21] } + { 4'd0, syndrome[22] } + { 4'd0, syndrome[52] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_14 = (sum_14 >= 5'd16);
-    wire [5:0] sum_15 = { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_15 = (sum_15 >= 6'd17);
-    wire [4:0] sum_16 = { 4'd0, syndrome[30] } + { 4'd0, syndrome[31] } + { 4'd0, syndrome[32] } + { 4'd0, syndrome[33] } + { 4'd0, syndrome[42] } + { 4'd0, syndrome[43] } + { 4'd0, syndrome[44] } + { 4'd0, syndrome[45] } + { 4'd0, syndrome[46] } + { 4'd0, syndrome[47] } + { 4'd0, syndrome[48] } + { 4'd0, syndrome[49] } + { 4'd0, syndrome[50] } + { 4'd0, syndrome[51] } + { 4'd0, syndrome[52] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_16 = (sum_16 >= 5'd13);
-    wire [5:0] sum_17 = { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_17 = (sum_17 >= 6'd19);
-    wire [5:0] sum_18 = { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_18 = (sum_18 >= 6'd21);
-    wire [5:0] sum_19 = { 5'd0, syndrome[0] } + { 5'd0, syndrome[1] } + { 5'd0, syndrome[2] } + { 5'd0, syndrome[3] } + { 5'd0, syndrome[4] } + { 5'd0, syndrome[5] } + { 5'd0, syndrome[6] } + { 5'd0, syndrome[7] } + { 5'd0, syndrome[8] } + { 5'd0, syndrome[9] } + { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_19 = (sum_19 >= 6'd20);
-    wire [5:0] sum_20 = { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_20 = (sum_20 >= 6'd23);
-    wire [4:0] sum_21 = { 4'd0, syndrome[17] } + { 4'd0, syndrome[18] } + { 4'd0, syndrome[19] } + { 4'd0, syndrome[20] } + { 4'd0, syndrome[21] } + { 4'd0, syndrome[22] } + { 4'd0, syndrome[23] } + { 4'd0, syndrome[24] } + { 4'd0, syndrome[25] } + { 4'd0, syndrome[26] } + { 4'd0, syndrome[27] } + { 4'd0, syndrome[28] } + { 4'd0, syndrome[29] } + { 4'd0, syndrome[30] } + { 4'd0, syndrome[31] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_21 = (sum_21 >= 5'd9);
-    wire [5:0] sum_22 = { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_22 = (sum_22 >= 6'd18);
-    wire [5:0] sum_23 = { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[63] };
-    wire flip_23 = (sum_23 >= 6'd25);
-    wire [5:0] sum_24 = { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_24 = (sum_24 >= 6'd25);
-    wire [5:0] sum_25 = { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_25 = (sum_25 >= 6'd17);
-    wire [5:0] sum_26 = { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_26 = (sum_26 >= 6'd24);
-    wire [4:0] sum_27 = { 4'd0, syndrome[19] } + { 4'd0, syndrome[20] } + { 4'd0, syndrome[21] } + { 4'd0, syndrome[22] } + { 4'd0, syndrome[23] } + { 4'd0, syndrome[24] } + { 4'd0, syndrome[25] } + { 4'd0, syndrome[49] } + { 4'd0, syndrome[50] } + { 4'd0, syndrome[51] } + { 4'd0, syndrome[52] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_27 = (sum_27 >= 5'd11);
-    wire [5:0] sum_28 = { 5'd0, syndrome[0] } + { 5'd0, syndrome[1] } + { 5'd0, syndrome[2] } + { 5'd0, syndrome[3] } + { 5'd0, syndrome[4] } + { 5'd0, syndrome[5] } + { 5'd0, syndrome[6] } + { 5'd0, syndrome[7] } + { 5'd0, syndrome[8] } + { 5'd0, syndrome[9] } + { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_28 = (sum_28 >= 6'd25);
-    wire [5:0] sum_29 = { 5'd0, syndrome[0] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_29 = (sum_29 >= 6'd25);
-    wire [5:0] sum_30 = { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_30 = (sum_30 >= 6'd18);
-    wire [4:0] sum_31 = { 4'd0, syndrome[19] } + { 4'd0, syndrome[20] } + { 4'd0, syndrome[21] } + { 4'd0, syndrome[22] } + { 4'd0, syndrome[23] } + { 4'd0, syndrome[24] } + { 4'd0, syndrome[25] } + { 4'd0, syndrome[26] } + { 4'd0, syndrome[27] } + { 4'd0, syndrome[28] } + { 4'd0, syndrome[52] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_31 = (sum_31 >= 5'd11);
-    wire [5:0] sum_32 = { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_32 = (sum_32 >= 6'd16);
-    wire [4:0] sum_33 = { 4'd0, syndrome[18] } + { 4'd0, syndrome[19] } + { 4'd0, syndrome[20] } + { 4'd0, syndrome[47] } + { 4'd0, syndrome[48] } + { 4'd0, syndrome[49] } + { 4'd0, syndrome[50] } + { 4'd0, syndrome[51] } + { 4'd0, syndrome[52] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_33 = (sum_33 >= 5'd10);
-    wire [4:0] sum_34 = { 4'd0, syndrome[29] } + { 4'd0, syndrome[30] } + { 4'd0, syndrome[31] } + { 4'd0, syndrome[48] } + { 4'd0, syndrome[49] } + { 4'd0, syndrome[50] } + { 4'd0, syndrome[51] } + { 4'd0, syndrome[52] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_34 = (sum_34 >= 5'd10);
-    wire [5:0] sum_35 = { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_35 = (sum_35 >= 6'd18);
-    wire [4:0] sum_36 = { 4'd0, syndrome[29] } + { 4'd0, syndrome[30] } + { 4'd0, syndrome[31] } + { 4'd0, syndrome[32] } + { 4'd0, syndrome[51] } + { 4'd0, syndrome[52] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_36 = (sum_36 >= 5'd9);
-    wire [4:0] sum_37 = { 4'd0, syndrome[22] } + { 4'd0, syndrome[23] } + { 4'd0, syndrome[24] } + { 4'd0, syndrome[25] } + { 4'd0, syndrome[26] } + { 4'd0, syndrome[27] } + { 4'd0, syndrome[28] } + { 4'd0, syndrome[29] } + { 4'd0, syndrome[30] } + { 4'd0, syndrome[31] } + { 4'd0, syndrome[32] } + { 4'd0, syndrome[33] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_37 = (sum_37 >= 5'd12);
-    wire [5:0] sum_38 = { 5'd0, syndrome[2] } + { 5'd0, syndrome[3] } + { 5'd0, syndrome[4] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_38 = (sum_38 >= 6'd16);
-    wire [5:0] sum_39 = { 5'd0, syndrome[9] } + { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_39 = (sum_39 >= 6'd23);
-    wire [4:0] sum_40 = { 4'd0, syndrome[15] } + { 4'd0, syndrome[39] } + { 4'd0, syndrome[40] } + { 4'd0, syndrome[41] } + { 4'd0, syndrome[42] } + { 4'd0, syndrome[43] } + { 4'd0, syndrome[44] } + { 4'd0, syndrome[45] } + { 4'd0, syndrome[46] } + { 4'd0, syndrome[47] } + { 4'd0, syndrome[48] } + { 4'd0, syndrome[49] } + { 4'd0, syndrome[50] } + { 4'd0, syndrome[51] } + { 4'd0, syndrome[52] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_40 = (sum_40 >= 5'd13);
-    wire [4:0] sum_41 = { 4'd0, syndrome[11] } + { 4'd0, syndrome[12] } + { 4'd0, syndrome[13] } + { 4'd0, syndrome[14] } + { 4'd0, syndrome[15] } + { 4'd0, syndrome[16] } + { 4'd0, syndrome[17] } + { 4'd0, syndrome[18] } + { 4'd0, syndrome[19] } + { 4'd0, syndrome[45] } + { 4'd0, syndrome[46] } + { 4'd0, syndrome[47] } + { 4'd0, syndrome[48] } + { 4'd0, syndrome[49] } + { 4'd0, syndrome[50] } + { 4'd0, syndrome[51] } + { 4'd0, syndrome[52] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_41 = (sum_41 >= 5'd14);
-    wire [1:0] sum_42 = { 1'd0, syndrome[23] } + { 1'd0, syndrome[62] } + { 1'd0, syndrome[63] };
-    wire flip_42 = (sum_42 >= 2'd2);
-    wire [2:0] sum_43 = { 2'd0, syndrome[22] } + { 2'd0, syndrome[23] } + { 2'd0, syndrome[24] } + { 2'd0, syndrome[25] } + { 2'd0, syndrome[61] } + { 2'd0, syndrome[62] } + { 2'd0, syndrome[63] };
-    wire flip_43 = (sum_43 >= 3'd4);
-    wire [5:0] sum_44 = { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_44 = (sum_44 >= 6'd25);
-    wire [5:0] sum_45 = { 5'd0, syndrome[3] } + { 5'd0, syndrome[4] } + { 5'd0, syndrome[5] } + { 5'd0, syndrome[6] } + { 5'd0, syndrome[7] } + { 5'd0, syndrome[8] } + { 5'd0, syndrome[9] } + { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_45 = (sum_45 >= 6'd24);
-    wire [5:0] sum_46 = { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_46 = (sum_46 >= 6'd19);
-    wire [5:0] sum_47 = { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_47 = (sum_47 >= 6'd19);
-    wire [3:0] sum_48 = { 3'd0, syndrome[6] } + { 3'd0, syndrome[7] } + { 3'd0, syndrome[8] } + { 3'd0, syndrome[9] } + { 3'd0, syndrome[59] } + { 3'd0, syndrome[60] } + { 3'd0, syndrome[61] } + { 3'd0, syndrome[62] } + { 3'd0, syndrome[63] };
-    wire flip_48 = (sum_48 >= 4'd5);
-    wire [5:0] sum_49 = { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_49 = (sum_49 >= 6'd21);
-    wire [5:0] sum_50 = { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_50 = (sum_50 >= 6'd20);
-    wire [4:0] sum_51 = { 4'd0, syndrome[23] } + { 4'd0, syndrome[24] } + { 4'd0, syndrome[25] } + { 4'd0, syndrome[44] } + { 4'd0, syndrome[45] } + { 4'd0, syndrome[46] } + { 4'd0, syndrome[47] } + { 4'd0, syndrome[48] } + { 4'd0, syndrome[49] } + { 4'd0, syndrome[50] } + { 4'd0, syndrome[51] } + { 4'd0, syndrome[52] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_51 = (sum_51 >= 5'd12);
-    wire [5:0] sum_52 = { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_52 = (sum_52 >= 6'd20);
-    wire [5:0] sum_53 = { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_53 = (sum_53 >= 6'd21);
-    wire [4:0] sum_54 = { 4'd0, syndrome[23] } + { 4'd0, syndrome[24] } + { 4'd0, syndrome[25] } + { 4'd0, syndrome[26] } + { 4'd0, syndrome[27] } + { 4'd0, syndrome[28] } + { 4'd0, syndrome[29] } + { 4'd0, syndrome[30] } + { 4'd0, syndrome[31] } + { 4'd0, syndrome[32] } + { 4'd0, syndrome[33] } + { 4'd0, syndrome[34] } + { 4'd0, syndrome[35] } + { 4'd0, syndrome[36] } + { 4'd0, syndrome[37] } + { 4'd0, syndrome[38] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_54 = (sum_54 >= 5'd14);
-    wire [4:0] sum_55 = { 4'd0, syndrome[31] } + { 4'd0, syndrome[32] } + { 4'd0, syndrome[33] } + { 4'd0, syndrome[34] } + { 4'd0, syndrome[35] } + { 4'd0, syndrome[43] } + { 4'd0, syndrome[44] } + { 4'd0, syndrome[45] } + { 4'd0, syndrome[46] } + { 4'd0, syndrome[47] } + { 4'd0, syndrome[48] } + { 4'd0, syndrome[49] } + { 4'd0, syndrome[50] } + { 4'd0, syndrome[51] } + { 4'd0, syndrome[52] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_55 = (sum_55 >= 5'd13);
-    wire [5:0] sum_56 = { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_56 = (sum_56 >= 6'd23);
-    wire [4:0] sum_57 = { 4'd0, syndrome[32] } + { 4'd0, syndrome[33] } + { 4'd0, syndrome[46] } + { 4'd0, syndrome[47] } + { 4'd0, syndrome[48] } + { 4'd0, syndrome[49] } + { 4'd0, syndrome[50] } + { 4'd0, syndrome[51] } + { 4'd0, syndrome[52] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_57 = (sum_57 >= 5'd10);
-    wire [4:0] sum_58 = { 4'd0, syndrome[1] } + { 4'd0, syndrome[2] } + { 4'd0, syndrome[3] } + { 4'd0, syndrome[4] } + { 4'd0, syndrome[5] } + { 4'd0, syndrome[6] } + { 4'd0, syndrome[7] } + { 4'd0, syndrome[8] } + { 4'd0, syndrome[9] } + { 4'd0, syndrome[48] } + { 4'd0, syndrome[49] } + { 4'd0, syndrome[50] } + { 4'd0, syndrome[51] } + { 4'd0, syndrome[52] } + { 4'd0, syndrome[53] } + { 4'd0, syndrome[54] } + { 4'd0, syndrome[55] } + { 4'd0, syndrome[56] } + { 4'd0, syndrome[57] } + { 4'd0, syndrome[58] } + { 4'd0, syndrome[59] } + { 4'd0, syndrome[60] } + { 4'd0, syndrome[61] } + { 4'd0, syndrome[62] } + { 4'd0, syndrome[63] };
-    wire flip_58 = (sum_58 >= 5'd13);
-    wire [5:0] sum_59 = { 5'd0, syndrome[6] } + { 5'd0, syndrome[7] } + { 5'd0, syndrome[8] } + { 5'd0, syndrome[9] } + { 5'd0, syndrome[10] } + { 5'd0, syndrome[11] } + { 5'd0, syndrome[12] } + { 5'd0, syndrome[13] } + { 5'd0, syndrome[14] } + { 5'd0, syndrome[15] } + { 5'd0, syndrome[16] } + { 5'd0, syndrome[17] } + { 5'd0, syndrome[18] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_59 = (sum_59 >= 6'd21);
-    wire [3:0] sum_60 = { 3'd0, syndrome[5] } + { 3'd0, syndrome[6] } + { 3'd0, syndrome[7] } + { 3'd0, syndrome[8] } + { 3'd0, syndrome[9] } + { 3'd0, syndrome[10] } + { 3'd0, syndrome[11] } + { 3'd0, syndrome[12] } + { 3'd0, syndrome[13] } + { 3'd0, syndrome[14] } + { 3'd0, syndrome[15] } + { 3'd0, syndrome[16] } + { 3'd0, syndrome[61] } + { 3'd0, syndrome[62] } + { 3'd0, syndrome[63] };
-    wire flip_60 = (sum_60 >= 4'd8);
-    wire [5:0] sum_61 = { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_61 = (sum_61 >= 6'd17);
-    wire [5:0] sum_62 = { 5'd0, syndrome[14] } + { 5'd0, syndrome[19] } + { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[44] } + { 5'd0, syndrome[45] } + { 5'd0, syndrome[46] } + { 5'd0, syndrome[47] } + { 5'd0, syndrome[48] } + { 5'd0, syndrome[49] } + { 5'd0, syndrome[50] } + { 5'd0, syndrome[51] } + { 5'd0, syndrome[52] } + { 5'd0, syndrome[53] } + { 5'd0, syndrome[54] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_62 = (sum_62 >= 6'd23);
-    wire [5:0] sum_63 = { 5'd0, syndrome[20] } + { 5'd0, syndrome[21] } + { 5'd0, syndrome[22] } + { 5'd0, syndrome[23] } + { 5'd0, syndrome[24] } + { 5'd0, syndrome[25] } + { 5'd0, syndrome[26] } + { 5'd0, syndrome[27] } + { 5'd0, syndrome[28] } + { 5'd0, syndrome[29] } + { 5'd0, syndrome[30] } + { 5'd0, syndrome[31] } + { 5'd0, syndrome[32] } + { 5'd0, syndrome[33] } + { 5'd0, syndrome[34] } + { 5'd0, syndrome[35] } + { 5'd0, syndrome[36] } + { 5'd0, syndrome[37] } + { 5'd0, syndrome[38] } + { 5'd0, syndrome[39] } + { 5'd0, syndrome[40] } + { 5'd0, syndrome[41] } + { 5'd0, syndrome[42] } + { 5'd0, syndrome[43] } + { 5'd0, syndrome[55] } + { 5'd0, syndrome[56] } + { 5'd0, syndrome[57] } + { 5'd0, syndrome[58] } + { 5'd0, syndrome[59] } + { 5'd0, syndrome[60] } + { 5'd0, syndrome[61] } + { 5'd0, syndrome[62] } + { 5'd0, syndrome[63] };
-    wire flip_63 = (sum_63 >= 6'd17);
-    wire [0:0] sum_64 = syndrome[0];
-    wire flip_64 = (sum_64 >= 1'd1);
-    wire [0:0] sum_65 = syndrome[1];
-    wire flip_65 = (sum_65 >= 1'd1);
-    wire [0:0] sum_66 = syndrome[2];
-    wire flip_66 = (sum_66 >= 1'd1);
-    wire [0:0] sum_67 = syndrome[3];
-    wire flip_67 = (sum_67 >= 1'd1);
-    wire [0:0] sum_68 = syndrome[4];
-    wire flip_68 = (sum_68 >= 1'd1);
-    wire [0:0] sum_69 = syndrome[5];
-    wire flip_69 = (sum_69 >= 1'd1);
-    wire [0:0] sum_70 = syndrome[6];
-    wire flip_70 = (sum_70 >= 1'd1);
-    wire [0:0] sum_71 = syndrome[7];
-    wire flip_71 = (sum_71 >= 1'd1);
-    wire [0:0] sum_72 = syndrome[8];
-    wire flip_72 = (sum_72 >= 1'd1);
-    wire [0:0] sum_73 = syndrome[9];
-    wire flip_73 = (sum_73 >= 1'd1);
-    wire [0:0] sum_74 = syndrome[10];
-    wire flip_74 = (sum_74 >= 1'd1);
-    wire [0:0] sum_75 = syndrome[11];
-    wire flip_75 = (sum_75 >= 1'd1);
-    wire [0:0] sum_76 = syndrome[12];
-    wire flip_76 = (sum_76 >= 1'd1);
-    wire [0:0] sum_77 = syndrome[13];
-    wire flip_77 = (sum_77 >= 1'd1);
-    wire [0:0] sum_78 = syndrome[14];
-    wire flip_78 = (sum_78 >= 1'd1);
-    wire [0:0] sum_79 = syndrome[15];
-    wire flip_79 = (sum_79 >= 1'd1);
-    wire [0:0] sum_80 = syndrome[16];
-    wire flip_80 = (sum_80 >= 1'd1);
-    wire [0:0] sum_81 = syndrome[17];
-    wire flip_81 = (sum_81 >= 1'd1);
-    wire [0:0] sum_82 = syndrome[18];
-    wire flip_82 = (sum_82 >= 1'd1);
-    wire [0:0] sum_83 = syndrome[19];
-    wire flip_83 = (sum_83 >= 1'd1);
-    wire [0:0] sum_84 = syndrome[20];
-    wire flip_84 = (sum_84 >= 1'd1);
-    wire [0:0] sum_85 = syndrome[21];
-    wire flip_85 = (sum_85 >= 1'd1);
-    wire [0:0] sum_86 = syndrome[22];
-    wire flip_86 = (sum_86 >= 1'd1);
-    wire [0:0] sum_87 = syndrome[23];
-    wire flip_87 = (sum_87 >= 1'd1);
-    wire [0:0] sum_88 = syndrome[24];
-    wire flip_88 = (sum_88 >= 1'd1);
-    wire [0:0] sum_89 = syndrome[25];
-    wire flip_89 = (sum_89 >= 1'd1);
-    wire [0:0] sum_90 = syndrome[26];
-    wire flip_90 = (sum_90 >= 1'd1);
-    wire [0:0] sum_91 = syndrome[27];
-    wire flip_91 = (sum_91 >= 1'd1);
-    wire [0:0] sum_92 = syndrome[28];
-    wire flip_92 = (sum_92 >= 1'd1);
-    wire [0:0] sum_93 = syndrome[29];
-    wire flip_93 = (sum_93 >= 1'd1);
-    wire [0:0] sum_94 = syndrome[30];
-    wire flip_94 = (sum_94 >= 1'd1);
-    wire [0:0] sum_95 = syndrome[31];
-    wire flip_95 = (sum_95 >= 1'd1);
-    wire [0:0] sum_96 = syndrome[32];
-    wire flip_96 = (sum_96 >= 1'd1);
-    wire [0:0] sum_97 = syndrome[33];
-    wire flip_97 = (sum_97 >= 1'd1);
-    wire [0:0] sum_98 = syndrome[34];
-    wire flip_98 = (sum_98 >= 1'd1);
-    wire [0:0] sum_99 = syndrome[35];
-    wire flip_99 = (sum_99 >= 1'd1);
-    wire [0:0] sum_100 = syndrome[36];
-    wire flip_100 = (sum_100 >= 1'd1);
-    wire [0:0] sum_101 = syndrome[37];
-    wire flip_101 = (sum_101 >= 1'd1);
-    wire [0:0] sum_102 = syndrome[38];
-    wire flip_102 = (sum_102 >= 1'd1);
-    wire [0:0] sum_103 = syndrome[39];
-    wire flip_103 = (sum_103 >= 1'd1);
-    wire [0:0] sum_104 = syndrome[40];
-    wire flip_104 = (sum_104 >= 1'd1);
-    wire [0:0] sum_105 = syndrome[41];
-    wire flip_105 = (sum_105 >= 1'd1);
-    wire [0:0] sum_106 = syndrome[42];
-    wire flip_106 = (sum_106 >= 1'd1);
-    wire [0:0] sum_107 = syndrome[43];
-    wire flip_107 = (sum_107 >= 1'd1);
-    wire [0:0] sum_108 = syndrome[44];
-    wire flip_108 = (sum_108 >= 1'd1);
-    wire [0:0] sum_109 = syndrome[45];
-    wire flip_109 = (sum_109 >= 1'd1);
-    wire [0:0] sum_110 = syndrome[46];
-    wire flip_110 = (sum_110 >= 1'd1);
-    wire [0:0] sum_111 = syndrome[47];
-    wire flip_111 = (sum_111 >= 1'd1);
-    wire [0:0] sum_112 = syndrome[48];
-    wire flip_112 = (sum_112 >= 1'd1);
-    wire [0:0] sum_113 = syndrome[49];
-    wire flip_113 = (sum_113 >= 1'd1);
-    wire [0:0] sum_114 = syndrome[50];
-    wire flip_114 = (sum_114 >= 1'd1);
-    wire [0:0] sum_115 = syndrome[51];
-    wire flip_115 = (sum_115 >= 1'd1);
-    wire [0:0] sum_116 = syndrome[52];
-    wire flip_116 = (sum_116 >= 1'd1);
-    wire [0:0] sum_117 = syndrome[53];
-    wire flip_117 = (sum_117 >= 1'd1);
-    wire [0:0] sum_118 = syndrome[54];
-    wire flip_118 = (sum_118 >= 1'd1);
-    wire [0:0] sum_119 = syndrome[55];
-    wire flip_119 = (sum_119 >= 1'd1);
-    wire [0:0] sum_120 = syndrome[56];
-    wire flip_120 = (sum_120 >= 1'd1);
-    wire [0:0] sum_121 = syndrome[57];
-    wire flip_121 = (sum_121 >= 1'd1);
-    wire [0:0] sum_122 = syndrome[58];
-    wire flip_122 = (sum_122 >= 1'd1);
-    wire [0:0] sum_123 = syndrome[59];
-    wire flip_123 = (sum_123 >= 1'd1);
-    wire [0:0] sum_124 = syndrome[60];
-    wire flip_124 = (sum_124 >= 1'd1);
-    wire [0:0] sum_125 = syndrome[61];
-    wire flip_125 = (sum_125 >= 1'd1);
-    wire [0:0] sum_126 = syndrome[62];
-    wire flip_126 = (sum_126 >= 1'd1);
-    wire [0:0] sum_127 = syndrome[63];
-    wire flip_127 = (sum_127 >= 1'd1);
+    wire [1:0] sum_0 = { 1'd0, syndrome[29] } + { 1'd0, syndrome[43] } + { 1'd0, syndrome[45] };
+    wire [1:0] sum_1 = { 1'd0, syndrome[19] } + { 1'd0, syndrome[24] } + { 1'd0, syndrome[55] };
+    wire [1:0] sum_2 = { 1'd0, syndrome[15] } + { 1'd0, syndrome[21] } + { 1'd0, syndrome[51] };
+    wire [1:0] sum_3 = { 1'd0, syndrome[4] } + { 1'd0, syndrome[42] } + { 1'd0, syndrome[43] };
+    wire [1:0] sum_4 = { 1'd0, syndrome[10] } + { 1'd0, syndrome[49] } + { 1'd0, syndrome[50] };
+    wire [1:0] sum_5 = { 1'd0, syndrome[6] } + { 1'd0, syndrome[31] } + { 1'd0, syndrome[60] };
+    wire [1:0] sum_6 = { 1'd0, syndrome[21] } + { 1'd0, syndrome[27] } + { 1'd0, syndrome[46] };
+    wire [1:0] sum_7 = { 1'd0, syndrome[13] } + { 1'd0, syndrome[21] } + { 1'd0, syndrome[39] };
+    wire [1:0] sum_8 = { 1'd0, syndrome[39] } + { 1'd0, syndrome[55] } + { 1'd0, syndrome[63] };
+    wire [1:0] sum_9 = { 1'd0, syndrome[22] } + { 1'd0, syndrome[24] } + { 1'd0, syndrome[42] };
+    wire [1:0] sum_10 = { 1'd0, syndrome[42] } + { 1'd0, syndrome[48] } + { 1'd0, syndrome[61] };
+    wire [1:0] sum_11 = { 1'd0, syndrome[11] } + { 1'd0, syndrome[19] } + { 1'd0, syndrome[34] };
+    wire [1:0] sum_12 = { 1'd0, syndrome[7] } + { 1'd0, syndrome[25] } + { 1'd0, syndrome[40] };
+    wire [1:0] sum_13 = { 1'd0, syndrome[2] } + { 1'd0, syndrome[11] } + { 1'd0, syndrome[58] };
+    wire [1:0] sum_14 = { 1'd0, syndrome[2] } + { 1'd0, syndrome[15] } + { 1'd0, syndrome[50] };
+    wire [1:0] sum_15 = { 1'd0, syndrome[35] } + { 1'd0, syndrome[57] } + { 1'd0, syndrome[60] };
+    wire [1:0] sum_16 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[9] } + { 1'd0, syndrome[27] };
+    wire [1:0] sum_17 = { 1'd0, syndrome[5] } + { 1'd0, syndrome[19] } + { 1'd0, syndrome[36] };
+    wire [1:0] sum_18 = { 1'd0, syndrome[39] } + { 1'd0, syndrome[51] } + { 1'd0, syndrome[55] };
+    wire [1:0] sum_19 = { 1'd0, syndrome[20] } + { 1'd0, syndrome[31] } + { 1'd0, syndrome[59] };
+    wire [1:0] sum_20 = { 1'd0, syndrome[2] } + { 1'd0, syndrome[54] } + { 1'd0, syndrome[56] };
+    wire [1:0] sum_21 = { 1'd0, syndrome[23] } + { 1'd0, syndrome[40] } + { 1'd0, syndrome[45] };
+    wire [1:0] sum_22 = { 1'd0, syndrome[9] } + { 1'd0, syndrome[11] } + { 1'd0, syndrome[33] };
+    wire [1:0] sum_23 = { 1'd0, syndrome[4] } + { 1'd0, syndrome[6] } + { 1'd0, syndrome[29] };
+    wire [1:0] sum_24 = { 1'd0, syndrome[3] } + { 1'd0, syndrome[18] } + { 1'd0, syndrome[43] };
+    wire [1:0] sum_25 = { 1'd0, syndrome[38] } + { 1'd0, syndrome[54] } + { 1'd0, syndrome[58] };
+    wire [1:0] sum_26 = { 1'd0, syndrome[3] } + { 1'd0, syndrome[26] } + { 1'd0, syndrome[44] };
+    wire [1:0] sum_27 = { 1'd0, syndrome[30] } + { 1'd0, syndrome[34] } + { 1'd0, syndrome[39] };
+    wire [1:0] sum_28 = { 1'd0, syndrome[15] } + { 1'd0, syndrome[28] } + { 1'd0, syndrome[33] };
+    wire [1:0] sum_29 = { 1'd0, syndrome[5] } + { 1'd0, syndrome[21] } + { 1'd0, syndrome[48] };
+    wire [1:0] sum_30 = { 1'd0, syndrome[20] } + { 1'd0, syndrome[35] } + { 1'd0, syndrome[40] };
+    wire [1:0] sum_31 = { 1'd0, syndrome[27] } + { 1'd0, syndrome[45] } + { 1'd0, syndrome[50] };
+    wire [1:0] sum_32 = { 1'd0, syndrome[9] } + { 1'd0, syndrome[39] } + { 1'd0, syndrome[51] };
+    wire [1:0] sum_33 = { 1'd0, syndrome[32] } + { 1'd0, syndrome[42] } + { 1'd0, syndrome[59] };
+    wire [1:0] sum_34 = { 1'd0, syndrome[39] } + { 1'd0, syndrome[45] } + { 1'd0, syndrome[57] };
+    wire [1:0] sum_35 = { 1'd0, syndrome[2] } + { 1'd0, syndrome[12] } + { 1'd0, syndrome[41] };
+    wire [1:0] sum_36 = { 1'd0, syndrome[33] } + { 1'd0, syndrome[48] } + { 1'd0, syndrome[51] };
+    wire [1:0] sum_37 = { 1'd0, syndrome[1] } + { 1'd0, syndrome[44] } + { 1'd0, syndrome[45] };
+    wire [1:0] sum_38 = { 1'd0, syndrome[26] } + { 1'd0, syndrome[31] } + { 1'd0, syndrome[49] };
+    wire [1:0] sum_39 = { 1'd0, syndrome[9] } + { 1'd0, syndrome[17] } + { 1'd0, syndrome[57] };
+    wire [1:0] sum_40 = { 1'd0, syndrome[3] } + { 1'd0, syndrome[51] } + { 1'd0, syndrome[55] };
+    wire [1:0] sum_41 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[3] } + { 1'd0, syndrome[56] };
+    wire [1:0] sum_42 = { 1'd0, syndrome[3] } + { 1'd0, syndrome[42] } + { 1'd0, syndrome[48] };
+    wire [1:0] sum_43 = { 1'd0, syndrome[7] } + { 1'd0, syndrome[12] } + { 1'd0, syndrome[48] };
+    wire [1:0] sum_44 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[2] } + { 1'd0, syndrome[52] };
+    wire [1:0] sum_45 = { 1'd0, syndrome[9] } + { 1'd0, syndrome[32] } + { 1'd0, syndrome[45] };
+    wire [1:0] sum_46 = { 1'd0, syndrome[25] } + { 1'd0, syndrome[44] } + { 1'd0, syndrome[61] };
+    wire [1:0] sum_47 = { 1'd0, syndrome[8] } + { 1'd0, syndrome[46] } + { 1'd0, syndrome[52] };
+    wire [1:0] sum_48 = { 1'd0, syndrome[42] } + { 1'd0, syndrome[51] } + { 1'd0, syndrome[53] };
+    wire [1:0] sum_49 = { 1'd0, syndrome[34] } + { 1'd0, syndrome[37] } + { 1'd0, syndrome[57] };
+    wire [1:0] sum_50 = { 1'd0, syndrome[1] } + { 1'd0, syndrome[14] } + { 1'd0, syndrome[47] };
+    wire [1:0] sum_51 = { 1'd0, syndrome[42] } + { 1'd0, syndrome[48] } + { 1'd0, syndrome[63] };
+    wire [1:0] sum_52 = { 1'd0, syndrome[16] } + { 1'd0, syndrome[40] } + { 1'd0, syndrome[55] };
+    wire [1:0] sum_53 = { 1'd0, syndrome[26] } + { 1'd0, syndrome[28] } + { 1'd0, syndrome[59] };
+    wire [1:0] sum_54 = { 1'd0, syndrome[24] } + { 1'd0, syndrome[45] } + { 1'd0, syndrome[60] };
+    wire [1:0] sum_55 = { 1'd0, syndrome[29] } + { 1'd0, syndrome[48] } + { 1'd0, syndrome[52] };
+    wire [1:0] sum_56 = { 1'd0, syndrome[16] } + { 1'd0, syndrome[30] } + { 1'd0, syndrome[54] };
+    wire [1:0] sum_57 = { 1'd0, syndrome[29] } + { 1'd0, syndrome[42] } + { 1'd0, syndrome[57] };
+    wire [1:0] sum_58 = { 1'd0, syndrome[16] } + { 1'd0, syndrome[19] } + { 1'd0, syndrome[24] };
+    wire [1:0] sum_59 = { 1'd0, syndrome[12] } + { 1'd0, syndrome[21] } + { 1'd0, syndrome[22] };
+    wire [1:0] sum_60 = { 1'd0, syndrome[6] } + { 1'd0, syndrome[35] } + { 1'd0, syndrome[36] };
+    wire [1:0] sum_61 = { 1'd0, syndrome[2] } + { 1'd0, syndrome[12] } + { 1'd0, syndrome[46] };
+    wire [1:0] sum_62 = { 1'd0, syndrome[22] } + { 1'd0, syndrome[34] } + { 1'd0, syndrome[46] };
+    wire [1:0] sum_63 = { 1'd0, syndrome[33] } + { 1'd0, syndrome[37] } + { 1'd0, syndrome[47] };
+    wire [1:0] sum_64 = { 1'd0, syndrome[0] } + { 1'd0, syndrome[1] };
+    wire [1:0] sum_65 = { 1'd0, syndrome[1] } + { 1'd0, syndrome[2] };
+    wire [1:0] sum_66 = { 1'd0, syndrome[2] } + { 1'd0, syndrome[3] };
+    wire [1:0] sum_67 = { 1'd0, syndrome[3] } + { 1'd0, syndrome[4] };
+    wire [1:0] sum_68 = { 1'd0, syndrome[4] } + { 1'd0, syndrome[5] };
+    wire [1:0] sum_69 = { 1'd0, syndrome[5] } + { 1'd0, syndrome[6] };
+    wire [1:0] sum_70 = { 1'd0, syndrome[6] } + { 1'd0, syndrome[7] };
+    wire [1:0] sum_71 = { 1'd0, syndrome[7] } + { 1'd0, syndrome[8] };
+    wire [1:0] sum_72 = { 1'd0, syndrome[8] } + { 1'd0, syndrome[9] };
+    wire [1:0] sum_73 = { 1'd0, syndrome[9] } + { 1'd0, syndrome[10] };
+    wire [1:0] sum_74 = { 1'd0, syndrome[10] } + { 1'd0, syndrome[11] };
+    wire [1:0] sum_75 = { 1'd0, syndrome[11] } + { 1'd0, syndrome[12] };
+    wire [1:0] sum_76 = { 1'd0, syndrome[12] } + { 1'd0, syndrome[13] };
+    wire [1:0] sum_77 = { 1'd0, syndrome[13] } + { 1'd0, syndrome[14] };
+    wire [1:0] sum_78 = { 1'd0, syndrome[14] } + { 1'd0, syndrome[15] };
+    wire [1:0] sum_79 = { 1'd0, syndrome[15] } + { 1'd0, syndrome[16] };
+    wire [1:0] sum_80 = { 1'd0, syndrome[16] } + { 1'd0, syndrome[17] };
+    wire [1:0] sum_81 = { 1'd0, syndrome[17] } + { 1'd0, syndrome[18] };
+    wire [1:0] sum_82 = { 1'd0, syndrome[18] } + { 1'd0, syndrome[19] };
+    wire [1:0] sum_83 = { 1'd0, syndrome[19] } + { 1'd0, syndrome[20] };
+    wire [1:0] sum_84 = { 1'd0, syndrome[20] } + { 1'd0, syndrome[21] };
+    wire [1:0] sum_85 = { 1'd0, syndrome[21] } + { 1'd0, syndrome[22] };
+    wire [1:0] sum_86 = { 1'd0, syndrome[22] } + { 1'd0, syndrome[23] };
+    wire [1:0] sum_87 = { 1'd0, syndrome[23] } + { 1'd0, syndrome[24] };
+    wire [1:0] sum_88 = { 1'd0, syndrome[24] } + { 1'd0, syndrome[25] };
+    wire [1:0] sum_89 = { 1'd0, syndrome[25] } + { 1'd0, syndrome[26] };
+    wire [1:0] sum_90 = { 1'd0, syndrome[26] } + { 1'd0, syndrome[27] };
+    wire [1:0] sum_91 = { 1'd0, syndrome[27] } + { 1'd0, syndrome[28] };
+    wire [1:0] sum_92 = { 1'd0, syndrome[28] } + { 1'd0, syndrome[29] };
+    wire [1:0] sum_93 = { 1'd0, syndrome[29] } + { 1'd0, syndrome[30] };
+    wire [1:0] sum_94 = { 1'd0, syndrome[30] } + { 1'd0, syndrome[31] };
+    wire [1:0] sum_95 = { 1'd0, syndrome[31] } + { 1'd0, syndrome[32] };
+    wire [1:0] sum_96 = { 1'd0, syndrome[32] } + { 1'd0, syndrome[33] };
+    wire [1:0] sum_97 = { 1'd0, syndrome[33] } + { 1'd0, syndrome[34] };
+    wire [1:0] sum_98 = { 1'd0, syndrome[34] } + { 1'd0, syndrome[35] };
+    wire [1:0] sum_99 = { 1'd0, syndrome[35] } + { 1'd0, syndrome[36] };
+    wire [1:0] sum_100 = { 1'd0, syndrome[36] } + { 1'd0, syndrome[37] };
+    wire [1:0] sum_101 = { 1'd0, syndrome[37] } + { 1'd0, syndrome[38] };
+    wire [1:0] sum_102 = { 1'd0, syndrome[38] } + { 1'd0, syndrome[39] };
+    wire [1:0] sum_103 = { 1'd0, syndrome[39] } + { 1'd0, syndrome[40] };
+    wire [1:0] sum_104 = { 1'd0, syndrome[40] } + { 1'd0, syndrome[41] };
+    wire [1:0] sum_105 = { 1'd0, syndrome[41] } + { 1'd0, syndrome[42] };
+    wire [1:0] sum_106 = { 1'd0, syndrome[42] } + { 1'd0, syndrome[43] };
+    wire [1:0] sum_107 = { 1'd0, syndrome[43] } + { 1'd0, syndrome[44] };
+    wire [1:0] sum_108 = { 1'd0, syndrome[44] } + { 1'd0, syndrome[45] };
+    wire [1:0] sum_109 = { 1'd0, syndrome[45] } + { 1'd0, syndrome[46] };
+    wire [1:0] sum_110 = { 1'd0, syndrome[46] } + { 1'd0, syndrome[47] };
+    wire [1:0] sum_111 = { 1'd0, syndrome[47] } + { 1'd0, syndrome[48] };
+    wire [1:0] sum_112 = { 1'd0, syndrome[48] } + { 1'd0, syndrome[49] };
+    wire [1:0] sum_113 = { 1'd0, syndrome[49] } + { 1'd0, syndrome[50] };
+    wire [1:0] sum_114 = { 1'd0, syndrome[50] } + { 1'd0, syndrome[51] };
+    wire [1:0] sum_115 = { 1'd0, syndrome[51] } + { 1'd0, syndrome[52] };
+    wire [1:0] sum_116 = { 1'd0, syndrome[52] } + { 1'd0, syndrome[53] };
+    wire [1:0] sum_117 = { 1'd0, syndrome[53] } + { 1'd0, syndrome[54] };
+    wire [1:0] sum_118 = { 1'd0, syndrome[54] } + { 1'd0, syndrome[55] };
+    wire [1:0] sum_119 = { 1'd0, syndrome[55] } + { 1'd0, syndrome[56] };
+    wire [1:0] sum_120 = { 1'd0, syndrome[56] } + { 1'd0, syndrome[57] };
+    wire [1:0] sum_121 = { 1'd0, syndrome[57] } + { 1'd0, syndrome[58] };
+    wire [1:0] sum_122 = { 1'd0, syndrome[58] } + { 1'd0, syndrome[59] };
+    wire [1:0] sum_123 = { 1'd0, syndrome[59] } + { 1'd0, syndrome[60] };
+    wire [1:0] sum_124 = { 1'd0, syndrome[60] } + { 1'd0, syndrome[61] };
+    wire [1:0] sum_125 = { 1'd0, syndrome[61] } + { 1'd0, syndrome[62] };
+    wire [1:0] sum_126 = { 1'd0, syndrome[62] } + { 1'd0, syndrome[63] };
+    wire [1:0] sum_127 = { 1'd0, syndrome[63] };
+    wire [1:0] best_votes_0_0 = (sum_0 >= sum_1) ? sum_0 : sum_1;
+    wire [6:0] best_idx_0_0 = (sum_0 >= sum_1) ? 7'd0 : 7'd1;
+    wire [1:0] best_votes_0_1 = (sum_2 >= sum_3) ? sum_2 : sum_3;
+    wire [6:0] best_idx_0_1 = (sum_2 >= sum_3) ? 7'd2 : 7'd3;
+    wire [1:0] best_votes_0_2 = (sum_4 >= sum_5) ? sum_4 : sum_5;
+    wire [6:0] best_idx_0_2 = (sum_4 >= sum_5) ? 7'd4 : 7'd5;
+    wire [1:0] best_votes_0_3 = (sum_6 >= sum_7) ? sum_6 : sum_7;
+    wire [6:0] best_idx_0_3 = (sum_6 >= sum_7) ? 7'd6 : 7'd7;
+    wire [1:0] best_votes_0_4 = (sum_8 >= sum_9) ? sum_8 : sum_9;
+    wire [6:0] best_idx_0_4 = (sum_8 >= sum_9) ? 7'd8 : 7'd9;
+    wire [1:0] best_votes_0_5 = (sum_10 >= sum_11) ? sum_10 : sum_11;
+    wire [6:0] best_idx_0_5 = (sum_10 >= sum_11) ? 7'd10 : 7'd11;
+    wire [1:0] best_votes_0_6 = (sum_12 >= sum_13) ? sum_12 : sum_13;
+    wire [6:0] best_idx_0_6 = (sum_12 >= sum_13) ? 7'd12 : 7'd13;
+    wire [1:0] best_votes_0_7 = (sum_14 >= sum_15) ? sum_14 : sum_15;
+    wire [6:0] best_idx_0_7 = (sum_14 >= sum_15) ? 7'd14 : 7'd15;
+    wire [1:0] best_votes_0_8 = (sum_16 >= sum_17) ? sum_16 : sum_17;
+    wire [6:0] best_idx_0_8 = (sum_16 >= sum_17) ? 7'd16 : 7'd17;
+    wire [1:0] best_votes_0_9 = (sum_18 >= sum_19) ? sum_18 : sum_19;
+    wire [6:0] best_idx_0_9 = (sum_18 >= sum_19) ? 7'd18 : 7'd19;
+    wire [1:0] best_votes_0_10 = (sum_20 >= sum_21) ? sum_20 : sum_21;
+    wire [6:0] best_idx_0_10 = (sum_20 >= sum_21) ? 7'd20 : 7'd21;
+    wire [1:0] best_votes_0_11 = (sum_22 >= sum_23) ? sum_22 : sum_23;
+    wire [6:0] best_idx_0_11 = (sum_22 >= sum_23) ? 7'd22 : 7'd23;
+    wire [1:0] best_votes_0_12 = (sum_24 >= sum_25) ? sum_24 : sum_25;
+    wire [6:0] best_idx_0_12 = (sum_24 >= sum_25) ? 7'd24 : 7'd25;
+    wire [1:0] best_votes_0_13 = (sum_26 >= sum_27) ? sum_26 : sum_27;
+    wire [6:0] best_idx_0_13 = (sum_26 >= sum_27) ? 7'd26 : 7'd27;
+    wire [1:0] best_votes_0_14 = (sum_28 >= sum_29) ? sum_28 : sum_29;
+    wire [6:0] best_idx_0_14 = (sum_28 >= sum_29) ? 7'd28 : 7'd29;
+    wire [1:0] best_votes_0_15 = (sum_30 >= sum_31) ? sum_30 : sum_31;
+    wire [6:0] best_idx_0_15 = (sum_30 >= sum_31) ? 7'd30 : 7'd31;
+    wire [1:0] best_votes_0_16 = (sum_32 >= sum_33) ? sum_32 : sum_33;
+    wire [6:0] best_idx_0_16 = (sum_32 >= sum_33) ? 7'd32 : 7'd33;
+    wire [1:0] best_votes_0_17 = (sum_34 >= sum_35) ? sum_34 : sum_35;
+    wire [6:0] best_idx_0_17 = (sum_34 >= sum_35) ? 7'd34 : 7'd35;
+    wire [1:0] best_votes_0_18 = (sum_36 >= sum_37) ? sum_36 : sum_37;
+    wire [6:0] best_idx_0_18 = (sum_36 >= sum_37) ? 7'd36 : 7'd37;
+    wire [1:0] best_votes_0_19 = (sum_38 >= sum_39) ? sum_38 : sum_39;
+    wire [6:0] best_idx_0_19 = (sum_38 >= sum_39) ? 7'd38 : 7'd39;
+    wire [1:0] best_votes_0_20 = (sum_40 >= sum_41) ? sum_40 : sum_41;
+    wire [6:0] best_idx_0_20 = (sum_40 >= sum_41) ? 7'd40 : 7'd41;
+    wire [1:0] best_votes_0_21 = (sum_42 >= sum_43) ? sum_42 : sum_43;
+    wire [6:0] best_idx_0_21 = (sum_42 >= sum_43) ? 7'd42 : 7'd43;
+    wire [1:0] best_votes_0_22 = (sum_44 >= sum_45) ? sum_44 : sum_45;
+    wire [6:0] best_idx_0_22 = (sum_44 >= sum_45) ? 7'd44 : 7'd45;
+    wire [1:0] best_votes_0_23 = (sum_46 >= sum_47) ? sum_46 : sum_47;
+    wire [6:0] best_idx_0_23 = (sum_46 >= sum_47) ? 7'd46 : 7'd47;
+    wire [1:0] best_votes_0_24 = (sum_48 >= sum_49) ? sum_48 : sum_49;
+    wire [6:0] best_idx_0_24 = (sum_48 >= sum_49) ? 7'd48 : 7'd49;
+    wire [1:0] best_votes_0_25 = (sum_50 >= sum_51) ? sum_50 : sum_51;
+    wire [6:0] best_idx_0_25 = (sum_50 >= sum_51) ? 7'd50 : 7'd51;
+    wire [1:0] best_votes_0_26 = (sum_52 >= sum_53) ? sum_52 : sum_53;
+    wire [6:0] best_idx_0_26 = (sum_52 >= sum_53) ? 7'd52 : 7'd53;
+    wire [1:0] best_votes_0_27 = (sum_54 >= sum_55) ? sum_54 : sum_55;
+    wire [6:0] best_idx_0_27 = (sum_54 >= sum_55) ? 7'd54 : 7'd55;
+    wire [1:0] best_votes_0_28 = (sum_56 >= sum_57) ? sum_56 : sum_57;
+    wire [6:0] best_idx_0_28 = (sum_56 >= sum_57) ? 7'd56 : 7'd57;
+    wire [1:0] best_votes_0_29 = (sum_58 >= sum_59) ? sum_58 : sum_59;
+    wire [6:0] best_idx_0_29 = (sum_58 >= sum_59) ? 7'd58 : 7'd59;
+    wire [1:0] best_votes_0_30 = (sum_60 >= sum_61) ? sum_60 : sum_61;
+    wire [6:0] best_idx_0_30 = (sum_60 >= sum_61) ? 7'd60 : 7'd61;
+    wire [1:0] best_votes_0_31 = (sum_62 >= sum_63) ? sum_62 : sum_63;
+    wire [6:0] best_idx_0_31 = (sum_62 >= sum_63) ? 7'd62 : 7'd63;
+    wire [1:0] best_votes_0_32 = (sum_64 >= sum_65) ? sum_64 : sum_65;
+    wire [6:0] best_idx_0_32 = (sum_64 >= sum_65) ? 7'd64 : 7'd65;
+    wire [1:0] best_votes_0_33 = (sum_66 >= sum_67) ? sum_66 : sum_67;
+    wire [6:0] best_idx_0_33 = (sum_66 >= sum_67) ? 7'd66 : 7'd67;
+    wire [1:0] best_votes_0_34 = (sum_68 >= sum_69) ? sum_68 : sum_69;
+    wire [6:0] best_idx_0_34 = (sum_68 >= sum_69) ? 7'd68 : 7'd69;
+    wire [1:0] best_votes_0_35 = (sum_70 >= sum_71) ? sum_70 : sum_71;
+    wire [6:0] best_idx_0_35 = (sum_70 >= sum_71) ? 7'd70 : 7'd71;
+    wire [1:0] best_votes_0_36 = (sum_72 >= sum_73) ? sum_72 : sum_73;
+    wire [6:0] best_idx_0_36 = (sum_72 >= sum_73) ? 7'd72 : 7'd73;
+    wire [1:0] best_votes_0_37 = (sum_74 >= sum_75) ? sum_74 : sum_75;
+    wire [6:0] best_idx_0_37 = (sum_74 >= sum_75) ? 7'd74 : 7'd75;
+    wire [1:0] best_votes_0_38 = (sum_76 >= sum_77) ? sum_76 : sum_77;
+    wire [6:0] best_idx_0_38 = (sum_76 >= sum_77) ? 7'd76 : 7'd77;
+    wire [1:0] best_votes_0_39 = (sum_78 >= sum_79) ? sum_78 : sum_79;
+    wire [6:0] best_idx_0_39 = (sum_78 >= sum_79) ? 7'd78 : 7'd79;
+    wire [1:0] best_votes_0_40 = (sum_80 >= sum_81) ? sum_80 : sum_81;
+    wire [6:0] best_idx_0_40 = (sum_80 >= sum_81) ? 7'd80 : 7'd81;
+    wire [1:0] best_votes_0_41 = (sum_82 >= sum_83) ? sum_82 : sum_83;
+    wire [6:0] best_idx_0_41 = (sum_82 >= sum_83) ? 7'd82 : 7'd83;
+    wire [1:0] best_votes_0_42 = (sum_84 >= sum_85) ? sum_84 : sum_85;
+    wire [6:0] best_idx_0_42 = (sum_84 >= sum_85) ? 7'd84 : 7'd85;
+    wire [1:0] best_votes_0_43 = (sum_86 >= sum_87) ? sum_86 : sum_87;
+    wire [6:0] best_idx_0_43 = (sum_86 >= sum_87) ? 7'd86 : 7'd87;
+    wire [1:0] best_votes_0_44 = (sum_88 >= sum_89) ? sum_88 : sum_89;
+    wire [6:0] best_idx_0_44 = (sum_88 >= sum_89) ? 7'd88 : 7'd89;
+    wire [1:0] best_votes_0_45 = (sum_90 >= sum_91) ? sum_90 : sum_91;
+    wire [6:0] best_idx_0_45 = (sum_90 >= sum_91) ? 7'd90 : 7'd91;
+    wire [1:0] best_votes_0_46 = (sum_92 >= sum_93) ? sum_92 : sum_93;
+    wire [6:0] best_idx_0_46 = (sum_92 >= sum_93) ? 7'd92 : 7'd93;
+    wire [1:0] best_votes_0_47 = (sum_94 >= sum_95) ? sum_94 : sum_95;
+    wire [6:0] best_idx_0_47 = (sum_94 >= sum_95) ? 7'd94 : 7'd95;
+    wire [1:0] best_votes_0_48 = (sum_96 >= sum_97) ? sum_96 : sum_97;
+    wire [6:0] best_idx_0_48 = (sum_96 >= sum_97) ? 7'd96 : 7'd97;
+    wire [1:0] best_votes_0_49 = (sum_98 >= sum_99) ? sum_98 : sum_99;
+    wire [6:0] best_idx_0_49 = (sum_98 >= sum_99) ? 7'd98 : 7'd99;
+    wire [1:0] best_votes_0_50 = (sum_100 >= sum_101) ? sum_100 : sum_101;
+    wire [6:0] best_idx_0_50 = (sum_100 >= sum_101) ? 7'd100 : 7'd101;
+    wire [1:0] best_votes_0_51 = (sum_102 >= sum_103) ? sum_102 : sum_103;
+    wire [6:0] best_idx_0_51 = (sum_102 >= sum_103) ? 7'd102 : 7'd103;
+    wire [1:0] best_votes_0_52 = (sum_104 >= sum_105) ? sum_104 : sum_105;
+    wire [6:0] best_idx_0_52 = (sum_104 >= sum_105) ? 7'd104 : 7'd105;
+    wire [1:0] best_votes_0_53 = (sum_106 >= sum_107) ? sum_106 : sum_107;
+    wire [6:0] best_idx_0_53 = (sum_106 >= sum_107) ? 7'd106 : 7'd107;
+    wire [1:0] best_votes_0_54 = (sum_108 >= sum_109) ? sum_108 : sum_109;
+    wire [6:0] best_idx_0_54 = (sum_108 >= sum_109) ? 7'd108 : 7'd109;
+    wire [1:0] best_votes_0_55 = (sum_110 >= sum_111) ? sum_110 : sum_111;
+    wire [6:0] best_idx_0_55 = (sum_110 >= sum_111) ? 7'd110 : 7'd111;
+    wire [1:0] best_votes_0_56 = (sum_112 >= sum_113) ? sum_112 : sum_113;
+    wire [6:0] best_idx_0_56 = (sum_112 >= sum_113) ? 7'd112 : 7'd113;
+    wire [1:0] best_votes_0_57 = (sum_114 >= sum_115) ? sum_114 : sum_115;
+    wire [6:0] best_idx_0_57 = (sum_114 >= sum_115) ? 7'd114 : 7'd115;
+    wire [1:0] best_votes_0_58 = (sum_116 >= sum_117) ? sum_116 : sum_117;
+    wire [6:0] best_idx_0_58 = (sum_116 >= sum_117) ? 7'd116 : 7'd117;
+    wire [1:0] best_votes_0_59 = (sum_118 >= sum_119) ? sum_118 : sum_119;
+    wire [6:0] best_idx_0_59 = (sum_118 >= sum_119) ? 7'd118 : 7'd119;
+    wire [1:0] best_votes_0_60 = (sum_120 >= sum_121) ? sum_120 : sum_121;
+    wire [6:0] best_idx_0_60 = (sum_120 >= sum_121) ? 7'd120 : 7'd121;
+    wire [1:0] best_votes_0_61 = (sum_122 >= sum_123) ? sum_122 : sum_123;
+    wire [6:0] best_idx_0_61 = (sum_122 >= sum_123) ? 7'd122 : 7'd123;
+    wire [1:0] best_votes_0_62 = (sum_124 >= sum_125) ? sum_124 : sum_125;
+    wire [6:0] best_idx_0_62 = (sum_124 >= sum_125) ? 7'd124 : 7'd125;
+    wire [1:0] best_votes_0_63 = (sum_126 >= sum_127) ? sum_126 : sum_127;
+    wire [6:0] best_idx_0_63 = (sum_126 >= sum_127) ? 7'd126 : 7'd127;
+    wire [1:0] best_votes_1_0 = (best_votes_0_0 >= best_votes_0_1) ? best_votes_0_0 : best_votes_0_1;
+    wire [6:0] best_idx_1_0 = (best_votes_0_0 >= best_votes_0_1) ? best_idx_0_0 : best_idx_0_1;
+    wire [1:0] best_votes_1_1 = (best_votes_0_2 >= best_votes_0_3) ? best_votes_0_2 : best_votes_0_3;
+    wire [6:0] best_idx_1_1 = (best_votes_0_2 >= best_votes_0_3) ? best_idx_0_2 : best_idx_0_3;
+    wire [1:0] best_votes_1_2 = (best_votes_0_4 >= best_votes_0_5) ? best_votes_0_4 : best_votes_0_5;
+    wire [6:0] best_idx_1_2 = (best_votes_0_4 >= best_votes_0_5) ? best_idx_0_4 : best_idx_0_5;
+    wire [1:0] best_votes_1_3 = (best_votes_0_6 >= best_votes_0_7) ? best_votes_0_6 : best_votes_0_7;
+    wire [6:0] best_idx_1_3 = (best_votes_0_6 >= best_votes_0_7) ? best_idx_0_6 : best_idx_0_7;
+    wire [1:0] best_votes_1_4 = (best_votes_0_8 >= best_votes_0_9) ? best_votes_0_8 : best_votes_0_9;
+    wire [6:0] best_idx_1_4 = (best_votes_0_8 >= best_votes_0_9) ? best_idx_0_8 : best_idx_0_9;
+    wire [1:0] best_votes_1_5 = (best_votes_0_10 >= best_votes_0_11) ? best_votes_0_10 : best_votes_0_11;
+    wire [6:0] best_idx_1_5 = (best_votes_0_10 >= best_votes_0_11) ? best_idx_0_10 : best_idx_0_11;
+    wire [1:0] best_votes_1_6 = (best_votes_0_12 >= best_votes_0_13) ? best_votes_0_12 : best_votes_0_13;
+    wire [6:0] best_idx_1_6 = (best_votes_0_12 >= best_votes_0_13) ? best_idx_0_12 : best_idx_0_13;
+    wire [1:0] best_votes_1_7 = (best_votes_0_14 >= best_votes_0_15) ? best_votes_0_14 : best_votes_0_15;
+    wire [6:0] best_idx_1_7 = (best_votes_0_14 >= best_votes_0_15) ? best_idx_0_14 : best_idx_0_15;
+    wire [1:0] best_votes_1_8 = (best_votes_0_16 >= best_votes_0_17) ? best_votes_0_16 : best_votes_0_17;
+    wire [6:0] best_idx_1_8 = (best_votes_0_16 >= best_votes_0_17) ? best_idx_0_16 : best_idx_0_17;
+    wire [1:0] best_votes_1_9 = (best_votes_0_18 >= best_votes_0_19) ? best_votes_0_18 : best_votes_0_19;
+    wire [6:0] best_idx_1_9 = (best_votes_0_18 >= best_votes_0_19) ? best_idx_0_18 : best_idx_0_19;
+    wire [1:0] best_votes_1_10 = (best_votes_0_20 >= best_votes_0_21) ? best_votes_0_20 : best_votes_0_21;
+    wire [6:0] best_idx_1_10 = (best_votes_0_20 >= best_votes_0_21) ? best_idx_0_20 : best_idx_0_21;
+    wire [1:0] best_votes_1_11 = (best_votes_0_22 >= best_votes_0_23) ? best_votes_0_22 : best_votes_0_23;
+    wire [6:0] best_idx_1_11 = (best_votes_0_22 >= best_votes_0_23) ? best_idx_0_22 : best_idx_0_23;
+    wire [1:0] best_votes_1_12 = (best_votes_0_24 >= best_votes_0_25) ? best_votes_0_24 : best_votes_0_25;
+    wire [6:0] best_idx_1_12 = (best_votes_0_24 >= best_votes_0_25) ? best_idx_0_24 : best_idx_0_25;
+    wire [1:0] best_votes_1_13 = (best_votes_0_26 >= best_votes_0_27) ? best_votes_0_26 : best_votes_0_27;
+    wire [6:0] best_idx_1_13 = (best_votes_0_26 >= best_votes_0_27) ? best_idx_0_26 : best_idx_0_27;
+    wire [1:0] best_votes_1_14 = (best_votes_0_28 >= best_votes_0_29) ? best_votes_0_28 : best_votes_0_29;
+    wire [6:0] best_idx_1_14 = (best_votes_0_28 >= best_votes_0_29) ? best_idx_0_28 : best_idx_0_29;
+    wire [1:0] best_votes_1_15 = (best_votes_0_30 >= best_votes_0_31) ? best_votes_0_30 : best_votes_0_31;
+    wire [6:0] best_idx_1_15 = (best_votes_0_30 >= best_votes_0_31) ? best_idx_0_30 : best_idx_0_31;
+    wire [1:0] best_votes_1_16 = (best_votes_0_32 >= best_votes_0_33) ? best_votes_0_32 : best_votes_0_33;
+    wire [6:0] best_idx_1_16 = (best_votes_0_32 >= best_votes_0_33) ? best_idx_0_32 : best_idx_0_33;
+    wire [1:0] best_votes_1_17 = (best_votes_0_34 >= best_votes_0_35) ? best_votes_0_34 : best_votes_0_35;
+    wire [6:0] best_idx_1_17 = (best_votes_0_34 >= best_votes_0_35) ? best_idx_0_34 : best_idx_0_35;
+    wire [1:0] best_votes_1_18 = (best_votes_0_36 >= best_votes_0_37) ? best_votes_0_36 : best_votes_0_37;
+    wire [6:0] best_idx_1_18 = (best_votes_0_36 >= best_votes_0_37) ? best_idx_0_36 : best_idx_0_37;
+    wire [1:0] best_votes_1_19 = (best_votes_0_38 >= best_votes_0_39) ? best_votes_0_38 : best_votes_0_39;
+    wire [6:0] best_idx_1_19 = (best_votes_0_38 >= best_votes_0_39) ? best_idx_0_38 : best_idx_0_39;
+    wire [1:0] best_votes_1_20 = (best_votes_0_40 >= best_votes_0_41) ? best_votes_0_40 : best_votes_0_41;
+    wire [6:0] best_idx_1_20 = (best_votes_0_40 >= best_votes_0_41) ? best_idx_0_40 : best_idx_0_41;
+    wire [1:0] best_votes_1_21 = (best_votes_0_42 >= best_votes_0_43) ? best_votes_0_42 : best_votes_0_43;
+    wire [6:0] best_idx_1_21 = (best_votes_0_42 >= best_votes_0_43) ? best_idx_0_42 : best_idx_0_43;
+    wire [1:0] best_votes_1_22 = (best_votes_0_44 >= best_votes_0_45) ? best_votes_0_44 : best_votes_0_45;
+    wire [6:0] best_idx_1_22 = (best_votes_0_44 >= best_votes_0_45) ? best_idx_0_44 : best_idx_0_45;
+    wire [1:0] best_votes_1_23 = (best_votes_0_46 >= best_votes_0_47) ? best_votes_0_46 : best_votes_0_47;
+    wire [6:0] best_idx_1_23 = (best_votes_0_46 >= best_votes_0_47) ? best_idx_0_46 : best_idx_0_47;
+    wire [1:0] best_votes_1_24 = (best_votes_0_48 >= best_votes_0_49) ? best_votes_0_48 : best_votes_0_49;
+    wire [6:0] best_idx_1_24 = (best_votes_0_48 >= best_votes_0_49) ? best_idx_0_48 : best_idx_0_49;
+    wire [1:0] best_votes_1_25 = (best_votes_0_50 >= best_votes_0_51) ? best_votes_0_50 : best_votes_0_51;
+    wire [6:0] best_idx_1_25 = (best_votes_0_50 >= best_votes_0_51) ? best_idx_0_50 : best_idx_0_51;
+    wire [1:0] best_votes_1_26 = (best_votes_0_52 >= best_votes_0_53) ? best_votes_0_52 : best_votes_0_53;
+    wire [6:0] best_idx_1_26 = (best_votes_0_52 >= best_votes_0_53) ? best_idx_0_52 : best_idx_0_53;
+    wire [1:0] best_votes_1_27 = (best_votes_0_54 >= best_votes_0_55) ? best_votes_0_54 : best_votes_0_55;
+    wire [6:0] best_idx_1_27 = (best_votes_0_54 >= best_votes_0_55) ? best_idx_0_54 : best_idx_0_55;
+    wire [1:0] best_votes_1_28 = (best_votes_0_56 >= best_votes_0_57) ? best_votes_0_56 : best_votes_0_57;
+    wire [6:0] best_idx_1_28 = (best_votes_0_56 >= best_votes_0_57) ? best_idx_0_56 : best_idx_0_57;
+    wire [1:0] best_votes_1_29 = (best_votes_0_58 >= best_votes_0_59) ? best_votes_0_58 : best_votes_0_59;
+    wire [6:0] best_idx_1_29 = (best_votes_0_58 >= best_votes_0_59) ? best_idx_0_58 : best_idx_0_59;
+    wire [1:0] best_votes_1_30 = (best_votes_0_60 >= best_votes_0_61) ? best_votes_0_60 : best_votes_0_61;
+    wire [6:0] best_idx_1_30 = (best_votes_0_60 >= best_votes_0_61) ? best_idx_0_60 : best_idx_0_61;
+    wire [1:0] best_votes_1_31 = (best_votes_0_62 >= best_votes_0_63) ? best_votes_0_62 : best_votes_0_63;
+    wire [6:0] best_idx_1_31 = (best_votes_0_62 >= best_votes_0_63) ? best_idx_0_62 : best_idx_0_63;
+    wire [1:0] best_votes_2_0 = (best_votes_1_0 >= best_votes_1_1) ? best_votes_1_0 : best_votes_1_1;
+    wire [6:0] best_idx_2_0 = (best_votes_1_0 >= best_votes_1_1) ? best_idx_1_0 : best_idx_1_1;
+    wire [1:0] best_votes_2_1 = (best_votes_1_2 >= best_votes_1_3) ? best_votes_1_2 : best_votes_1_3;
+    wire [6:0] best_idx_2_1 = (best_votes_1_2 >= best_votes_1_3) ? best_idx_1_2 : best_idx_1_3;
+    wire [1:0] best_votes_2_2 = (best_votes_1_4 >= best_votes_1_5) ? best_votes_1_4 : best_votes_1_5;
+    wire [6:0] best_idx_2_2 = (best_votes_1_4 >= best_votes_1_5) ? best_idx_1_4 : best_idx_1_5;
+    wire [1:0] best_votes_2_3 = (best_votes_1_6 >= best_votes_1_7) ? best_votes_1_6 : best_votes_1_7;
+    wire [6:0] best_idx_2_3 = (best_votes_1_6 >= best_votes_1_7) ? best_idx_1_6 : best_idx_1_7;
+    wire [1:0] best_votes_2_4 = (best_votes_1_8 >= best_votes_1_9) ? best_votes_1_8 : best_votes_1_9;
+    wire [6:0] best_idx_2_4 = (best_votes_1_8 >= best_votes_1_9) ? best_idx_1_8 : best_idx_1_9;
+    wire [1:0] best_votes_2_5 = (best_votes_1_10 >= best_votes_1_11) ? best_votes_1_10 : best_votes_1_11;
+    wire [6:0] best_idx_2_5 = (best_votes_1_10 >= best_votes_1_11) ? best_idx_1_10 : best_idx_1_11;
+    wire [1:0] best_votes_2_6 = (best_votes_1_12 >= best_votes_1_13) ? best_votes_1_12 : best_votes_1_13;
+    wire [6:0] best_idx_2_6 = (best_votes_1_12 >= best_votes_1_13) ? best_idx_1_12 : best_idx_1_13;
+    wire [1:0] best_votes_2_7 = (best_votes_1_14 >= best_votes_1_15) ? best_votes_1_14 : best_votes_1_15;
+    wire [6:0] best_idx_2_7 = (best_votes_1_14 >= best_votes_1_15) ? best_idx_1_14 : best_idx_1_15;
+    wire [1:0] best_votes_2_8 = (best_votes_1_16 >= best_votes_1_17) ? best_votes_1_16 : best_votes_1_17;
+    wire [6:0] best_idx_2_8 = (best_votes_1_16 >= best_votes_1_17) ? best_idx_1_16 : best_idx_1_17;
+    wire [1:0] best_votes_2_9 = (best_votes_1_18 >= best_votes_1_19) ? best_votes_1_18 : best_votes_1_19;
+    wire [6:0] best_idx_2_9 = (best_votes_1_18 >= best_votes_1_19) ? best_idx_1_18 : best_idx_1_19;
+    wire [1:0] best_votes_2_10 = (best_votes_1_20 >= best_votes_1_21) ? best_votes_1_20 : best_votes_1_21;
+    wire [6:0] best_idx_2_10 = (best_votes_1_20 >= best_votes_1_21) ? best_idx_1_20 : best_idx_1_21;
+    wire [1:0] best_votes_2_11 = (best_votes_1_22 >= best_votes_1_23) ? best_votes_1_22 : best_votes_1_23;
+    wire [6:0] best_idx_2_11 = (best_votes_1_22 >= best_votes_1_23) ? best_idx_1_22 : best_idx_1_23;
+    wire [1:0] best_votes_2_12 = (best_votes_1_24 >= best_votes_1_25) ? best_votes_1_24 : best_votes_1_25;
+    wire [6:0] best_idx_2_12 = (best_votes_1_24 >= best_votes_1_25) ? best_idx_1_24 : best_idx_1_25;
+    wire [1:0] best_votes_2_13 = (best_votes_1_26 >= best_votes_1_27) ? best_votes_1_26 : best_votes_1_27;
+    wire [6:0] best_idx_2_13 = (best_votes_1_26 >= best_votes_1_27) ? best_idx_1_26 : best_idx_1_27;
+    wire [1:0] best_votes_2_14 = (best_votes_1_28 >= best_votes_1_29) ? best_votes_1_28 : best_votes_1_29;
+    wire [6:0] best_idx_2_14 = (best_votes_1_28 >= best_votes_1_29) ? best_idx_1_28 : best_idx_1_29;
+    wire [1:0] best_votes_2_15 = (best_votes_1_30 >= best_votes_1_31) ? best_votes_1_30 : best_votes_1_31;
+    wire [6:0] best_idx_2_15 = (best_votes_1_30 >= best_votes_1_31) ? best_idx_1_30 : best_idx_1_31;
+    wire [1:0] best_votes_3_0 = (best_votes_2_0 >= best_votes_2_1) ? best_votes_2_0 : best_votes_2_1;
+    wire [6:0] best_idx_3_0 = (best_votes_2_0 >= best_votes_2_1) ? best_idx_2_0 : best_idx_2_1;
+    wire [1:0] best_votes_3_1 = (best_votes_2_2 >= best_votes_2_3) ? best_votes_2_2 : best_votes_2_3;
+    wire [6:0] best_idx_3_1 = (best_votes_2_2 >= best_votes_2_3) ? best_idx_2_2 : best_idx_2_3;
+    wire [1:0] best_votes_3_2 = (best_votes_2_4 >= best_votes_2_5) ? best_votes_2_4 : best_votes_2_5;
+    wire [6:0] best_idx_3_2 = (best_votes_2_4 >= best_votes_2_5) ? best_idx_2_4 : best_idx_2_5;
+    wire [1:0] best_votes_3_3 = (best_votes_2_6 >= best_votes_2_7) ? best_votes_2_6 : best_votes_2_7;
+    wire [6:0] best_idx_3_3 = (best_votes_2_6 >= best_votes_2_7) ? best_idx_2_6 : best_idx_2_7;
+    wire [1:0] best_votes_3_4 = (best_votes_2_8 >= best_votes_2_9) ? best_votes_2_8 : best_votes_2_9;
+    wire [6:0] best_idx_3_4 = (best_votes_2_8 >= best_votes_2_9) ? best_idx_2_8 : best_idx_2_9;
+    wire [1:0] best_votes_3_5 = (best_votes_2_10 >= best_votes_2_11) ? best_votes_2_10 : best_votes_2_11;
+    wire [6:0] best_idx_3_5 = (best_votes_2_10 >= best_votes_2_11) ? best_idx_2_10 : best_idx_2_11;
+    wire [1:0] best_votes_3_6 = (best_votes_2_12 >= best_votes_2_13) ? best_votes_2_12 : best_votes_2_13;
+    wire [6:0] best_idx_3_6 = (best_votes_2_12 >= best_votes_2_13) ? best_idx_2_12 : best_idx_2_13;
+    wire [1:0] best_votes_3_7 = (best_votes_2_14 >= best_votes_2_15) ? best_votes_2_14 : best_votes_2_15;
+    wire [6:0] best_idx_3_7 = (best_votes_2_14 >= best_votes_2_15) ? best_idx_2_14 : best_idx_2_15;
+    wire [1:0] best_votes_4_0 = (best_votes_3_0 >= best_votes_3_1) ? best_votes_3_0 : best_votes_3_1;
+    wire [6:0] best_idx_4_0 = (best_votes_3_0 >= best_votes_3_1) ? best_idx_3_0 : best_idx_3_1;
+    wire [1:0] best_votes_4_1 = (best_votes_3_2 >= best_votes_3_3) ? best_votes_3_2 : best_votes_3_3;
+    wire [6:0] best_idx_4_1 = (best_votes_3_2 >= best_votes_3_3) ? best_idx_3_2 : best_idx_3_3;
+    wire [1:0] best_votes_4_2 = (best_votes_3_4 >= best_votes_3_5) ? best_votes_3_4 : best_votes_3_5;
+    wire [6:0] best_idx_4_2 = (best_votes_3_4 >= best_votes_3_5) ? best_idx_3_4 : best_idx_3_5;
+    wire [1:0] best_votes_4_3 = (best_votes_3_6 >= best_votes_3_7) ? best_votes_3_6 : best_votes_3_7;
+    wire [6:0] best_idx_4_3 = (best_votes_3_6 >= best_votes_3_7) ? best_idx_3_6 : best_idx_3_7;
+    wire [1:0] best_votes_5_0 = (best_votes_4_0 >= best_votes_4_1) ? best_votes_4_0 : best_votes_4_1;
+    wire [6:0] best_idx_5_0 = (best_votes_4_0 >= best_votes_4_1) ? best_idx_4_0 : best_idx_4_1;
+    wire [1:0] best_votes_5_1 = (best_votes_4_2 >= best_votes_4_3) ? best_votes_4_2 : best_votes_4_3;
+    wire [6:0] best_idx_5_1 = (best_votes_4_2 >= best_votes_4_3) ? best_idx_4_2 : best_idx_4_3;
+    wire [1:0] best_votes_6_0 = (best_votes_5_0 >= best_votes_5_1) ? best_votes_5_0 : best_votes_5_1;
+    wire [6:0] best_idx_6_0 = (best_votes_5_0 >= best_votes_5_1) ? best_idx_5_0 : best_idx_5_1;
+    wire [1:0] best_votes = best_votes_6_0;
+    wire [6:0] best_idx = best_idx_6_0;
     always @(posedge clk or negedge rst_n) begin
         if (!rst_n) begin
             state <= IDLE;
             current_cw <= 0;
+            received_data <= 0;
             iter_count <= 0;
             codeword_out <= 0;
             data_out <= 0;
@@ -428,6 +559,7 @@ module ldpc_ecc_w64 (
             else if (decode_en && state == IDLE) begin
                 state <= CALC_SYNDROME;
                 current_cw <= codeword_in;
+                received_data <= codeword_in[63:0];
                 iter_count <= 0;
             end
             
@@ -436,149 +568,23 @@ module ldpc_ecc_w64 (
                     CALC_SYNDROME: begin
                         if (!has_error) begin
                              state <= FINISH;
-                        end else if (iter_count == MAX_ITER) begin
+                        end else if (iter_count == MAX_ITER || best_votes == 0) begin
                              state <= FINISH;
                         end else begin
                              state <= FLIP_BITS;
                         end
                     end
                     FLIP_BITS: begin
-                        // Apply flips
-                        current_cw[0] <= current_cw[0] ^ flip_0;
-                        current_cw[1] <= current_cw[1] ^ flip_1;
-                        current_cw[2] <= current_cw[2] ^ flip_2;
-                        current_cw[3] <= current_cw[3] ^ flip_3;
-                        current_cw[4] <= current_cw[4] ^ flip_4;
-                        current_cw[5] <= current_cw[5] ^ flip_5;
-                        current_cw[6] <= current_cw[6] ^ flip_6;
-                        current_cw[7] <= current_cw[7] ^ flip_7;
-                        current_cw[8] <= current_cw[8] ^ flip_8;
-                        current_cw[9] <= current_cw[9] ^ flip_9;
-                        current_cw[10] <= current_cw[10] ^ flip_10;
-                        current_cw[11] <= current_cw[11] ^ flip_11;
-                        current_cw[12] <= current_cw[12] ^ flip_12;
-                        current_cw[13] <= current_cw[13] ^ flip_13;
-                        current_cw[14] <= current_cw[14] ^ flip_14;
-                        current_cw[15] <= current_cw[15] ^ flip_15;
-                        current_cw[16] <= current_cw[16] ^ flip_16;
-                        current_cw[17] <= current_cw[17] ^ flip_17;
-                        current_cw[18] <= current_cw[18] ^ flip_18;
-                        current_cw[19] <= current_cw[19] ^ flip_19;
-                        current_cw[20] <= current_cw[20] ^ flip_20;
-                        current_cw[21] <= current_cw[21] ^ flip_21;
-                        current_cw[22] <= current_cw[22] ^ flip_22;
-                        current_cw[23] <= current_cw[23] ^ flip_23;
-                        current_cw[24] <= current_cw[24] ^ flip_24;
-                        current_cw[25] <= current_cw[25] ^ flip_25;
-                        current_cw[26] <= current_cw[26] ^ flip_26;
-                        current_cw[27] <= current_cw[27] ^ flip_27;
-                        current_cw[28] <= current_cw[28] ^ flip_28;
-                        current_cw[29] <= current_cw[29] ^ flip_29;
-                        current_cw[30] <= current_cw[30] ^ flip_30;
-                        current_cw[31] <= current_cw[31] ^ flip_31;
-                        current_cw[32] <= current_cw[32] ^ flip_32;
-                        current_cw[33] <= current_cw[33] ^ flip_33;
-                        current_cw[34] <= current_cw[34] ^ flip_34;
-                        current_cw[35] <= current_cw[35] ^ flip_35;
-                        current_cw[36] <= current_cw[36] ^ flip_36;
-                        current_cw[37] <= current_cw[37] ^ flip_37;
-                        current_cw[38] <= current_cw[38] ^ flip_38;
-                        current_cw[39] <= current_cw[39] ^ flip_39;
-                        current_cw[40] <= current_cw[40] ^ flip_40;
-                        current_cw[41] <= current_cw[41] ^ flip_41;
-                        current_cw[42] <= current_cw[42] ^ flip_42;
-                        current_cw[43] <= current_cw[43] ^ flip_43;
-                        current_cw[44] <= current_cw[44] ^ flip_44;
-                        current_cw[45] <= current_cw[45] ^ flip_45;
-                        current_cw[46] <= current_cw[46] ^ flip_46;
-                        current_cw[47] <= current_cw[47] ^ flip_47;
-                        current_cw[48] <= current_cw[48] ^ flip_48;
-                        current_cw[49] <= current_cw[49] ^ flip_49;
-                        current_cw[50] <= current_cw[50] ^ flip_50;
-                        current_cw[51] <= current_cw[51] ^ flip_51;
-                        current_cw[52] <= current_cw[52] ^ flip_52;
-                        current_cw[53] <= current_cw[53] ^ flip_53;
-                        current_cw[54] <= current_cw[54] ^ flip_54;
-                        current_cw[55] <= current_cw[55] ^ flip_55;
-                        current_cw[56] <= current_cw[56] ^ flip_56;
-                        current_cw[57] <= current_cw[57] ^ flip_57;
-                        current_cw[58] <= current_cw[58] ^ flip_58;
-                        current_cw[59] <= current_cw[59] ^ flip_59;
-                        current_cw[60] <= current_cw[60] ^ flip_60;
-                        current_cw[61] <= current_cw[61] ^ flip_61;
-                        current_cw[62] <= current_cw[62] ^ flip_62;
-                        current_cw[63] <= current_cw[63] ^ flip_63;
-                        current_cw[64] <= current_cw[64] ^ flip_64;
-                        current_cw[65] <= current_cw[65] ^ flip_65;
-                        current_cw[66] <= current_cw[66] ^ flip_66;
-                        current_cw[67] <= current_cw[67] ^ flip_67;
-                        current_cw[68] <= current_cw[68] ^ flip_68;
-                        current_cw[69] <= current_cw[69] ^ flip_69;
-                        current_cw[70] <= current_cw[70] ^ flip_70;
-                        current_cw[71] <= current_cw[71] ^ flip_71;
-                        current_cw[72] <= current_cw[72] ^ flip_72;
-                        current_cw[73] <= current_cw[73] ^ flip_73;
-                        current_cw[74] <= current_cw[74] ^ flip_74;
-                        current_cw[75] <= current_cw[75] ^ flip_75;
-                        current_cw[76] <= current_cw[76] ^ flip_76;
-                        current_cw[77] <= current_cw[77] ^ flip_77;
-                        current_cw[78] <= current_cw[78] ^ flip_78;
-                        current_cw[79] <= current_cw[79] ^ flip_79;
-                        current_cw[80] <= current_cw[80] ^ flip_80;
-                        current_cw[81] <= current_cw[81] ^ flip_81;
-                        current_cw[82] <= current_cw[82] ^ flip_82;
-                        current_cw[83] <= current_cw[83] ^ flip_83;
-                        current_cw[84] <= current_cw[84] ^ flip_84;
-                        current_cw[85] <= current_cw[85] ^ flip_85;
-                        current_cw[86] <= current_cw[86] ^ flip_86;
-                        current_cw[87] <= current_cw[87] ^ flip_87;
-                        current_cw[88] <= current_cw[88] ^ flip_88;
-                        current_cw[89] <= current_cw[89] ^ flip_89;
-                        current_cw[90] <= current_cw[90] ^ flip_90;
-                        current_cw[91] <= current_cw[91] ^ flip_91;
-                        current_cw[92] <= current_cw[92] ^ flip_92;
-                        current_cw[93] <= current_cw[93] ^ flip_93;
-                        current_cw[94] <= current_cw[94] ^ flip_94;
-                        current_cw[95] <= current_cw[95] ^ flip_95;
-                        current_cw[96] <= current_cw[96] ^ flip_96;
-                        current_cw[97] <= current_cw[97] ^ flip_97;
-                        current_cw[98] <= current_cw[98] ^ flip_98;
-                        current_cw[99] <= current_cw[99] ^ flip_99;
-                        current_cw[100] <= current_cw[100] ^ flip_100;
-                        current_cw[101] <= current_cw[101] ^ flip_101;
-                        current_cw[102] <= current_cw[102] ^ flip_102;
-                        current_cw[103] <= current_cw[103] ^ flip_103;
-                        current_cw[104] <= current_cw[104] ^ flip_104;
-                        current_cw[105] <= current_cw[105] ^ flip_105;
-                        current_cw[106] <= current_cw[106] ^ flip_106;
-                        current_cw[107] <= current_cw[107] ^ flip_107;
-                        current_cw[108] <= current_cw[108] ^ flip_108;
-                        current_cw[109] <= current_cw[109] ^ flip_109;
-                        current_cw[110] <= current_cw[110] ^ flip_110;
-                        current_cw[111] <= current_cw[111] ^ flip_111;
-                        current_cw[112] <= current_cw[112] ^ flip_112;
-                        current_cw[113] <= current_cw[113] ^ flip_113;
-                        current_cw[114] <= current_cw[114] ^ flip_114;
-                        current_cw[115] <= current_cw[115] ^ flip_115;
-                        current_cw[116] <= current_cw[116] ^ flip_116;
-                        current_cw[117] <= current_cw[117] ^ flip_117;
-                        current_cw[118] <= current_cw[118] ^ flip_118;
-                        current_cw[119] <= current_cw[119] ^ flip_119;
-                        current_cw[120] <= current_cw[120] ^ flip_120;
-                        current_cw[121] <= current_cw[121] ^ flip_121;
-                        current_cw[122] <= current_cw[122] ^ flip_122;
-                        current_cw[123] <= current_cw[123] ^ flip_123;
-                        current_cw[124] <= current_cw[124] ^ flip_124;
-                        current_cw[125] <= current_cw[125] ^ flip_125;
-                        current_cw[126] <= current_cw[126] ^ flip_126;
-                        current_cw[127] <= current_cw[127] ^ flip_127;
+                        // Flip the lowest-index variable with the most unsatisfied checks
+                        current_cw[best_idx] <= ~current_cw[best_idx];
                         iter_count <= iter_count + 1;
                         state <= CALC_SYNDROME;
                     end
                     FINISH: begin
-                        data_out <= current_cw[63:0];
+                        // On failure return the received data bits, as LDPCEngine does
+                        data_out <= has_error ? received_data : current_cw[63:0];
                         error_detected <= has_error;
-                        error_corrected <= (has_error == 0); // Approx
+                        error_corrected <= (has_error == 0);
                         valid_out <= 1'b1;
                         state <= IDLE;
                     end